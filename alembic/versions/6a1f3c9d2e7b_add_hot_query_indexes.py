@@ -0,0 +1,117 @@
+"""Add composite indexes for hot repository, identifier and monitoring queries.
+
+Revision ID: 6a1f3c9d2e7b
+Revises: 5e8f9a2b3c4d
+Create Date: 2026-10-18 09:00:00.000000
+
+Indexes are built with CREATE INDEX CONCURRENTLY so they can be applied to a
+live database without taking write locks on articles/article_analyses. Each
+index is created in its own autocommit block because CONCURRENTLY cannot run
+inside a transaction.
+
+Query -> index mapping:
+    articles (status, published_on)
+        ArticleRepository.get_recent_articles / get_articles_with_filters /
+        get_article_statistics, BatchArticleIdentifier.get_analyzable_articles,
+        cleanup_old_articles
+    articles (status, created_at)
+        BatchArticleIdentifier.get_recent_analyzable_articles_sync,
+        AnalysisScheduler._check_content_availability
+    articles (publisher_id, status, published_on)
+        ArticleRepository.get_articles_by_publisher, publisher filters and stats
+    article_analyses (article_id, created_at)
+        latest-analysis lookups per article and "not yet analyzed" anti-joins
+    article_analyses (validation_status, created_at, signal_strength)
+        ArticleRepository.get_articles_with_analysis_since,
+        NewsletterTaskMonitor.get_newsletter_pipeline_health
+    article_analyses (created_at) INCLUDE (cost_usd)
+        AnalysisScheduler._check_daily_budget_usage
+    article_categories (category_id)
+        category statistics joins
+    newsletters (status, created_at)
+        NewsletterTaskMonitor._check_recent_failures
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6a1f3c9d2e7b"
+down_revision: Union[str, None] = "5e8f9a2b3c4d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns, INCLUDE columns)
+HOT_QUERY_INDEXES: list[tuple[str, str, list[str], list[str]]] = [
+    ("idx_articles_status_published_on", "articles", ["status", "published_on"], []),
+    ("idx_articles_status_created_at", "articles", ["status", "created_at"], []),
+    (
+        "idx_articles_publisher_status_published_on",
+        "articles",
+        ["publisher_id", "status", "published_on"],
+        [],
+    ),
+    (
+        "idx_article_analyses_article_created",
+        "article_analyses",
+        ["article_id", "created_at"],
+        [],
+    ),
+    (
+        "idx_article_analyses_validation_created",
+        "article_analyses",
+        ["validation_status", "created_at", "signal_strength"],
+        ["article_id"],
+    ),
+    (
+        "idx_article_analyses_created_at",
+        "article_analyses",
+        ["created_at"],
+        ["cost_usd"],
+    ),
+    (
+        "idx_article_categories_category_id",
+        "article_categories",
+        ["category_id"],
+        [],
+    ),
+    (
+        "idx_newsletters_status_created_at",
+        "newsletters",
+        ["status", "created_at"],
+        [],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Create hot-path indexes concurrently."""
+    for name, table, columns, include in HOT_QUERY_INDEXES:
+        with op.get_context().autocommit_block():
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_include=include,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+    # Refresh planner statistics so the new indexes are picked up immediately
+    with op.get_context().autocommit_block():
+        op.execute("ANALYZE articles")
+        op.execute("ANALYZE article_analyses")
+
+
+def downgrade() -> None:
+    """Drop hot-path indexes concurrently."""
+    for name, table, _columns, _include in reversed(HOT_QUERY_INDEXES):
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
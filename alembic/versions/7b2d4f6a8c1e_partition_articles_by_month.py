@@ -0,0 +1,216 @@
+"""Range-partition articles and article_analyses by month.
+
+Revision ID: 7b2d4f6a8c1e
+Revises: 6a1f3c9d2e7b
+Create Date: 2026-10-18 12:00:00.000000
+
+articles is partitioned on published_on, article_analyses on created_at (the
+analysis row's own timestamp; it has no published_on of its own). Each table
+is rebuilt: the existing table is renamed, a partitioned table with the same
+columns is created, monthly partitions are created from the oldest row up to
+three months ahead plus a DEFAULT partition, the rows are copied, and the old
+table is dropped. This takes an exclusive lock on both tables for the
+duration of the copy, so run it in a maintenance window.
+
+PostgreSQL requires every primary key / unique constraint on a partitioned
+table to include the partition key, so:
+    - articles.published_on becomes NOT NULL (backfilled from created_on /
+      created_at) and the primary key becomes (id, published_on); ids still
+      come from the shared sequence and stay unique.
+    - the unique constraints on external_id, guid and url (and article_id +
+      analysis_version on article_analyses) are extended with the partition key.
+    - foreign keys that reference articles(id) are dropped: a foreign key can
+      only reference a partitioned table through a constraint that includes the
+      partition key, and keeping them would make partition drops scan the
+      referencing tables. The ORM models keep their ForeignKey metadata for
+      relationship joins.
+
+Upcoming partitions are pre-created by the maintain_partitions Celery task;
+retention detaches, drops or archives whole partitions (see
+crypto_newsletter.shared.database.partitions).
+"""
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2d4f6a8c1e"
+down_revision: Union[str, None] = "6a1f3c9d2e7b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+# table -> (partition key, {unique constraint name: columns without the key})
+PARTITIONED_TABLES: dict[str, tuple[str, dict[str, list[str]]]] = {
+    "articles": (
+        "published_on",
+        {
+            "articles_external_id_key": ["external_id"],
+            "articles_guid_key": ["guid"],
+            "articles_url_key": ["url"],
+        },
+    ),
+    "article_analyses": (
+        "created_at",
+        {"uq_article_analysis_version": ["article_id", "analysis_version"]},
+    ),
+}
+
+# Foreign keys to articles(id) restored on downgrade: (table, column)
+ARTICLE_REFERENCES = [
+    ("article_categories", "article_id"),
+    ("article_analyses", "article_id"),
+    ("newsletter_articles", "article_id"),
+    ("signals", "article_id"),
+    ("article_embeddings", "article_id"),
+]
+
+
+def _month_floor(moment: datetime) -> datetime:
+    moment = moment.astimezone(UTC) if moment.tzinfo else moment.replace(tzinfo=UTC)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + (month.month - 1) + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _scalar(sql: str, **params):
+    return op.get_bind().execute(sa.text(sql), params).scalar()
+
+
+def _rows(sql: str, **params) -> list:
+    return list(op.get_bind().execute(sa.text(sql), params).all())
+
+
+def _table_exists(table: str) -> bool:
+    return _scalar("SELECT to_regclass(:table) IS NOT NULL", table=table)
+
+
+def _drop_referencing_foreign_keys(table: str) -> None:
+    for referencing_table, name in _rows(
+        """
+        SELECT conrelid::regclass::text, conname
+        FROM pg_constraint
+        WHERE contype = 'f' AND confrelid = CAST(:table AS regclass)
+        """,
+        table=table,
+    ):
+        op.execute(f'ALTER TABLE {referencing_table} DROP CONSTRAINT "{name}"')
+
+
+def _rebuild_table(
+    table: str, key: str, uniques: dict[str, list[str]], partitioned: bool
+) -> None:
+    """Recreate ``table`` (partitioned or plain) and copy its rows across."""
+    old = f"{table}_{'unpartitioned' if partitioned else 'partitioned'}"
+
+    # Capture outgoing foreign keys and plain indexes before the old table goes
+    own_foreign_keys = _rows(
+        """
+        SELECT conname, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE contype = 'f' AND conrelid = CAST(:table AS regclass)
+        """,
+        table=table,
+    )
+    index_definitions = [
+        definition
+        for (definition,) in _rows(
+            """
+            SELECT pg_get_indexdef(i.indexrelid)
+            FROM pg_index i
+            WHERE i.indrelid = CAST(:table AS regclass)
+              AND NOT i.indisunique
+              AND NOT i.indisprimary
+            """,
+            table=table,
+        )
+    ]
+    sequence = _scalar("SELECT pg_get_serial_sequence(:table, 'id')", table=table)
+
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    if sequence:
+        op.execute(f"ALTER SEQUENCE {sequence} OWNED BY NONE")
+
+    partition_clause = f" PARTITION BY RANGE ({key})" if partitioned else ""
+    op.execute(
+        f"CREATE TABLE {table} "
+        f"(LIKE {old} INCLUDING DEFAULTS INCLUDING CONSTRAINTS){partition_clause}"
+    )
+
+    if partitioned:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {key} SET NOT NULL")
+        oldest = _scalar(f"SELECT min({key}) FROM {old}") or datetime.now(UTC)
+        month = _month_floor(oldest)
+        last = _add_months(_month_floor(datetime.now(UTC)), MONTHS_AHEAD)
+        while month <= last:
+            upper = _add_months(month, 1)
+            op.execute(
+                f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+            month = upper
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    op.execute(f"DROP TABLE {old}")
+    if sequence:
+        op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+
+    key_columns = [key] if partitioned else []
+    op.execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey "
+        f"PRIMARY KEY ({', '.join(['id', *key_columns])})"
+    )
+    for name, columns in uniques.items():
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {name} "
+            f"UNIQUE ({', '.join([*columns, *key_columns])})"
+        )
+    for name, definition in own_foreign_keys:
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}')
+    for definition in index_definitions:
+        op.execute(definition)
+
+    op.execute(f"ANALYZE {table}")
+
+
+def upgrade() -> None:
+    """Convert articles and article_analyses to monthly range partitions."""
+    op.execute(
+        """
+        UPDATE articles
+        SET published_on = COALESCE(created_on, created_at, now())
+        WHERE published_on IS NULL
+        """
+    )
+
+    for table in PARTITIONED_TABLES:
+        _drop_referencing_foreign_keys(table)
+
+    for table, (key, uniques) in PARTITIONED_TABLES.items():
+        _rebuild_table(table, key, uniques, partitioned=True)
+
+
+def downgrade() -> None:
+    """Convert back to plain tables (detached/archived partitions are not restored)."""
+    for table, (key, uniques) in PARTITIONED_TABLES.items():
+        _rebuild_table(table, key, uniques, partitioned=False)
+
+    op.execute("ALTER TABLE articles ALTER COLUMN published_on DROP NOT NULL")
+
+    for referencing_table, column in ARTICLE_REFERENCES:
+        if not _table_exists(referencing_table):
+            continue
+        op.execute(
+            f"ALTER TABLE {referencing_table} "
+            f"ADD CONSTRAINT {referencing_table}_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES articles (id) NOT VALID"
+        )
@@ -0,0 +1,130 @@
+"""Normalize analysis signals into indexed tables.
+
+Revision ID: 8c4e6a1b3d5f
+Revises: 7b2d4f6a8c1e
+Create Date: 2026-10-18 15:00:00.000000
+
+Weak signals, pattern anomalies and adjacent connections are stored as JSONB
+arrays on article_analyses, so filtering by type, confidence or time needs a
+scan of every analysis. Analysis storage now also writes one row per entry:
+    weak_signals          -> signals (existing table from 002, plus analysis_id)
+    pattern_anomalies     -> signal_anomalies
+    adjacent_connections  -> signal_connections
+
+analysis_id and article_id carry no foreign keys: both referenced tables are
+partitioned and their primary keys include the partition key (see
+7b2d4f6a8c1e). Existing analyses are copied by the backfill job
+(``crypto-newsletter db-backfill-signals`` or the backfill_analysis_signals
+Celery task), not by this migration.
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4e6a1b3d5f"
+down_revision: Union[str, None] = "7b2d4f6a8c1e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("signals", sa.Column("analysis_id", sa.BigInteger(), nullable=True))
+    op.create_index("idx_signals_analysis_id", "signals", ["analysis_id"])
+
+    op.create_table(
+        "signal_anomalies",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("article_id", sa.BigInteger(), nullable=False),
+        sa.Column("analysis_id", sa.BigInteger(), nullable=True),
+        sa.Column("expected_pattern", sa.Text(), nullable=False),
+        sa.Column("observed_pattern", sa.Text(), nullable=False),
+        sa.Column("deviation_significance", sa.Float(), nullable=False),
+        sa.Column("historical_context", sa.Text(), nullable=True),
+        sa.Column("potential_causes", postgresql.JSONB(), nullable=True),
+        sa.Column(
+            "detected_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.CheckConstraint(
+            "deviation_significance >= 0 AND deviation_significance <= 1",
+            name="check_anomaly_significance",
+        ),
+    )
+    op.create_index(
+        "idx_signal_anomalies_article_id", "signal_anomalies", ["article_id"]
+    )
+    op.create_index(
+        "idx_signal_anomalies_analysis_id", "signal_anomalies", ["analysis_id"]
+    )
+    op.create_index(
+        "idx_signal_anomalies_significance_detected",
+        "signal_anomalies",
+        ["deviation_significance", "detected_at"],
+    )
+    op.create_index(
+        "idx_signal_anomalies_detected_at", "signal_anomalies", ["detected_at"]
+    )
+
+    op.create_table(
+        "signal_connections",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("article_id", sa.BigInteger(), nullable=False),
+        sa.Column("analysis_id", sa.BigInteger(), nullable=True),
+        sa.Column("crypto_element", sa.Text(), nullable=False),
+        sa.Column("external_domain", sa.String(100), nullable=False),
+        sa.Column("connection_type", sa.String(100), nullable=True),
+        sa.Column("relevance", sa.Float(), nullable=False),
+        sa.Column("opportunity_description", sa.Text(), nullable=True),
+        sa.Column("development_indicators", postgresql.JSONB(), nullable=True),
+        sa.Column(
+            "detected_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.CheckConstraint(
+            "relevance >= 0 AND relevance <= 1", name="check_connection_relevance"
+        ),
+    )
+    op.create_index(
+        "idx_signal_connections_article_id", "signal_connections", ["article_id"]
+    )
+    op.create_index(
+        "idx_signal_connections_analysis_id", "signal_connections", ["analysis_id"]
+    )
+    op.create_index(
+        "idx_signal_connections_domain_relevance",
+        "signal_connections",
+        ["external_domain", "relevance"],
+    )
+    op.create_index(
+        "idx_signal_connections_detected_at", "signal_connections", ["detected_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("signal_connections")
+    op.drop_table("signal_anomalies")
+    op.drop_index("idx_signals_analysis_id", table_name="signals")
+    op.drop_column("signals", "analysis_id")
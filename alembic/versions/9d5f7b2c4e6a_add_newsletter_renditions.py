@@ -0,0 +1,51 @@
+"""Add newsletter renditions.
+
+Revision ID: 9d5f7b2c4e6a
+Revises: 8c4e6a1b3d5f
+Create Date: 2026-10-18 17:00:00.000000
+
+Newsletter HTML was rendered from markdown on every request. Renditions (web
+HTML, email-safe HTML and plain text) are now rendered once when a newsletter
+is created or edited and served from this table. source_hash identifies the
+newsletter fields and template version a body was rendered from, so a stale
+rendition is detected and replaced. Existing newsletters are rendered on
+first view, or ahead of time by ``crypto-newsletter newsletter-render``.
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d5f7b2c4e6a"
+down_revision: Union[str, None] = "8c4e6a1b3d5f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "newsletter_renditions",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("newsletter_id", sa.BigInteger(), nullable=False),
+        sa.Column("variant", sa.String(length=20), nullable=False),
+        sa.Column("source_hash", sa.String(length=64), nullable=False),
+        sa.Column("body", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["newsletter_id"], ["newsletters.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("newsletter_id", "variant", name="uq_newsletter_rendition"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("newsletter_renditions")
@@ -0,0 +1,62 @@
+"""Add LLM cache entries.
+
+Revision ID: ae6c8d3f5b7a
+Revises: 9d5f7b2c4e6a
+Create Date: 2026-10-18 19:00:00.000000
+
+Backing table for the database backend of the analysis agents' result cache.
+Rows are keyed by a hash of the agent, model, system prompt and formatted
+input, so re-analysing unchanged content returns the stored, validated output
+instead of calling the model again. expires_at implements the TTL and
+last_used_at the least-recently-used eviction when the table is over its
+size bound.
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ae6c8d3f5b7a"
+down_revision: Union[str, None] = "9d5f7b2c4e6a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_cache_entries",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("agent", sa.String(length=100), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("output", postgresql.JSONB(), nullable=False),
+        sa.Column("usage", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "last_used_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("hits", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(
+        "idx_llm_cache_last_used", "llm_cache_entries", ["last_used_at"]
+    )
+    op.create_index("idx_llm_cache_expires", "llm_cache_entries", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_llm_cache_expires", table_name="llm_cache_entries")
+    op.drop_index("idx_llm_cache_last_used", table_name="llm_cache_entries")
+    op.drop_table("llm_cache_entries")
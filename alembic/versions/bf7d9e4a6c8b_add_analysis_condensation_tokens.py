@@ -0,0 +1,38 @@
+"""Add article and condensed token counts to analyses.
+
+Revision ID: bf7d9e4a6c8b
+Revises: ae6c8d3f5b7a
+Create Date: 2026-10-18 20:00:00.000000
+
+Article bodies are condensed (boilerplate and duplicate paragraphs removed,
+then the most information-dense sentences kept up to ARTICLE_TOKEN_BUDGET)
+before content analysis. article_tokens and condensed_tokens record the
+estimated body tokens before and after, so the saving can be compared with
+cost_usd and processing_time_ms. Both are NULL for earlier analyses.
+"""
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "bf7d9e4a6c8b"
+down_revision: Union[str, None] = "ae6c8d3f5b7a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "article_analyses", sa.Column("article_tokens", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "article_analyses", sa.Column("condensed_tokens", sa.Integer(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("article_analyses", "condensed_tokens")
+    op.drop_column("article_analyses", "article_tokens")
@@ -0,0 +1,76 @@
+"""Add analysis batch jobs.
+
+Revision ID: c1e8a0f5d7b9
+Revises: bf7d9e4a6c8b
+Create Date: 2026-10-18 21:00:00.000000
+
+Backlog articles can be analyzed through the provider's asynchronous batch
+endpoint instead of interactive calls. Each row tracks one submitted job:
+the provider's job name, the articles it covers (so they are not selected
+again while it is open), its state while it is polled, and how many results
+were validated and stored once it completed.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c1e8a0f5d7b9"
+down_revision: Union[str, None] = "bf7d9e4a6c8b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analysis_batch_jobs",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("provider_job_id", sa.String(length=255), nullable=False),
+        sa.Column("backend", sa.String(length=20), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("article_ids", postgresql.ARRAY(sa.BigInteger()), nullable=False),
+        sa.Column(
+            "status", sa.String(length=20), server_default="SUBMITTED", nullable=False
+        ),
+        sa.Column("articles_stored", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("articles_failed", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("cost_usd", sa.Numeric(precision=8, scale=4), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column(
+            "submitted_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            "status IN ('SUBMITTED', 'RUNNING', 'COMPLETED', 'FAILED', "
+            "'CANCELLED', 'EXPIRED')",
+            name="check_analysis_batch_job_status",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("provider_job_id"),
+    )
+    op.create_index("idx_analysis_batch_jobs_status", "analysis_batch_jobs", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_analysis_batch_jobs_status", table_name="analysis_batch_jobs")
+    op.drop_table("analysis_batch_jobs")
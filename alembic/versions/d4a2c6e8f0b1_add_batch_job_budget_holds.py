@@ -0,0 +1,47 @@
+"""Add budget holds to analysis batch jobs.
+
+Revision ID: d4a2c6e8f0b1
+Revises: c1e8a0f5d7b9
+Create Date: 2026-10-18 23:30:00.000000
+
+A batch job's estimated cost is reserved in the budget ledger when the job
+is submitted and settled with its actual cost when it completes. The
+reservation (hold id and ledger day) is kept on the job, so whichever
+worker polls the job to completion can settle it.
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a2c6e8f0b1"
+down_revision: Union[str, None] = "c1e8a0f5d7b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "analysis_batch_jobs",
+        sa.Column(
+            "estimated_cost_usd", sa.Numeric(precision=8, scale=4), nullable=True
+        ),
+    )
+    op.add_column(
+        "analysis_batch_jobs",
+        sa.Column("budget_hold_id", sa.String(length=32), nullable=True),
+    )
+    op.add_column(
+        "analysis_batch_jobs",
+        sa.Column("budget_day", sa.String(length=10), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("analysis_batch_jobs", "budget_day")
+    op.drop_column("analysis_batch_jobs", "budget_hold_id")
+    op.drop_column("analysis_batch_jobs", "estimated_cost_usd")
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+API Response Encoding Benchmark
+
+Measures p50/p99 latency and bytes on the wire of the newsletter list and
+detail endpoints with the previous encoding (jsonable_encoder and stdlib
+JSON, no compression) and with FAST_JSON_RESPONSES and response compression
+enabled. The database is replaced by in-memory newsletters of
+realistic size and the response cache is disabled, so the numbers isolate
+validation, serialization and compression.
+
+Usage:
+    python scripts/benchmark_api_encoding.py
+    python scripts/benchmark_api_encoding.py --requests 2000 --page-size 50
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("COINDESK_API_KEY", "benchmark")
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from crypto_newsletter.shared.config.settings import reset_settings  # noqa: E402
+from crypto_newsletter.web import main  # noqa: E402
+from crypto_newsletter.web.routers import api  # noqa: E402
+
+WORDS = (
+    "bitcoin ether etf inflows outflows stablecoin liquidity custody layer-2 "
+    "rollup validator staking yield basis funding regulator sec mica treasury "
+    "volatility correlation miners hashrate halving options open-interest "
+    "on-chain whales exchange reserves settlement tokenization institutional"
+).split()
+
+CONFIGURATIONS = {
+    "before": {
+        "FAST_JSON_RESPONSES": "false",
+        "RESPONSE_COMPRESSION_ENABLED": "false",
+    },
+    "orjson": {
+        "FAST_JSON_RESPONSES": "true",
+        "RESPONSE_COMPRESSION_ENABLED": "false",
+    },
+    "after": {
+        "FAST_JSON_RESPONSES": "true",
+        "RESPONSE_COMPRESSION_ENABLED": "true",
+    },
+}
+
+
+def _paragraph(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return f"{text} [source](https://example.com/{rng.randrange(10**6)})."
+
+
+def _newsletter(newsletter_id: int) -> SimpleNamespace:
+    """About 10 KB of varied markdown, like a generated daily newsletter."""
+    rng = random.Random(newsletter_id)
+    now = datetime(2026, 10, 1, tzinfo=UTC) - timedelta(days=newsletter_id)
+    sections = "\n\n".join(
+        f"## Section {n}\n\n" + "\n\n".join(_paragraph(rng, 60) for _ in range(4))
+        for n in range(1, 7)
+    )
+    return SimpleNamespace(
+        id=newsletter_id,
+        title=f"Daily Brief {newsletter_id}",
+        content=f"# Daily Brief {newsletter_id}\n\n{sections}",
+        summary=_paragraph(rng, 40),
+        generation_date=now,
+        status="PUBLISHED",
+        quality_score=0.87,
+        agent_version="1.0",
+        generation_metadata={
+            "newsletter_type": "DAILY",
+            "story_selection": {"selected_count": 8, "themes": ["etf", "l2"]},
+        },
+        published_at=now,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class InMemoryNewsletterRepository:
+    newsletters = [_newsletter(n) for n in range(1, 101)]
+
+    def __init__(self, db) -> None:
+        pass
+
+    async def get_newsletter_by_id(self, newsletter_id):
+        return self.newsletters[newsletter_id - 1]
+
+    async def get_newsletters_with_filters(self, limit, offset, **filters):
+        return self.newsletters[offset : offset + limit]
+
+    async def count_newsletters_with_filters(self, **filters):
+        return len(self.newsletters)
+
+
+@asynccontextmanager
+async def _no_session():
+    yield None
+
+
+def measure(client: TestClient, path: str, requests: int) -> dict[str, float]:
+    """Latency percentiles (ms) and wire bytes of GET ``path``."""
+    headers = {"Accept-Encoding": "br, gzip"}
+    for _ in range(20):
+        client.get(path, headers=headers)
+
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get(path, headers=headers)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.text
+
+    timings.sort()
+    return {
+        "p50": statistics.median(timings),
+        "p99": timings[min(len(timings) - 1, int(len(timings) * 0.99))],
+        "bytes": response.num_bytes_downloaded,
+        "encoding": response.headers.get("content-encoding", "identity"),
+    }
+
+
+def main_benchmark() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument(
+        "--bandwidth-mbps",
+        type=float,
+        default=50.0,
+        help="Client bandwidth for the estimated transfer time column",
+    )
+    args = parser.parse_args()
+
+    api.get_read_session = _no_session
+    api.NewsletterRepository = InMemoryNewsletterRepository
+    endpoints = {
+        "list": f"/api/newsletters?limit={args.page_size}",
+        "detail": "/api/newsletters/1",
+    }
+
+    results = {}
+    for name, environment in CONFIGURATIONS.items():
+        os.environ.update(environment)
+        reset_settings()
+        # No lifespan: startup checks would try to reach the database and Redis
+        client = TestClient(main.create_app())
+        for endpoint, path in endpoints.items():
+            results[name, endpoint] = measure(client, path, args.requests)
+
+    print(f"⏱️  {args.requests} requests per endpoint, page size {args.page_size}")
+    print("(p50/p99 are in-process; transfer is bytes at --bandwidth-mbps)")
+    print(
+        f"{'endpoint':<10}{'config':<8}{'p50 ms':>9}{'p99 ms':>9}"
+        f"{'bytes':>10}{'transfer ms':>13}  encoding"
+    )
+    for endpoint in endpoints:
+        for name in CONFIGURATIONS:
+            r = results[name, endpoint]
+            transfer = r["bytes"] * 8 / (args.bandwidth_mbps * 1000)
+            print(
+                f"{endpoint:<10}{name:<8}{r['p50']:>9.2f}{r['p99']:>9.2f}"
+                f"{r['bytes']:>10}{transfer:>13.2f}  {r['encoding']}"
+            )
+
+
+if __name__ == "__main__":
+    main_benchmark()
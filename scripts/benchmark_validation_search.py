@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Signal Validation Search Benchmark
+
+Simulates concurrent signal validations, each issuing several external
+searches, against the stub search backend with a fixed per-request latency.
+Compares the previous tool (a blocking client call inside the async tool,
+one query per call) with the async client, parallel multi-query calls and
+the result cache. Reports wall time and the worst event-loop stall, which is
+how long every other analysis on the loop was frozen.
+
+Usage:
+    python scripts/benchmark_validation_search.py
+    python scripts/benchmark_validation_search.py --validations 16 --latency 0.3
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("COINDESK_API_KEY", "benchmark")
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+
+from crypto_newsletter.analysis.search import (  # noqa: E402
+    ExternalSearch,
+    StubSearchBackend,
+)
+
+TOPICS = ("etf inflows", "stablecoin supply", "miner reserves", "funding rates")
+
+
+def queries_for(validation: int, per_validation: int) -> list[str]:
+    # Validations of related articles share some of their searches
+    return [
+        f"{TOPICS[(validation + n) % len(TOPICS)]} {n}" for n in range(per_validation)
+    ]
+
+
+async def watch_loop(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """Largest delay of a periodic timer, i.e. the longest loop stall."""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+async def blocking_validation(queries: list[str], latency: float) -> None:
+    for _ in queries:
+        time.sleep(latency)  # synchronous HTTP request inside the async tool
+
+
+async def async_validation(search: ExternalSearch, queries: list[str]) -> None:
+    await search.search_many(queries)
+
+
+async def measure(make_validations) -> tuple[float, float]:
+    stop = asyncio.Event()
+    watcher = asyncio.create_task(watch_loop(stop))
+    started = time.perf_counter()
+    await asyncio.gather(*make_validations())
+    elapsed = time.perf_counter() - started
+    stop.set()
+    return elapsed, await watcher
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--validations", type=int, default=8)
+    parser.add_argument("--searches", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    workload = [queries_for(v, args.searches) for v in range(args.validations)]
+    total = sum(len(queries) for queries in workload)
+
+    before = asyncio.run(
+        measure(lambda: [blocking_validation(q, args.latency) for q in workload])
+    )
+
+    backend = StubSearchBackend(latency=args.latency)
+    search = ExternalSearch(backend, max_parallel=4)
+    after = asyncio.run(
+        measure(lambda: [async_validation(search, q) for q in workload])
+    )
+
+    print(
+        f"{args.validations} validations x {args.searches} searches, "
+        f"{args.latency * 1000:.0f} ms per request"
+    )
+    print(f"{'':<10}{'wall (s)':>10}{'max stall (s)':>15}{'requests':>10}")
+    print(f"{'before':<10}{before[0]:>10.2f}{before[1]:>15.2f}{total:>10}")
+    print(f"{'after':<10}{after[0]:>10.2f}{after[1]:>15.2f}{len(backend.queries):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,15 @@
 """Content Analysis Agent for cryptocurrency signal detection."""
 
+from typing import Optional
+
 from pydantic_ai import Agent
 
 from ..dependencies import AnalysisDependencies
-from ..models.analysis import ContentAnalysis
+from ..models.analysis import ContentAnalysis, PackedContentAnalysis
 from .providers import get_content_analysis_model
 
-# Content Analysis Agent with carefully crafted prompt
-content_analysis_agent = Agent(
-    get_content_analysis_model(),
-    deps_type=AnalysisDependencies,
-    output_type=ContentAnalysis,
-    system_prompt="""You are an expert cryptocurrency market analyst specializing in signal detection. Your role is to identify subtle market indicators that mainstream coverage often misses.
+# Carefully crafted prompt shared by the single and packed agents
+CONTENT_ANALYSIS_PROMPT = """You are an expert cryptocurrency market analyst specializing in signal detection. Your role is to identify subtle market indicators that mainstream coverage often misses.
 
 ANALYSIS FOCUS:
 • Weak Signals: Subtle indicators of emerging trends not explicitly stated
@@ -34,7 +32,30 @@ QUALITY STANDARDS:
 • Implications must be specific, not vague predictions
 • Uniqueness score should reflect insights not found in typical crypto coverage
 
-Remember: You're looking for what others might miss, not restating obvious information.""",
+Remember: You're looking for what others might miss, not restating obvious information."""
+
+PACKED_ANALYSIS_PROMPT = """
+
+MULTIPLE ARTICLES:
+• The input contains several articles, each introduced by its ARTICLE ID
+• Analyze every article independently, as if it were the only one
+• Return exactly one analysis per article, with its ARTICLE ID
+• Evidence must come from the article being analyzed, never from another"""
+
+# Content Analysis Agent
+content_analysis_agent = Agent(
+    get_content_analysis_model(),
+    deps_type=AnalysisDependencies,
+    output_type=ContentAnalysis,
+    system_prompt=CONTENT_ANALYSIS_PROMPT,
+)
+
+# Several short articles per request: the system prompt is sent once
+packed_content_analysis_agent = Agent(
+    get_content_analysis_model(),
+    deps_type=AnalysisDependencies,
+    output_type=PackedContentAnalysis,
+    system_prompt=CONTENT_ANALYSIS_PROMPT + PACKED_ANALYSIS_PROMPT,
 )
 
 
@@ -45,3 +66,14 @@ def format_article_for_analysis(title: str, body: str, publisher: str = None) ->
         formatted += f"PUBLISHER: {publisher}\n\n"
     formatted += f"CONTENT:\n{body}"
     return formatted
+
+
+def format_articles_for_packed_analysis(
+    articles: list[tuple[int, str, str, Optional[str]]],
+) -> str:
+    """Format ``(article_id, title, body, publisher)`` tuples for one request."""
+    return "\n\n==========\n\n".join(
+        f"ARTICLE ID: {article_id}\n\n"
+        + format_article_for_analysis(title, body, publisher)
+        for article_id, title, body, publisher in articles
+    )
@@ -1,20 +1,177 @@
 """Agent orchestration for multi-step analysis workflow."""
 
+import asyncio
 import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any, Optional
 
+from pydantic_ai import Agent
 from pydantic_ai.usage import Usage
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core.storage.signals import store_analysis_signals
+from ...shared.database.partitions import lock_unique_key
 from ...shared.models.models import ArticleAnalysis
+from ..cache import AgentRun, get_llm_cache
+from ..concurrency import run_agent
+from ..condense import CondensedArticle, condense_article
 from ..dependencies import AnalysisDependencies
 from ..models.analysis import ContentAnalysis
 from ..models.validation import SignalValidation
-from .content_analysis import content_analysis_agent, format_article_for_analysis
+from ..rate_limit import get_llm_rate_limiter
+from .content_analysis import (
+    content_analysis_agent,
+    format_article_for_analysis,
+    format_articles_for_packed_analysis,
+    packed_content_analysis_agent,
+)
+from .settings import analysis_settings
 from .signal_validation import format_signals_for_validation, signal_validation_agent
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PackableArticle:
+    """An article that may share a content analysis request with others."""
+
+    article_id: int
+    title: str
+    body: str
+    publisher: Optional[str] = None
+    condensed: Optional[CondensedArticle] = None
+
+    @property
+    def tokens(self) -> int:
+        return self.condensed.condensed_tokens if self.condensed else 0
+
+
+@dataclass
+class PackedAnalysis:
+    """One article's share of a packed content analysis request."""
+
+    run: AgentRun
+    condensed: CondensedArticle
+    share: float
+    pack_size: int
+
+
+def plan_packs(
+    articles: Sequence[PackableArticle],
+    token_budget: int,
+    max_articles: int,
+    article_max_tokens: int,
+) -> list[list[PackableArticle]]:
+    """
+    Group short articles into packs of at most ``token_budget`` body tokens.
+
+    First-fit decreasing by size. Articles over ``article_max_tokens`` and
+    articles left alone in a pack are returned as single-article packs.
+    """
+    packs: list[list[PackableArticle]] = []
+    totals: list[int] = []
+    for article in sorted(articles, key=lambda a: -a.tokens):
+        if article.tokens <= article_max_tokens:
+            for i, pack in enumerate(packs):
+                if (
+                    len(pack) < max_articles
+                    and pack[0].tokens <= article_max_tokens
+                    and totals[i] + article.tokens <= token_budget
+                ):
+                    pack.append(article)
+                    totals[i] += article.tokens
+                    break
+            else:
+                packs.append([article])
+                totals.append(article.tokens)
+        else:
+            packs.append([article])
+            totals.append(article.tokens)
+    return packs
+
+
+def _usage_share(usage: Usage, share: float) -> Usage:
+    return Usage(
+        requests=usage.requests,
+        request_tokens=round((usage.request_tokens or 0) * share),
+        response_tokens=round((usage.response_tokens or 0) * share),
+        total_tokens=round((usage.total_tokens or 0) * share),
+    )
+
+
+def build_analysis_record(
+    article_id: int,
+    content_analysis: ContentAnalysis,
+    validation_result: Optional[SignalValidation],
+    processing_time_ms: Optional[int],
+    token_usage: int,
+    cost_usd: float,
+    condensed: Optional[CondensedArticle] = None,
+) -> ArticleAnalysis:
+    """Map agent outputs to an ``ArticleAnalysis`` row (not yet added)."""
+    return ArticleAnalysis(
+        article_id=article_id,
+        analysis_version="1.0",
+        # Core analysis fields
+        sentiment=content_analysis.sentiment,
+        impact_score=content_analysis.impact_score,
+        summary=content_analysis.summary,
+        context=content_analysis.context,
+        # Signal detection fields (convert to JSONB)
+        weak_signals=[signal.model_dump() for signal in content_analysis.weak_signals],
+        pattern_anomalies=[
+            anomaly.model_dump() for anomaly in content_analysis.pattern_anomalies
+        ],
+        adjacent_connections=[
+            conn.model_dump() for conn in content_analysis.adjacent_connections
+        ],
+        narrative_gaps=content_analysis.narrative_gaps,
+        edge_indicators=content_analysis.edge_indicators,
+        # Validation fields
+        verified_facts=[
+            result.model_dump() for result in validation_result.validation_results
+        ]
+        if validation_result
+        else [],
+        research_sources=[],  # Could be extracted from validation results
+        validation_status="COMPLETED" if validation_result else "PENDING",
+        # Quality metrics
+        analysis_confidence=content_analysis.analysis_confidence,
+        signal_strength=content_analysis.signal_strength,
+        uniqueness_score=content_analysis.uniqueness_score,
+        # Processing metadata
+        processing_time_ms=processing_time_ms,
+        token_usage=token_usage,
+        cost_usd=cost_usd,
+        article_tokens=condensed.original_tokens if condensed else None,
+        condensed_tokens=condensed.condensed_tokens if condensed else None,
+    )
+
+
+async def existing_analysis_id(
+    db: AsyncSession, article_id: int, analysis_version: str = "1.0"
+) -> Optional[int]:
+    """
+    Id of the article's stored analysis of ``analysis_version``, if any.
+
+    ``uq_article_analysis_version`` only holds within one monthly partition,
+    so the key stays locked until the transaction ends: a writer that finds
+    nothing can insert without racing a duplicate into another month.
+    """
+    await lock_unique_key(db, "article_analyses", article_id, analysis_version)
+    return await db.scalar(
+        select(ArticleAnalysis.id)
+        .where(
+            ArticleAnalysis.article_id == article_id,
+            ArticleAnalysis.analysis_version == analysis_version,
+        )
+        .limit(1)
+    )
+
+
 class AnalysisOrchestrator:
     """Orchestrates multi-agent analysis workflow."""
 
@@ -29,10 +186,15 @@ class AnalysisOrchestrator:
         body: str,
         publisher: str,
         deps: AnalysisDependencies,
+        packed: Optional[PackedAnalysis] = None,
     ) -> dict[str, Any]:
         """
         Complete analysis workflow: content analysis + signal validation.
 
+        ``packed`` is this article's share of a packed content analysis
+        (see ``analyze_content_packed``); the content analysis call is then
+        skipped.
+
         Returns:
             Dict with analysis results, validation results, costs, and metadata
         """
@@ -41,23 +203,45 @@ class AnalysisOrchestrator:
             deps.current_article_id = article_id
             deps.current_publisher = publisher
 
-            # Step 1: Content Analysis
-            logger.info(f"Starting content analysis for article {article_id}")
-            formatted_content = format_article_for_analysis(title, body, publisher)
+            started = time.perf_counter()
 
-            content_result = await content_analysis_agent.run(
-                formatted_content, deps=deps
-            )
+            # Step 0: Strip boilerplate and fit the body to the token budget
+            condensed = packed.condensed if packed else None
+            if packed is None and analysis_settings.condense_articles:
+                condensed = condense_article(
+                    body, analysis_settings.article_token_budget
+                )
+                # An article that is all boilerplate is sent as it came
+                body = condensed.text or body
+                logger.info(
+                    f"Condensed article {article_id}: "
+                    f"{condensed.original_tokens} -> {condensed.condensed_tokens} "
+                    f"tokens (saved {condensed.tokens_saved})"
+                )
+
+            # Step 1: Content Analysis
+            if packed is not None:
+                content_result = packed.run
+            else:
+                logger.info(f"Starting content analysis for article {article_id}")
+                formatted_content = format_article_for_analysis(title, body, publisher)
+                content_result = await self._run_agent(
+                    "content_analysis", content_analysis_agent, formatted_content, deps
+                )
 
             content_analysis: ContentAnalysis = content_result.output
-            content_usage: Usage = content_result.usage()
+            content_usage: Usage = content_result.usage
 
             # Calculate cost based on token usage (Gemini 2.5 Flash pricing)
             # Approximate cost: $0.075 per 1M input tokens, $0.30 per 1M output tokens
+            # A cached result was paid for by an earlier analysis
             input_tokens = content_usage.request_tokens or 0
             output_tokens = content_usage.response_tokens or 0
-            estimated_cost = (input_tokens * 0.075 / 1_000_000) + (
-                output_tokens * 0.30 / 1_000_000
+            estimated_cost = (
+                0.0
+                if content_result.cached
+                else (input_tokens * 0.075 / 1_000_000)
+                + (output_tokens * 0.30 / 1_000_000)
             )
 
             # Track costs
@@ -91,18 +275,24 @@ class AnalysisOrchestrator:
                         high_confidence_signals
                     )
 
-                    validation_result_obj = await signal_validation_agent.run(
-                        formatted_signals, deps=deps
+                    validation_result_obj = await self._run_agent(
+                        "signal_validation",
+                        signal_validation_agent,
+                        formatted_signals,
+                        deps,
                     )
 
                     validation_result: SignalValidation = validation_result_obj.output
-                    validation_usage: Usage = validation_result_obj.usage()
+                    validation_usage: Usage = validation_result_obj.usage
 
                     # Calculate validation cost based on token usage
                     val_input_tokens = validation_usage.request_tokens or 0
                     val_output_tokens = validation_usage.response_tokens or 0
-                    validation_cost = (val_input_tokens * 0.075 / 1_000_000) + (
-                        val_output_tokens * 0.30 / 1_000_000
+                    validation_cost = (
+                        0.0
+                        if validation_result_obj.cached
+                        else (val_input_tokens * 0.075 / 1_000_000)
+                        + (val_output_tokens * 0.30 / 1_000_000)
                     )
 
                     # Track additional costs
@@ -117,8 +307,9 @@ class AnalysisOrchestrator:
             else:
                 logger.info("Skipping validation: no signals or insufficient budget")
 
-            # Combine results
-            total_cost = deps.cost_tracker.total_cost
+            # Combine results (the tracker may be shared by other articles)
+            total_cost = estimated_cost + (validation_cost if validation_usage else 0.0)
+            processing_time_ms = int((time.perf_counter() - started) * 1000)
 
             # Store results in database (only if db_session is provided)
             analysis_record_id = None
@@ -131,6 +322,8 @@ class AnalysisOrchestrator:
                     content_usage=content_usage,
                     validation_usage=validation_usage,
                     deps=deps,
+                    processing_time_ms=processing_time_ms,
+                    condensed=condensed,
                 )
             else:
                 logger.info("Skipping database storage - will be handled by calling task")
@@ -154,7 +347,16 @@ class AnalysisOrchestrator:
                     "total_tokens": (content_usage.total_tokens or 0)
                     + (validation_usage.total_tokens or 0 if validation_usage else 0),
                 },
+                "cache": {
+                    "content_analysis": content_result.cached,
+                    "signal_validation": validation_result_obj.cached
+                    if validation_usage
+                    else False,
+                },
+                "condensation": condensed.report() if condensed else None,
+                "packed": packed.pack_size if packed else None,
                 "processing_metadata": {
+                    "processing_time_ms": processing_time_ms,
                     "signals_found": len(content_analysis.weak_signals),
                     "signals_validated": len(validation_result.validation_results)
                     if validation_result
@@ -174,6 +376,130 @@ class AnalysisOrchestrator:
                 "costs": {"total": deps.cost_tracker.total_cost},
             }
 
+    async def analyze_content_packed(
+        self, articles: Sequence[PackableArticle], deps: AnalysisDependencies
+    ) -> dict[int, PackedAnalysis]:
+        """
+        Content analysis of short articles, several per request.
+
+        Articles are condensed and grouped by ``plan_packs`` under
+        ``PACK_TOKEN_BUDGET``. Each pack is one request to the packed agent,
+        whose output lists one ContentAnalysis per ARTICLE ID. Token usage,
+        and so cost, is split between the pack's articles by their share of
+        its body tokens.
+
+        Returns:
+            Article ID -> PackedAnalysis, to be passed to ``analyze_article``.
+            Articles not in the result (too long, alone in their pack, or
+            missing from a malformed or failed response) should be analyzed
+            with single-article calls.
+        """
+        for article in articles:
+            if article.condensed is None:
+                article.condensed = condense_article(
+                    article.body,
+                    analysis_settings.article_token_budget
+                    if analysis_settings.condense_articles
+                    else 10**9,
+                )
+        packs = [
+            pack
+            for pack in plan_packs(
+                articles,
+                analysis_settings.pack_token_budget,
+                analysis_settings.pack_max_articles,
+                analysis_settings.pack_article_max_tokens,
+            )
+            if len(pack) > 1
+        ]
+        results: dict[int, PackedAnalysis] = {}
+        for pack_results in await asyncio.gather(
+            *(self._analyze_pack(pack, deps) for pack in packs)
+        ):
+            results.update(pack_results)
+        return results
+
+    async def _analyze_pack(
+        self, pack: list[PackableArticle], deps: AnalysisDependencies
+    ) -> dict[int, PackedAnalysis]:
+        ids = [article.article_id for article in pack]
+        prompt = format_articles_for_packed_analysis(
+            [
+                (a.article_id, a.title, a.condensed.text or a.body, a.publisher)
+                for a in pack
+            ]
+        )
+        try:
+            run = await self._run_agent(
+                "packed_content_analysis", packed_content_analysis_agent, prompt, deps
+            )
+        except Exception as e:
+            logger.warning(f"Packed analysis of articles {ids} failed: {e}")
+            return {}
+
+        by_id: dict[int, list[ContentAnalysis]] = {}
+        for analysis in run.output.analyses:
+            by_id.setdefault(analysis.article_id, []).append(analysis)
+        total_tokens = sum(article.tokens for article in pack) or 1
+
+        results = {}
+        for article in pack:
+            analyses = by_id.get(article.article_id, [])
+            if len(analyses) != 1:
+                continue
+            share = article.tokens / total_tokens
+            results[article.article_id] = PackedAnalysis(
+                run=AgentRun(
+                    output=ContentAnalysis.model_validate(
+                        analyses[0].model_dump(exclude={"article_id"})
+                    ),
+                    usage=_usage_share(run.usage, share),
+                    cached=run.cached,
+                ),
+                condensed=article.condensed,
+                share=share,
+                pack_size=len(pack),
+            )
+        if len(results) < len(pack):
+            missing = sorted(set(ids) - set(results))
+            logger.warning(
+                f"Packed analysis returned no usable result for articles {missing}; "
+                "they fall back to single-article calls"
+            )
+        return results
+
+    async def _run_agent(
+        self, agent_name: str, agent: Agent, prompt: str, deps: AnalysisDependencies
+    ) -> AgentRun:
+        """
+        Run an agent, or return its cached output for an identical request.
+
+        Only cache misses count against the LLM request rate limit and take
+        a slot of the model's adaptive concurrency limit.
+        """
+        cache = get_llm_cache()
+        key = cache.key(agent_name, agent, prompt) if cache.enabled else None
+        if key is not None:
+            cached = await cache.get(key, agent.output_type)
+            if cached is not None:
+                logger.info(
+                    f"{agent_name} served from cache (hit rate {cache.hit_rate:.0%})"
+                )
+                return cached
+
+        await get_llm_rate_limiter().acquire()
+        # Validation runs searches between its model requests
+        timeout = (
+            analysis_settings.llm_tool_agent_timeout_seconds
+            if agent is signal_validation_agent
+            else analysis_settings.llm_call_timeout_seconds
+        )
+        result = await run_agent(agent, prompt, timeout=timeout, deps=deps)
+        run = AgentRun(output=result.output, usage=result.usage())
+        if key is not None:
+            await cache.set(key, agent_name, agent, run.output, run.usage)
+        return run
+
     async def _store_analysis_results(
         self,
         article_id: int,
@@ -183,58 +509,40 @@ class AnalysisOrchestrator:
         content_usage: Usage,
         validation_usage: Optional[Usage],
         deps: AnalysisDependencies,
+        processing_time_ms: Optional[int] = None,
+        condensed: Optional[CondensedArticle] = None,
     ) -> int:
         """Store analysis results in the database."""
         try:
-            # Calculate processing time (estimate based on token usage)
             total_tokens = (content_usage.total_tokens or 0) + (
                 validation_usage.total_tokens or 0 if validation_usage else 0
             )
-            processing_time_ms = int(total_tokens * 0.1)  # Rough estimate
-
-            # Create ArticleAnalysis record
-            analysis_record = ArticleAnalysis(
-                article_id=article_id,
-                analysis_version="1.0",
-                # Core analysis fields
-                sentiment=content_analysis.sentiment,
-                impact_score=content_analysis.impact_score,
-                summary=content_analysis.summary,
-                context=content_analysis.context,
-                # Signal detection fields (convert to JSONB)
-                weak_signals=[
-                    signal.model_dump() for signal in content_analysis.weak_signals
-                ],
-                pattern_anomalies=[
-                    anomaly.model_dump()
-                    for anomaly in content_analysis.pattern_anomalies
-                ],
-                adjacent_connections=[
-                    conn.model_dump() for conn in content_analysis.adjacent_connections
-                ],
-                narrative_gaps=content_analysis.narrative_gaps,
-                edge_indicators=content_analysis.edge_indicators,
-                # Validation fields
-                verified_facts=[
-                    result.model_dump()
-                    for result in validation_result.validation_results
-                ]
-                if validation_result
-                else [],
-                research_sources=[],  # Could be extracted from validation results
-                validation_status="COMPLETED" if validation_result else "PENDING",
-                # Quality metrics
-                analysis_confidence=content_analysis.analysis_confidence,
-                signal_strength=content_analysis.signal_strength,
-                uniqueness_score=content_analysis.uniqueness_score,
-                # Processing metadata
+            if processing_time_ms is None:
+                processing_time_ms = int(total_tokens * 0.1)  # Rough estimate
+
+            existing_id = await existing_analysis_id(deps.db_session, article_id)
+            if existing_id is not None:
+                # Stored by a concurrent analysis of the same article
+                await deps.db_session.commit()
+                logger.info(
+                    f"Analysis for article {article_id} already stored "
+                    f"with ID {existing_id}"
+                )
+                return existing_id
+
+            analysis_record = build_analysis_record(
+                article_id,
+                content_analysis,
+                validation_result,
                 processing_time_ms=processing_time_ms,
                 token_usage=total_tokens,
                 cost_usd=total_cost,
+                condensed=condensed,
             )
 
             # Store in database
             deps.db_session.add(analysis_record)
+            await store_analysis_signals(deps.db_session, analysis_record)
             await deps.db_session.commit()
             await deps.db_session.refresh(analysis_record)
 
@@ -3,6 +3,7 @@
 import os
 from typing import Union
 
+from pydantic_ai.models import Model
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.models.test import TestModel
 
@@ -45,3 +46,12 @@ def get_signal_validation_model() -> Union[GoogleModel, TestModel]:
     return GoogleModel(
         model_name=analysis_settings.signal_validation_model,
     )
+
+
+async def warm_up_model(model: Model) -> None:
+    """
+    Open the provider connection of ``model`` from the running loop with a
+    metadata request (not billed); test models need nothing.
+    """
+    if isinstance(model, GoogleModel):
+        await model.client.aio.models.get(model=model.model_name)
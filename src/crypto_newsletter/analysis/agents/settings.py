@@ -39,11 +39,98 @@ class AnalysisSettings(BaseSettings):
     max_searches_per_validation: int = Field(
         default=5, alias="MAX_SEARCHES_PER_VALIDATION"
     )
+    # Budget ledger shared by all workers (backend: redis, or local for tests
+    # and single-process runs)
+    budget_ledger_backend: str = Field(default="redis", alias="BUDGET_LEDGER_BACKEND")
+    budget_hold_seconds: float = Field(default=900.0, alias="BUDGET_HOLD_SECONDS")
+
+    # External search (backend: tavily or stub)
+    search_backend: str = Field(default="tavily", alias="SEARCH_BACKEND")
+    search_cache_ttl_seconds: float = Field(
+        default=3600.0, alias="SEARCH_CACHE_TTL_SECONDS"
+    )
+    search_cache_size: int = Field(default=512, alias="SEARCH_CACHE_SIZE")
+    max_parallel_searches: int = Field(default=4, alias="MAX_PARALLEL_SEARCHES")
+    search_timeout_seconds: float = Field(default=20.0, alias="SEARCH_TIMEOUT_SECONDS")
 
     # Quality Thresholds
     min_content_length: int = Field(default=2000, alias="MIN_CONTENT_LENGTH")
+
+    # Input condensation (article body tokens sent to content analysis)
+    condense_articles: bool = Field(default=True, alias="CONDENSE_ARTICLES")
+    article_token_budget: int = Field(default=2000, alias="ARTICLE_TOKEN_BUDGET")
+
+    # Packed analysis: several short articles per content analysis request
+    analysis_packing: bool = Field(default=False, alias="ANALYSIS_PACKING")
+    pack_token_budget: int = Field(default=6000, alias="PACK_TOKEN_BUDGET")
+    pack_max_articles: int = Field(default=8, alias="PACK_MAX_ARTICLES")
+    pack_article_max_tokens: int = Field(
+        default=800, alias="PACK_ARTICLE_MAX_TOKENS"
+    )
     min_signal_confidence: float = Field(default=0.3, alias="MIN_SIGNAL_CONFIDENCE")
 
+    # Provider limits (shared by all analyses in a worker process)
+    llm_requests_per_minute: float = Field(
+        default=60.0, alias="LLM_REQUESTS_PER_MINUTE"
+    )
+    llm_max_concurrency: int = Field(default=8, alias="LLM_MAX_CONCURRENCY")
+
+    # Adaptive concurrency per model, between the minimum and
+    # LLM_MAX_CONCURRENCY, with a circuit breaker
+    llm_min_concurrency: int = Field(default=1, alias="LLM_MIN_CONCURRENCY")
+    llm_latency_target_seconds: float = Field(
+        default=30.0, alias="LLM_LATENCY_TARGET_SECONDS"
+    )
+    # Wall-clock limit of one agent run: single-request agents, agents that
+    # search between requests (signal validation) and newsletter agents
+    llm_call_timeout_seconds: float = Field(
+        default=120.0, alias="LLM_CALL_TIMEOUT_SECONDS"
+    )
+    llm_tool_agent_timeout_seconds: float = Field(
+        default=300.0, alias="LLM_TOOL_AGENT_TIMEOUT_SECONDS"
+    )
+    llm_newsletter_timeout_seconds: float = Field(
+        default=600.0, alias="LLM_NEWSLETTER_TIMEOUT_SECONDS"
+    )
+    llm_breaker_failure_threshold: int = Field(
+        default=5, alias="LLM_BREAKER_FAILURE_THRESHOLD"
+    )
+    llm_breaker_reset_seconds: float = Field(
+        default=60.0, alias="LLM_BREAKER_RESET_SECONDS"
+    )
+
+    # Provider batch jobs for backlog articles (backend: gemini or stub)
+    backlog_batch_jobs: bool = Field(default=False, alias="BACKLOG_BATCH_JOBS")
+    batch_job_backend: str = Field(default="gemini", alias="BATCH_JOB_BACKEND")
+    batch_job_max_articles: int = Field(default=200, alias="BATCH_JOB_MAX_ARTICLES")
+    batch_job_poll_interval_seconds: int = Field(
+        default=600, alias="BATCH_JOB_POLL_INTERVAL_SECONDS"
+    )
+    batch_job_timeout_hours: float = Field(
+        default=48.0, alias="BATCH_JOB_TIMEOUT_HOURS"
+    )
+    batch_job_stub_dir: str = Field(
+        default=".cache/batch-jobs", alias="BATCH_JOB_STUB_DIR"
+    )
+
+    # Result cache (backend: database, disk or none)
+    llm_cache_backend: str = Field(default="database", alias="LLM_CACHE_BACKEND")
+    llm_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 3600, alias="LLM_CACHE_TTL_SECONDS"
+    )
+    llm_cache_max_entries: int = Field(default=10_000, alias="LLM_CACHE_MAX_ENTRIES")
+    llm_cache_dir: str = Field(
+        default=".cache/llm-results", alias="LLM_CACHE_DIR"
+    )
+
+    # Runtime
+    analysis_timeout_seconds: float = Field(
+        default=300.0, alias="ANALYSIS_TIMEOUT_SECONDS"
+    )
+    runtime_drain_timeout_seconds: float = Field(
+        default=30.0, alias="ANALYSIS_RUNTIME_DRAIN_TIMEOUT"
+    )
+
     # Testing
     testing: bool = Field(default=False, alias="TESTING")
 
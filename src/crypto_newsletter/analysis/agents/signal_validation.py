@@ -2,13 +2,12 @@
 
 
 from pydantic_ai import Agent, RunContext
-from tavily import TavilyClient
 
 from ..dependencies import AnalysisDependencies
 from ..models.signals import WeakSignal
 from ..models.validation import SignalValidation
+from ..search import format_results, get_external_search
 from .providers import get_signal_validation_model
-from .settings import analysis_settings
 
 # Signal Validation Agent with Tavily integration
 signal_validation_agent = Agent(
@@ -26,6 +25,7 @@ VALIDATION APPROACH:
 
 RESEARCH QUALITY STANDARDS:
 • Use 3-5 targeted searches per validation cycle
+• Pass related queries to a single search call; they run in parallel
 • Focus on sources published within the last 6 months when possible
 • Clearly distinguish between supporting and contradicting evidence
 • Provide specific data points and examples, not general statements
@@ -49,33 +49,40 @@ Focus on research that provides actionable intelligence for market participants.
 
 @signal_validation_agent.tool
 async def search_external_sources(
-    ctx: RunContext[AnalysisDependencies], query: str, max_results: int = 3
+    ctx: RunContext[AnalysisDependencies], queries: list[str], max_results: int = 3
 ) -> str:
-    """Search external sources using Tavily for signal validation."""
-    if not analysis_settings.tavily_api_key:
+    """
+    Search external sources for signal validation, up to
+    ``max_searches_per_validation`` searches over all calls.
+
+    Args:
+        queries: One or more targeted search queries; they run in parallel
+        max_results: Results per query
+    """
+    search = get_external_search()
+    if search is None:
         return "External search unavailable: No Tavily API key configured"
 
-    try:
-        client = TavilyClient(api_key=analysis_settings.tavily_api_key)
-        response = client.search(
-            query=query,
-            max_results=max_results,
-            search_depth="advanced",
-            include_domains=["coindesk.com", "cointelegraph.com", "decrypt.co"],
+    limit = ctx.deps.max_searches_per_validation
+    remaining = max(0, limit - ctx.deps.searches_used)
+    if queries and not remaining:
+        return f"Search limit reached: {limit} searches per validation"
+
+    allowed = queries[:remaining]
+    ctx.deps.searches_used += len(allowed)
+    sections = []
+    for query, results in await search.search_many(allowed, max_results):
+        if isinstance(results, Exception):
+            body = f"Search error: {results}"
+        else:
+            body = format_results(results)
+        sections.append(f"QUERY: {query}\n\n{body}")
+    if len(queries) > remaining:
+        sections.append(
+            f"Skipped {len(queries) - remaining} queries: "
+            f"limit is {limit} searches per validation"
         )
-
-        results = []
-        for result in response.get("results", []):
-            results.append(
-                f"Source: {result.get('title', 'Unknown')}\n"
-                f"URL: {result.get('url', 'N/A')}\n"
-                f"Content: {result.get('content', 'No content')[:500]}...\n"
-            )
-
-        return "\n---\n".join(results) if results else "No relevant sources found"
-
-    except Exception as e:
-        return f"Search error: {str(e)}"
+    return "\n\n===\n\n".join(sections) if sections else "No queries given"
 
 
 def format_signals_for_validation(signals: list[WeakSignal]) -> str:
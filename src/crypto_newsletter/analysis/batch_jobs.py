@@ -0,0 +1,645 @@
+"""
+Provider batch jobs for non-urgent content analysis.
+
+Backlog articles do not need an answer within seconds. Instead of
+interactive calls they can go through the provider's asynchronous batch
+endpoint: requests are written as JSONL, submitted as one job, polled until
+the job finishes, and the outputs are validated before they are stored.
+Batch requests are billed at a discount and are not paced by the
+interactive LLM rate limiter.
+
+A job's estimated cost is reserved in the budget ledger when it is
+submitted and settled with its actual cost when it completes (or released
+when it fails), so jobs cannot commit more than the day's budget either.
+Jobs still running at BATCH_JOB_TIMEOUT_HOURS are cancelled at the provider.
+"""
+
+import asyncio
+import io
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional, Protocol
+
+from google import genai
+from google.genai import types
+from pydantic import BaseModel, ValidationError
+from pydantic_ai import Agent
+from pydantic_ai.profiles.google import GoogleJsonSchemaTransformer
+from pydantic_ai.usage import Usage
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from ..core.storage.signals import store_analysis_signals
+from ..shared.database.partitions import lock_unique_key
+from ..shared.models.models import AnalysisBatchJob, Article, ArticleAnalysis
+from .agents.content_analysis import content_analysis_agent, format_article_for_analysis
+from .agents.orchestrator import build_analysis_record
+from .agents.settings import analysis_settings
+from .budget import Reservation, get_budget_ledger
+from .condense import condense_article, estimate_tokens
+from .models.analysis import ContentAnalysis
+
+logger = logging.getLogger(__name__)
+
+BATCH_BACKENDS = ("gemini", "stub")
+# Provider job states, normalized; the last four are final
+JOB_STATES = ("PENDING", "RUNNING", "SUCCEEDED", "FAILED", "CANCELLED", "EXPIRED")
+FINAL_STATES = frozenset(JOB_STATES[2:])
+# Jobs whose articles must not be selected again
+OPEN_JOB_STATUSES = ("SUBMITTED", "RUNNING")
+# Batch requests cost half the interactive price (same per-token rates as
+# the orchestrator's estimate)
+BATCH_PRICE_FACTOR = 0.5
+INPUT_PRICE_PER_MILLION = 0.075
+OUTPUT_PRICE_PER_MILLION = 0.30
+# Output tokens assumed per request when reserving a job's budget
+ESTIMATED_OUTPUT_TOKENS = 1_000
+
+_KEY_PREFIX = "article-"
+_GEMINI_STATES = {
+    "JOB_STATE_SUCCEEDED": "SUCCEEDED",
+    "JOB_STATE_PARTIALLY_SUCCEEDED": "SUCCEEDED",
+    "JOB_STATE_FAILED": "FAILED",
+    "JOB_STATE_CANCELLED": "CANCELLED",
+    "JOB_STATE_EXPIRED": "EXPIRED",
+    "JOB_STATE_QUEUED": "PENDING",
+    "JOB_STATE_PENDING": "PENDING",
+}
+
+
+@dataclass
+class BatchJobStatus:
+    """State of a submitted job, normalized across backends."""
+
+    state: str
+    error: Optional[str] = None
+
+    @property
+    def done(self) -> bool:
+        return self.state in FINAL_STATES
+
+
+class BatchJobBackend(Protocol):
+    name: str
+    model: str
+
+    async def submit(self, requests_jsonl: str, display_name: str) -> str:
+        """Submit a JSONL file of keyed requests; returns the job id."""
+        ...
+
+    async def status(self, job_id: str) -> BatchJobStatus: ...
+
+    async def results(self, job_id: str) -> str:
+        """JSONL of keyed responses of a finished job."""
+        ...
+
+    async def cancel(self, job_id: str) -> None:
+        """Stop a job at the provider; its unfinished requests are not billed."""
+        ...
+
+
+class GeminiBatchBackend:
+    """The Gemini API batch mode: an uploaded JSONL file in, a file out."""
+
+    name = "gemini"
+
+    def __init__(self, api_key: str, model: str) -> None:
+        self.client = genai.Client(api_key=api_key)
+        self.model = model
+
+    async def submit(self, requests_jsonl: str, display_name: str) -> str:
+        uploaded = await self.client.aio.files.upload(
+            file=io.BytesIO(requests_jsonl.encode()),
+            config=types.UploadFileConfig(display_name=display_name, mime_type="jsonl"),
+        )
+        job = await self.client.aio.batches.create(
+            model=self.model,
+            src=uploaded.name,
+            config=types.CreateBatchJobConfig(display_name=display_name),
+        )
+        return job.name
+
+    async def status(self, job_id: str) -> BatchJobStatus:
+        job = await self.client.aio.batches.get(name=job_id)
+        state = job.state.name if job.state else ""
+        return BatchJobStatus(
+            state=_GEMINI_STATES.get(state, "RUNNING"),
+            error=job.error.message if job.error else None,
+        )
+
+    async def results(self, job_id: str) -> str:
+        job = await self.client.aio.batches.get(name=job_id)
+        if not (job.dest and job.dest.file_name):
+            raise ValueError(f"Batch job {job_id} has no result file")
+        data = await self.client.aio.files.download(file=job.dest.file_name)
+        return data.decode()
+
+    async def cancel(self, job_id: str) -> None:
+        await self.client.aio.batches.cancel(name=job_id)
+
+
+def stub_content_analysis(request: dict[str, Any]) -> str:
+    """Neutral, schema-valid content analysis for the stub backend."""
+    prompt = request["contents"][0]["parts"][0]["text"]
+    title = prompt.split("\n", 1)[0].removeprefix("TITLE: ")
+    return ContentAnalysis(
+        sentiment="NEUTRAL",
+        impact_score=0.0,
+        summary=f"Stub analysis of {title}.",
+        context="Generated by the stub batch backend.",
+        weak_signals=[],
+        pattern_anomalies=[],
+        adjacent_connections=[],
+        narrative_gaps=[],
+        edge_indicators=[],
+        analysis_confidence=0.5,
+        signal_strength=0.0,
+        uniqueness_score=0.0,
+    ).model_dump_json()
+
+
+class StubBatchBackend:
+    """
+    Local stand-in for a provider batch endpoint.
+
+    Jobs are directories holding the submitted requests, so a job submitted
+    by one worker can be polled by another. A job finishes
+    ``completion_seconds`` after submission; its responses come from
+    ``responder`` in the provider's response format.
+    """
+
+    name = "stub"
+    model = "stub"
+
+    def __init__(
+        self,
+        directory: str | Path,
+        completion_seconds: float = 0.0,
+        responder: Callable[[dict[str, Any]], str] = stub_content_analysis,
+    ) -> None:
+        self.directory = Path(directory)
+        self.completion_seconds = completion_seconds
+        self.responder = responder
+
+    def _job_dir(self, job_id: str) -> Path:
+        return self.directory / job_id
+
+    def _submit(self, requests_jsonl: str, display_name: str) -> str:
+        job_id = f"stub-{uuid.uuid4().hex}"
+        job_dir = self._job_dir(job_id)
+        job_dir.mkdir(parents=True)
+        (job_dir / "requests.jsonl").write_text(requests_jsonl)
+        meta = {"display_name": display_name, "submitted_at": time.time()}
+        with tempfile.NamedTemporaryFile(
+            "w", dir=job_dir, delete=False, suffix=".tmp"
+        ) as handle:
+            json.dump(meta, handle)
+        os.replace(handle.name, job_dir / "job.json")
+        return job_id
+
+    def _status(self, job_id: str) -> BatchJobStatus:
+        meta_path = self._job_dir(job_id) / "job.json"
+        if not meta_path.exists():
+            return BatchJobStatus("FAILED", error=f"Unknown job {job_id}")
+        meta = json.loads(meta_path.read_text())
+        if (self._job_dir(job_id) / "cancelled").exists():
+            return BatchJobStatus("CANCELLED")
+        if time.time() - meta["submitted_at"] < self.completion_seconds:
+            return BatchJobStatus("RUNNING")
+        return BatchJobStatus("SUCCEEDED")
+
+    def _results(self, job_id: str) -> str:
+        lines = []
+        requests_path = self._job_dir(job_id) / "requests.jsonl"
+        for line in requests_path.read_text().splitlines():
+            entry = json.loads(line)
+            request = entry["request"]
+            text = self.responder(request)
+            prompt = request["contents"][0]["parts"][0]["text"]
+            system = request["system_instruction"]["parts"][0]["text"]
+            prompt_tokens = estimate_tokens(system) + estimate_tokens(prompt)
+            output_tokens = estimate_tokens(text)
+            response = {
+                "candidates": [{"content": {"parts": [{"text": text}]}}],
+                "usageMetadata": {
+                    "promptTokenCount": prompt_tokens,
+                    "candidatesTokenCount": output_tokens,
+                    "totalTokenCount": prompt_tokens + output_tokens,
+                },
+            }
+            lines.append(json.dumps({"key": entry["key"], "response": response}))
+        return "\n".join(lines) + "\n"
+
+    async def submit(self, requests_jsonl: str, display_name: str) -> str:
+        return await asyncio.to_thread(self._submit, requests_jsonl, display_name)
+
+    async def status(self, job_id: str) -> BatchJobStatus:
+        return await asyncio.to_thread(self._status, job_id)
+
+    async def results(self, job_id: str) -> str:
+        return await asyncio.to_thread(self._results, job_id)
+
+    async def cancel(self, job_id: str) -> None:
+        job_dir = self._job_dir(job_id)
+        if not job_dir.exists():
+            raise ValueError(f"Unknown job {job_id}")
+        await asyncio.to_thread((job_dir / "cancelled").touch)
+
+
+def build_batch_request(key: str, prompt: str, agent: Agent) -> dict[str, Any]:
+    """
+    One JSONL line: the agent's system prompt and output schema around
+    ``prompt``, in the provider's (Gemini ``GenerateContentRequest``) format.
+    """
+    schema = GoogleJsonSchemaTransformer(
+        agent.output_type.model_json_schema(), strict=None
+    ).walk()
+    return {
+        "key": key,
+        "request": {
+            "system_instruction": {
+                "parts": [{"text": "\n\n".join(agent._system_prompts)}]
+            },
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generation_config": {
+                "response_mime_type": "application/json",
+                "response_json_schema": schema,
+            },
+        },
+    }
+
+
+def build_content_analysis_jsonl(
+    articles: Sequence[tuple[int, str, str, Optional[str]]],
+) -> str:
+    """
+    Content analysis requests for ``(article_id, title, body, publisher)``,
+    with bodies condensed as for interactive analysis.
+    """
+    lines = []
+    for article_id, title, body, publisher in articles:
+        if analysis_settings.condense_articles:
+            condensed = condense_article(body, analysis_settings.article_token_budget)
+            body = condensed.text or body
+        prompt = format_article_for_analysis(title, body, publisher)
+        request = build_batch_request(
+            f"{_KEY_PREFIX}{article_id}", prompt, content_analysis_agent
+        )
+        lines.append(json.dumps(request))
+    return "\n".join(lines) + "\n"
+
+
+@dataclass
+class BatchResult:
+    """A validated output, or why one response could not be used."""
+
+    article_id: int
+    output: Optional[BaseModel] = None
+    usage: Usage = field(default_factory=Usage)
+    error: Optional[str] = None
+
+
+def _get(mapping: dict[str, Any], camel: str, snake: str) -> Any:
+    return mapping.get(camel, mapping.get(snake))
+
+
+def parse_batch_results(
+    results_jsonl: str, output_type: type[BaseModel]
+) -> dict[int, BatchResult]:
+    """
+    Validate each keyed response against ``output_type``.
+
+    Responses that errored, are empty or fail validation come back with an
+    ``error`` and no output; lines without an article key are skipped.
+    """
+    results: dict[int, BatchResult] = {}
+    for line in results_jsonl.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        key = str(entry.get("key", ""))
+        if not key.startswith(_KEY_PREFIX):
+            logger.warning(f"Skipping batch response with unexpected key {key!r}")
+            continue
+        result = BatchResult(article_id=int(key.removeprefix(_KEY_PREFIX)))
+        results[result.article_id] = result
+
+        response = entry.get("response")
+        if not response:
+            error = entry.get("error") or entry.get("status") or "no response"
+            result.error = str(
+                error.get("message", error) if isinstance(error, dict) else error
+            )
+            continue
+        metadata = _get(response, "usageMetadata", "usage_metadata") or {}
+        input_tokens = _get(metadata, "promptTokenCount", "prompt_token_count") or 0
+        output_tokens = (
+            _get(metadata, "candidatesTokenCount", "candidates_token_count") or 0
+        )
+        result.usage = Usage(
+            requests=1,
+            request_tokens=input_tokens,
+            response_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+        )
+
+        candidates = response.get("candidates") or []
+        parts = (
+            (candidates[0].get("content") or {}).get("parts", []) if candidates else []
+        )
+        text = "".join(p.get("text", "") for p in parts if not p.get("thought"))
+        try:
+            result.output = output_type.model_validate_json(text)
+        except ValidationError as e:
+            result.error = f"invalid output: {e.error_count()} validation errors"
+    return results
+
+
+def batch_cost(usage: Usage) -> float:
+    return (
+        (
+            (usage.request_tokens or 0) * INPUT_PRICE_PER_MILLION
+            + (usage.response_tokens or 0) * OUTPUT_PRICE_PER_MILLION
+        )
+        / 1_000_000
+        * BATCH_PRICE_FACTOR
+    )
+
+
+def estimate_batch_cost(requests_jsonl: str) -> float:
+    """
+    Cost to reserve for a job: the requests' prompt tokens, plus
+    ESTIMATED_OUTPUT_TOKENS per request.
+    """
+    prompt_tokens = requests = 0
+    for line in requests_jsonl.splitlines():
+        if not line.strip():
+            continue
+        request = json.loads(line)["request"]
+        contents = [request["system_instruction"], *request["contents"]]
+        prompt_tokens += sum(
+            estimate_tokens(part.get("text", ""))
+            for content in contents
+            for part in content["parts"]
+        )
+        requests += 1
+    return batch_cost(
+        Usage(
+            request_tokens=prompt_tokens,
+            response_tokens=requests * ESTIMATED_OUTPUT_TOKENS,
+        )
+    )
+
+
+def _hold_seconds() -> float:
+    """A job's budget is held until it may have timed out and been polled."""
+    return (
+        analysis_settings.batch_job_timeout_hours * 3600
+        + 2 * analysis_settings.batch_job_poll_interval_seconds
+    )
+
+
+def _reservation(job: AnalysisBatchJob) -> Optional[Reservation]:
+    if not (job.budget_hold_id and job.budget_day):
+        return None
+    return Reservation(
+        job.budget_hold_id, job.budget_day, float(job.estimated_cost_usd or 0.0)
+    )
+
+
+async def _open_job_article_ids(db: AsyncSession) -> set[int]:
+    rows = await db.scalars(
+        select(AnalysisBatchJob.article_ids).where(
+            AnalysisBatchJob.status.in_(OPEN_JOB_STATUSES)
+        )
+    )
+    return {article_id for article_ids in rows for article_id in article_ids}
+
+
+async def submit_analysis_batch(
+    db: AsyncSession, article_ids: Sequence[int], backend: BatchJobBackend
+) -> Optional[AnalysisBatchJob]:
+    """
+    Submit content analysis of the given articles as one batch job.
+
+    Articles that are already analyzed, too short, or in another open job
+    are left out. The job's estimated cost is reserved in the budget ledger
+    before it is submitted. Returns the job record (committed), or None when
+    no article is left.
+
+    Raises:
+        BudgetExceededError: Not enough budget left for the job
+    """
+    pending = await _open_job_article_ids(db)
+    analyzed = select(ArticleAnalysis.article_id).where(
+        ArticleAnalysis.article_id.in_(article_ids)
+    )
+    articles = (
+        await db.scalars(
+            select(Article)
+            .options(selectinload(Article.publisher))
+            .where(Article.id.in_(article_ids), Article.id.not_in(analyzed))
+            .order_by(Article.id)
+        )
+    ).all()
+    candidates = [
+        (
+            article.id,
+            article.title,
+            article.body,
+            article.publisher.name if article.publisher else None,
+        )
+        for article in articles
+        if article.id not in pending
+        and len(article.body or "") >= analysis_settings.min_content_length
+    ]
+    if not candidates:
+        return None
+
+    requests_jsonl = build_content_analysis_jsonl(candidates)
+    estimated_cost = estimate_batch_cost(requests_jsonl)
+    ledger = get_budget_ledger()
+    reservation = await ledger.reserve(estimated_cost, hold_seconds=_hold_seconds())
+    display_name = f"backlog-analysis-{datetime.now(UTC):%Y%m%d-%H%M%S}"
+    try:
+        provider_job_id = await backend.submit(requests_jsonl, display_name)
+    except BaseException:
+        await ledger.release(reservation)
+        raise
+    job = AnalysisBatchJob(
+        provider_job_id=provider_job_id,
+        backend=backend.name,
+        model=backend.model,
+        article_ids=[article_id for article_id, *_ in candidates],
+        status="SUBMITTED",
+        estimated_cost_usd=estimated_cost,
+        budget_hold_id=reservation.id,
+        budget_day=reservation.day,
+    )
+    db.add(job)
+    await db.commit()
+    logger.info(
+        f"Submitted batch job {provider_job_id} for {len(candidates)} articles "
+        f"(${estimated_cost:.4f} reserved)"
+    )
+    return job
+
+
+async def _store_batch_results(
+    db: AsyncSession, job: AnalysisBatchJob, results: dict[int, BatchResult]
+) -> tuple[int, int, float]:
+    """Add an analysis per valid result; returns stored, failed and cost."""
+    # Keep each article's analysis unique across monthly partitions
+    for article_id in sorted(job.article_ids):
+        await lock_unique_key(db, "article_analyses", article_id, "1.0")
+    already_analyzed = set(
+        await db.scalars(
+            select(ArticleAnalysis.article_id).where(
+                ArticleAnalysis.article_id.in_(job.article_ids)
+            )
+        )
+    )
+    stored = failed = 0
+    cost = 0.0
+    for article_id in job.article_ids:
+        result = results.get(article_id)
+        if result is not None:
+            cost += batch_cost(result.usage)
+        if article_id in already_analyzed:
+            # Analyzed interactively while the job was running
+            continue
+        if result is None or result.output is None:
+            failed += 1
+            reason = result.error if result else "missing from results"
+            logger.warning(f"No batch analysis for article {article_id}: {reason}")
+            continue
+        record = build_analysis_record(
+            article_id,
+            result.output,
+            None,
+            processing_time_ms=None,
+            token_usage=result.usage.total_tokens or 0,
+            cost_usd=batch_cost(result.usage),
+        )
+        db.add(record)
+        await store_analysis_signals(db, record)
+        stored += 1
+    return stored, failed, cost
+
+
+async def poll_analysis_batch(
+    db: AsyncSession, job: AnalysisBatchJob, backend: BatchJobBackend
+) -> dict[str, Any]:
+    """
+    Check a job once; when it has finished, validate and store its results.
+
+    Articles without a valid result stay unanalyzed and can be selected
+    again. A job still running after BATCH_JOB_TIMEOUT_HOURS is cancelled at
+    the provider (and polled again if that fails). The job's reservation is
+    settled with its actual cost, or released if it did not complete.
+    Returns a summary with ``done`` False while the job is running.
+    """
+    if job.status not in OPEN_JOB_STATUSES:
+        return {"done": True, "job_id": job.id, "status": job.status}
+
+    status = await backend.status(job.provider_job_id)
+    now = datetime.now(UTC)
+    if not status.done:
+        timeout = timedelta(hours=analysis_settings.batch_job_timeout_hours)
+        cancelled = False
+        if now - job.submitted_at >= timeout:
+            try:
+                await backend.cancel(job.provider_job_id)
+                cancelled = True
+            except Exception as e:
+                logger.warning(
+                    f"Could not cancel timed-out batch job {job.provider_job_id}: {e}"
+                )
+        if not cancelled:
+            job.status = "RUNNING"
+            await db.commit()
+            return {"done": False, "job_id": job.id, "status": job.status}
+        status = BatchJobStatus("EXPIRED", error="Timed out waiting for the job")
+
+    if status.state == "SUCCEEDED":
+        results = parse_batch_results(
+            await backend.results(job.provider_job_id), ContentAnalysis
+        )
+        stored, failed, cost = await _store_batch_results(db, job, results)
+        job.status = "COMPLETED"
+        job.articles_stored = stored
+        job.articles_failed = failed
+        job.cost_usd = cost
+    else:
+        job.status = status.state
+        job.error_message = status.error
+    job.completed_at = now
+    await db.commit()
+
+    # Batch spending counts against the same daily budget as interactive
+    # analyses
+    ledger = get_budget_ledger()
+    reservation = _reservation(job)
+    if job.status != "COMPLETED":
+        if reservation is not None:
+            await ledger.release(reservation)
+    elif reservation is not None:
+        await ledger.commit(reservation, cost, analyses=stored)
+    else:
+        # Submitted before jobs reserved their budget
+        await ledger.record(cost, analyses=stored)
+    logger.info(
+        f"Batch job {job.provider_job_id} {job.status}: "
+        f"{job.articles_stored} stored, {job.articles_failed} failed"
+    )
+    return {
+        "done": True,
+        "job_id": job.id,
+        "status": job.status,
+        "articles_stored": job.articles_stored,
+        "articles_failed": job.articles_failed,
+        "cost_usd": float(job.cost_usd or 0.0),
+        "error": job.error_message,
+    }
+
+
+_batch_backend: Optional[BatchJobBackend] = None
+
+
+def create_batch_backend(backend: Optional[str] = None) -> BatchJobBackend:
+    """
+    Build a batch backend from the ``BATCH_JOB_*`` settings.
+
+    Raises:
+        ValueError: Unknown backend name, or Gemini without ``GEMINI_API_KEY``
+    """
+    backend = (backend or analysis_settings.batch_job_backend).lower()
+    if backend not in BATCH_BACKENDS:
+        raise ValueError(
+            f"Unknown batch job backend {backend!r}; "
+            f"expected one of {', '.join(BATCH_BACKENDS)}"
+        )
+    if backend == "stub":
+        return StubBatchBackend(analysis_settings.batch_job_stub_dir)
+    if not analysis_settings.gemini_api_key:
+        raise ValueError("GEMINI_API_KEY is required for the gemini batch backend")
+    return GeminiBatchBackend(
+        analysis_settings.gemini_api_key, analysis_settings.content_analysis_model
+    )
+
+
+def get_batch_backend() -> BatchJobBackend:
+    """Process-wide batch backend."""
+    global _batch_backend
+    if _batch_backend is None:
+        _batch_backend = create_batch_backend()
+    return _batch_backend
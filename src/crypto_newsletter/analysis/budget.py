@@ -0,0 +1,548 @@
+"""
+Analysis budget ledger shared by every worker.
+
+Each analysis reserves its worst-case cost before it starts and settles the
+reservation with the actual cost when it ends, so concurrent analyses can
+never commit more than the budget between them. Budgets are per UTC day
+(keys roll over at midnight) with optional per-session sub-budgets for
+batch processing sessions.
+
+The Redis ledger keeps the counters in Redis and runs every check-and-update
+as one Lua script, so a budget check is one round trip and atomic across
+processes. Reservations that are never settled (a worker died) expire after
+``hold_seconds`` and are returned to the budget by the next reservation.
+Amounts are stored as integer micro-dollars. While Redis is unreachable the
+ledger falls back to an in-process ledger (logging a warning), so analyses
+go on against a per-process budget rather than failing.
+
+``BUDGET_LEDGER_BACKEND=local`` keeps the whole ledger in process memory,
+for tests and single-process runs.
+"""
+
+import asyncio
+import dataclasses
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+from redis.exceptions import RedisError
+
+from .agents.settings import analysis_settings
+
+logger = logging.getLogger(__name__)
+
+LEDGER_BACKENDS = ("redis", "local")
+KEY_PREFIX = "analysis-budget"
+# Day and session counters outlive their day by this long, for reporting
+KEY_TTL_SECONDS = 2 * 24 * 3600
+MICROS = 1_000_000
+USAGE_FIELDS = ("limit", "spent", "reserved", "count")
+
+# KEYS: day counters, day holds (zset by expiry), day hold table, session
+# counters ('' for none)
+# ARGV: daily limit, amount, hold id, now (ms), hold (ms), key TTL (s),
+# session key prefix, session id
+# Returns {1, available after} when reserved, {0, available} when the day
+# budget is short and {-1, available} when the session budget is short.
+# Reclaiming an expired hold updates its session's counters by a key built
+# in the script, so the ledger needs a non-cluster Redis.
+RESERVE_SCRIPT = """
+local day, holds, hold_table, session = KEYS[1], KEYS[2], KEYS[3], KEYS[4]
+local amount = tonumber(ARGV[2])
+local now = tonumber(ARGV[4])
+
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', holds, '-inf', now)) do
+  local entry = redis.call('HGET', hold_table, id)
+  if entry then
+    local sep = string.find(entry, ':', 1, true)
+    local held = tonumber(string.sub(entry, 1, sep - 1))
+    local owner = string.sub(entry, sep + 1)
+    redis.call('HINCRBY', day, 'reserved', -held)
+    if owner ~= '' then
+      redis.call('HINCRBY', ARGV[7] .. owner, 'reserved', -held)
+    end
+    redis.call('HDEL', hold_table, id)
+  end
+  redis.call('ZREM', holds, id)
+end
+
+redis.call('HSET', day, 'limit', ARGV[1])
+local totals = redis.call('HMGET', day, 'spent', 'reserved')
+local available = tonumber(ARGV[1]) - (tonumber(totals[1]) or 0)
+  - (tonumber(totals[2]) or 0)
+if amount > available then
+  return {0, available}
+end
+
+if session ~= '' then
+  local counters = redis.call('HMGET', session, 'limit', 'spent', 'reserved')
+  if counters[1] then
+    local session_available = tonumber(counters[1])
+      - (tonumber(counters[2]) or 0) - (tonumber(counters[3]) or 0)
+    if amount > session_available then
+      return {-1, session_available}
+    end
+  end
+  redis.call('HINCRBY', session, 'reserved', amount)
+  redis.call('EXPIRE', session, ARGV[6])
+end
+
+redis.call('HINCRBY', day, 'reserved', amount)
+redis.call('ZADD', holds, now + tonumber(ARGV[5]), ARGV[3])
+redis.call('HSET', hold_table, ARGV[3], ARGV[2] .. ':' .. ARGV[8])
+redis.call('EXPIRE', day, ARGV[6])
+redis.call('EXPIRE', holds, ARGV[6])
+redis.call('EXPIRE', hold_table, ARGV[6])
+return {1, available - amount}
+"""
+
+# KEYS: day counters, day holds, day hold table, session counters ('' for
+# none)
+# ARGV: hold id ('' for none), actual amount, key TTL (s), analyses to
+# count
+# Drops the hold (if it has not expired) and adds the actual amount to the
+# spent counters. Returns the amount that was held.
+SETTLE_SCRIPT = """
+local day, holds, hold_table, session = KEYS[1], KEYS[2], KEYS[3], KEYS[4]
+local held = 0
+local entry = ARGV[1] ~= '' and redis.call('HGET', hold_table, ARGV[1])
+if entry then
+  held = tonumber(string.sub(entry, 1, string.find(entry, ':', 1, true) - 1))
+  redis.call('HDEL', hold_table, ARGV[1])
+  redis.call('ZREM', holds, ARGV[1])
+  redis.call('HINCRBY', day, 'reserved', -held)
+  if session ~= '' then
+    redis.call('HINCRBY', session, 'reserved', -held)
+  end
+end
+
+local actual = tonumber(ARGV[2])
+if actual > 0 then
+  redis.call('HINCRBY', day, 'spent', actual)
+  if session ~= '' then
+    redis.call('HINCRBY', session, 'spent', actual)
+  end
+end
+if tonumber(ARGV[4]) > 0 then
+  redis.call('HINCRBY', day, 'count', ARGV[4])
+end
+redis.call('EXPIRE', day, ARGV[3])
+return held
+"""
+
+
+class BudgetExceededError(Exception):
+    """A reservation would take the day or session over its budget."""
+
+    def __init__(self, scope: str, available: float) -> None:
+        self.scope = scope
+        self.available = available
+        super().__init__(
+            f"{scope.capitalize()} analysis budget exceeded "
+            f"(${max(available, 0.0):.4f} available)"
+        )
+
+
+@dataclass(frozen=True)
+class Reservation:
+    """Cost held for one analysis until it is settled."""
+
+    id: str
+    day: str
+    amount: float
+    session_id: Optional[str] = None
+    # Held by the Redis ledger's in-process fallback
+    fallback: bool = False
+
+
+def _today() -> str:
+    return datetime.now(UTC).strftime("%Y-%m-%d")
+
+
+def _to_micros(amount: float) -> int:
+    return int(round(amount * MICROS))
+
+
+def _usage(counters: dict[str, int], limit: Optional[int]) -> dict[str, Any]:
+    """Counters in dollars; ``remaining`` is None without a limit."""
+    spent, reserved = counters.get("spent", 0), counters.get("reserved", 0)
+    return {
+        "limit": None if limit is None else limit / MICROS,
+        "spent": spent / MICROS,
+        "reserved": reserved / MICROS,
+        "remaining": None if limit is None else (limit - spent - reserved) / MICROS,
+        "analyses": counters.get("count", 0),
+    }
+
+
+class RedisBudgetLedger:
+    """
+    Budget counters in Redis, updated by Lua scripts, with an in-process
+    fallback while Redis is unreachable.
+    """
+
+    name = "redis"
+    # Every worker sees the same counters
+    shared = True
+
+    def __init__(
+        self,
+        daily_budget: float,
+        redis_url: Optional[str] = None,
+        hold_seconds: float = 900.0,
+        redis_client: Any = None,
+    ) -> None:
+        self.daily_budget = daily_budget
+        self.redis_url = redis_url
+        self.hold_seconds = hold_seconds
+        self._redis = redis_client
+        self._injected = redis_client is not None
+        self._redis_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._scripts: dict[str, Any] = {}
+        # Takes reservations while Redis is unreachable
+        self.fallback = LocalBudgetLedger(daily_budget, hold_seconds=hold_seconds)
+        self.degraded = False
+
+    def _unavailable(self, error: Exception) -> None:
+        if not self.degraded:
+            logger.warning(
+                f"Budget ledger cannot reach Redis, using a per-process "
+                f"budget until it is back: {error}"
+            )
+        self.degraded = True
+
+    def _available(self) -> None:
+        if self.degraded:
+            logger.info("Budget ledger reconnected to Redis")
+        self.degraded = False
+
+    def _client(self) -> Any:
+        """Async client for the running loop (clients are bound to a loop)."""
+        if not self._injected:
+            loop = asyncio.get_running_loop()
+            if self._redis is None or self._redis_loop is not loop:
+                import redis.asyncio as redis
+
+                self._redis = redis.from_url(self.redis_url)
+                self._redis_loop = loop
+                self._scripts = {}
+        if not self._scripts:
+            # Scripts run by EVALSHA, loading them on the first NOSCRIPT
+            self._scripts = {
+                "reserve": self._redis.register_script(RESERVE_SCRIPT),
+                "settle": self._redis.register_script(SETTLE_SCRIPT),
+            }
+        return self._redis
+
+    def _script(self, name: str) -> Any:
+        self._client()
+        return self._scripts[name]
+
+    @staticmethod
+    def _day_keys(day: str) -> list[str]:
+        base = f"{KEY_PREFIX}:day:{day}"
+        return [base, f"{base}:holds", f"{base}:hold"]
+
+    @staticmethod
+    def _session_key(session_id: Optional[str]) -> str:
+        return f"{KEY_PREFIX}:session:{session_id}" if session_id else ""
+
+    async def open_session(self, session_id: str, budget: float) -> None:
+        """Give ``session_id`` a sub-budget (in addition to the day's)."""
+        await self.fallback.open_session(session_id, budget)
+        client = self._client()
+        key = self._session_key(session_id)
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, "limit", _to_micros(budget))
+                pipe.expire(key, KEY_TTL_SECONDS)
+                await pipe.execute()
+        except RedisError as e:
+            self._unavailable(e)
+
+    async def reserve(
+        self,
+        amount: float,
+        session_id: Optional[str] = None,
+        hold_seconds: Optional[float] = None,
+    ) -> Reservation:
+        """
+        Hold ``amount`` against today's budget (and the session's) for
+        ``hold_seconds`` (default: the ledger's).
+
+        Raises:
+            BudgetExceededError: Not enough budget left
+        """
+        day = _today()
+        hold_id = uuid.uuid4().hex
+        hold_seconds = hold_seconds or self.hold_seconds
+        try:
+            allowed, available = await self._script("reserve")(
+                keys=[*self._day_keys(day), self._session_key(session_id)],
+                args=[
+                    _to_micros(self.daily_budget),
+                    _to_micros(amount),
+                    hold_id,
+                    int(time.time() * 1000),
+                    int(hold_seconds * 1000),
+                    max(KEY_TTL_SECONDS, int(hold_seconds)),
+                    f"{KEY_PREFIX}:session:",
+                    session_id or "",
+                ],
+            )
+        except RedisError as e:
+            self._unavailable(e)
+            reservation = await self.fallback.reserve(
+                amount, session_id, hold_seconds
+            )
+            return dataclasses.replace(reservation, fallback=True)
+        self._available()
+        if allowed != 1:
+            scope = "session" if allowed == -1 else "daily"
+            raise BudgetExceededError(scope, available / MICROS)
+        return Reservation(hold_id, day, amount, session_id)
+
+    async def _settle(
+        self,
+        day: str,
+        hold_id: str,
+        session_id: Optional[str],
+        actual: float,
+        analyses: int,
+    ) -> None:
+        try:
+            await self._script("settle")(
+                keys=[*self._day_keys(day), self._session_key(session_id)],
+                args=[hold_id, _to_micros(actual), KEY_TTL_SECONDS, analyses],
+            )
+        except RedisError as e:
+            self._unavailable(e)
+            # The Redis hold expires; the spending is counted in-process
+            self.fallback._settle(day, "", session_id, actual, analyses)
+
+    async def commit(
+        self, reservation: Reservation, actual: float, analyses: int = 1
+    ) -> None:
+        """Replace the hold with the actual cost of its ``analyses``."""
+        if reservation.fallback:
+            await self.fallback.commit(reservation, actual, analyses)
+            return
+        await self._settle(
+            reservation.day, reservation.id, reservation.session_id, actual, analyses
+        )
+
+    async def release(self, reservation: Reservation) -> None:
+        """Drop the hold of an analysis that spent nothing."""
+        if reservation.fallback:
+            await self.fallback.release(reservation)
+            return
+        await self._settle(
+            reservation.day, reservation.id, reservation.session_id, 0.0, 0
+        )
+
+    async def record(self, amount: float, analyses: int = 0) -> None:
+        """Add spending that was not reserved (e.g. provider batch jobs)."""
+        await self._settle(_today(), "", None, amount, analyses)
+
+    @staticmethod
+    def _counters(values: list[Any]) -> dict[str, int]:
+        return {
+            field: int(value)
+            for field, value in zip(USAGE_FIELDS, values, strict=True)
+            if value is not None
+        }
+
+    def _day_usage(self, values: list[Any]) -> dict[str, Any]:
+        return _usage(self._counters(values), _to_micros(self.daily_budget))
+
+    async def usage(self, session_id: Optional[str] = None) -> dict[str, Any]:
+        """Today's (or a session's) limit, spent, reserved and remaining."""
+        client = self._client()
+        try:
+            if not session_id:
+                return self._day_usage(
+                    await client.hmget(self._day_keys(_today())[0], USAGE_FIELDS)
+                )
+            values = await client.hmget(self._session_key(session_id), USAGE_FIELDS)
+        except RedisError as e:
+            self._unavailable(e)
+            return await self.fallback.usage(session_id)
+        counters = self._counters(values)
+        return _usage(counters, counters.get("limit"))
+
+    def usage_sync(self) -> dict[str, Any]:
+        """Today's ``usage()`` for synchronous callers such as the scheduler."""
+        import redis
+
+        client = redis.Redis.from_url(self.redis_url)
+        try:
+            return self._day_usage(
+                client.hmget(self._day_keys(_today())[0], USAGE_FIELDS)
+            )
+        except RedisError as e:
+            self._unavailable(e)
+            return self.fallback.usage_sync()
+        finally:
+            client.close()
+
+
+class LocalBudgetLedger:
+    """
+    The same ledger in process memory, for tests and single-process runs.
+
+    Semantics match the Redis ledger, but each process has its own budget.
+    """
+
+    name = "local"
+    shared = False
+
+    def __init__(self, daily_budget: float, hold_seconds: float = 900.0) -> None:
+        self.daily_budget = daily_budget
+        self.hold_seconds = hold_seconds
+        self._lock = threading.Lock()
+        self._days: dict[str, dict[str, int]] = {}
+        self._sessions: dict[str, dict[str, int]] = {}
+        # hold id -> (day, amount, session id, expires at)
+        self._holds: dict[str, tuple[str, int, Optional[str], float]] = {}
+
+    def _day(self, day: str) -> dict[str, int]:
+        return self._days.setdefault(
+            day, {"limit": 0, "spent": 0, "reserved": 0, "count": 0}
+        )
+
+    def _session(self, session_id: str) -> dict[str, int]:
+        return self._sessions.setdefault(session_id, {"spent": 0, "reserved": 0})
+
+    def _drop_hold(self, hold_id: str) -> int:
+        hold = self._holds.pop(hold_id, None)
+        if hold is None:
+            return 0
+        day, held, session_id, _ = hold
+        self._day(day)["reserved"] -= held
+        if session_id:
+            self._session(session_id)["reserved"] -= held
+        return held
+
+    async def open_session(self, session_id: str, budget: float) -> None:
+        with self._lock:
+            self._session(session_id)["limit"] = _to_micros(budget)
+
+    async def reserve(
+        self,
+        amount: float,
+        session_id: Optional[str] = None,
+        hold_seconds: Optional[float] = None,
+    ) -> Reservation:
+        day, now, micros = _today(), time.time(), _to_micros(amount)
+        expires_at = now + (hold_seconds or self.hold_seconds)
+        with self._lock:
+            for hold_id, (*_, hold_expires) in list(self._holds.items()):
+                if hold_expires <= now:
+                    self._drop_hold(hold_id)
+
+            counters = self._day(day)
+            counters["limit"] = _to_micros(self.daily_budget)
+            available = counters["limit"] - counters["spent"] - counters["reserved"]
+            if micros > available:
+                raise BudgetExceededError("daily", available / MICROS)
+            if session_id:
+                session = self._session(session_id)
+                if "limit" in session:
+                    session_available = (
+                        session["limit"] - session["spent"] - session["reserved"]
+                    )
+                    if micros > session_available:
+                        raise BudgetExceededError("session", session_available / MICROS)
+                session["reserved"] += micros
+            counters["reserved"] += micros
+            hold_id = uuid.uuid4().hex
+            self._holds[hold_id] = (day, micros, session_id, expires_at)
+        return Reservation(hold_id, day, amount, session_id)
+
+    def _settle(
+        self,
+        day: str,
+        hold_id: str,
+        session_id: Optional[str],
+        actual: float,
+        analyses: int,
+    ) -> None:
+        with self._lock:
+            self._drop_hold(hold_id)
+            counters = self._day(day)
+            counters["spent"] += _to_micros(actual)
+            counters["count"] += analyses
+            if session_id:
+                self._session(session_id)["spent"] += _to_micros(actual)
+
+    async def commit(
+        self, reservation: Reservation, actual: float, analyses: int = 1
+    ) -> None:
+        self._settle(
+            reservation.day, reservation.id, reservation.session_id, actual, analyses
+        )
+
+    async def release(self, reservation: Reservation) -> None:
+        self._settle(reservation.day, reservation.id, reservation.session_id, 0.0, 0)
+
+    async def record(self, amount: float, analyses: int = 0) -> None:
+        self._settle(_today(), "", None, amount, analyses)
+
+    async def usage(self, session_id: Optional[str] = None) -> dict[str, Any]:
+        if not session_id:
+            return self.usage_sync()
+        with self._lock:
+            counters = dict(self._session(session_id))
+        return _usage(counters, counters.get("limit"))
+
+    def usage_sync(self) -> dict[str, Any]:
+        with self._lock:
+            counters = dict(self._day(_today()))
+        return _usage(counters, _to_micros(self.daily_budget))
+
+
+BudgetLedger = RedisBudgetLedger | LocalBudgetLedger
+
+_budget_ledger: Optional[BudgetLedger] = None
+
+
+def create_budget_ledger(backend: Optional[str] = None) -> BudgetLedger:
+    """
+    Build a ledger from the ``DAILY_ANALYSIS_BUDGET`` and ``BUDGET_*``
+    settings.
+
+    Raises:
+        ValueError: Unknown backend name
+    """
+    backend = (backend or analysis_settings.budget_ledger_backend).lower()
+    if backend not in LEDGER_BACKENDS:
+        raise ValueError(
+            f"Unknown budget ledger backend {backend!r}; "
+            f"expected one of {', '.join(LEDGER_BACKENDS)}"
+        )
+    if backend == "local":
+        return LocalBudgetLedger(
+            analysis_settings.daily_analysis_budget,
+            hold_seconds=analysis_settings.budget_hold_seconds,
+        )
+    from ..shared.config.settings import get_settings
+
+    return RedisBudgetLedger(
+        analysis_settings.daily_analysis_budget,
+        redis_url=get_settings().redis_url,
+        hold_seconds=analysis_settings.budget_hold_seconds,
+    )
+
+
+def get_budget_ledger() -> BudgetLedger:
+    """Process-wide ledger (in-process when ``TESTING`` is set)."""
+    global _budget_ledger
+    if _budget_ledger is None:
+        _budget_ledger = create_budget_ledger(
+            "local" if analysis_settings.testing else None
+        )
+    return _budget_ledger
@@ -0,0 +1,416 @@
+"""Content-addressed cache of validated agent results."""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import BaseModel, ValidationError
+from pydantic_ai import Agent
+from pydantic_ai.usage import Usage
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from ..shared.models import LLMCacheEntry
+from .agents.settings import analysis_settings
+
+logger = logging.getLogger(__name__)
+
+CACHE_BACKENDS = ("database", "disk", "none")
+# Stores between eviction passes
+PRUNE_INTERVAL = 100
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _model_name(agent: Agent) -> str:
+    model = agent.model
+    return str(getattr(model, "model_name", model))
+
+
+def instructions_hash(agent: Agent) -> str:
+    """
+    Hash of what the agent sends besides the user prompt.
+
+    Covers the static system prompts and the output schema, so editing a
+    prompt or a field of the output model starts a fresh set of entries.
+    """
+    schema = {}
+    if isinstance(agent.output_type, type) and issubclass(agent.output_type, BaseModel):
+        schema = agent.output_type.model_json_schema()
+    return _sha256(
+        json.dumps(
+            {"system_prompts": list(agent._system_prompts), "output": schema},
+            sort_keys=True,
+        )
+    )
+
+
+@dataclass
+class AgentRun:
+    """Output and token usage of an agent call, fresh or from the cache."""
+
+    output: Any
+    usage: Usage
+    cached: bool = False
+
+
+@dataclass
+class CachedResult:
+    output: dict[str, Any]
+    usage: dict[str, Any]
+
+
+class DatabaseLLMCacheBackend:
+    """Entries in the ``llm_cache_entries`` table, shared by all workers."""
+
+    name = "database"
+
+    async def get(self, key: str) -> Optional[CachedResult]:
+        from ..shared.database.connection import get_db_session
+
+        async with get_db_session() as db:
+            # Fetch and record the hit in one round trip
+            row = (
+                await db.execute(
+                    update(LLMCacheEntry)
+                    .where(
+                        LLMCacheEntry.key == key,
+                        LLMCacheEntry.expires_at > func.now(),
+                    )
+                    .values(hits=LLMCacheEntry.hits + 1, last_used_at=func.now())
+                    .returning(LLMCacheEntry.output, LLMCacheEntry.usage)
+                )
+            ).first()
+        return CachedResult(row.output, row.usage) if row else None
+
+    async def set(
+        self,
+        key: str,
+        agent: str,
+        model: str,
+        output: dict[str, Any],
+        usage: dict[str, Any],
+        ttl_seconds: int,
+    ) -> None:
+        from ..shared.database.connection import get_db_session
+
+        expires_at = datetime.now(UTC) + timedelta(seconds=ttl_seconds)
+        statement = insert(LLMCacheEntry).values(
+            key=key,
+            agent=agent,
+            model=model,
+            output=output,
+            usage=usage,
+            expires_at=expires_at,
+            hits=0,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[LLMCacheEntry.key],
+            set_={
+                "output": statement.excluded.output,
+                "usage": statement.excluded.usage,
+                "expires_at": statement.excluded.expires_at,
+                "last_used_at": func.now(),
+            },
+        )
+        async with get_db_session() as db:
+            await db.execute(statement)
+
+    async def prune(self, max_entries: int) -> int:
+        """Delete expired entries, then the least recently used over the bound."""
+        from ..shared.database.connection import get_db_session
+
+        async with get_db_session() as db:
+            expired = await db.execute(
+                delete(LLMCacheEntry).where(LLMCacheEntry.expires_at <= func.now())
+            )
+            keep = (
+                select(LLMCacheEntry.key)
+                .order_by(LLMCacheEntry.last_used_at.desc())
+                .limit(max_entries)
+            )
+            evicted = await db.execute(
+                delete(LLMCacheEntry).where(LLMCacheEntry.key.not_in(keep))
+            )
+        return (expired.rowcount or 0) + (evicted.rowcount or 0)
+
+    async def clear(self) -> int:
+        from ..shared.database.connection import get_db_session
+
+        async with get_db_session() as db:
+            result = await db.execute(delete(LLMCacheEntry))
+        return result.rowcount or 0
+
+    async def summary(self) -> dict[str, Any]:
+        from ..shared.database.connection import get_db_session
+
+        async with get_db_session() as db:
+            row = (
+                await db.execute(
+                    select(
+                        func.count(LLMCacheEntry.key),
+                        func.coalesce(func.sum(LLMCacheEntry.hits), 0),
+                    )
+                )
+            ).one()
+        return {"entries": row[0], "lifetime_hits": int(row[1])}
+
+
+class DiskLLMCacheBackend:
+    """
+    One JSON file per entry under ``directory``, sharded by key prefix.
+
+    A file's mtime is its last use: hits touch it and eviction removes the
+    oldest files. Suitable for a single host (local development, one worker).
+    """
+
+    name = "disk"
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _files(self) -> list[Path]:
+        return list(self.directory.glob("*/*.json"))
+
+    def _read(self, key: str) -> Optional[CachedResult]:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        if entry["expires_at"] <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)
+        return CachedResult(entry["output"], entry["usage"])
+
+    def _write(self, key: str, entry: dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _prune(self, max_entries: int) -> int:
+        now = time.time()
+        removed = 0
+        entries = []
+        for path in self._files():
+            try:
+                expires_at = json.loads(path.read_text(encoding="utf-8"))["expires_at"]
+                if expires_at <= now:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                else:
+                    entries.append((path.stat().st_mtime, path))
+            except (OSError, ValueError, KeyError):
+                path.unlink(missing_ok=True)
+                removed += 1
+        entries.sort(reverse=True)
+        for _, path in entries[max_entries:]:
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def _clear(self) -> int:
+        files = self._files()
+        for path in files:
+            path.unlink(missing_ok=True)
+        return len(files)
+
+    async def get(self, key: str) -> Optional[CachedResult]:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(
+        self,
+        key: str,
+        agent: str,
+        model: str,
+        output: dict[str, Any],
+        usage: dict[str, Any],
+        ttl_seconds: int,
+    ) -> None:
+        entry = {
+            "agent": agent,
+            "model": model,
+            "output": output,
+            "usage": usage,
+            "expires_at": time.time() + ttl_seconds,
+        }
+        await asyncio.to_thread(self._write, key, entry)
+
+    async def prune(self, max_entries: int) -> int:
+        return await asyncio.to_thread(self._prune, max_entries)
+
+    async def clear(self) -> int:
+        return await asyncio.to_thread(self._clear)
+
+    async def summary(self) -> dict[str, Any]:
+        files = await asyncio.to_thread(self._files)
+        return {"entries": len(files), "directory": str(self.directory)}
+
+
+class LLMCache:
+    """
+    Cache of validated agent outputs keyed by everything that produced them.
+
+    The key is a hash of the agent name, the model name, the agent's
+    instructions (``instructions_hash``) and the formatted input, so a hit
+    is only possible for a byte-identical request to the same model. Cached
+    outputs are re-validated against the agent's output type on read; an
+    entry that no longer validates is a miss.
+
+    The cache is best effort: backend errors are logged and treated as a
+    miss (or a skipped store), never as a failed analysis.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[DatabaseLLMCacheBackend | DiskLLMCacheBackend],
+        ttl_seconds: int = 7 * 24 * 3600,
+        max_entries: int = 10_000,
+        prune_interval: int = PRUNE_INTERVAL,
+    ) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.prune_interval = prune_interval
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "backend": self.backend.name if self.backend else "none",
+            **self.stats,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+    @staticmethod
+    def key(agent_name: str, agent: Agent, prompt: str) -> str:
+        return _sha256(
+            "\n".join(
+                (
+                    agent_name,
+                    _model_name(agent),
+                    instructions_hash(agent),
+                    _sha256(prompt),
+                )
+            )
+        )
+
+    async def get(self, key: str, output_type: type[BaseModel]) -> Optional[AgentRun]:
+        """Look up ``key``; the output is validated as ``output_type``."""
+        if self.backend is None:
+            return None
+        try:
+            entry = await self.backend.get(key)
+            if entry is not None:
+                run = AgentRun(
+                    output=output_type.model_validate(entry.output),
+                    usage=Usage(**entry.usage),
+                    cached=True,
+                )
+                self.stats["hits"] += 1
+                return run
+        except ValidationError as e:
+            logger.info(f"Discarding stale LLM cache entry {key[:12]}: {e}")
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"LLM cache lookup failed: {e}")
+        self.stats["misses"] += 1
+        return None
+
+    async def set(
+        self, key: str, agent_name: str, agent: Agent, output: BaseModel, usage: Usage
+    ) -> None:
+        """Store a validated output; evicts every ``prune_interval`` stores."""
+        if self.backend is None:
+            return
+        try:
+            await self.backend.set(
+                key,
+                agent=agent_name,
+                model=_model_name(agent),
+                output=output.model_dump(mode="json"),
+                usage=dataclasses.asdict(usage),
+                ttl_seconds=self.ttl_seconds,
+            )
+            self.stats["stores"] += 1
+            if self.stats["stores"] % self.prune_interval == 0:
+                await self.prune()
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"LLM cache store failed: {e}")
+
+    async def prune(self) -> int:
+        """Drop expired entries and the least recently used over ``max_entries``."""
+        if self.backend is None:
+            return 0
+        removed = await self.backend.prune(self.max_entries)
+        self.stats["evictions"] += removed
+        if removed:
+            logger.info(f"Evicted {removed} LLM cache entries")
+        return removed
+
+
+_llm_cache: Optional[LLMCache] = None
+
+
+def create_llm_cache(backend: Optional[str] = None) -> LLMCache:
+    """
+    Build a cache from the ``LLM_CACHE_*`` settings.
+
+    Raises:
+        ValueError: Unknown backend name
+    """
+    backend = (backend or analysis_settings.llm_cache_backend).lower()
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(
+            f"Unknown LLM cache backend {backend!r}; "
+            f"expected one of {', '.join(CACHE_BACKENDS)}"
+        )
+    implementation = None
+    if backend == "database":
+        implementation = DatabaseLLMCacheBackend()
+    elif backend == "disk":
+        implementation = DiskLLMCacheBackend(analysis_settings.llm_cache_dir)
+    return LLMCache(
+        implementation,
+        ttl_seconds=analysis_settings.llm_cache_ttl_seconds,
+        max_entries=analysis_settings.llm_cache_max_entries,
+    )
+
+
+def get_llm_cache() -> LLMCache:
+    """Process-wide result cache (disabled when ``TESTING`` is set)."""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = create_llm_cache("none" if analysis_settings.testing else None)
+    return _llm_cache
@@ -0,0 +1,369 @@
+"""
+Adaptive concurrency for LLM provider calls.
+
+Each model gets a controller that bounds its requests in flight. The limit
+grows additively (about one slot per window of healthy calls) while calls
+succeed within the latency target, and is cut multiplicatively when the
+provider signals overload: a 429, a 5xx or a request timeout. Calls that
+were already in flight when the limit was cut do not cut it again, so one
+burst halves the limit once rather than once per failed call.
+
+An agent run may span several requests, tool calls (searches) and retries,
+so each kind of agent has its own wall-clock limit (``run_agent``). A run
+that exceeds it says nothing about the provider: it neither cuts the limit
+nor trips the breaker.
+
+A circuit breaker stops calls to a model after consecutive overloads; they
+fail at once with CircuitOpenError instead of queueing behind a provider
+that is down. After ``reset_seconds`` one probe call is let through
+(half-open), and its outcome closes or reopens the circuit.
+
+Controllers are per process and may be shared by event loops in different
+threads (the analysis runtime and newsletter tasks).
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+import httpx
+from google.genai import errors as genai_errors
+from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
+
+from .agents.settings import analysis_settings
+
+logger = logging.getLogger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Calls to a model are suspended until its circuit breaker resets."""
+
+    def __init__(self, model: str, retry_after: float) -> None:
+        self.model = model
+        self.retry_after = retry_after
+        super().__init__(f"Circuit open for model {model}; retry in {retry_after:.0f}s")
+
+
+def is_overload_error(exc: Optional[BaseException]) -> bool:
+    """
+    Whether ``exc`` (or an exception it was raised from) is a 429, 5xx or
+    provider request timeout.
+    """
+    while exc is not None:
+        if isinstance(exc, httpx.TimeoutException):
+            return True
+        status = None
+        if isinstance(exc, ModelHTTPError):
+            status = exc.status_code
+        elif isinstance(exc, genai_errors.APIError):
+            status = exc.code
+        if status is not None and (status == 429 or status >= 500):
+            return True
+        exc = exc.__cause__
+    return False
+
+
+class CircuitBreaker:
+    """
+    Closed, open or half-open; opens after ``failure_threshold`` overloads in
+    a row. Not thread-safe by itself (the controller holds its lock).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self.times_opened = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    def retry_after(self) -> float:
+        """Seconds until a call may be let through again."""
+        if self.state == CLOSED:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_seconds - self._clock())
+
+    def allow(self) -> bool:
+        """Whether a call may start; in half-open state, one probe at a time."""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            if self.retry_after() > 0:
+                return False
+            self.state = HALF_OPEN
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._probing = False
+        self.state = CLOSED
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self._opened_at = self._clock()
+            self.times_opened += 1
+
+    def record_cancelled(self) -> None:
+        """A call ended without an outcome; let another probe through."""
+        self._probing = False
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on concurrent calls to one model, with a circuit breaker.
+
+    Use ``async with limiter.slot():`` around each call.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        latency_target: float = 30.0,
+        backoff: float = 0.5,
+        breaker: Optional[CircuitBreaker] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(
+            self.max_limit, max(self.min_limit, initial_limit or self.max_limit)
+        )
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.breaker = breaker or CircuitBreaker(clock=clock)
+        self.in_flight = 0
+        self.stats = {
+            "calls": 0,
+            "successes": 0,
+            "overloads": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "rejected": 0,
+            "increases": 0,
+            "decreases": 0,
+        }
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._last_cut = float("-inf")
+        # Healthy calls since the limit last changed
+        self._healthy = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "waiting": len(self._waiters),
+                "circuit": self.breaker.state,
+                "retry_after_seconds": round(self.breaker.retry_after(), 1),
+                "times_opened": self.breaker.times_opened,
+                **self.stats,
+            }
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold one of the model's slots for a call.
+
+        Raises:
+            CircuitOpenError: The model's circuit is open
+        """
+        with self._lock:
+            allowed = self.breaker.allow()
+            if not allowed:
+                self.stats["rejected"] += 1
+                retry_after = self.breaker.retry_after()
+        if not allowed:
+            raise CircuitOpenError(self.name, retry_after)
+
+        try:
+            await self._acquire()
+        except BaseException:
+            with self._lock:
+                self.breaker.record_cancelled()
+            raise
+        started = self._clock()
+        outcome = "cancelled"
+        try:
+            yield
+            outcome = "success"
+        except TimeoutError:
+            # The run's own deadline, not an answer from the provider
+            outcome = "timeout"
+            raise
+        except Exception as e:
+            outcome = "overload" if is_overload_error(e) else "error"
+            raise
+        finally:
+            self._settle(outcome, started)
+
+    async def _acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self.in_flight < self.limit:
+                self.in_flight += 1
+                return
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                waiting = (loop, future) in self._waiters
+                if waiting:
+                    self._waiters.remove((loop, future))
+            # A slot handed over before the cancellation is passed on
+            if not waiting and future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._wake()
+
+    def _wake(self) -> None:
+        """Hand free slots to waiters, in order (holding the lock)."""
+        while self._waiters and self.in_flight < self.limit:
+            loop, future = self._waiters.popleft()
+            self.in_flight += 1
+            try:
+                loop.call_soon_threadsafe(self._hand_over, future)
+            except RuntimeError:  # the waiter's loop has closed
+                self.in_flight -= 1
+
+    def _hand_over(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self._release()
+        else:
+            future.set_result(None)
+
+    def _settle(self, outcome: str, started: float) -> None:
+        now = self._clock()
+        with self._lock:
+            self.in_flight -= 1
+            if outcome != "cancelled":
+                self.stats["calls"] += 1
+            if outcome == "overload":
+                self.stats["overloads"] += 1
+                self.breaker.record_failure()
+                # Calls started before the last cut saw the same overload
+                if started > self._last_cut:
+                    self._decrease(now)
+            elif outcome in ("cancelled", "timeout"):
+                if outcome == "timeout":
+                    self.stats["timeouts"] += 1
+                self.breaker.record_cancelled()
+            else:
+                self.stats["successes" if outcome == "success" else "errors"] += 1
+                # The provider answered, whatever the output was
+                self.breaker.record_success()
+                if outcome == "success" and now - started <= self.latency_target:
+                    self._increase()
+            self._wake()
+
+    def _increase(self) -> None:
+        """One more slot after a full window (``limit``) of healthy calls."""
+        self._healthy += 1
+        if self._healthy < self.limit or self.limit >= self.max_limit:
+            return
+        self.limit += 1
+        self._healthy = 0
+        self.stats["increases"] += 1
+        logger.info(f"LLM concurrency for {self.name} raised to {self.limit}")
+
+    def _decrease(self, now: float) -> None:
+        before = self.limit
+        self.limit = max(self.min_limit, int(self.limit * self.backoff))
+        self._healthy = 0
+        self._last_cut = now
+        self.stats["decreases"] += 1
+        logger.warning(
+            f"LLM concurrency for {self.name} cut from {before} to "
+            f"{self.limit} after an overload"
+            + (" (circuit open)" if self.breaker.state == OPEN else "")
+        )
+
+
+_controllers: dict[str, AdaptiveConcurrencyLimiter] = {}
+_controllers_lock = threading.Lock()
+
+
+def model_name(agent: Agent) -> str:
+    """Name of the model an agent runs on, which keys its controller."""
+    model = agent.model
+    if isinstance(model, str):
+        return model
+    name = getattr(model, "model_name", None)
+    return name if isinstance(name, str) else type(model).__name__
+
+
+def get_llm_concurrency(model: str) -> AdaptiveConcurrencyLimiter:
+    """Process-wide controller for ``model`` (``LLM_*`` settings)."""
+    with _controllers_lock:
+        controller = _controllers.get(model)
+        if controller is None:
+            controller = _controllers[model] = AdaptiveConcurrencyLimiter(
+                model,
+                max_limit=analysis_settings.llm_max_concurrency,
+                min_limit=analysis_settings.llm_min_concurrency,
+                latency_target=analysis_settings.llm_latency_target_seconds,
+                breaker=CircuitBreaker(
+                    analysis_settings.llm_breaker_failure_threshold,
+                    analysis_settings.llm_breaker_reset_seconds,
+                ),
+            )
+        return controller
+
+
+async def run_agent(
+    agent: Agent, prompt: str, timeout: Optional[float] = None, **kwargs: Any
+) -> Any:
+    """
+    ``agent.run`` through its model's controller, within ``timeout`` seconds
+    (default ``LLM_CALL_TIMEOUT_SECONDS``).
+
+    Only provider errors count towards the model's limit and breaker; a run
+    that times out does not.
+
+    Raises:
+        CircuitOpenError: The model's circuit is open
+        TimeoutError: The run took longer than ``timeout``
+    """
+    timeout = timeout or analysis_settings.llm_call_timeout_seconds
+    async with get_llm_concurrency(model_name(agent)).slot():
+        async with asyncio.timeout(timeout):
+            return await agent.run(prompt, **kwargs)
+
+
+def llm_concurrency_metrics() -> dict[str, dict[str, Any]]:
+    """Current limit, load and circuit state of each model's controller."""
+    with _controllers_lock:
+        controllers = list(_controllers.values())
+    return {controller.name: controller.snapshot() for controller in controllers}
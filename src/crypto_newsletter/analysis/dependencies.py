@@ -43,4 +43,6 @@ class AnalysisDependencies:
 
     # Analysis settings
     max_searches_per_validation: int = 5
+    # Searches the validation agent has run so far, across its tool calls
+    searches_used: int = 0
     min_signal_confidence: float = 0.3
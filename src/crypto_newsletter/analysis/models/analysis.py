@@ -56,3 +56,17 @@ class ContentAnalysis(BaseModel):
         le=1.0,
         description="How unique these insights are vs mainstream coverage (0.0-1.0)",
     )
+
+
+class ArticleContentAnalysis(ContentAnalysis):
+    """Content analysis of one article in a packed request."""
+
+    article_id: int = Field(description="ARTICLE ID of the article analyzed")
+
+
+class PackedContentAnalysis(BaseModel):
+    """Analyses of several articles sent in one request."""
+
+    analyses: list[ArticleContentAnalysis] = Field(
+        description="One analysis per article, each with its ARTICLE ID"
+    )
@@ -0,0 +1,85 @@
+"""Request rate limiting for LLM provider calls."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Optional
+
+from .agents.settings import analysis_settings
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket for coroutines: ``rate`` requests per second, bursts of ``burst``.
+
+    Waiters are served in FIFO order. The limiter may be shared by any number
+    of concurrent coroutines on one event loop (it rebinds if the loop that
+    uses it is replaced, e.g. after the analysis runtime restarts).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def per_minute(
+        cls, requests_per_minute: float, burst: int = 1
+    ) -> "AsyncRateLimiter":
+        return cls(requests_per_minute / 60.0, burst)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock, self._lock_loop = asyncio.Lock(), loop
+        return self._lock
+
+    async def acquire(self, tokens: int = 1) -> float:
+        """
+        Wait until ``tokens`` requests may be made.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        async with self._get_lock():
+            self._refill()
+            while self._tokens < tokens:
+                delay = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= tokens
+        return waited
+
+
+_llm_limiter: Optional[AsyncRateLimiter] = None
+
+
+def get_llm_rate_limiter() -> AsyncRateLimiter:
+    """Process-wide limiter for LLM requests (``LLM_REQUESTS_PER_MINUTE``)."""
+    global _llm_limiter
+    if _llm_limiter is None:
+        _llm_limiter = AsyncRateLimiter.per_minute(
+            analysis_settings.llm_requests_per_minute,
+            burst=analysis_settings.llm_max_concurrency,
+        )
+    return _llm_limiter
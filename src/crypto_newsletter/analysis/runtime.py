@@ -0,0 +1,232 @@
+"""Long-lived event loop for running analysis coroutines from sync code."""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import threading
+from collections.abc import Coroutine
+from typing import Any, Optional, TypeVar
+
+from sqlalchemy import text
+
+from .agents.settings import analysis_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AnalysisRuntime:
+    """
+    One event loop per worker process, running in a dedicated thread.
+
+    Sync code (Celery tasks) submits coroutines with
+    ``asyncio.run_coroutine_threadsafe`` instead of creating a thread and a
+    fresh event loop per article. Everything bound to the loop it was first
+    used on stays warm between articles: the pooled async DB engine (one per
+    loop, see ``shared.database.connection``) and the HTTP clients of the
+    model providers.
+
+    The loop is started on first use and is not inherited across a fork.
+    ``shutdown`` drains in-flight analyses before closing the loop.
+    """
+
+    def __init__(self, name: str = "analysis-runtime") -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._accepting = False
+        self._inflight: set[concurrent.futures.Future] = set()
+
+    @property
+    def running(self) -> bool:
+        return (
+            self._loop is not None
+            and self._pid == os.getpid()
+            and self._loop.is_running()
+        )
+
+    @property
+    def inflight(self) -> int:
+        """Submitted coroutines that have not finished yet."""
+        return len(self._inflight)
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the loop thread if it is not running (idempotent).
+
+        Raises:
+            RuntimeError: The runtime is draining for shutdown
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                # The loop thread does not survive a fork; drop the parent's
+                self._loop = self._thread = None
+                self._inflight = set()
+            elif self._loop is not None and not self._accepting:
+                raise RuntimeError(f"{self.name} is shutting down")
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                started = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._loop, started), name=self.name
+                )
+                self._thread.daemon = True
+                self._thread.start()
+                started.wait()
+                self._pid = os.getpid()
+                self._accepting = True
+                logger.info(f"Started {self.name} event loop")
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, started: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        loop.run_forever()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """Schedule ``coro`` on the runtime loop and return its future."""
+        try:
+            loop = self.start()
+        except RuntimeError:
+            coro.close()
+            raise
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        with self._lock:
+            self._inflight.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            self._inflight.discard(future)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        Run ``coro`` on the runtime loop and wait for its result.
+
+        Raises:
+            TimeoutError: The coroutine did not finish in ``timeout`` seconds;
+                it is cancelled on the loop
+            RuntimeError: Called from the runtime loop itself (would deadlock)
+        """
+        if self._thread is not None and threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(f"{self.name}.run() called from its own event loop")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    async def _warm_up(self) -> None:
+        # Opens this loop's pooled engine and installs its shutdown hook
+        from crypto_newsletter.shared.database.connection import get_db_session
+
+        async with get_db_session() as db:
+            await db.execute(text("SELECT 1"))
+
+        # Opens the model providers' HTTP connections from this loop
+        from .agents.content_analysis import content_analysis_agent
+        from .agents.providers import warm_up_model
+        from .agents.signal_validation import signal_validation_agent
+
+        await asyncio.gather(
+            *(
+                warm_up_model(agent.model)
+                for agent in (content_analysis_agent, signal_validation_agent)
+            )
+        )
+
+    def warm_up(self, timeout: Optional[float] = 30.0) -> bool:
+        """
+        Open the loop's DB pool and model provider connections ahead of the
+        first analysis; best effort.
+        """
+        try:
+            self.run(self._warm_up(), timeout=timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"{self.name} warm-up failed: {e}")
+            return False
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Drain in-flight work, then close the loop and its resources.
+
+        New submissions are refused while draining. Coroutines still running
+        after ``timeout`` seconds (default ``ANALYSIS_RUNTIME_DRAIN_TIMEOUT``)
+        are cancelled. Async generators are shut down inside the loop, which
+        disposes the loop's DB engine cleanly.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or self._pid != os.getpid():
+                return
+            self._accepting = False
+            pending = list(self._inflight)
+
+        if timeout is None:
+            timeout = analysis_settings.runtime_drain_timeout_seconds
+        if pending:
+            logger.info(f"Draining {len(pending)} analyses before shutdown")
+            _, not_done = concurrent.futures.wait(pending, timeout=timeout)
+            for future in not_done:
+                future.cancel()
+            if not_done:
+                logger.warning(f"Cancelled {len(not_done)} analyses at shutdown")
+
+        async def _close() -> None:
+            tasks = [
+                task
+                for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+            await loop.shutdown_default_executor()
+
+        if loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(_close(), loop).result(timeout=30)
+            except Exception as e:
+                logger.warning(f"Error closing {self.name}: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=30)
+
+        with self._lock:
+            if not loop.is_running():
+                loop.close()
+            self._loop = self._thread = None
+            self._inflight = set()
+        logger.info(f"Stopped {self.name} event loop")
+
+
+_runtime: Optional[AnalysisRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_analysis_runtime() -> AnalysisRuntime:
+    """Get the process-wide analysis runtime (started on first use)."""
+    global _runtime
+    if _runtime is None:
+        with _runtime_lock:
+            if _runtime is None:
+                _runtime = AnalysisRuntime()
+                atexit.register(_runtime.shutdown)
+    return _runtime
+
+
+def shutdown_analysis_runtime(timeout: Optional[float] = None) -> None:
+    """Drain and stop the analysis runtime if it was started."""
+    if _runtime is not None:
+        _runtime.shutdown(timeout)
@@ -8,6 +8,8 @@ from typing import Any
 from crypto_newsletter.shared.database.connection import get_sync_db_session
 from sqlalchemy import text
 
+from .budget import get_budget_ledger
+
 logger = logging.getLogger(__name__)
 
 
@@ -96,18 +98,26 @@ class AnalysisScheduler:
     def _check_daily_budget_usage(self, db) -> dict[str, Any]:
         """Check how much of daily budget has been used."""
         try:
-            # Get today's analysis costs
-            today_query = text(
+            ledger = get_budget_ledger()
+            if ledger.shared:
+                # Today's counters, including analyses still in flight
+                usage = ledger.usage_sync()
+                daily_cost = usage["spent"] + usage["reserved"]
+                daily_analyses = usage["analyses"]
+            else:
+                # Get today's analysis costs
+                today_query = text(
+                    """
+                    SELECT COALESCE(SUM(cost_usd), 0) as daily_cost,
+                           COUNT(*) as daily_analyses
+                    FROM article_analyses
+                    WHERE created_at >= CURRENT_DATE
                 """
-                SELECT COALESCE(SUM(cost_usd), 0) as daily_cost, COUNT(*) as daily_analyses
-                FROM article_analyses
-                WHERE created_at >= CURRENT_DATE
-            """
-            )
+                )
 
-            result = db.execute(today_query).fetchone()
-            daily_cost = float(result[0]) if result else 0.0
-            daily_analyses = int(result[1]) if result else 0
+                result = db.execute(today_query).fetchone()
+                daily_cost = float(result[0]) if result else 0.0
+                daily_analyses = int(result[1]) if result else 0
 
             remaining_budget = self.config.DAILY_BUDGET - daily_cost
             budget_utilization = (daily_cost / self.config.DAILY_BUDGET) * 100
@@ -135,9 +145,10 @@ class AnalysisScheduler:
                 """
                 SELECT COUNT(*) as count
                 FROM articles a
-                LEFT JOIN article_analyses aa ON a.id = aa.article_id
                 WHERE a.status = 'ACTIVE'
-                  AND aa.id IS NULL
+                  AND NOT EXISTS (
+                    SELECT 1 FROM article_analyses aa WHERE aa.article_id = a.id
+                  )
                   AND LENGTH(a.body) > :min_length
                   AND a.created_at >= NOW() - INTERVAL '24 hours'
             """
@@ -153,9 +164,10 @@ class AnalysisScheduler:
                 """
                 SELECT COUNT(*) as count
                 FROM articles a
-                LEFT JOIN article_analyses aa ON a.id = aa.article_id
                 WHERE a.status = 'ACTIVE'
-                  AND aa.id IS NULL
+                  AND NOT EXISTS (
+                    SELECT 1 FROM article_analyses aa WHERE aa.article_id = a.id
+                  )
                   AND LENGTH(a.body) > :min_length
             """
             )
@@ -170,10 +182,11 @@ class AnalysisScheduler:
                 """
                 SELECT COUNT(*) as count
                 FROM articles a
-                LEFT JOIN article_analyses aa ON a.id = aa.article_id
                 LEFT JOIN publishers p ON a.publisher_id = p.id
                 WHERE a.status = 'ACTIVE'
-                  AND aa.id IS NULL
+                  AND NOT EXISTS (
+                    SELECT 1 FROM article_analyses aa WHERE aa.article_id = a.id
+                  )
                   AND LENGTH(a.body) > :min_length
                   AND p.name = ANY(:publishers)
             """
@@ -0,0 +1,283 @@
+"""External search for signal validation: async backends, cache and fan-out."""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any, Optional, Protocol
+
+from .agents.settings import analysis_settings
+
+logger = logging.getLogger(__name__)
+
+SEARCH_BACKENDS = ("tavily", "stub")
+# Sources the validation agent searches by default
+DEFAULT_DOMAINS = ("coindesk.com", "cointelegraph.com", "decrypt.co")
+# Characters of each result's content shown to the agent
+CONTENT_PREVIEW_CHARS = 500
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query, used as its cache key."""
+    return _WHITESPACE.sub(" ", query).strip().casefold()
+
+
+class SearchBackend(Protocol):
+    name: str
+
+    async def search(self, query: str, max_results: int) -> list[dict[str, Any]]:
+        """Results as dicts with ``title``, ``url`` and ``content``."""
+        ...
+
+
+class TavilySearchBackend:
+    """
+    Tavily's native async client, one per event loop.
+
+    The client keeps its HTTP connection pool open between tool calls, so
+    consecutive searches from a worker reuse TLS connections instead of
+    opening one per search. Clients are bound to the loop that created them
+    (httpx pools are not shareable across loops).
+    """
+
+    name = "tavily"
+
+    def __init__(
+        self,
+        api_key: str,
+        include_domains: Sequence[str] = DEFAULT_DOMAINS,
+        search_depth: str = "advanced",
+        timeout: float = 20.0,
+    ) -> None:
+        self.api_key = api_key
+        self.include_domains = list(include_domains)
+        self.search_depth = search_depth
+        self.timeout = timeout
+        self._clients: dict[asyncio.AbstractEventLoop, Any] = {}
+
+    def _client(self) -> Any:
+        from tavily import AsyncTavilyClient
+
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            # Forget clients of loops that have been closed
+            self._clients = {
+                known: c for known, c in self._clients.items() if not known.is_closed()
+            }
+            client = self._clients[loop] = AsyncTavilyClient(api_key=self.api_key)
+        return client
+
+    async def search(self, query: str, max_results: int) -> list[dict[str, Any]]:
+        response = await self._client().search(
+            query=query,
+            max_results=max_results,
+            search_depth=self.search_depth,
+            include_domains=self.include_domains,
+            timeout=self.timeout,
+        )
+        return response.get("results", [])
+
+
+class StubSearchBackend:
+    """
+    Deterministic offline results for tests and benchmarks.
+
+    Each query yields ``max_results`` synthetic results derived from the
+    query text after ``latency`` seconds, and is recorded in ``queries``.
+    """
+
+    name = "stub"
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.queries: list[str] = []
+
+    async def search(self, query: str, max_results: int) -> list[dict[str, Any]]:
+        self.queries.append(query)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        digest = hashlib.sha1(query.encode("utf-8")).hexdigest()[:8]
+        return [
+            {
+                "title": f"Result {n} for {query}",
+                "url": f"https://search.invalid/{digest}/{n}",
+                "content": f"Stub evidence {n} about {query}.",
+            }
+            for n in range(1, max_results + 1)
+        ]
+
+
+class ExternalSearch:
+    """
+    Search with a TTL/LRU result cache and bounded parallel fan-out.
+
+    Queries are cached by their normalized form and ``max_results``, so
+    the same search issued by several analyses (or repeated by the agent)
+    reaches the backend once per TTL. Concurrent identical searches share
+    one backend request.
+    """
+
+    def __init__(
+        self,
+        backend: SearchBackend,
+        cache_ttl: float = 3600.0,
+        cache_size: int = 512,
+        max_parallel: int = 4,
+    ) -> None:
+        self.backend = backend
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.max_parallel = max(1, max_parallel)
+        self._cache: OrderedDict[tuple[str, int], tuple[float, list]] = OrderedDict()
+        self._inflight: dict[tuple[str, int], asyncio.Future] = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "errors": 0}
+
+    def _cached(self, key: tuple[str, int]) -> Optional[list[dict[str, Any]]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return results
+
+    def _store(self, key: tuple[str, int], results: list[dict[str, Any]]) -> None:
+        self._cache[key] = (time.monotonic() + self.cache_ttl, results)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def search(self, query: str, max_results: int = 3) -> list[dict[str, Any]]:
+        """
+        Search one query, from the cache when possible.
+
+        Raises:
+            Exception: Whatever the backend raised; errors are not cached
+        """
+        key = (normalize_query(query), max_results)
+        loop = asyncio.get_running_loop()
+        while True:
+            results = self._cached(key)
+            if results is not None:
+                self.stats["hits"] += 1
+                return results
+
+            pending = self._inflight.get(key)
+            if pending is None or pending.get_loop() is not loop:
+                break
+            self.stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The search this call joined was cancelled, not this call:
+                # run it again (the first waiter back leads the retry)
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        self.stats["misses"] += 1
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            results = await self.backend.search(query, max_results)
+            self._store(key, results)
+            future.set_result(results)
+            return results
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved: nobody may be waiting on this future
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def search_many(
+        self, queries: Sequence[str], max_results: int = 3
+    ) -> list[tuple[str, Any]]:
+        """
+        Run several queries in parallel, at most ``max_parallel`` at a time.
+
+        Returns:
+            ``(query, results)`` in input order; ``results`` is the exception
+            for a query whose search failed
+        """
+        semaphore = asyncio.Semaphore(self.max_parallel)
+
+        async def one(query: str) -> Any:
+            async with semaphore:
+                try:
+                    return await self.search(query, max_results)
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.warning(f"Search failed for {query!r}: {e}")
+                    return e
+
+        results = await asyncio.gather(*(one(query) for query in queries))
+        return list(zip(queries, results, strict=True))
+
+
+def format_results(results: list[dict[str, Any]]) -> str:
+    """Render search results for the validation agent."""
+    formatted = []
+    for result in results:
+        content = (result.get("content") or "No content")[:CONTENT_PREVIEW_CHARS]
+        formatted.append(
+            f"Source: {result.get('title', 'Unknown')}\n"
+            f"URL: {result.get('url', 'N/A')}\n"
+            f"Content: {content}...\n"
+        )
+    return "\n---\n".join(formatted) if formatted else "No relevant sources found"
+
+
+_external_search: Optional[ExternalSearch] = None
+
+
+def create_external_search(backend: Optional[str] = None) -> Optional[ExternalSearch]:
+    """
+    Build a search client from the ``SEARCH_*`` settings.
+
+    Returns None for the Tavily backend without a ``TAVILY_API_KEY``.
+
+    Raises:
+        ValueError: Unknown backend name
+    """
+    backend = (backend or analysis_settings.search_backend).lower()
+    if backend not in SEARCH_BACKENDS:
+        raise ValueError(
+            f"Unknown search backend {backend!r}; "
+            f"expected one of {', '.join(SEARCH_BACKENDS)}"
+        )
+    if backend == "stub":
+        implementation: SearchBackend = StubSearchBackend()
+    elif analysis_settings.tavily_api_key:
+        implementation = TavilySearchBackend(
+            analysis_settings.tavily_api_key,
+            timeout=analysis_settings.search_timeout_seconds,
+        )
+    else:
+        return None
+    return ExternalSearch(
+        implementation,
+        cache_ttl=analysis_settings.search_cache_ttl_seconds,
+        cache_size=analysis_settings.search_cache_size,
+        max_parallel=analysis_settings.max_parallel_searches,
+    )
+
+
+def get_external_search() -> Optional[ExternalSearch]:
+    """Process-wide search client, or None when search is not configured."""
+    global _external_search
+    if _external_search is None:
+        _external_search = create_external_search()
+    return _external_search
@@ -2,19 +2,31 @@
 
 import asyncio
 import logging
-from typing import Any
+import time
+from typing import Any, Optional
 
+from crypto_newsletter.core.storage.signals import store_analysis_signals
 from crypto_newsletter.shared.celery.app import celery_app
 from crypto_newsletter.shared.database.connection import (
     get_db_session,
     get_sync_db_session,
 )
-from crypto_newsletter.shared.models import Article, ArticleAnalysis
+from crypto_newsletter.shared.models import AnalysisBatchJob, Article, ArticleAnalysis
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from .agents.orchestrator import orchestrator
+from .agents.orchestrator import (
+    PackableArticle,
+    PackedAnalysis,
+    existing_analysis_id,
+    orchestrator,
+)
 from .agents.settings import analysis_settings
+from .batch_jobs import get_batch_backend, poll_analysis_batch, submit_analysis_batch
+from .budget import BudgetExceededError, get_budget_ledger
 from .dependencies import AnalysisDependencies, CostTracker
+from .runtime import get_analysis_runtime
 
 logger = logging.getLogger(__name__)
 
@@ -63,24 +75,31 @@ async def analyze_article_direct(
             min_signal_confidence=analysis_settings.min_signal_confidence,
         )
 
-        # Check budget before starting
-        if not cost_tracker.can_afford(analysis_settings.max_cost_per_article):
-            logger.warning(f"Insufficient budget for article {article_id}")
+        # Reserve the article's worst-case cost before starting
+        ledger = get_budget_ledger()
+        try:
+            reservation = await ledger.reserve(analysis_settings.max_cost_per_article)
+        except BudgetExceededError as e:
+            logger.warning(f"Insufficient budget for article {article_id}: {e}")
             return {
                 "success": False,
                 "article_id": article_id,
-                "error": "Daily analysis budget exceeded",
+                "error": str(e),
                 "requires_manual_review": False,
             }
 
-        # Run orchestrated analysis
-        result = await orchestrator.analyze_article(
-            article_id=article_id,
-            title=article.title,
-            body=article.body,
-            publisher=article.publisher,
-            deps=deps,
-        )
+        # Run orchestrated analysis; the tracker may already carry other costs
+        spent_before = cost_tracker.total_cost
+        try:
+            result = await orchestrator.analyze_article(
+                article_id=article_id,
+                title=article.title,
+                body=article.body,
+                publisher=article.publisher,
+                deps=deps,
+            )
+        finally:
+            await ledger.commit(reservation, cost_tracker.total_cost - spent_before)
 
         # Store results in database if successful
         if result["success"]:
@@ -105,196 +124,261 @@ async def analyze_article_direct(
         }
 
 
-def analyze_article_sync(article_id: int, cost_tracker: CostTracker) -> dict[str, Any]:
+async def analyze_article_isolated(
+    article_id: int,
+    cost_tracker: CostTracker,
+    packed: Optional[PackedAnalysis] = None,
+    session_id: Optional[str] = None,
+) -> dict[str, Any]:
     """
-    Sync wrapper for article analysis using sync database operations.
+    Analyze one article in its own database session.
+
+    A failure rolls back only this article's session, so analyses running
+    concurrently in a batch are independent. The orchestrator stores and
+    commits the results; articles that already have an analysis are skipped.
+
+    Args:
+        article_id: ID of the article to analyze
+        cost_tracker: Cost meter for this article
+        packed: The article's share of a packed content analysis, if any
+        session_id: Budget ledger session the cost also counts against
 
-    This function uses sync database operations to avoid SQLAlchemy async
-    issues in Celery workers, while still using async AI agents via asyncio.run().
+    Returns:
+        Dict with success, analysis_id, processing_cost and signals_found,
+        or success False and an error
     """
-    try:
-        with get_sync_db_session() as db:
-            # Get article using sync database operations
-            article = db.query(Article).filter(Article.id == article_id).first()
-            if not article:
-                logger.error(f"Article {article_id} not found")
-                return {
-                    "success": False,
-                    "article_id": article_id,
-                    "error": f"Article {article_id} not found",
-                }
+    async with get_db_session() as db:
+        article = await db.scalar(
+            select(Article)
+            .options(selectinload(Article.publisher))
+            .where(Article.id == article_id)
+        )
+        if not article:
+            logger.error(f"Article {article_id} not found")
+            return {
+                "success": False,
+                "article_id": article_id,
+                "error": f"Article {article_id} not found",
+            }
 
-            # Check if article meets minimum requirements
-            if len(article.body or "") < analysis_settings.min_content_length:
-                logger.warning(f"Article {article_id} too short for analysis")
-                return {
-                    "success": False,
-                    "article_id": article_id,
-                    "error": "Article too short for analysis",
-                }
+        # Check if article meets minimum requirements
+        if len(article.body or "") < analysis_settings.min_content_length:
+            logger.warning(f"Article {article_id} too short for analysis")
+            return {
+                "success": False,
+                "article_id": article_id,
+                "error": "Article too short for analysis",
+            }
+
+        # Check if analysis already exists
+        analysis_id = await existing_analysis_id(db, article_id)
+        if analysis_id is not None:
+            logger.info(f"Analysis already exists for article {article_id}")
+            return {
+                "success": True,
+                "article_id": article_id,
+                "analysis_id": analysis_id,
+                "skipped": True,
+                "reason": "Analysis already exists",
+            }
 
-            # Check if analysis already exists
-            existing_analysis = (
-                db.query(ArticleAnalysis)
-                .filter(ArticleAnalysis.article_id == article_id)
-                .first()
+        ledger = get_budget_ledger()
+        try:
+            reservation = await ledger.reserve(
+                analysis_settings.max_cost_per_article, session_id=session_id
             )
+        except BudgetExceededError as e:
+            logger.warning(f"Insufficient budget for article {article_id}: {e}")
+            return {"success": False, "article_id": article_id, "error": str(e)}
 
-            if existing_analysis:
-                logger.info(f"Analysis already exists for article {article_id}")
-                return {
-                    "success": True,
+        logger.info(f"Starting analysis for article {article_id}")
+        publisher = article.publisher.name if article.publisher else None
+        deps = AnalysisDependencies(
+            db_session=db,
+            cost_tracker=cost_tracker,
+            current_publisher=publisher,
+            current_article_id=article_id,
+            max_searches_per_validation=analysis_settings.max_searches_per_validation,
+            min_signal_confidence=analysis_settings.min_signal_confidence,
+        )
+        spent_before = cost_tracker.total_cost
+        try:
+            analysis_result = await orchestrator.analyze_article(
+                article_id=article_id,
+                title=article.title,
+                body=article.body,
+                publisher=publisher,
+                deps=deps,
+                packed=packed,
+            )
+        finally:
+            await ledger.commit(reservation, cost_tracker.total_cost - spent_before)
+
+    if not analysis_result.get("success", False):
+        logger.error(
+            f"Analysis failed for article {article_id}: "
+            f"{analysis_result.get('error', 'Unknown error')}"
+        )
+        return analysis_result
+
+    # The orchestrator already stored the results in the database
+    costs = analysis_result["costs"]
+    logger.info(f"Analysis completed for article {article_id}")
+    return {
+        "success": True,
+        "article_id": article_id,
+        "analysis_id": analysis_result.get("analysis_record_id"),
+        "processing_cost": costs["content_analysis"] + costs["signal_validation"],
+        "signals_found": analysis_result["processing_metadata"]["signals_found"],
+    }
+
+
+async def analyze_content_packed(
+    article_ids: list[int], daily_budget: float
+) -> dict[int, PackedAnalysis]:
+    """
+    Run packed content analysis for the batch's analyzable articles.
+
+    Articles that are missing, too short or already analyzed are left to
+    analyze_article_isolated, which reports them. Nothing is stored here.
+    """
+    async with get_db_session() as db:
+        analyzed = select(ArticleAnalysis.article_id).where(
+            ArticleAnalysis.article_id.in_(article_ids)
+        )
+        articles = (
+            await db.scalars(
+                select(Article)
+                .options(selectinload(Article.publisher))
+                .where(Article.id.in_(article_ids), Article.id.not_in(analyzed))
+            )
+        ).all()
+        candidates = [
+            PackableArticle(
+                article_id=article.id,
+                title=article.title,
+                body=article.body,
+                publisher=article.publisher.name if article.publisher else None,
+            )
+            for article in articles
+            if len(article.body or "") >= analysis_settings.min_content_length
+        ]
+    if len(candidates) < 2:
+        return {}
+    deps = AnalysisDependencies(
+        db_session=None,
+        cost_tracker=CostTracker(daily_budget=daily_budget),
+        max_searches_per_validation=analysis_settings.max_searches_per_validation,
+        min_signal_confidence=analysis_settings.min_signal_confidence,
+    )
+    return await orchestrator.analyze_content_packed(candidates, deps)
+
+
+async def analyze_articles_concurrently(
+    article_ids: list[int],
+    max_concurrency: int,
+    daily_budget: float,
+    timeout: Optional[float] = None,
+    packing: Optional[bool] = None,
+    session_id: Optional[str] = None,
+    session_budget: Optional[float] = None,
+) -> list[dict[str, Any]]:
+    """
+    Analyze articles concurrently, at most ``max_concurrency`` at a time.
+
+    LLM requests are additionally paced by the process-wide rate limiter, so
+    wall-clock time approaches the slowest article rather than the sum.
+
+    With packing (default ``ANALYSIS_PACKING``), short articles first get
+    their content analysis from shared requests (analyze_content_packed);
+    the rest, and any article a packed response did not cover, use
+    single-article calls.
+
+    Every analysis reserves its cost in the shared budget ledger, so
+    concurrent analyses (in this and other workers) cannot overspend the
+    day's budget or ``session_budget``.
+
+    Args:
+        article_ids: Articles to analyze
+        max_concurrency: Analyses in flight at once
+        daily_budget: Budget of each article's cost tracker
+        timeout: Per-article timeout (default ANALYSIS_TIMEOUT_SECONDS)
+        packing: Pack short articles into shared content analysis requests
+        session_id: Budget ledger session of the batch
+        session_budget: Sub-budget of the session (with ``session_id``)
+
+    Returns:
+        One result per article (see analyze_article_isolated), in completion
+        order, each with duration_seconds
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    timeout = timeout or analysis_settings.analysis_timeout_seconds
+    if packing is None:
+        packing = analysis_settings.analysis_packing
+    if session_id and session_budget is not None:
+        await get_budget_ledger().open_session(session_id, session_budget)
+
+    packed: dict[int, PackedAnalysis] = {}
+    if packing:
+        try:
+            packed = await asyncio.wait_for(
+                analyze_content_packed(article_ids, daily_budget), timeout
+            )
+        except Exception as e:
+            logger.warning(f"Packed analysis failed, analyzing one by one: {e}")
+        logger.info(f"Packed content analysis covered {len(packed)} articles")
+
+    async def analyze(article_id: int) -> dict[str, Any]:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(
+                    analyze_article_isolated(
+                        article_id,
+                        CostTracker(daily_budget=daily_budget),
+                        packed=packed.get(article_id),
+                        session_id=session_id,
+                    ),
+                    timeout,
+                )
+            except TimeoutError:
+                logger.error(f"Analysis timed out for article {article_id}")
+                result = {
+                    "success": False,
                     "article_id": article_id,
-                    "analysis_id": existing_analysis.id,
-                    "skipped": True,
-                    "reason": "Analysis already exists",
+                    "error": f"Analysis timed out after {timeout:.0f} seconds",
                 }
+            except Exception as e:
+                logger.error(f"Analysis failed for article {article_id}: {e}")
+                result = {"success": False, "article_id": article_id, "error": str(e)}
+            result["duration_seconds"] = round(time.perf_counter() - started, 2)
+            return result
 
-            # Run async analysis within the existing event loop context
-            logger.info(f"Starting analysis for article {article_id}")
-
-            # Since we're in an AsyncIO pool, we can use asyncio.run directly
-            # without creating a new event loop
-            async def run_analysis():
-                # Create async database session for the orchestrator
-                from crypto_newsletter.shared.database.connection import get_db_manager
-
-                async_db_manager = get_db_manager()
-
-                async with async_db_manager.get_session() as async_session:
-                    # Create dependencies for the orchestrator
-                    from crypto_newsletter.analysis.dependencies import (
-                        AnalysisDependencies,
-                    )
-
-                    deps = AnalysisDependencies(
-                        db_session=async_session,
-                        cost_tracker=cost_tracker,
-                        current_publisher=article.publisher,
-                        current_article_id=article_id,
-                        max_searches_per_validation=analysis_settings.max_searches_per_validation,
-                        min_signal_confidence=analysis_settings.min_signal_confidence,
-                    )
-
-                    # Run the async analysis
-                    return await orchestrator.analyze_article(
-                        article_id=article_id,
-                        title=article.title,
-                        body=article.body,
-                        publisher=article.publisher,
-                        deps=deps,
-                    )
-
-            # Since we're in an AsyncIO pool, we can await the coroutine directly
-            # by making this function async and calling it properly
-            import concurrent.futures
-
-            # Run the async function in a separate thread with proper cleanup
-            def run_in_thread():
-                # Create a new event loop for this thread
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    # Run the analysis
-                    result = new_loop.run_until_complete(run_analysis())
-
-                    # Give extra time for any lingering async operations (especially HTTP calls)
-                    await_time = 2.0  # 2 seconds for HTTP operations to complete
-                    logger.debug(f"Waiting {await_time}s for any lingering operations")
-                    new_loop.run_until_complete(asyncio.sleep(await_time))
-
-                    # Wait for any pending tasks to complete
-                    pending_tasks = asyncio.all_tasks(new_loop)
-                    if pending_tasks:
-                        logger.debug(
-                            f"Waiting for {len(pending_tasks)} pending tasks to complete"
-                        )
-                        new_loop.run_until_complete(
-                            asyncio.gather(*pending_tasks, return_exceptions=True)
-                        )
-
-                        # Wait a bit more after task completion
-                        new_loop.run_until_complete(asyncio.sleep(0.1))
-
-                    return result
-                except Exception as e:
-                    logger.error(f"Error in thread analysis: {str(e)}")
-                    raise
-                finally:
-                    # Graceful shutdown of the event loop
-                    try:
-                        # Wait more before cleanup to ensure all HTTP operations finish
-                        new_loop.run_until_complete(asyncio.sleep(1.0))
-
-                        # Cancel any remaining tasks
-                        pending_tasks = asyncio.all_tasks(new_loop)
-                        if pending_tasks:
-                            logger.debug(
-                                f"Cancelling {len(pending_tasks)} remaining tasks"
-                            )
-                            for task in pending_tasks:
-                                task.cancel()
-
-                            # Wait for cancellations to complete with timeout
-                            try:
-                                new_loop.run_until_complete(
-                                    asyncio.wait_for(
-                                        asyncio.gather(
-                                            *pending_tasks, return_exceptions=True
-                                        ),
-                                        timeout=2.0,  # 2 second timeout for cleanup
-                                    )
-                                )
-                            except asyncio.TimeoutError:
-                                logger.warning("Timeout waiting for task cancellations")
-
-                        # Final wait before closing
-                        new_loop.run_until_complete(asyncio.sleep(0.1))
-
-                        # Close the loop gracefully
-                        if not new_loop.is_closed():
-                            new_loop.close()
-
-                    except Exception as cleanup_error:
-                        logger.warning(f"Error during loop cleanup: {cleanup_error}")
-                        # Force close if graceful cleanup fails
-                        if not new_loop.is_closed():
-                            try:
-                                new_loop.close()
-                            except Exception:
-                                pass  # Ignore errors during force close
-
-            # Execute in a thread to avoid event loop conflicts
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_in_thread)
-                # Add timeout to prevent hanging (5 minutes should be enough)
-                try:
-                    analysis_result = future.result(timeout=300)
-                except concurrent.futures.TimeoutError:
-                    logger.error(f"Analysis timed out for article {article_id}")
-                    return {
-                        "success": False,
-                        "article_id": article_id,
-                        "error": "Analysis timed out after 5 minutes",
-                    }
-
-            # Check if analysis was successful
-            if not analysis_result.get("success", False):
-                logger.error(
-                    f"Analysis failed for article {article_id}: {analysis_result.get('error', 'Unknown error')}"
-                )
-                return analysis_result
+    results = []
+    for completed in asyncio.as_completed([analyze(a) for a in article_ids]):
+        results.append(await completed)
+    return results
 
-            # The orchestrator already stored the results in the database
-            # Just return the success result
-            logger.info(f"Analysis completed for article {article_id}")
-            return {
-                "success": True,
-                "article_id": article_id,
-                "analysis_id": analysis_result.get("analysis_record_id"),
-                "processing_cost": analysis_result.get("costs", {}).get("total", 0.0),
-            }
 
+def analyze_article_sync(article_id: int, cost_tracker: CostTracker) -> dict[str, Any]:
+    """
+    Sync wrapper for article analysis.
+
+    Runs analyze_article_isolated on the worker's persistent analysis
+    runtime (warm DB pool and model clients).
+    """
+    timeout = analysis_settings.analysis_timeout_seconds
+    try:
+        return get_analysis_runtime().run(
+            analyze_article_isolated(article_id, cost_tracker), timeout=timeout
+        )
+    except TimeoutError:
+        logger.error(f"Analysis timed out for article {article_id}")
+        return {
+            "success": False,
+            "article_id": article_id,
+            "error": f"Analysis timed out after {timeout:.0f} seconds",
+        }
     except Exception as e:
         logger.error(f"Sync analysis failed for article {article_id}: {str(e)}")
         return {"success": False, "article_id": article_id, "error": str(e)}
@@ -319,81 +403,7 @@ def analyze_article_task(self, article_id: int) -> dict[str, Any]:
     Returns:
         Dict with analysis results and metadata
     """
-
-    async def _run_analysis() -> dict[str, Any]:
-        """Internal async function to run the analysis."""
-
-        async with get_db_session() as db:
-            try:
-                # Get article from database
-                article = await db.get(Article, article_id)
-                if not article:
-                    raise ValueError(f"Article {article_id} not found")
-
-                # Check if article meets minimum requirements
-                if len(article.body or "") < analysis_settings.min_content_length:
-                    logger.warning(f"Article {article_id} too short for analysis")
-                    return {
-                        "success": False,
-                        "article_id": article_id,
-                        "error": "Article content too short for analysis",
-                        "requires_manual_review": False,
-                    }
-
-                # Set up dependencies
-                deps = AnalysisDependencies(
-                    db_session=db,
-                    cost_tracker=CostTracker(
-                        daily_budget=analysis_settings.daily_analysis_budget
-                    ),
-                    current_publisher=article.publisher,
-                    current_article_id=article_id,
-                    max_searches_per_validation=analysis_settings.max_searches_per_validation,
-                    min_signal_confidence=analysis_settings.min_signal_confidence,
-                )
-
-                # Check budget before starting
-                if not deps.cost_tracker.can_afford(
-                    analysis_settings.max_cost_per_article
-                ):
-                    logger.warning(f"Insufficient budget for article {article_id}")
-                    return {
-                        "success": False,
-                        "article_id": article_id,
-                        "error": "Daily analysis budget exceeded",
-                        "requires_manual_review": False,
-                    }
-
-                # Run orchestrated analysis
-                result = await orchestrator.analyze_article(
-                    article_id=article_id,
-                    title=article.title,
-                    body=article.body,
-                    publisher=article.publisher,
-                    deps=deps,
-                )
-
-                # Store results in database if successful
-                if result["success"]:
-                    await _store_analysis_results(db, article_id, result)
-                    await db.commit()
-
-                    logger.info(
-                        f"Analysis complete for article {article_id}. "
-                        f"Cost: ${result['costs']['total']:.4f}, "
-                        f"Signals: {result['processing_metadata']['signals_found']}"
-                    )
-
-                return result
-
-            except Exception as e:
-                await db.rollback()
-                logger.error(f"Analysis failed for article {article_id}: {str(e)}")
-                raise
-
-    # Run the async analysis with proper event loop handling
     try:
-        # Use a more robust approach for AsyncIO/Celery integration
         return _run_analysis_sync_wrapper(article_id)
     except Exception as e:
         logger.error(f"Task failed for article {article_id}: {str(e)}")
@@ -411,105 +421,88 @@ def analyze_article_task(self, article_id: int) -> dict[str, Any]:
 def _run_analysis_sync_wrapper(article_id: int) -> dict[str, Any]:
     """
     Synchronous wrapper for analysis that works with both Celery and batch processing.
-    This function handles the AsyncIO/Celery integration properly.
+
+    The analysis runs on the worker's persistent event loop, so the DB pool
+    and model clients are reused across tasks.
     """
-    import concurrent.futures
+    return get_analysis_runtime().run(_run_analysis(article_id))
 
-    def run_in_new_thread():
-        """Run the async analysis in a completely new thread with its own event loop."""
-        # Create a new event loop for this thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
 
+async def _run_analysis(article_id: int) -> dict[str, Any]:
+    """Analyze an article, store the results and commit."""
+    async with get_db_session() as db:
         try:
-            # Run the async analysis function
-            async def _run_analysis_internal() -> dict[str, Any]:
-                """Internal async function to run the analysis."""
-                async with get_db_session() as db:
-                    try:
-                        # Get article from database
-                        article = await db.get(Article, article_id)
-                        if not article:
-                            raise ValueError(f"Article {article_id} not found")
-
-                        # Check if article meets minimum requirements
-                        if (
-                            len(article.body or "")
-                            < analysis_settings.min_content_length
-                        ):
-                            logger.warning(
-                                f"Article {article_id} too short for analysis"
-                            )
-                            return {
-                                "success": False,
-                                "article_id": article_id,
-                                "error": "Article content too short for analysis",
-                                "requires_manual_review": False,
-                            }
-
-                        # Set up dependencies
-                        deps = AnalysisDependencies(
-                            db_session=db,
-                            cost_tracker=CostTracker(
-                                daily_budget=analysis_settings.daily_analysis_budget
-                            ),
-                            current_publisher=article.publisher,
-                            current_article_id=article_id,
-                            max_searches_per_validation=analysis_settings.max_searches_per_validation,
-                            min_signal_confidence=analysis_settings.min_signal_confidence,
-                        )
-
-                        # Check budget before starting
-                        if not deps.cost_tracker.can_afford(
-                            analysis_settings.max_cost_per_article
-                        ):
-                            logger.warning(
-                                f"Insufficient budget for article {article_id}"
-                            )
-                            return {
-                                "success": False,
-                                "article_id": article_id,
-                                "error": "Daily analysis budget exceeded",
-                                "requires_manual_review": False,
-                            }
-
-                        # Run orchestrated analysis
-                        result = await orchestrator.analyze_article(
-                            article_id=article_id,
-                            title=article.title,
-                            body=article.body,
-                            publisher=article.publisher,
-                            deps=deps,
-                        )
-
-                        # Store results in database if successful
-                        if result["success"]:
-                            await _store_analysis_results(db, article_id, result)
-                            await db.commit()
-
-                            logger.info(
-                                f"Analysis complete for article {article_id}. "
-                                f"Cost: ${result['costs']['total']:.4f}, "
-                                f"Signals: {result['processing_metadata']['signals_found']}"
-                            )
-
-                        return result
-
-                    except Exception as e:
-                        await db.rollback()
-                        logger.error(
-                            f"Analysis failed for article {article_id}: {str(e)}"
-                        )
-                        raise
-
-            return loop.run_until_complete(_run_analysis_internal())
-        finally:
-            loop.close()
+            # Get article from database
+            article = await db.get(Article, article_id)
+            if not article:
+                raise ValueError(f"Article {article_id} not found")
+
+            # Check if article meets minimum requirements
+            if len(article.body or "") < analysis_settings.min_content_length:
+                logger.warning(f"Article {article_id} too short for analysis")
+                return {
+                    "success": False,
+                    "article_id": article_id,
+                    "error": "Article content too short for analysis",
+                    "requires_manual_review": False,
+                }
+
+            # Set up dependencies
+            deps = AnalysisDependencies(
+                db_session=db,
+                cost_tracker=CostTracker(
+                    daily_budget=analysis_settings.daily_analysis_budget
+                ),
+                current_publisher=article.publisher,
+                current_article_id=article_id,
+                max_searches_per_validation=analysis_settings.max_searches_per_validation,
+                min_signal_confidence=analysis_settings.min_signal_confidence,
+            )
+
+            # Reserve the article's worst-case cost before starting
+            ledger = get_budget_ledger()
+            try:
+                reservation = await ledger.reserve(
+                    analysis_settings.max_cost_per_article
+                )
+            except BudgetExceededError as e:
+                logger.warning(f"Insufficient budget for article {article_id}: {e}")
+                return {
+                    "success": False,
+                    "article_id": article_id,
+                    "error": str(e),
+                    "requires_manual_review": False,
+                }
+
+            # Run orchestrated analysis
+            try:
+                result = await orchestrator.analyze_article(
+                    article_id=article_id,
+                    title=article.title,
+                    body=article.body,
+                    publisher=article.publisher,
+                    deps=deps,
+                )
+            finally:
+                await ledger.commit(reservation, deps.cost_tracker.total_cost)
+
+            # Store results in database if successful
+            if result["success"]:
+                await _store_analysis_results(db, article_id, result)
+                await db.commit()
+
+                logger.info(
+                    f"Analysis complete for article {article_id}. "
+                    f"Cost: ${result['costs']['total']:.4f}, "
+                    f"Signals: {result['processing_metadata']['signals_found']}"
+                )
 
-    # Run in a separate thread to completely isolate from any existing event loop
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        future = executor.submit(run_in_new_thread)
-        return future.result()
+            return result
+
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Analysis failed for article {article_id}: {str(e)}")
+            raise
 
 
 async def _store_analysis_results(
@@ -517,6 +510,10 @@ async def _store_analysis_results(
 ) -> None:
     """Store analysis results in the database."""
 
+    if await existing_analysis_id(db, article_id) is not None:
+        logger.info(f"Analysis for article {article_id} stored concurrently")
+        return
+
     content_analysis = result["content_analysis"]
     signal_validation = result.get("signal_validation")
 
@@ -549,9 +546,104 @@ async def _store_analysis_results(
         ),
         token_usage=result.get("usage", {}).get("total_tokens", 0),
         cost_usd=result["costs"]["total"],
+        article_tokens=(result.get("condensation") or {}).get("original_tokens"),
+        condensed_tokens=(result.get("condensation") or {}).get("condensed_tokens"),
     )
 
     db.add(analysis)
+    await store_analysis_signals(db, analysis)
+
+
+async def _submit_backlog_batch(article_ids: list[int]) -> Optional[dict[str, Any]]:
+    async with get_db_session() as db:
+        job = await submit_analysis_batch(db, article_ids, get_batch_backend())
+        if job is None:
+            return None
+        return {
+            "job_id": job.id,
+            "provider_job_id": job.provider_job_id,
+            "articles": len(job.article_ids),
+        }
+
+
+async def _poll_batch(job_id: int) -> dict[str, Any]:
+    async with get_db_session() as db:
+        job = await db.get(AnalysisBatchJob, job_id)
+        if job is None:
+            return {"done": True, "job_id": job_id, "error": "Batch job not found"}
+        return await poll_analysis_batch(db, job, get_batch_backend())
+
+
+@celery_app.task(
+    bind=True,
+    name="crypto_newsletter.analysis.tasks.submit_backlog_analysis_batch",
+    queue="analysis",
+)
+def submit_backlog_analysis_batch_task(
+    self, max_articles: Optional[int] = None
+) -> dict[str, Any]:
+    """
+    Submit older unanalyzed articles as one provider batch job.
+
+    Backlog articles are not time-sensitive, so they go through the
+    provider's batch endpoint (discounted, and outside the interactive rate
+    limit) instead of analyze_article calls. The job is then polled by
+    poll_analysis_batch_task. Does nothing unless BACKLOG_BATCH_JOBS is set.
+
+    Args:
+        max_articles: Articles in the job (default BATCH_JOB_MAX_ARTICLES)
+
+    Returns:
+        Dict with the submitted job, or the reason nothing was submitted
+    """
+    if not analysis_settings.backlog_batch_jobs:
+        return {"success": True, "status": "disabled"}
+
+    from crypto_newsletter.newsletter.batch.identifier import BatchArticleIdentifier
+
+    with get_sync_db_session() as db:
+        article_ids = BatchArticleIdentifier()._get_older_quality_articles_sync(
+            db, limit=max_articles or analysis_settings.batch_job_max_articles
+        )
+    try:
+        submitted = get_analysis_runtime().run(_submit_backlog_batch(article_ids))
+    except BudgetExceededError as e:
+        logger.warning(f"Backlog batch job not submitted: {e}")
+        return {"success": True, "status": "budget_exceeded", "error": str(e)}
+    if submitted is None:
+        return {"success": True, "status": "no_articles"}
+
+    poll_analysis_batch_task.apply_async(
+        args=[submitted["job_id"]],
+        countdown=analysis_settings.batch_job_poll_interval_seconds,
+    )
+    return {"success": True, "status": "submitted", **submitted}
+
+
+@celery_app.task(
+    bind=True,
+    name="crypto_newsletter.analysis.tasks.poll_analysis_batch",
+    queue="analysis",
+)
+def poll_analysis_batch_task(self, job_id: int) -> dict[str, Any]:
+    """
+    Check a batch job; store its validated results once it has finished.
+
+    Re-schedules itself every BATCH_JOB_POLL_INTERVAL_SECONDS while the job
+    is running.
+
+    Args:
+        job_id: AnalysisBatchJob id
+
+    Returns:
+        Dict with the job's status and, when done, stored and failed counts
+    """
+    result = get_analysis_runtime().run(_poll_batch(job_id))
+    if not result["done"]:
+        poll_analysis_batch_task.apply_async(
+            args=[job_id], countdown=analysis_settings.batch_job_poll_interval_seconds
+        )
+    return result
 
 
 @celery_app.task(
@@ -433,6 +433,103 @@ def db_status() -> None:
     asyncio.run(_db_status())
 
 
+@app.command()
+def db_profile(
+    api_url: str = typer.Option(
+        "http://localhost:8000", help="Running API whose query stats to show"
+    ),
+    local: bool = typer.Option(
+        False, "--local", help="Profile a read workload in this process instead"
+    ),
+    iterations: int = typer.Option(3, help="Workload repetitions with --local"),
+    limit: int = typer.Option(10, help="Number of statements to show"),
+    order_by: str = typer.Option(
+        "total", help="With --local, rank by total, mean, max or calls"
+    ),
+) -> None:
+    """Show the heaviest SQL statements by normalized fingerprint."""
+    from crypto_newsletter.shared.database.instrumentation import get_query_stats
+
+    async def _local_profile() -> dict:
+        from crypto_newsletter.core.storage.repository import (
+            ArticleRepository,
+            CategoryRepository,
+        )
+        from crypto_newsletter.shared.database.connection import get_read_session
+
+        query_stats = get_query_stats()
+        query_stats.reset()
+        for _ in range(iterations):
+            async with get_read_session() as db:
+                articles = ArticleRepository(db)
+                await articles.get_article_statistics()
+                await articles.get_recent_articles(hours=24, limit=100)
+                await articles.get_articles_with_filters(limit=20)
+                await articles.get_analysis_ready_articles()
+                await CategoryRepository(db).get_category_statistics()
+        return query_stats.snapshot(limit)
+
+    try:
+        if local:
+            console.print(
+                f"⏱️  [bold blue]Profiling read workload "
+                f"({iterations} runs)...[/bold blue]"
+            )
+            profile = asyncio.run(_local_profile())
+            heaviest = get_query_stats().heaviest(limit, order_by)
+            slowest = profile["slowest"]
+        else:
+            import httpx
+
+            console.print(
+                f"⏱️  [bold blue]Fetching query stats from {api_url}...[/bold blue]"
+            )
+            response = httpx.get(f"{api_url.rstrip('/')}/health/metrics", timeout=30)
+            response.raise_for_status()
+            profile = response.json()["database"]
+            # The API ranks statements by total time
+            heaviest = profile.get("heaviest_queries", [])[:limit]
+            slowest = profile.get("slowest_queries", [])
+    except Exception as e:
+        console.print(f"❌ [bold red]Query profile failed:[/bold red] {e}")
+        raise typer.Exit(1)
+
+    console.print(
+        f"Queries: {profile.get('total_queries', 0)}, "
+        f"avg {profile.get('avg_query_time_ms', 0):.2f} ms, "
+        f"slow: {profile.get('slow_queries_count', 0)}"
+    )
+
+    table = Table(title="Heaviest Statements")
+    table.add_column("Calls", style="cyan", justify="right")
+    table.add_column("Total ms", style="green", justify="right")
+    table.add_column("Mean ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("Max ms", style="yellow", justify="right")
+    table.add_column("Slow", style="red", justify="right")
+    table.add_column("Statement")
+    for entry in heaviest:
+        table.add_row(
+            str(entry["calls"]),
+            f"{entry['total_ms']:.1f}",
+            f"{entry['mean_ms']:.2f}",
+            f"{entry['p95_ms']:.0f}",
+            f"{entry['max_ms']:.1f}",
+            str(entry["slow_calls"]),
+            entry["statement"][:120],
+        )
+    console.print(table)
+
+    if slowest:
+        console.print("\n🐢 [bold]Slowest executions:[/bold]")
+        for sample in slowest[:limit]:
+            console.print(
+                f"   • {sample['duration_ms']:.1f} ms "
+                f"from {sample['caller'] or 'unknown caller'}: "
+                f"{sample['statement'][:100]}"
+            )
+
+
 @app.command()
 def db_cleanup(
     days: int = typer.Option(30, help="Delete articles older than N days"),
@@ -473,6 +570,222 @@ def db_cleanup(
     asyncio.run(_cleanup())
 
 
+@app.command()
+def db_archive(
+    days: int = typer.Option(30, help="Archive articles older than N days"),
+    archive_dir: Optional[str] = typer.Option(
+        None, help="Archive directory (default: ARCHIVE_DIR)"
+    ),
+    chunk_size: Optional[int] = typer.Option(
+        None, help="Articles per chunk (default: ARCHIVE_CHUNK_SIZE)"
+    ),
+    sleep: Optional[float] = typer.Option(
+        None,
+        help="Seconds to sleep between chunks (default: ARCHIVE_CHUNK_SLEEP_SECONDS)",
+    ),
+    format: Optional[str] = typer.Option(
+        None,
+        help="auto, parquet, ndjson-zstd or ndjson-gzip (default: ARCHIVE_FORMAT)",
+    ),
+    resume: bool = typer.Option(True, help="Resume an unfinished run"),
+    max_chunks: Optional[int] = typer.Option(
+        None, help="Stop after N chunks (resumable)"
+    ),
+) -> None:
+    """Archive old articles to compressed files, then soft-delete them in chunks."""
+    from datetime import UTC, timedelta
+
+    from crypto_newsletter.core.storage.archive import ArticleArchiver
+
+    settings = get_settings()
+    archiver = ArticleArchiver(
+        archive_dir=archive_dir or settings.archive_dir,
+        chunk_size=chunk_size or settings.archive_chunk_size,
+        sleep_seconds=(
+            sleep if sleep is not None else settings.archive_chunk_sleep_seconds
+        ),
+        archive_format=format or settings.archive_format,
+    )
+    console.print(
+        f"🗄️  [bold blue]Archiving articles older than {days} days "
+        f"to {archiver.archive_dir}...[/bold blue]"
+    )
+
+    try:
+        report = asyncio.run(
+            archiver.run(
+                datetime.now(UTC) - timedelta(days=days),
+                resume=resume,
+                max_chunks=max_chunks,
+            )
+        )
+    except Exception as e:
+        console.print(f"❌ [bold red]Archive failed:[/bold red] {e}")
+        raise typer.Exit(1)
+
+    table = Table(title="Archive Run")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+    for key, value in report.items():
+        table.add_row(key.replace("_", " ").title(), str(value))
+    console.print(table)
+
+
+@app.command()
+def db_restore(
+    path: str = typer.Argument(..., help="Archive file or directory to restore"),
+    dry_run: bool = typer.Option(
+        True, help="Show what would be restored without writing"
+    ),
+) -> None:
+    """Re-ingest archived articles from archive files."""
+    from crypto_newsletter.core.storage.archive import restore_articles
+
+    console.print(f"♻️  [bold blue]Restoring articles from {path}...[/bold blue]")
+
+    try:
+        summary = asyncio.run(restore_articles(path, dry_run=dry_run))
+    except Exception as e:
+        console.print(f"❌ [bold red]Restore failed:[/bold red] {e}")
+        raise typer.Exit(1)
+
+    verb = "Would restore" if dry_run else "Restored"
+    console.print(
+        f"✅ {verb} {summary['articles_restored']} existing and inserted "
+        f"{summary['articles_inserted']} missing articles "
+        f"from {summary['files']} files"
+    )
+
+
+
+@app.command()
+def db_backfill_signals(
+    chunk_size: int = typer.Option(500, help="Analyses per chunk/transaction"),
+    start_after_id: int = typer.Option(
+        0, help="Resume after this analysis id (last_analysis_id of a prior run)"
+    ),
+    max_chunks: Optional[int] = typer.Option(None, help="Stop after N chunks"),
+) -> None:
+    """Populate the normalized signal tables from existing analyses."""
+    from crypto_newsletter.core.storage.signals import backfill_analysis_signals
+
+    console.print("📡 [bold blue]Backfilling normalized signals...[/bold blue]")
+
+    try:
+        report = asyncio.run(
+            backfill_analysis_signals(
+                chunk_size=chunk_size,
+                start_after_id=start_after_id,
+                max_chunks=max_chunks,
+            )
+        )
+    except Exception as e:
+        console.print(f"❌ [bold red]Signal backfill failed:[/bold red] {e}")
+        raise typer.Exit(1)
+
+    table = Table(title="Signal Backfill")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+    for key, value in report.items():
+        table.add_row(key.replace("_", " ").title(), str(value))
+    console.print(table)
+
+
+@app.command()
+def embed_articles(
+    limit: Optional[int] = typer.Option(
+        None, help="Embed at most N articles (default: all pending)"
+    ),
+) -> None:
+    """Embed pending articles and rebuild the similarity index file."""
+    from crypto_newsletter.core.embeddings import EmbeddingService
+
+    console.print("🧭 [bold blue]Embedding articles...[/bold blue]")
+
+    try:
+        report = asyncio.run(EmbeddingService().update(limit=limit))
+    except Exception as e:
+        console.print(f"❌ [bold red]Embedding failed:[/bold red] {e}")
+        raise typer.Exit(1)
+
+    table = Table(title="Article Embeddings")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+    for key, value in report.items():
+        table.add_row(key.replace("_", " ").title(), str(value))
+    console.print(table)
+
+
+@app.command()
+def newsletter_render(
+    force: bool = typer.Option(False, help="Re-render all newsletters"),
+) -> None:
+    """Render missing or stale newsletter HTML, email and text renditions."""
+    from crypto_newsletter.newsletter.storage import NewsletterStorage
+    from crypto_newsletter.shared.database.connection import get_db_session
+
+    console.print("🖨️ [bold blue]Rendering newsletters...[/bold blue]")
+
+    async def run() -> dict[str, int]:
+        async with get_db_session() as db:
+            return await NewsletterStorage(db).refresh_renditions(force=force)
+
+    try:
+        report = asyncio.run(run())
+    except Exception as e:
+        console.print(f"❌ [bold red]Rendering failed:[/bold red] {e}")
+        raise typer.Exit(1)
+
+    table = Table(title="Newsletter Renditions")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+    for key, value in report.items():
+        table.add_row(key.replace("_", " ").title(), str(value))
+    console.print(table)
+
+@app.command()
+def llm_cache(
+    prune: bool = typer.Option(False, help="Evict expired and least recently used"),
+    clear: bool = typer.Option(False, help="Delete every cached result"),
+    backend: Optional[str] = typer.Option(
+        None, help="database or disk (default: LLM_CACHE_BACKEND)"
+    ),
+) -> None:
+    """Show, prune or clear the cache of LLM analysis results."""
+    from crypto_newsletter.analysis.cache import create_llm_cache
+
+    try:
+        cache = create_llm_cache(backend)
+    except ValueError as e:
+        console.print(f"❌ [bold red]{e}[/bold red]")
+        raise typer.Exit(1)
+    if not cache.enabled:
+        console.print("ℹ️ The LLM result cache is disabled (LLM_CACHE_BACKEND=none)")
+        return
+
+    async def run() -> dict:
+        report = {"backend": cache.backend.name}
+        if clear:
+            report["cleared"] = await cache.backend.clear()
+        elif prune:
+            report["evicted"] = await cache.prune()
+        report.update(await cache.backend.summary())
+        return report
+
+    try:
+        report = asyncio.run(run())
+    except Exception as e:
+        console.print(f"❌ [bold red]LLM cache command failed:[/bold red] {e}")
+        raise typer.Exit(1)
+
+    table = Table(title="LLM Result Cache")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+    for key, value in report.items():
+        table.add_row(key.replace("_", " ").title(), str(value))
+    console.print(table)
+
+
 # Task Management Commands
 @app.command()
 def tasks_active() -> None:
@@ -828,62 +1141,63 @@ def shell() -> None:
 
 @app.command()
 def export_data(
-    output: str = typer.Option("articles.json", help="Output file path"),
-    format: str = typer.Option("json", help="Export format (json/csv)"),
-    days: int = typer.Option(7, help="Days of data to export"),
+    output: Optional[str] = typer.Option(
+        None, help="Output file path (default: articles.<format>[.gz|.zst])"
+    ),
+    format: str = typer.Option("ndjson", help="Export format (ndjson/csv/parquet)"),
+    days: Optional[int] = typer.Option(
+        7, help="Days of data to export (0 for all articles)"
+    ),
+    compression: str = typer.Option(
+        "none",
+        help="none, gzip or zstd (Parquet compresses inside the file)",
+    ),
+    include_analysis: bool = typer.Option(
+        False, help="Add fields from each article's latest analysis"
+    ),
+    include_body: bool = typer.Option(False, help="Include article bodies"),
+    status: Optional[str] = typer.Option("ACTIVE", help="Article status filter"),
+    chunk_size: int = typer.Option(5000, help="Rows fetched per cursor step"),
 ) -> None:
-    """Export article data to file."""
-    console.print(
-        f"📤 [bold blue]Exporting {days} days of data to {output}...[/bold blue]"
+    """Stream article data to an NDJSON, CSV or Parquet file."""
+    from crypto_newsletter.core.storage.export import (
+        ExportQuery,
+        check_export_options,
+        export_filename,
+        export_to_file,
     )
 
-    async def _export():
-        try:
-            import csv
-            import json
-
-            from crypto_newsletter.core.storage.repository import ArticleRepository
-            from crypto_newsletter.shared.database.connection import get_db_session
-
-            async with get_db_session() as db:
-                repo = ArticleRepository(db)
-                articles = await repo.get_recent_articles(hours=days * 24, limit=1000)
-
-                # Convert to dict format
-                data = []
-                for article in articles:
-                    data.append(
-                        {
-                            "id": article.id,
-                            "title": article.title,
-                            "url": article.url,
-                            "published_on": article.published_on.isoformat()
-                            if article.published_on
-                            else None,
-                            "publisher_id": article.publisher_id,
-                        }
-                    )
-
-                # Export based on format
-                if format.lower() == "json":
-                    with open(output, "w") as f:
-                        json.dump(data, f, indent=2)
-                elif format.lower() == "csv":
-                    with open(output, "w", newline="") as f:
-                        if data:
-                            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                            writer.writeheader()
-                            writer.writerows(data)
+    export_format = "ndjson" if format.lower() == "json" else format.lower()
+    try:
+        check_export_options(export_format, compression)
+    except (ImportError, ValueError) as e:
+        console.print(f"❌ [bold red]Export failed:[/bold red] {e}")
+        raise typer.Exit(1)
 
-                console.print(
-                    f"✅ [bold green]Exported {len(data)} articles to {output}[/bold green]"
-                )
+    output = output or export_filename(export_format, compression)
+    scope = f"{days} days of data" if days else "all articles"
+    console.print(f"📤 [bold blue]Exporting {scope} to {output}...[/bold blue]")
 
-        except Exception as e:
-            console.print(f"❌ [bold red]Export failed:[/bold red] {e}")
-            raise typer.Exit(1)
+    query = ExportQuery.last_days(
+        days,
+        status=status,
+        include_body=include_body,
+        include_analysis=include_analysis,
+    )
+    try:
+        report = asyncio.run(
+            export_to_file(output, query, export_format, compression, chunk_size)
+        )
+    except Exception as e:
+        console.print(f"❌ [bold red]Export failed:[/bold red] {e}")
+        raise typer.Exit(1)
 
-    asyncio.run(_export())
+    table = Table(title="Export")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+    for key, value in report.items():
+        table.add_row(key.replace("_", " ").title(), str(value))
+    console.print(table)
 
 
 # Help and Information Commands
@@ -905,7 +1219,14 @@ def commands() -> None:
             ("schedule-ingest", "Schedule ingestion task"),
             ("stats", "Show article statistics"),
             ("db-status", "Check database status"),
+            ("db-profile", "Show the heaviest SQL statements"),
             ("db-cleanup", "Clean up old articles"),
+            ("db-archive", "Archive and soft-delete old articles"),
+            ("db-restore", "Restore articles from archive"),
+            ("db-backfill-signals", "Normalize analysis signals"),
+            ("embed-articles", "Embed articles for similarity search"),
+            ("newsletter-render", "Render newsletter HTML/email/text"),
+            ("llm-cache", "Show or prune cached LLM results"),
         ],
         "⚙️ Task Management": [
             ("tasks-active", "Show active tasks"),
@@ -0,0 +1,21 @@
+"""Article embeddings and local vector similarity search."""
+
+from .embedder import Embedder, HashingEmbedder, get_embedder
+from .index import VectorIndex
+from .service import (
+    EmbeddingService,
+    article_text,
+    get_similarity_index,
+    reset_similarity_index,
+)
+
+__all__ = [
+    "Embedder",
+    "HashingEmbedder",
+    "get_embedder",
+    "VectorIndex",
+    "EmbeddingService",
+    "article_text",
+    "get_similarity_index",
+    "reset_similarity_index",
+]
@@ -0,0 +1,122 @@
+"""Pluggable text embedders for article similarity."""
+
+import hashlib
+import importlib
+import math
+import re
+from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9'$-]*[a-z0-9]|[a-z0-9]")
+
+# Frequent words that carry no topic; dropped instead of IDF weighting
+STOPWORDS = frozenset(
+    """
+    a about after all also an and any are as at be been being but by can could
+    did do does for from had has have he her his how i if in into is it its
+    just like may more most new no not of on one or other our out over said
+    says she so some such than that the their them then there these they this
+    to up us was we were what when which while who will with would you your
+    """.split()
+)
+
+
+class Embedder(ABC):
+    """
+    Turns texts into fixed-size vectors.
+
+    Implementations return one L2-normalized float32 row per text, so the dot
+    product of two rows is their cosine similarity. ``name`` and ``version``
+    are stored with every embedding; changing either starts a new index.
+    """
+
+    name: str
+    version: str
+    dimension: int
+
+    @abstractmethod
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts into an array of shape (len(texts), dimension)."""
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows in place; all-zero rows stay zero."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+class HashingEmbedder(Embedder):
+    """
+    Local, deterministic embedder using the hashing trick.
+
+    Unigrams and bigrams (stopwords removed) are hashed with BLAKE2b into
+    ``dimension`` signed buckets and weighted by sublinear term frequency
+    (1 + log tf). It needs no model download, network or fitted vocabulary, so
+    every process produces identical vectors for the same text.
+    """
+
+    name = "hashing"
+
+    def __init__(self, dimension: int = 256) -> None:
+        if dimension < 8:
+            raise ValueError("Embedding dimension must be at least 8")
+        self.dimension = dimension
+        self.version = f"v1-d{dimension}"
+        self._bucket = lru_cache(maxsize=1 << 18)(self._hash_feature)
+
+    def _hash_feature(self, feature: str) -> tuple[int, float]:
+        digest = int.from_bytes(
+            hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(),
+            "little",
+        )
+        return digest % self.dimension, 1.0 if digest >> 63 else -1.0
+
+    @staticmethod
+    def features(text: str) -> list[str]:
+        """Unigram and bigram features of a text."""
+        tokens = [
+            token
+            for token in _TOKEN.findall(text.lower())
+            if token not in STOPWORDS and not token.isdigit()
+        ]
+        return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in Counter(self.features(text or "")).items():
+                bucket, sign = self._bucket(feature)
+                vectors[row, bucket] += sign * (1.0 + math.log(count))
+        return normalize_rows(vectors)
+
+
+EMBEDDERS: dict[str, type[Embedder]] = {"hashing": HashingEmbedder}
+
+
+def get_embedder(backend: str = "hashing", dimension: int = 256) -> Embedder:
+    """
+    Create the configured embedder.
+
+    Args:
+        backend: A registered name (``hashing``) or ``package.module:Class``
+            for a custom ``Embedder`` subclass taking a ``dimension`` argument
+        dimension: Vector size
+    """
+    if backend in EMBEDDERS:
+        return EMBEDDERS[backend](dimension=dimension)
+
+    module_name, _, class_name = backend.partition(":")
+    if not class_name:
+        raise ValueError(
+            f"Unknown embedding backend {backend!r}; expected one of "
+            f"{list(EMBEDDERS)} or 'package.module:Class'"
+        )
+    embedder_class = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(embedder_class, type) and issubclass(embedder_class, Embedder)):
+        raise TypeError(f"{backend} is not an Embedder subclass")
+    return embedder_class(dimension=dimension)
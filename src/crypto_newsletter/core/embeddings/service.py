@@ -0,0 +1,276 @@
+"""Article embedding generation and the process-wide similarity index."""
+
+import asyncio
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any, Optional
+
+import numpy as np
+from loguru import logger
+from sqlalchemy import and_, bindparam, exists, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from crypto_newsletter.shared.config.settings import get_settings
+from crypto_newsletter.shared.database.connection import get_db_session
+from crypto_newsletter.shared.models import Article, ArticleEmbedding
+
+from .embedder import Embedder, get_embedder
+from .index import VectorIndex
+
+# Characters of body text embedded after the title and subtitle
+BODY_CHARS = 4000
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+_PENDING_ARTICLES = (
+    select(Article.id, Article.title, Article.subtitle, Article.body)
+    .where(
+        Article.status == "ACTIVE",
+        Article.id > bindparam("after_id"),
+        ~exists().where(
+            and_(
+                ArticleEmbedding.article_id == Article.id,
+                ArticleEmbedding.embedding_model == bindparam("model"),
+                ArticleEmbedding.embedding_version == bindparam("version"),
+            )
+        ),
+    )
+    .order_by(Article.id)
+    .limit(bindparam("limit"))
+)
+# Keyset on (created_at, id): one bulk insert shares a created_at
+_NEW_EMBEDDINGS = (
+    select(
+        ArticleEmbedding.id,
+        ArticleEmbedding.article_id,
+        ArticleEmbedding.embedding,
+        ArticleEmbedding.created_at,
+    )
+    .where(
+        ArticleEmbedding.embedding_model == bindparam("model"),
+        ArticleEmbedding.embedding_version == bindparam("version"),
+        tuple_(ArticleEmbedding.created_at, ArticleEmbedding.id)
+        > tuple_(bindparam("after_created_at"), bindparam("after_id")),
+    )
+    .order_by(ArticleEmbedding.created_at, ArticleEmbedding.id)
+    .limit(bindparam("limit"))
+)
+
+
+def article_text(title: str, subtitle: Optional[str], body: Optional[str]) -> str:
+    """Text embedded for an article; the title is repeated to weight it up."""
+    return "\n".join(
+        part for part in (title, title, subtitle, (body or "")[:BODY_CHARS]) if part
+    )
+
+
+class EmbeddingService:
+    """Writes article embeddings in batches and keeps a VectorIndex in sync."""
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        index_path: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        settings = get_settings()
+        self.embedder = embedder or get_embedder(
+            settings.embedding_backend, settings.embedding_dimension
+        )
+        self.index_path = index_path or settings.embedding_index_path
+        self.batch_size = batch_size or settings.embedding_batch_size
+
+    @property
+    def _model_params(self) -> dict[str, str]:
+        return {"model": self.embedder.name, "version": self.embedder.version}
+
+    def new_index(self) -> VectorIndex:
+        return VectorIndex(
+            self.embedder.dimension, self.embedder.name, self.embedder.version
+        )
+
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
+        """Embed off the event loop (hashing a batch is CPU-bound)."""
+        return await asyncio.to_thread(self.embedder.embed, texts)
+
+    async def embed_pending_articles(self, limit: Optional[int] = None) -> int:
+        """
+        Embed ACTIVE articles that have no embedding for the current embedder.
+
+        Each batch of ``batch_size`` articles is embedded and bulk-inserted in
+        its own transaction.
+
+        Args:
+            limit: Stop after this many articles (default: all pending)
+
+        Returns:
+            Number of articles embedded
+        """
+        embedded = 0
+        after_id = 0
+        while limit is None or embedded < limit:
+            batch_limit = self.batch_size
+            if limit is not None:
+                batch_limit = min(batch_limit, limit - embedded)
+
+            async with get_db_session() as db:
+                rows = (
+                    await db.execute(
+                        _PENDING_ARTICLES,
+                        {
+                            **self._model_params,
+                            "after_id": after_id,
+                            "limit": batch_limit,
+                        },
+                    )
+                ).all()
+                if not rows:
+                    break
+
+                vectors = await self.embed_texts(
+                    [article_text(row.title, row.subtitle, row.body) for row in rows]
+                )
+                await db.execute(
+                    insert(ArticleEmbedding).on_conflict_do_nothing(
+                        constraint="uq_article_embedding"
+                    ),
+                    [
+                        {
+                            "article_id": row.id,
+                            "embedding": vector.tolist(),
+                            "embedding_model": self.embedder.name,
+                            "embedding_version": self.embedder.version,
+                        }
+                        for row, vector in zip(rows, vectors)
+                    ],
+                )
+
+            embedded += len(rows)
+            after_id = rows[-1].id
+            logger.debug(f"Embedded {len(rows)} articles up to id {after_id}")
+
+        if embedded:
+            logger.info(f"Embedded {embedded} articles with {self.embedder.name}")
+        return embedded
+
+    async def sync_index(self, index: VectorIndex) -> int:
+        """
+        Add embeddings written since the index's watermark (by any process).
+
+        Rows from ``EMBEDDING_SYNC_OVERLAP_SECONDS`` before the watermark are
+        read again, so a transaction that committed after newer rows is not
+        skipped; re-reading a vector just replaces it.
+
+        Returns:
+            Number of vectors added or replaced
+        """
+        after = (_EPOCH, 0)
+        if index.watermark is not None:
+            overlap = timedelta(seconds=get_settings().embedding_sync_overlap_seconds)
+            after = (index.watermark - overlap, 0)
+
+        added = 0
+        while True:
+            async with get_db_session() as db:
+                rows = (
+                    await db.execute(
+                        _NEW_EMBEDDINGS,
+                        {
+                            **self._model_params,
+                            "after_created_at": after[0],
+                            "after_id": after[1],
+                            "limit": self.batch_size * 16,
+                        },
+                    )
+                ).all()
+            if not rows:
+                return added
+
+            index.add(
+                [row.article_id for row in rows],
+                np.asarray([row.embedding for row in rows], dtype=np.float32),
+            )
+            after = (rows[-1].created_at, rows[-1].id)
+            if index.watermark is None or after[0] > index.watermark:
+                index.watermark = after[0]
+            added += len(rows)
+
+    async def load_index(self) -> VectorIndex:
+        """
+        Load the persisted index (memory-mapped), then sync it from the database.
+
+        A missing index or one built by a different embedder starts empty and
+        is rebuilt from ``article_embeddings``. The index is saved again when
+        the sync added anything.
+        """
+        index = VectorIndex.load(self.index_path)
+        embedder = self.embedder
+        if index is None or not index.matches(
+            embedder.name, embedder.version, embedder.dimension
+        ):
+            index = self.new_index()
+
+        if await self.sync_index(index):
+            index.save(self.index_path)
+        logger.info(f"Similarity index ready: {len(index)} articles")
+        return index
+
+    async def update(self, limit: Optional[int] = None) -> dict[str, Any]:
+        """Embed pending articles and refresh the persisted index."""
+        started = time.monotonic()
+        embedded = await self.embed_pending_articles(limit)
+        index = await get_similarity_index(self, max_age_seconds=0)
+        index.save(self.index_path)
+        return {
+            "articles_embedded": embedded,
+            "index_size": len(index),
+            "embedder": f"{self.embedder.name}/{self.embedder.version}",
+            "duration_seconds": round(time.monotonic() - started, 2),
+        }
+
+
+_index: Optional[VectorIndex] = None
+_last_sync = 0.0
+_sync_lock = threading.Lock()
+
+
+async def get_similarity_index(
+    service: Optional[EmbeddingService] = None,
+    max_age_seconds: Optional[float] = None,
+) -> VectorIndex:
+    """
+    Get the process-wide similarity index, loading it on first use.
+
+    Afterwards it is synced from the database at most every
+    ``EMBEDDING_SYNC_SECONDS`` so embeddings written by workers show up; a
+    sync already running in this process is not waited for.
+    """
+    global _index, _last_sync
+    service = service or EmbeddingService()
+    if max_age_seconds is None:
+        max_age_seconds = get_settings().embedding_sync_seconds
+
+    if _index is not None and time.monotonic() - _last_sync < max_age_seconds:
+        return _index
+    if not _sync_lock.acquire(blocking=False):
+        if _index is not None:
+            return _index
+        await asyncio.to_thread(_sync_lock.acquire)
+
+    try:
+        if _index is None:
+            _index = await service.load_index()
+        elif time.monotonic() - _last_sync >= max_age_seconds:
+            await service.sync_index(_index)
+        _last_sync = time.monotonic()
+        return _index
+    finally:
+        _sync_lock.release()
+
+
+def reset_similarity_index() -> None:
+    """Forget the loaded index (tests, embedder changes)."""
+    global _index, _last_sync
+    _index = None
+    _last_sync = 0.0
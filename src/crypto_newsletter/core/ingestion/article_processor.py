@@ -8,6 +8,7 @@ from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
+from crypto_newsletter.shared.database.partitions import lock_unique_key
 from crypto_newsletter.shared.models import Article, ArticleCategory, Category, Publisher
 from crypto_newsletter.shared.utils.language_detection import (
     validate_article_language,
@@ -40,6 +41,10 @@ class ArticleProcessor:
 
         logger.info(f"Processing {len(articles)} articles")
 
+        # The unique constraints only hold per published_on month; one
+        # ingestion at a time keeps the cross-month duplicate check race-free
+        await lock_unique_key(self.db, "articles")
+
         for article_data in articles:
             try:
                 # Validate and correct language
@@ -230,6 +235,10 @@ class ArticleProcessor:
                 article_data["UPDATED_ON"], tz=timezone.utc
             )
 
+        # published_on is the partition key and cannot be NULL
+        if published_on is None:
+            published_on = created_on or datetime.now(timezone.utc)
+
         article = Article(
             external_id=article_data.get("ID"),
             guid=article_data.get("GUID"),
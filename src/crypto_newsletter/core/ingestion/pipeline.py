@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
+from crypto_newsletter.shared.cache import ARTICLES, PUBLISHERS, invalidate_cache_tags
 from crypto_newsletter.shared.config.settings import get_settings
 from crypto_newsletter.shared.database.connection import get_db_session
 
@@ -25,6 +26,7 @@ class ArticleIngestionPipeline:
             "articles_processed": 0,
             "duplicates_skipped": 0,
             "errors": 0,
+            "articles_embedded": 0,
             "processing_time": 0.0,
         }
 
@@ -79,7 +81,11 @@ class ArticleIngestionPipeline:
             self.stats["articles_processed"] = processed_count
             self.stats["duplicates_skipped"] = len(recent_articles) - len(unique_articles)
 
-            # Step 5: Generate final results
+            # Step 5: Embed the new articles for similarity search
+            if processed_count and self.settings.embeddings_enabled:
+                await self._embed_new_articles()
+
+            # Step 6: Generate final results
             return self._generate_results(start_time)
 
         except Exception as e:
@@ -131,9 +137,23 @@ class ArticleIngestionPipeline:
             processor = ArticleProcessor(db_session)
             processed_count = await processor.process_articles(articles)
 
+        if processed_count:
+            # Committed: cached stats and publisher lists are stale now
+            await invalidate_cache_tags(ARTICLES, PUBLISHERS)
+
         logger.info(f"Successfully processed and stored {processed_count} articles")
         return processed_count
 
+    async def _embed_new_articles(self) -> None:
+        """Embed articles without an embedding; failures do not fail ingestion."""
+        from crypto_newsletter.core.embeddings import EmbeddingService
+
+        try:
+            embedded = await EmbeddingService().embed_pending_articles()
+            self.stats["articles_embedded"] = embedded
+        except Exception as e:
+            logger.warning(f"Article embedding failed, will retry next run: {e}")
+
     def _generate_results(self, start_time: datetime) -> Dict[str, Any]:
         """Generate pipeline execution results."""
         end_time = datetime.now(timezone.utc)
@@ -149,6 +169,7 @@ class ArticleIngestionPipeline:
                 "articles_fetched": self.stats["articles_fetched"],
                 "articles_processed": self.stats["articles_processed"],
                 "duplicates_skipped": self.stats["duplicates_skipped"],
+                "articles_embedded": self.stats["articles_embedded"],
                 "success_rate": (
                     self.stats["articles_processed"] / self.stats["articles_fetched"]
                     if self.stats["articles_fetched"] > 0
@@ -217,6 +238,7 @@ class ArticleIngestionPipeline:
             "articles_processed": 0,
             "duplicates_skipped": 0,
             "errors": 0,
+            "articles_embedded": 0,
             "processing_time": 0.0,
         }
 
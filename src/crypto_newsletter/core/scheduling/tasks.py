@@ -5,11 +5,18 @@ from typing import Any, Optional
 
 from crypto_newsletter.core.ingestion import pipeline_health_check
 from crypto_newsletter.core.ingestion.pipeline import ArticleIngestionPipeline
-from crypto_newsletter.core.storage.repository import ArticleRepository
+from crypto_newsletter.core.storage.archive import ArticleArchiver
+from crypto_newsletter.core.storage.signals import backfill_analysis_signals
 from crypto_newsletter.newsletter.monitoring import get_newsletter_health_status
 from crypto_newsletter.shared.celery.app import celery_app
 from crypto_newsletter.shared.celery.health import check_celery_health
+from crypto_newsletter.shared.config.settings import get_settings
 from crypto_newsletter.shared.database.connection import get_db_session
+from crypto_newsletter.shared.database.partitions import (
+    apply_partition_retention,
+    ensure_partitions,
+    is_partitioned,
+)
 from loguru import logger
 
 
@@ -171,6 +178,12 @@ async def cleanup_old_articles(
     """
     Scheduled task to clean up old articles.
 
+    On a partitioned schema, whole monthly partitions older than the cutoff
+    are archived, detached or dropped (PARTITION_RETENTION_MODE), so retention
+    has month granularity. Otherwise old articles are exported to compressed
+    archive files and marked as DELETED in resumable chunks (see
+    ArticleArchiver).
+
     Args:
         days_to_keep: Number of days of articles to keep
         dry_run: If True, only count articles that would be deleted
@@ -188,7 +201,27 @@ async def cleanup_old_articles(
             cutoff_date = datetime.now(UTC) - timedelta(days=days_to_keep)
 
             async with get_db_session() as db:
-                repo = ArticleRepository(db)
+                if await is_partitioned(db, "articles"):
+                    settings = get_settings()
+                    retired = await apply_partition_retention(
+                        db,
+                        cutoff_date,
+                        mode=settings.partition_retention_mode,
+                        archive_schema=settings.partition_archive_schema,
+                        dry_run=dry_run,
+                    )
+                    partition_names = [partition.name for partition in retired]
+                    logger.info(
+                        f"Partition retention ({settings.partition_retention_mode}, "
+                        f"dry_run={dry_run}): {partition_names or 'nothing to retire'}"
+                    )
+                    return {
+                        "success": True,
+                        "dry_run": dry_run,
+                        "retention_mode": settings.partition_retention_mode,
+                        "partitions_retired": partition_names,
+                        "cutoff_date": cutoff_date.isoformat(),
+                    }
 
                 if dry_run:
                     # Count articles that would be deleted
@@ -209,34 +242,26 @@ async def cleanup_old_articles(
                         "cutoff_date": cutoff_date.isoformat(),
                     }
 
-                else:
-                    # Actually delete old articles (mark as DELETED)
-                    from crypto_newsletter.shared.models import Article
-                    from sqlalchemy import update
-
-                    query = (
-                        update(Article)
-                        .where(
-                            Article.published_on < cutoff_date,
-                            Article.status == "ACTIVE",
-                        )
-                        .values(status="DELETED", updated_on=datetime.now(UTC))
-                    )
-
-                    result = await db.execute(query)
-                    await db.commit()
-
-                    deleted_count = result.rowcount
-                    logger.info(
-                        f"Cleanup completed: {deleted_count} articles marked as deleted"
-                    )
+            # Archive and soft-delete in short per-chunk transactions
+            settings = get_settings()
+            archiver = ArticleArchiver(
+                archive_dir=settings.archive_dir,
+                chunk_size=settings.archive_chunk_size,
+                sleep_seconds=settings.archive_chunk_sleep_seconds,
+                archive_format=settings.archive_format,
+            )
+            report = await archiver.run(cutoff_date)
+            logger.info(
+                f"Cleanup completed: {report['articles_archived']} articles "
+                f"archived and marked as deleted"
+            )
 
-                    return {
-                        "success": True,
-                        "dry_run": False,
-                        "articles_deleted": deleted_count,
-                        "cutoff_date": cutoff_date.isoformat(),
-                    }
+            return {
+                "success": True,
+                "dry_run": False,
+                "articles_deleted": report["articles_archived"],
+                **report,
+            }
 
         except Exception as exc:
             logger.error(f"Article cleanup failed: {exc}")
@@ -257,6 +282,97 @@ async def cleanup_old_articles(
     return await _run_cleanup()
 
 
+@celery_app.task(
+    bind=True,
+    name="crypto_newsletter.core.scheduling.tasks.maintain_partitions",
+    max_retries=2,
+)
+async def maintain_partitions(
+    self,
+    months_ahead: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Scheduled task to pre-create upcoming monthly partitions.
+
+    Args:
+        months_ahead: Months to create beyond the current one
+            (default: PARTITION_MONTHS_AHEAD)
+
+    Returns:
+        Dict with the partitions that were created
+    """
+
+    async def _run_maintenance():
+        months = (
+            months_ahead
+            if months_ahead is not None
+            else get_settings().partition_months_ahead
+        )
+        try:
+            async with get_db_session() as db:
+                if not await is_partitioned(db, "articles"):
+                    logger.debug("Articles table is not partitioned, skipping")
+                    return {"success": True, "partitioned": False, "created": []}
+
+                created = await ensure_partitions(db, months_ahead=months)
+
+            logger.info(f"Partition maintenance completed - created: {created}")
+            return {
+                "success": True,
+                "partitioned": True,
+                "created": created,
+                "months_ahead": months,
+            }
+
+        except Exception as exc:
+            logger.error(f"Partition maintenance failed: {exc}")
+
+            if self.request.retries < self.max_retries:
+                raise self.retry(countdown=600, exc=exc)
+
+            return {"success": False, "error": str(exc)}
+
+    return await _run_maintenance()
+
+
+@celery_app.task(
+    bind=True,
+    name="crypto_newsletter.core.scheduling.tasks.backfill_analysis_signals",
+    max_retries=2,
+)
+async def backfill_signals(
+    self,
+    chunk_size: int = 500,
+    start_after_id: int = 0,
+) -> dict[str, Any]:
+    """
+    One-off task to populate the normalized signal tables from analyses.
+
+    Each chunk replaces its own rows, so a retry can safely start over.
+
+    Args:
+        chunk_size: Analyses per chunk/transaction
+        start_after_id: Only analyses with a greater id are processed
+
+    Returns:
+        Dict with the backfill report
+    """
+    try:
+        report = await backfill_analysis_signals(
+            chunk_size=chunk_size, start_after_id=start_after_id
+        )
+        logger.info(f"Signal backfill completed: {report}")
+        return {"success": True, **report}
+
+    except Exception as exc:
+        logger.error(f"Signal backfill failed: {exc}")
+
+        if self.request.retries < self.max_retries:
+            raise self.retry(countdown=300, exc=exc)
+
+        return {"success": False, "error": str(exc)}
+
+
 @celery_app.task(
     name="crypto_newsletter.core.scheduling.tasks.manual_ingest",
     max_retries=1,
@@ -1,19 +1,25 @@
 """Storage layer with repository pattern for data access."""
 
 from .repository import (
+    AgentArticle,
     ArticleRepository,
     CategoryRepository,
+    EmbeddingRepository,
     NewsletterRepository,
     PublisherRepository,
+    SignalRepository,
     get_recent_articles_with_stats,
     run_pipeline_with_monitoring,
 )
 
 __all__ = [
+    "AgentArticle",
     "ArticleRepository",
     "CategoryRepository",
+    "EmbeddingRepository",
     "NewsletterRepository",
     "PublisherRepository",
+    "SignalRepository",
     "get_recent_articles_with_stats",
     "run_pipeline_with_monitoring",
 ]
@@ -0,0 +1,408 @@
+"""Chunked, resumable article archiving with compressed cold-storage export."""
+
+import asyncio
+import gzip
+import json
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy import DateTime, insert, select, update
+
+from crypto_newsletter.shared.cache import ARTICLES, invalidate_cache_tags
+from crypto_newsletter.shared.database.connection import get_db_session
+from crypto_newsletter.shared.models import Article
+
+ARTICLE_COLUMNS = [column.name for column in Article.__table__.columns]
+DATETIME_COLUMNS = {
+    column.name
+    for column in Article.__table__.columns
+    if isinstance(column.type, DateTime)
+}
+
+# Archive format -> file extension
+ARCHIVE_FORMATS = {
+    "parquet": "parquet",
+    "ndjson-zstd": "ndjson.zst",
+    "ndjson-gzip": "ndjson.gz",
+}
+CHECKPOINT_FILE = "checkpoint.json"
+
+
+def _has_module(name: str) -> bool:
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_archive_format(archive_format: str = "auto") -> str:
+    """
+    Resolve the archive format, checking optional dependencies.
+
+    "auto" prefers Parquet (pyarrow), then zstd NDJSON (zstandard), then gzip
+    NDJSON, which only needs the standard library.
+    """
+    if archive_format == "auto":
+        if _has_module("pyarrow"):
+            return "parquet"
+        if _has_module("zstandard"):
+            return "ndjson-zstd"
+        return "ndjson-gzip"
+
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ValueError(
+            f"Unknown archive format {archive_format!r}; "
+            f"expected auto or one of {list(ARCHIVE_FORMATS)}"
+        )
+    required = {"parquet": "pyarrow", "ndjson-zstd": "zstandard"}.get(archive_format)
+    if required and not _has_module(required):
+        raise ImportError(
+            f"Archive format {archive_format!r} requires {required}. "
+            "Install with: uv add 'crypto-newsletter[archive]'"
+        )
+    return archive_format
+
+
+def _format_for_path(path: Path) -> str:
+    for archive_format, extension in ARCHIVE_FORMATS.items():
+        if path.name.endswith(f".{extension}"):
+            return archive_format
+    raise ValueError(f"Not an article archive file: {path}")
+
+
+def _to_json_row(row: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in row.items()
+    }
+
+
+def _from_json_row(row: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: datetime.fromisoformat(value)
+        if key in DATETIME_COLUMNS and isinstance(value, str)
+        else value
+        for key, value in row.items()
+    }
+
+
+def write_archive_file(
+    path: Path, rows: list[dict[str, Any]], archive_format: str
+) -> int:
+    """
+    Write rows to ``path`` atomically (temp file + rename).
+
+    Returns:
+        Size of the written file in bytes
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+
+    if archive_format == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        pq.write_table(pa.Table.from_pylist(rows), tmp_path, compression="zstd")
+    else:
+        payload = "".join(
+            json.dumps(_to_json_row(row), ensure_ascii=False) + "\n" for row in rows
+        ).encode("utf-8")
+        if archive_format == "ndjson-zstd":
+            import zstandard
+
+            tmp_path.write_bytes(zstandard.ZstdCompressor(level=10).compress(payload))
+        else:
+            with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+                f.write(payload)
+
+    tmp_path.replace(path)
+    return path.stat().st_size
+
+
+def read_archive_file(path: Path) -> list[dict[str, Any]]:
+    """Read the rows stored in an archive file."""
+    archive_format = _format_for_path(path)
+
+    if archive_format == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path).to_pylist()
+
+    if archive_format == "ndjson-zstd":
+        import zstandard
+
+        with zstandard.ZstdDecompressor().stream_reader(path.open("rb")) as reader:
+            payload = reader.read()
+    else:
+        with gzip.open(path, "rb") as f:
+            payload = f.read()
+
+    return [
+        _from_json_row(json.loads(line))
+        for line in payload.decode("utf-8").splitlines()
+        if line.strip()
+    ]
+
+
+def iter_archive_files(archive_dir: Path) -> Iterator[Path]:
+    """Iterate article archive files in ``archive_dir`` in write order."""
+    extensions = tuple(f".{extension}" for extension in ARCHIVE_FORMATS.values())
+    for path in sorted(archive_dir.glob("articles-*")):
+        if path.name.endswith(extensions):
+            yield path
+
+
+@dataclass
+class ArchiveCheckpoint:
+    """Progress of an archive run, persisted after every committed chunk."""
+
+    cutoff: str
+    archive_format: str
+    last_id: int = 0
+    chunks: int = 0
+    rows: int = 0
+    bytes_written: int = 0
+    elapsed_seconds: float = 0.0
+    started_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    completed: bool = False
+
+    @property
+    def run_id(self) -> str:
+        return datetime.fromisoformat(self.cutoff).strftime("%Y%m%dT%H%M%S")
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["ArchiveCheckpoint"]:
+        if not path.exists():
+            return None
+        return cls(**json.loads(path.read_text()))
+
+    def save(self, path: Path) -> None:
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(json.dumps(asdict(self), indent=2))
+        tmp_path.replace(path)
+
+    def report(self) -> dict[str, Any]:
+        """Throughput summary for logs and task results."""
+        elapsed = max(self.elapsed_seconds, 1e-9)
+        return {
+            "cutoff_date": self.cutoff,
+            "archive_format": self.archive_format,
+            "chunks": self.chunks,
+            "articles_archived": self.rows,
+            "bytes_written": self.bytes_written,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "rows_per_second": round(self.rows / elapsed, 1),
+            "mb_per_second": round(self.bytes_written / elapsed / 1_000_000, 3),
+            "last_id": self.last_id,
+            "completed": self.completed,
+        }
+
+
+class ArticleArchiver:
+    """
+    Archive and soft-delete old articles in primary-key chunks.
+
+    Each chunk is read by keyset pagination on ``id``, written to a compressed
+    archive file, then marked DELETED in its own short transaction. The
+    checkpoint file records the last committed id, so an interrupted run
+    resumes where it stopped; a chunk whose file was written but whose update
+    did not commit is simply re-read and its file overwritten.
+    """
+
+    def __init__(
+        self,
+        archive_dir: Path | str,
+        chunk_size: int = 1000,
+        sleep_seconds: float = 0.5,
+        archive_format: str = "auto",
+    ) -> None:
+        self.archive_dir = Path(archive_dir)
+        self.chunk_size = chunk_size
+        self.sleep_seconds = sleep_seconds
+        self.archive_format = archive_format
+
+    @property
+    def checkpoint_path(self) -> Path:
+        return self.archive_dir / CHECKPOINT_FILE
+
+    def _start_or_resume(self, cutoff: datetime, resume: bool) -> ArchiveCheckpoint:
+        checkpoint = ArchiveCheckpoint.load(self.checkpoint_path) if resume else None
+        if checkpoint is not None and not checkpoint.completed:
+            logger.info(
+                f"Resuming archive run from id {checkpoint.last_id} "
+                f"({checkpoint.rows} articles already archived)"
+            )
+            return checkpoint
+
+        cutoff = cutoff if cutoff.tzinfo else cutoff.replace(tzinfo=UTC)
+        return ArchiveCheckpoint(
+            cutoff=cutoff.isoformat(),
+            archive_format=resolve_archive_format(self.archive_format),
+        )
+
+    async def run(
+        self,
+        cutoff: datetime,
+        resume: bool = True,
+        max_chunks: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """
+        Archive ACTIVE articles published before ``cutoff``.
+
+        Args:
+            cutoff: Articles published before this instant are archived
+            resume: Continue an unfinished run from its checkpoint (its cutoff wins)
+            max_chunks: Stop after this many chunks (the run stays resumable)
+
+        Returns:
+            Throughput report for the run
+        """
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint = self._start_or_resume(cutoff, resume)
+        checkpoint.save(self.checkpoint_path)
+        run_cutoff = datetime.fromisoformat(checkpoint.cutoff)
+        extension = ARCHIVE_FORMATS[checkpoint.archive_format]
+        chunks_this_call = 0
+
+        while max_chunks is None or chunks_this_call < max_chunks:
+            chunk_start = time.monotonic()
+
+            async with get_db_session() as db:
+                result = await db.execute(
+                    select(*Article.__table__.columns)
+                    .where(
+                        Article.status == "ACTIVE",
+                        Article.published_on < run_cutoff,
+                        Article.id > checkpoint.last_id,
+                    )
+                    .order_by(Article.id)
+                    .limit(self.chunk_size)
+                )
+                rows = [dict(row._mapping) for row in result.all()]
+                if not rows:
+                    checkpoint.completed = True
+                    break
+
+                # Named by first id: a chunk re-read after a crash overwrites
+                # only its own file, never a chunk that was already committed
+                path = self.archive_dir / (
+                    f"articles-{checkpoint.run_id}-{rows[0]['id']:012d}.{extension}"
+                )
+                size = await asyncio.to_thread(
+                    write_archive_file, path, rows, checkpoint.archive_format
+                )
+
+                ids = [row["id"] for row in rows]
+                await db.execute(
+                    update(Article)
+                    .where(Article.id.in_(ids), Article.status == "ACTIVE")
+                    .values(status="DELETED", updated_at=datetime.now(UTC))
+                )
+                # Committed by the session context manager on exit
+
+            checkpoint.last_id = ids[-1]
+            checkpoint.chunks += 1
+            checkpoint.rows += len(rows)
+            checkpoint.bytes_written += size
+            checkpoint.elapsed_seconds += time.monotonic() - chunk_start
+            checkpoint.save(self.checkpoint_path)
+            chunks_this_call += 1
+
+            logger.info(
+                f"Archived chunk {checkpoint.chunks} ({len(rows)} articles, "
+                f"{size / 1024:.1f} KiB) to {path.name}; "
+                f"{checkpoint.report()['rows_per_second']} rows/s overall"
+            )
+
+            if len(rows) < self.chunk_size:
+                checkpoint.completed = True
+                break
+            if self.sleep_seconds:
+                await asyncio.sleep(self.sleep_seconds)
+
+        checkpoint.save(self.checkpoint_path)
+        if chunks_this_call:
+            await invalidate_cache_tags(ARTICLES)
+        report = checkpoint.report()
+        logger.info(
+            f"Archive run {'completed' if checkpoint.completed else 'paused'}: {report}"
+        )
+        return report
+
+
+async def restore_articles(
+    archive_path: Path | str, dry_run: bool = False
+) -> dict[str, Any]:
+    """
+    Re-ingest archived articles.
+
+    Articles that still exist (soft-deleted) get their archived values back,
+    including status; articles that no longer exist are inserted with their
+    original ids.
+
+    Args:
+        archive_path: An archive file or a directory of archive files
+        dry_run: Only count what would be restored
+
+    Returns:
+        Dict with restore counts
+    """
+    archive_path = Path(archive_path)
+    files = (
+        list(iter_archive_files(archive_path))
+        if archive_path.is_dir()
+        else [archive_path]
+    )
+    summary = {"files": len(files), "articles_restored": 0, "articles_inserted": 0}
+
+    for path in files:
+        rows = await asyncio.to_thread(read_archive_file, path)
+        if not rows:
+            continue
+
+        async with get_db_session() as db:
+            result = await db.execute(
+                select(Article.external_id).where(
+                    Article.external_id.in_([row["external_id"] for row in rows])
+                )
+            )
+            existing = set(result.scalars().all())
+            to_update = [row for row in rows if row["external_id"] in existing]
+            to_insert = [row for row in rows if row["external_id"] not in existing]
+
+            if not dry_run:
+                for row in to_update:
+                    values = {
+                        key: value
+                        for key, value in row.items()
+                        if key in ARTICLE_COLUMNS and key not in ("id", "external_id")
+                    }
+                    await db.execute(
+                        update(Article)
+                        .where(Article.external_id == row["external_id"])
+                        .values(**values)
+                    )
+                if to_insert:
+                    await db.execute(
+                        insert(Article),
+                        [
+                            {k: v for k, v in row.items() if k in ARTICLE_COLUMNS}
+                            for row in to_insert
+                        ],
+                    )
+
+        summary["articles_restored"] += len(to_update)
+        summary["articles_inserted"] += len(to_insert)
+        logger.info(
+            f"{'Would restore' if dry_run else 'Restored'} {path.name}: "
+            f"{len(to_update)} updated, {len(to_insert)} inserted"
+        )
+
+    if not dry_run and (summary["articles_restored"] or summary["articles_inserted"]):
+        await invalidate_cache_tags(ARTICLES)
+    return summary
@@ -0,0 +1,453 @@
+"""Streaming article export to NDJSON, CSV or Parquet."""
+
+import csv
+import io
+import json
+import time
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy import Float, Select, cast, func, select, true
+
+from crypto_newsletter.core.storage.archive import _has_module
+from crypto_newsletter.shared.database.connection import get_read_session
+from crypto_newsletter.shared.models import Article, ArticleAnalysis, Publisher
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+# Output field -> column expression; analysis fields come from the latest
+# analysis of each article
+ARTICLE_FIELDS = {
+    "id": Article.id,
+    "external_id": Article.external_id,
+    "title": Article.title,
+    "subtitle": Article.subtitle,
+    "authors": Article.authors,
+    "url": Article.url,
+    "published_on": Article.published_on,
+    "publisher_id": Article.publisher_id,
+    "publisher": Publisher.name,
+    "language": Article.language,
+    "keywords": Article.keywords,
+    "sentiment": Article.sentiment,
+    "status": Article.status,
+    "upvotes": Article.upvotes,
+    "downvotes": Article.downvotes,
+    "score": Article.score,
+    "created_at": Article.created_at,
+}
+BODY_FIELD = "body"
+ANALYSIS_FIELDS = (
+    "analysis_sentiment",
+    "impact_score",
+    "signal_strength",
+    "uniqueness_score",
+    "analysis_confidence",
+    "analysis_summary",
+    "weak_signal_count",
+    "analyzed_at",
+)
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+COMPRESSED_MEDIA_TYPES = {"gzip": "application/gzip", "zstd": "application/zstd"}
+EXTENSIONS = {"ndjson": "ndjson", "csv": "csv", "parquet": "parquet"}
+COMPRESSION_EXTENSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+@dataclass
+class ExportQuery:
+    """Which articles and fields to export."""
+
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    status: Optional[str] = "ACTIVE"
+    publisher_id: Optional[int] = None
+    include_body: bool = False
+    include_analysis: bool = False
+
+    @classmethod
+    def last_days(cls, days: Optional[int], **kwargs: Any) -> "ExportQuery":
+        """Articles published in the last ``days`` days (all when None)."""
+        since = datetime.now(UTC) - timedelta(days=days) if days else None
+        return cls(since=since, **kwargs)
+
+    @property
+    def fields(self) -> list[str]:
+        fields = list(ARTICLE_FIELDS)
+        if self.include_body:
+            fields.append(BODY_FIELD)
+        if self.include_analysis:
+            fields.extend(ANALYSIS_FIELDS)
+        return fields
+
+    def statement(self) -> Select:
+        """Column-only select in published order; no ORM objects are built."""
+        columns = [column.label(name) for name, column in ARTICLE_FIELDS.items()]
+        if self.include_body:
+            columns.append(Article.body.label(BODY_FIELD))
+
+        statement = select(*columns).outerjoin(
+            Publisher, Publisher.id == Article.publisher_id
+        )
+
+        if self.include_analysis:
+            # One index probe on (article_id, created_at) per article
+            latest = (
+                select(
+                    ArticleAnalysis.sentiment.label("analysis_sentiment"),
+                    cast(ArticleAnalysis.impact_score, Float).label("impact_score"),
+                    cast(ArticleAnalysis.signal_strength, Float).label(
+                        "signal_strength"
+                    ),
+                    cast(ArticleAnalysis.uniqueness_score, Float).label(
+                        "uniqueness_score"
+                    ),
+                    cast(ArticleAnalysis.analysis_confidence, Float).label(
+                        "analysis_confidence"
+                    ),
+                    ArticleAnalysis.summary.label("analysis_summary"),
+                    func.coalesce(
+                        func.jsonb_array_length(ArticleAnalysis.weak_signals), 0
+                    ).label("weak_signal_count"),
+                    ArticleAnalysis.created_at.label("analyzed_at"),
+                )
+                .where(ArticleAnalysis.article_id == Article.id)
+                .order_by(ArticleAnalysis.created_at.desc())
+                .limit(1)
+                .lateral("latest_analysis")
+            )
+            statement = statement.add_columns(
+                *(latest.c[name] for name in ANALYSIS_FIELDS)
+            ).outerjoin(latest, true())
+
+        if self.since is not None:
+            statement = statement.where(Article.published_on >= self.since)
+        if self.until is not None:
+            statement = statement.where(Article.published_on < self.until)
+        if self.status is not None:
+            statement = statement.where(Article.status == self.status)
+        if self.publisher_id is not None:
+            statement = statement.where(Article.publisher_id == self.publisher_id)
+        return statement.order_by(Article.published_on, Article.id)
+
+
+@dataclass
+class ExportStats:
+    """Progress of one export, updated as chunks are written."""
+
+    rows: int = 0
+    bytes_written: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    elapsed_seconds: float = 0.0
+
+    def report(self) -> dict[str, Any]:
+        elapsed = max(self.elapsed_seconds, 1e-9)
+        return {
+            "rows": self.rows,
+            "bytes_written": self.bytes_written,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "rows_per_second": round(self.rows / elapsed, 1),
+            "mb_per_second": round(self.bytes_written / elapsed / 1_000_000, 3),
+        }
+
+
+def _json_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class NdjsonEncoder:
+    """One JSON object per line."""
+
+    def __init__(self, fields: Sequence[str]) -> None:
+        self.fields = fields
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        lines = [
+            json.dumps(
+                {name: _json_value(value) for name, value in zip(self.fields, row)},
+                ensure_ascii=False,
+            )
+            for row in rows
+        ]
+        return ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class CsvEncoder:
+    """RFC 4180 CSV with a header row; None is written as an empty field."""
+
+    def __init__(self, fields: Sequence[str]) -> None:
+        self.fields = fields
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def header(self) -> bytes:
+        self._writer.writerow(self.fields)
+        return self._drain()
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        self._writer.writerows([[_json_value(value) for value in row] for row in rows])
+        return self._drain()
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _ByteSink(io.RawIOBase):
+    """Writable file that hands out what was written since the last drain."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ParquetEncoder:
+    """Parquet with one row group per chunk, compressed column by column."""
+
+    def __init__(self, fields: Sequence[str], compression: str) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.fields = list(fields)
+        self._pa = pa
+        self._sink = _ByteSink()
+        self._schema = pa.schema([(name, _arrow_type(pa, name)) for name in fields])
+        self._writer = pq.ParquetWriter(
+            self._sink,
+            self._schema,
+            compression="none" if compression == "none" else compression,
+        )
+
+    def header(self) -> bytes:
+        return self._sink.drain()
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        if rows:
+            columns = list(zip(*rows))
+            self._writer.write_table(
+                self._pa.Table.from_arrays(
+                    [
+                        self._pa.array(column, type=self._schema.field(i).type)
+                        for i, column in enumerate(columns)
+                    ],
+                    schema=self._schema,
+                )
+            )
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+_INTEGER_FIELDS = {
+    "id",
+    "external_id",
+    "publisher_id",
+    "upvotes",
+    "downvotes",
+    "score",
+    "weak_signal_count",
+}
+_FLOAT_FIELDS = {
+    "impact_score",
+    "signal_strength",
+    "uniqueness_score",
+    "analysis_confidence",
+}
+_TIMESTAMP_FIELDS = {"published_on", "created_at", "analyzed_at"}
+
+
+def _arrow_type(pa: Any, name: str) -> Any:
+    if name in _INTEGER_FIELDS:
+        return pa.int64()
+    if name in _FLOAT_FIELDS:
+        return pa.float64()
+    if name in _TIMESTAMP_FIELDS:
+        return pa.timestamp("us", tz="UTC")
+    return pa.string()
+
+
+class _Compressor:
+    """Incremental gzip/zstd stream compression (identity for "none")."""
+
+    def __init__(self, compression: str) -> None:
+        if compression == "gzip":
+            self._compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        elif compression == "zstd":
+            import zstandard
+
+            self._compressor = zstandard.ZstdCompressor(level=6).compressobj()
+        else:
+            self._compressor = None
+
+    def compress(self, data: bytes) -> bytes:
+        if self._compressor is None or not data:
+            return data
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush() if self._compressor is not None else b""
+
+
+def check_export_options(export_format: str, compression: str) -> None:
+    """Validate format and compression, including optional dependencies."""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unknown export format {export_format!r}; expected one of "
+            f"{list(EXPORT_FORMATS)}"
+        )
+    if compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Unknown compression {compression!r}; expected one of "
+            f"{list(COMPRESSIONS)}"
+        )
+    required = []
+    if export_format == "parquet":
+        required.append("pyarrow")
+    elif compression == "zstd":
+        required.append("zstandard")
+    for module in required:
+        if not _has_module(module):
+            raise ImportError(
+                f"Export as {export_format} with {compression} compression "
+                f"requires {module}. Install with: uv add 'crypto-newsletter[archive]'"
+            )
+
+
+def export_filename(export_format: str, compression: str) -> str:
+    """Default file name, e.g. ``articles.ndjson.zst``."""
+    suffix = "" if export_format == "parquet" else COMPRESSION_EXTENSIONS[compression]
+    return f"articles.{EXTENSIONS[export_format]}{suffix}"
+
+
+def export_media_type(export_format: str, compression: str) -> str:
+    """Content type of an export; compressed NDJSON/CSV is served as the archive."""
+    if export_format == "parquet" or compression == "none":
+        return MEDIA_TYPES[export_format]
+    return COMPRESSED_MEDIA_TYPES[compression]
+
+
+def _encoder(export_format: str, fields: list[str], compression: str) -> Any:
+    if export_format == "parquet":
+        return ParquetEncoder(fields, compression)
+    if export_format == "csv":
+        return CsvEncoder(fields)
+    return NdjsonEncoder(fields)
+
+
+async def stream_export(
+    query: ExportQuery,
+    export_format: str = "ndjson",
+    compression: str = "none",
+    chunk_size: int = 5000,
+    stats: Optional[ExportStats] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Stream an export as encoded (and compressed) byte chunks.
+
+    Rows come from a server-side cursor ``chunk_size`` at a time, so memory
+    stays constant however many articles match. Parquet compresses inside
+    the file (one row group per chunk); NDJSON and CSV are wrapped in a
+    gzip or zstd stream.
+
+    Args:
+        query: Articles and fields to export
+        export_format: ndjson, csv or parquet
+        compression: none, gzip or zstd
+        chunk_size: Rows fetched and encoded per step
+        stats: Updated with rows, bytes and elapsed time as chunks go out
+    """
+    check_export_options(export_format, compression)
+    stats = stats if stats is not None else ExportStats()
+    fields = query.fields
+    encoder = _encoder(export_format, fields, compression)
+    compressor = _Compressor("none" if export_format == "parquet" else compression)
+
+    def emit(data: bytes) -> bytes:
+        stats.bytes_written += len(data)
+        stats.elapsed_seconds = time.perf_counter() - stats.started
+        return data
+
+    header = compressor.compress(encoder.header())
+    if header:
+        yield emit(header)
+
+    async with get_read_session() as db:
+        result = await db.stream(
+            query.statement().execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.partitions(chunk_size):
+            stats.rows += len(rows)
+            data = compressor.compress(encoder.encode(rows))
+            if data:
+                yield emit(data)
+
+    yield emit(compressor.compress(encoder.finish()) + compressor.flush())
+    logger.info(f"Exported articles: {stats.report()}")
+
+
+async def export_to_file(
+    path: Path | str,
+    query: ExportQuery,
+    export_format: str = "ndjson",
+    compression: str = "none",
+    chunk_size: int = 5000,
+) -> dict[str, Any]:
+    """
+    Export articles to ``path`` atomically (temp file + rename).
+
+    Returns:
+        Throughput report: rows, bytes_written, elapsed_seconds, rows_per_second
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    stats = ExportStats()
+    try:
+        with tmp_path.open("wb") as f:
+            async for chunk in stream_export(
+                query, export_format, compression, chunk_size, stats
+            ):
+                f.write(chunk)
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return {"path": str(path), **stats.report()}
@@ -1,23 +1,222 @@
 """Repository pattern implementation for data access operations."""
 
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any, Optional
 
-from crypto_newsletter.shared.database.connection import get_db_session
+import numpy as np
+from crypto_newsletter.core.embeddings import (
+    EmbeddingService,
+    article_text,
+    get_similarity_index,
+)
+from crypto_newsletter.newsletter.rendering import save_renditions
+from crypto_newsletter.shared.cache import NEWSLETTERS, invalidate_cache_tags
+from crypto_newsletter.shared.database.connection import get_read_session
 from crypto_newsletter.shared.models import (
     Article,
+    ArticleAnalysis,
     ArticleCategory,
+    ArticleEmbedding,
     Category,
     Newsletter,
     NewsletterArticle,
     Publisher,
+    Signal,
+    SignalAnomaly,
+    SignalConnection,
 )
 from loguru import logger
-from sqlalchemy import and_, asc, case, desc, func, or_, select
+from sqlalchemy import (
+    Integer,
+    Select,
+    and_,
+    asc,
+    bindparam,
+    case,
+    desc,
+    func,
+    or_,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 
+@dataclass(slots=True)
+class AgentArticle:
+    """Article joined with its latest analysis, shaped for the newsletter agents."""
+
+    id: int
+    title: str
+    body: Optional[str]
+    url: str
+    published_on: Optional[datetime]
+    publisher: str
+    signal_strength: float = 0.0
+    uniqueness_score: float = 0.0
+    analysis_confidence: float = 0.0
+    weak_signals: list = field(default_factory=list)
+    pattern_anomalies: list = field(default_factory=list)
+    adjacent_connections: list = field(default_factory=list)
+    narrative_gaps: list = field(default_factory=list)
+    edge_indicators: list = field(default_factory=list)
+
+    @classmethod
+    def from_row(cls, row: Any) -> "AgentArticle":
+        """Build from a row returned by get_agent_articles_since."""
+        return cls(
+            id=row.id,
+            title=row.title,
+            body=row.body,
+            url=row.url,
+            published_on=row.published_on,
+            publisher=row.publisher_name or "Unknown",
+            signal_strength=float(row.signal_strength or 0.0),
+            uniqueness_score=float(row.uniqueness_score or 0.0),
+            analysis_confidence=float(row.analysis_confidence or 0.0),
+            weak_signals=row.weak_signals or [],
+            pattern_anomalies=row.pattern_anomalies or [],
+            adjacent_connections=row.adjacent_connections or [],
+            narrative_gaps=row.narrative_gaps or [],
+            edge_indicators=row.edge_indicators or [],
+        )
+
+    def to_agent_dict(self) -> dict[str, Any]:
+        """Convert to the dictionary format expected by the agent system."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "body": self.body,
+            "published_on": self.published_on.isoformat()
+            if self.published_on
+            else None,
+            "publisher": self.publisher,
+            "url": self.url,
+            "weak_signals": self.weak_signals,
+            "pattern_anomalies": self.pattern_anomalies,
+            "adjacent_connections": self.adjacent_connections,
+            "signal_strength": self.signal_strength,
+            "uniqueness_score": self.uniqueness_score,
+            "analysis_confidence": self.analysis_confidence,
+            "narrative_gaps": self.narrative_gaps,
+            "edge_indicators": self.edge_indicators,
+        }
+
+
+# Hot statements built once at import; values are supplied as bound parameters,
+# so every call hits SQLAlchemy's compiled cache without rebuilding the select
+# and asyncpg can reuse the prepared statement on a pooled connection.
+_RECENT_ARTICLES = (
+    select(Article)
+    .where(
+        Article.published_on >= bindparam("cutoff"),
+        Article.status == "ACTIVE",
+    )
+    .order_by(desc(Article.published_on))
+    .limit(bindparam("limit", type_=Integer))
+)
+_RECENT_ARTICLES_WITH_CATEGORIES = _RECENT_ARTICLES.options(
+    selectinload(Article.article_categories).selectinload(ArticleCategory.category)
+)
+_ARTICLE_BY_EXTERNAL_ID = select(Article).where(
+    Article.external_id == bindparam("external_id")
+)
+_ARTICLE_BY_URL = select(Article).where(Article.url == bindparam("url"))
+_ARTICLE_BY_GUID = select(Article).where(Article.guid == bindparam("guid"))
+_ACTIVE_ARTICLE_BY_ID = select(Article).where(
+    Article.id == bindparam("article_id"), Article.status == "ACTIVE"
+)
+
+# Quality publishers prioritized for analysis
+QUALITY_PUBLISHERS = ("NewsBTC", "CoinDesk", "Crypto Potato")
+
+
+def _paginated(query: Select) -> Select:
+    return query.offset(bindparam("offset", type_=Integer)).limit(
+        bindparam("limit", type_=Integer)
+    )
+
+
+@lru_cache(maxsize=256)
+def _filtered_articles_statement(
+    has_status: bool,
+    publisher_filter: Optional[str],
+    has_cutoff: bool,
+    has_start_date: bool,
+    has_end_date: bool,
+    has_search: bool,
+    order_column: str,
+    ascending: bool,
+) -> Select:
+    """
+    Build get_articles_with_filters' statement for one combination of filters.
+
+    Filter values are bound parameters, so each combination is built and
+    compiled once; later calls only supply values.
+    """
+    query = select(Article).join(Publisher, isouter=True)
+    if has_status:
+        query = query.where(Article.status == bindparam("status"))
+    if publisher_filter == "id":
+        query = query.where(Article.publisher_id == bindparam("publisher_id"))
+    elif publisher_filter == "name":
+        query = query.where(Publisher.name.ilike(bindparam("publisher_pattern")))
+    if has_cutoff:
+        query = query.where(Article.published_on >= bindparam("cutoff"))
+    if has_start_date:
+        query = query.where(Article.published_on >= bindparam("start_date"))
+    if has_end_date:
+        query = query.where(Article.published_on <= bindparam("end_date"))
+    if has_search:
+        pattern = bindparam("search_pattern")
+        query = query.where(
+            or_(
+                Article.title.ilike(pattern),
+                Article.body.ilike(pattern),
+                Article.subtitle.ilike(pattern),
+            )
+        )
+
+    column = getattr(Article, order_column)
+    query = query.order_by(asc(column) if ascending else desc(column))
+    return _paginated(query)
+
+
+@lru_cache(maxsize=2)
+def _analysis_ready_statement(by_publisher: bool) -> Select:
+    """Build get_analysis_ready_articles' statement (values are bound)."""
+    query = (
+        select(Article)
+        .join(Publisher, isouter=True)
+        .where(
+            and_(
+                Article.status == "ACTIVE",
+                func.length(Article.body) >= bindparam("min_content_length"),
+                Article.body.is_not(None),
+                Article.body != "",
+            )
+        )
+    )
+    if by_publisher:
+        query = query.where(Article.publisher_id == bindparam("publisher_id"))
+    else:
+        query = query.order_by(
+            case(
+                (
+                    Publisher.name.in_(
+                        bindparam("quality_publishers", expanding=True)
+                    ),
+                    1,
+                ),
+                else_=2,
+            ),
+            desc(Article.published_on),
+        )
+    return _paginated(query)
+
+
 class ArticleRepository:
     """Repository for article-related database operations."""
 
@@ -45,22 +244,9 @@ class ArticleRepository:
         cutoff_time = datetime.now(UTC) - timedelta(hours=hours)
 
         query = (
-            select(Article)
-            .where(
-                and_(Article.published_on >= cutoff_time, Article.status == "ACTIVE")
-            )
-            .order_by(desc(Article.published_on))
-            .limit(limit)
+            _RECENT_ARTICLES_WITH_CATEGORIES if include_categories else _RECENT_ARTICLES
         )
-
-        if include_categories:
-            query = query.options(
-                selectinload(Article.article_categories).selectinload(
-                    ArticleCategory.category
-                )
-            )
-
-        result = await self.db.execute(query)
+        result = await self.db.execute(query, {"cutoff": cutoff_time, "limit": limit})
         articles = result.scalars().all()
 
         logger.debug(f"Retrieved {len(articles)} recent articles from database")
@@ -68,20 +254,19 @@ class ArticleRepository:
 
     async def get_article_by_external_id(self, external_id: int) -> Optional[Article]:
         """Get article by CoinDesk external ID."""
-        query = select(Article).where(Article.external_id == external_id)
-        result = await self.db.execute(query)
+        result = await self.db.execute(
+            _ARTICLE_BY_EXTERNAL_ID, {"external_id": external_id}
+        )
         return result.scalar_one_or_none()
 
     async def get_article_by_url(self, url: str) -> Optional[Article]:
         """Get article by URL."""
-        query = select(Article).where(Article.url == url)
-        result = await self.db.execute(query)
+        result = await self.db.execute(_ARTICLE_BY_URL, {"url": url})
         return result.scalar_one_or_none()
 
     async def get_article_by_guid(self, guid: str) -> Optional[Article]:
         """Get article by GUID."""
-        query = select(Article).where(Article.guid == guid)
-        result = await self.db.execute(query)
+        result = await self.db.execute(_ARTICLE_BY_GUID, {"guid": guid})
         return result.scalar_one_or_none()
 
     async def get_articles_by_publisher(
@@ -114,8 +299,6 @@ class ArticleRepository:
         Returns:
             List of Article instances with analysis
         """
-        from crypto_newsletter.shared.models import ArticleAnalysis
-
         query = (
             select(Article)
             .join(ArticleAnalysis, Article.id == ArticleAnalysis.article_id)
@@ -139,6 +322,87 @@ class ArticleRepository:
         )
         return list(articles)
 
+    async def get_agent_articles_since(
+        self,
+        since_date: datetime,
+        min_signal_strength: float = 0.0,
+        limit: int = 100,
+        min_content_length: Optional[int] = None,
+        order_by_signal: bool = False,
+        completed_only: bool = True,
+    ) -> list[AgentArticle]:
+        """
+        Get analyzed articles with their latest analysis and publisher name.
+
+        Runs a single query: the latest completed analysis per article is picked
+        with DISTINCT ON (article_id), then joined to articles and publishers.
+
+        Args:
+            since_date: Only consider analyses created since this datetime
+            min_signal_strength: Minimum signal strength of the latest analysis
+            limit: Maximum number of articles to return
+            min_content_length: Optional minimum article body length
+            order_by_signal: Order by signal strength instead of analysis recency
+            completed_only: Only consider analyses with a COMPLETED validation
+
+        Returns:
+            List of AgentArticle records
+        """
+        analysis_filters = [
+            ArticleAnalysis.created_at >= since_date,
+            ArticleAnalysis.signal_strength >= min_signal_strength,
+        ]
+        if completed_only:
+            analysis_filters.append(ArticleAnalysis.validation_status == "COMPLETED")
+
+        latest_analysis = (
+            select(ArticleAnalysis)
+            .where(and_(*analysis_filters))
+            .distinct(ArticleAnalysis.article_id)
+            .order_by(ArticleAnalysis.article_id, desc(ArticleAnalysis.created_at))
+            .subquery("latest_analysis")
+        )
+
+        filters = [Article.status == "ACTIVE"]
+        if min_content_length:
+            filters.append(func.length(Article.body) > min_content_length)
+
+        query = (
+            select(
+                Article.id,
+                Article.title,
+                Article.body,
+                Article.url,
+                Article.published_on,
+                Publisher.name.label("publisher_name"),
+                latest_analysis.c.signal_strength,
+                latest_analysis.c.uniqueness_score,
+                latest_analysis.c.analysis_confidence,
+                latest_analysis.c.weak_signals,
+                latest_analysis.c.pattern_anomalies,
+                latest_analysis.c.adjacent_connections,
+                latest_analysis.c.narrative_gaps,
+                latest_analysis.c.edge_indicators,
+            )
+            .join(latest_analysis, latest_analysis.c.article_id == Article.id)
+            .join(Publisher, Publisher.id == Article.publisher_id, isouter=True)
+            .where(and_(*filters))
+            .order_by(
+                desc(latest_analysis.c.signal_strength)
+                if order_by_signal
+                else desc(latest_analysis.c.created_at)
+            )
+            .limit(limit)
+        )
+
+        result = await self.db.execute(query)
+        articles = [AgentArticle.from_row(row) for row in result.all()]
+
+        logger.debug(
+            f"Retrieved {len(articles)} agent-ready articles since {since_date}"
+        )
+        return articles
+
     async def get_articles_by_category(
         self, category_name: str, limit: int = 50
     ) -> list[Article]:
@@ -225,62 +489,57 @@ class ArticleRepository:
     ) -> list[dict[str, Any]]:
         """Get articles with comprehensive filtering and search."""
         try:
-            query = select(Article).join(Publisher, isouter=True)
-
-            # Base filter
-            filters = []
+            params: dict[str, Any] = {"offset": offset, "limit": limit}
             if status:
-                filters.append(Article.status == status)
+                params["status"] = status
 
             # Publisher filters
+            publisher_filter = None
             if publisher_id:
-                filters.append(Article.publisher_id == publisher_id)
+                publisher_filter = "id"
+                params["publisher_id"] = publisher_id
             elif publisher_name:
-                filters.append(Publisher.name.ilike(f"%{publisher_name}%"))
+                publisher_filter = "name"
+                params["publisher_pattern"] = f"%{publisher_name}%"
 
             # Date filters
             if hours_back:
-                cutoff = datetime.now(UTC) - timedelta(hours=hours_back)
-                filters.append(Article.published_on >= cutoff)
+                params["cutoff"] = datetime.now(UTC) - timedelta(hours=hours_back)
 
             if start_date:
                 try:
-                    start_dt = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
-                    filters.append(Article.published_on >= start_dt)
+                    params["start_date"] = datetime.fromisoformat(
+                        start_date.replace("Z", "+00:00")
+                    )
                 except ValueError:
                     logger.warning(f"Invalid start_date format: {start_date}")
 
             if end_date:
                 try:
-                    end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-                    filters.append(Article.published_on <= end_dt)
+                    params["end_date"] = datetime.fromisoformat(
+                        end_date.replace("Z", "+00:00")
+                    )
                 except ValueError:
                     logger.warning(f"Invalid end_date format: {end_date}")
 
             # Search filter
             if search_query:
-                search_filter = or_(
-                    Article.title.ilike(f"%{search_query}%"),
-                    Article.body.ilike(f"%{search_query}%"),
-                    Article.subtitle.ilike(f"%{search_query}%"),
-                )
-                filters.append(search_filter)
-
-            # Apply all filters
-            if filters:
-                query = query.where(and_(*filters))
+                params["search_pattern"] = f"%{search_query}%"
 
             # Ordering
-            order_column = getattr(Article, order_by, Article.published_on)
-            if order.lower() == "asc":
-                query = query.order_by(asc(order_column))
-            else:
-                query = query.order_by(desc(order_column))
-
-            # Pagination
-            query = query.offset(offset).limit(limit)
-
-            result = await self.db.execute(query)
+            order_column = order_by if hasattr(Article, order_by) else "published_on"
+
+            query = _filtered_articles_statement(
+                has_status="status" in params,
+                publisher_filter=publisher_filter,
+                has_cutoff="cutoff" in params,
+                has_start_date="start_date" in params,
+                has_end_date="end_date" in params,
+                has_search="search_pattern" in params,
+                order_column=order_column,
+                ascending=order.lower() == "asc",
+            )
+            result = await self.db.execute(query, params)
             articles = result.scalars().all()
 
             return [
@@ -325,36 +584,18 @@ class ArticleRepository:
             List of analysis-ready articles
         """
         try:
-            # Quality publishers prioritized for analysis
-            quality_publishers = ["NewsBTC", "CoinDesk", "Crypto Potato"]
-
-            query = (
-                select(Article)
-                .join(Publisher, isouter=True)
-                .where(
-                    and_(
-                        Article.status == "ACTIVE",
-                        func.length(Article.body) >= min_content_length,
-                        Article.body.is_not(None),
-                        Article.body != "",
-                    )
-                )
-            )
-
-            # Apply publisher filter
+            query = _analysis_ready_statement(by_publisher=bool(publisher_id))
+            params = {
+                "min_content_length": min_content_length,
+                "offset": offset,
+                "limit": limit,
+            }
             if publisher_id:
-                query = query.where(Article.publisher_id == publisher_id)
+                params["publisher_id"] = publisher_id
             else:
-                # Prioritize quality publishers
-                query = query.order_by(
-                    case((Publisher.name.in_(quality_publishers), 1), else_=2),
-                    desc(Article.published_on),
-                )
+                params["quality_publishers"] = list(QUALITY_PUBLISHERS)
 
-            # Apply pagination
-            query = query.offset(offset).limit(limit)
-
-            result = await self.db.execute(query)
+            result = await self.db.execute(query, params)
             articles = result.scalars().all()
 
             return [
@@ -383,10 +624,9 @@ class ArticleRepository:
     async def get_article_by_id(self, article_id: int) -> Optional[dict[str, Any]]:
         """Get detailed article information by ID."""
         try:
-            query = select(Article).where(
-                Article.id == article_id, Article.status == "ACTIVE"
+            result = await self.db.execute(
+                _ACTIVE_ARTICLE_BY_ID, {"article_id": article_id}
             )
-            result = await self.db.execute(query)
             article = result.scalar_one_or_none()
 
             if not article:
@@ -539,10 +779,330 @@ class CategoryRepository:
         ]
 
 
+# Normalized signal tables -> (model, category column, score column)
+_SIGNAL_TABLES = {
+    "signals": (Signal, Signal.signal_type, Signal.confidence),
+    "anomalies": (SignalAnomaly, None, SignalAnomaly.deviation_significance),
+    "connections": (
+        SignalConnection,
+        SignalConnection.external_domain,
+        SignalConnection.relevance,
+    ),
+}
+
+
+@lru_cache(maxsize=32)
+def _signal_table_statement(
+    table: str, has_category: bool, has_until: bool, order_by_score: bool
+) -> Select:
+    """
+    Build a SignalRepository query for one table and combination of filters.
+
+    Filters are (category =) score >= and detected_at >= / < so the planner
+    can use the (category, score) and detected_at indexes.
+    """
+    model, category, score = _SIGNAL_TABLES[table]
+    query = (
+        select(
+            *model.__table__.columns,
+            Article.title.label("article_title"),
+            Article.url.label("article_url"),
+        )
+        .join(Article, Article.id == model.article_id, isouter=True)
+        .where(
+            score >= bindparam("min_score"),
+            model.detected_at >= bindparam("since"),
+        )
+    )
+    if has_category:
+        query = query.where(category == bindparam("category"))
+    if has_until:
+        query = query.where(model.detected_at < bindparam("until"))
+
+    primary = score if order_by_score else model.detected_at
+    return _paginated(query.order_by(desc(primary), desc(model.id)))
+
+
+_SIGNAL_TYPE_SUMMARY = (
+    select(
+        Signal.signal_type,
+        func.count(Signal.id).label("count"),
+        func.avg(Signal.confidence).label("avg_confidence"),
+        func.max(Signal.confidence).label("max_confidence"),
+        func.max(Signal.detected_at).label("last_detected_at"),
+    )
+    .where(
+        Signal.confidence >= bindparam("min_score"),
+        Signal.detected_at >= bindparam("since"),
+        Signal.detected_at < bindparam("until"),
+    )
+    .group_by(Signal.signal_type)
+    .order_by(desc("count"))
+)
+
+
+class SignalRepository:
+    """Repository for the normalized signal, anomaly and connection tables."""
+
+    ORDERINGS = ("detected_at", "score")
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        """Initialize repository with database session."""
+        self.db = db_session
+
+    async def _query(
+        self,
+        table: str,
+        since: datetime,
+        until: Optional[datetime],
+        category: Optional[str],
+        min_score: float,
+        limit: int,
+        offset: int,
+        order_by: str,
+    ) -> list[dict[str, Any]]:
+        if order_by not in self.ORDERINGS:
+            raise ValueError(
+                f"Unknown ordering {order_by!r}; expected one of {self.ORDERINGS}"
+            )
+        query = _signal_table_statement(
+            table, category is not None, until is not None, order_by == "score"
+        )
+        params: dict[str, Any] = {
+            "since": since,
+            "min_score": min_score,
+            "limit": limit,
+            "offset": offset,
+        }
+        if category is not None:
+            params["category"] = category
+        if until is not None:
+            params["until"] = until
+
+        result = await self.db.execute(query, params)
+        return [
+            {
+                **row._asdict(),
+                "detected_at": row.detected_at.isoformat(),
+                "created_at": row.created_at.isoformat(),
+            }
+            for row in result.all()
+        ]
+
+    async def get_signals(
+        self,
+        since: datetime,
+        until: Optional[datetime] = None,
+        signal_type: Optional[str] = None,
+        min_confidence: float = 0.0,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str = "detected_at",
+    ) -> list[dict[str, Any]]:
+        """
+        Get weak signals detected in a time window.
+
+        Args:
+            since: Only signals detected at or after this instant
+            until: Only signals detected before this instant
+            signal_type: Exact signal type (e.g. "regulatory_shift")
+            min_confidence: Minimum confidence (inclusive)
+            limit: Maximum number of signals
+            offset: Number of signals to skip
+            order_by: "detected_at" (newest first) or "score" (most confident)
+        """
+        signals = await self._query(
+            "signals",
+            since,
+            until,
+            signal_type,
+            min_confidence,
+            limit,
+            offset,
+            order_by,
+        )
+        for signal in signals:
+            signal["metadata"] = signal.pop("metadata") or {}
+            signal.pop("updated_at", None)
+        return signals
+
+    async def get_anomalies(
+        self,
+        since: datetime,
+        until: Optional[datetime] = None,
+        min_significance: float = 0.0,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str = "detected_at",
+    ) -> list[dict[str, Any]]:
+        """Get pattern anomalies detected in a time window."""
+        anomalies = await self._query(
+            "anomalies",
+            since,
+            until,
+            None,
+            min_significance,
+            limit,
+            offset,
+            order_by,
+        )
+        for anomaly in anomalies:
+            anomaly["potential_causes"] = anomaly["potential_causes"] or []
+        return anomalies
+
+    async def get_connections(
+        self,
+        since: datetime,
+        until: Optional[datetime] = None,
+        external_domain: Optional[str] = None,
+        min_relevance: float = 0.0,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str = "detected_at",
+    ) -> list[dict[str, Any]]:
+        """Get adjacent connections detected in a time window."""
+        connections = await self._query(
+            "connections",
+            since,
+            until,
+            external_domain,
+            min_relevance,
+            limit,
+            offset,
+            order_by,
+        )
+        for connection in connections:
+            indicators = connection["development_indicators"]
+            connection["development_indicators"] = indicators or []
+        return connections
+
+    async def get_signal_type_summary(
+        self,
+        since: datetime,
+        until: Optional[datetime] = None,
+        min_confidence: float = 0.0,
+    ) -> list[dict[str, Any]]:
+        """Get signal counts and confidence per signal type, most frequent first."""
+        result = await self.db.execute(
+            _SIGNAL_TYPE_SUMMARY,
+            {
+                "since": since,
+                "until": until or datetime.now(UTC),
+                "min_score": min_confidence,
+            },
+        )
+        return [
+            {
+                "signal_type": row.signal_type,
+                "count": row.count,
+                "avg_confidence": round(float(row.avg_confidence), 3),
+                "max_confidence": float(row.max_confidence),
+                "last_detected_at": row.last_detected_at.isoformat(),
+            }
+            for row in result.all()
+        ]
+
+
+_ARTICLES_BY_IDS = select(
+    Article.id,
+    Article.title,
+    Article.url,
+    Article.published_on,
+    Article.publisher_id,
+).where(Article.id.in_(bindparam("ids", expanding=True)))
+_ARTICLE_TEXT = select(Article.title, Article.subtitle, Article.body).where(
+    Article.id == bindparam("article_id")
+)
+_STORED_EMBEDDING = select(ArticleEmbedding.embedding).where(
+    ArticleEmbedding.article_id == bindparam("article_id"),
+    ArticleEmbedding.embedding_model == bindparam("model"),
+    ArticleEmbedding.embedding_version == bindparam("version"),
+)
+
+
+class EmbeddingRepository:
+    """Repository for article embeddings and similarity search."""
+
+    def __init__(
+        self, db_session: AsyncSession, service: Optional[EmbeddingService] = None
+    ) -> None:
+        """Initialize repository with database session."""
+        self.db = db_session
+        self.service = service or EmbeddingService()
+
+    async def get_article_vector(self, article_id: int) -> Optional[np.ndarray]:
+        """
+        Get an article's vector: from the index, else the stored embedding,
+        else embedded on the fly from its text. None if the article is missing.
+        """
+        index = await get_similarity_index(self.service)
+        vector = index.get(article_id)
+        if vector is not None:
+            return vector
+
+        embedder = self.service.embedder
+        params = {
+            "article_id": article_id,
+            "model": embedder.name,
+            "version": embedder.version,
+        }
+        stored = (await self.db.execute(_STORED_EMBEDDING, params)).scalar()
+        if stored is not None:
+            return np.asarray(stored, dtype=np.float32)
+
+        row = (await self.db.execute(_ARTICLE_TEXT, params)).one_or_none()
+        if row is None:
+            return None
+        vectors = await self.service.embed_texts(
+            [article_text(row.title, row.subtitle, row.body)]
+        )
+        return vectors[0]
+
+    async def find_similar(
+        self, vector: np.ndarray, k: int = 10, exclude_ids: tuple[int, ...] = ()
+    ) -> list[dict[str, Any]]:
+        """
+        Get the k nearest articles to a vector, most similar first.
+
+        Neighbours come from the in-memory index; their article rows are
+        loaded in one query.
+        """
+        index = await get_similarity_index(self.service)
+        neighbours = index.search(vector, k, exclude=exclude_ids)
+        if not neighbours:
+            return []
+
+        result = await self.db.execute(
+            _ARTICLES_BY_IDS, {"ids": [article_id for article_id, _ in neighbours]}
+        )
+        articles = {row.id: row for row in result.all()}
+        return [
+            {
+                "id": article_id,
+                "title": articles[article_id].title,
+                "url": articles[article_id].url,
+                "published_on": articles[article_id].published_on.isoformat(),
+                "publisher_id": articles[article_id].publisher_id,
+                "similarity": round(similarity, 4),
+            }
+            for article_id, similarity in neighbours
+            if article_id in articles
+        ]
+
+    async def find_similar_to_article(
+        self, article_id: int, k: int = 10
+    ) -> Optional[list[dict[str, Any]]]:
+        """Get the k articles most similar to an article (None if it is missing)."""
+        vector = await self.get_article_vector(article_id)
+        if vector is None:
+            return None
+        return await self.find_similar(vector, k, exclude_ids=(article_id,))
+
+
 # Convenience functions for common operations
 async def get_recent_articles_with_stats(hours: int = 24) -> dict[str, Any]:
     """Get recent articles with comprehensive statistics."""
-    async with get_db_session() as db_session:
+    async with get_read_session() as db_session:
         article_repo = ArticleRepository(db_session)
 
         articles = await article_repo.get_recent_articles(hours=hours)
@@ -777,9 +1337,14 @@ class NewsletterRepository:
         if summary is not None:
             newsletter.summary = summary
 
+        # Renditions depend on title and content only, not on status
+        if title is not None or content is not None:
+            await save_renditions(self.db, newsletter)
+
         # Commit changes
         await self.db.commit()
         await self.db.refresh(newsletter)
+        await invalidate_cache_tags(NEWSLETTERS)
 
         return newsletter
 
@@ -791,5 +1356,6 @@ class NewsletterRepository:
 
         await self.db.delete(newsletter)
         await self.db.commit()
+        await invalidate_cache_tags(NEWSLETTERS)
 
         return True
@@ -0,0 +1,269 @@
+"""Normalized signal rows written alongside the analysis JSONB arrays.
+
+Each entry of ``ArticleAnalysis.weak_signals``, ``pattern_anomalies`` and
+``adjacent_connections`` becomes one row in ``signals``, ``signal_anomalies``
+or ``signal_connections``, so signal queries filter through B-tree indexes
+instead of scanning every analysis. The JSONB arrays stay the source of
+truth: rows are written in bulk when an analysis is stored, and
+``backfill_analysis_signals`` rebuilds them for existing analyses.
+"""
+
+import time
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crypto_newsletter.shared.database.connection import get_db_session
+from crypto_newsletter.shared.models import (
+    ArticleAnalysis,
+    Signal,
+    SignalAnomaly,
+    SignalConnection,
+)
+
+SIGNAL_MODELS = (Signal, SignalAnomaly, SignalConnection)
+
+
+def _as_dict(entry: Any) -> Optional[dict[str, Any]]:
+    if hasattr(entry, "model_dump"):
+        return entry.model_dump()
+    return entry if isinstance(entry, dict) else None
+
+
+def _score(value: Any) -> Optional[float]:
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        return None
+    return min(max(score, 0.0), 1.0)
+
+
+def _signal_row(entry: dict[str, Any]) -> Optional[dict[str, Any]]:
+    confidence = _score(entry.get("confidence"))
+    if not entry.get("signal_type") or not entry.get("description"):
+        return None
+    if confidence is None:
+        return None
+    return {
+        "signal_type": str(entry["signal_type"])[:100],
+        "description": entry["description"],
+        "confidence": confidence,
+        "implications": entry.get("implications"),
+        "signal_metadata": {
+            "evidence": entry.get("evidence") or [],
+            "timeframe": entry.get("timeframe"),
+        },
+    }
+
+
+def _anomaly_row(entry: dict[str, Any]) -> Optional[dict[str, Any]]:
+    significance = _score(entry.get("deviation_significance"))
+    if not entry.get("expected_pattern") or not entry.get("observed_pattern"):
+        return None
+    if significance is None:
+        return None
+    return {
+        "expected_pattern": entry["expected_pattern"],
+        "observed_pattern": entry["observed_pattern"],
+        "deviation_significance": significance,
+        "historical_context": entry.get("historical_context"),
+        "potential_causes": entry.get("potential_causes") or [],
+    }
+
+
+def _connection_row(entry: dict[str, Any]) -> Optional[dict[str, Any]]:
+    relevance = _score(entry.get("relevance"))
+    connection_type = entry.get("connection_type")
+    if not entry.get("crypto_element") or not entry.get("external_domain"):
+        return None
+    if relevance is None:
+        return None
+    return {
+        "crypto_element": entry["crypto_element"],
+        "external_domain": str(entry["external_domain"])[:100],
+        "connection_type": str(connection_type)[:100] if connection_type else None,
+        "relevance": relevance,
+        "opportunity_description": entry.get("opportunity_description"),
+        "development_indicators": entry.get("development_indicators") or [],
+    }
+
+
+# JSONB array on article_analyses -> (table model, row builder)
+_SOURCES = {
+    "weak_signals": (Signal, _signal_row),
+    "pattern_anomalies": (SignalAnomaly, _anomaly_row),
+    "adjacent_connections": (SignalConnection, _connection_row),
+}
+
+
+def build_signal_rows(
+    article_id: int,
+    analysis_id: Optional[int],
+    detected_at: datetime,
+    agent_version: Optional[str] = None,
+    **arrays: Any,
+) -> dict[type, list[dict[str, Any]]]:
+    """
+    Turn an analysis's JSONB arrays into rows for the normalized tables.
+
+    Args:
+        article_id: Analyzed article
+        analysis_id: Source ArticleAnalysis row
+        detected_at: Timestamp stored on every row (the analysis time)
+        agent_version: Stored on ``signals.agent_version``
+        **arrays: ``weak_signals``, ``pattern_anomalies`` and/or
+            ``adjacent_connections``; entries may be dicts or pydantic models
+
+    Entries missing a required field or score are skipped; scores are
+    clamped to [0, 1] to satisfy the table check constraints.
+
+    Returns:
+        Rows per model, ready for a bulk insert
+    """
+    unknown = set(arrays) - set(_SOURCES)
+    if unknown:
+        raise ValueError(f"Unknown signal arrays: {sorted(unknown)}")
+
+    common = {
+        "article_id": article_id,
+        "analysis_id": analysis_id,
+        "detected_at": detected_at,
+    }
+    rows: dict[type, list[dict[str, Any]]] = {model: [] for model in SIGNAL_MODELS}
+    for name, entries in arrays.items():
+        model, build_row = _SOURCES[name]
+        for entry in entries or []:
+            data = _as_dict(entry)
+            row = build_row(data) if data is not None else None
+            if row is None:
+                logger.debug(f"Skipping malformed {name} entry: {entry!r}")
+                continue
+            row.update(common)
+            if model is Signal:
+                row["agent_version"] = agent_version
+            rows[model].append(row)
+    return rows
+
+
+async def insert_signal_rows(
+    db: AsyncSession, rows: dict[type, list[dict[str, Any]]]
+) -> dict[str, int]:
+    """Bulk insert rows from ``build_signal_rows``, one statement per table."""
+    counts = {}
+    for model, model_rows in rows.items():
+        if model_rows:
+            await db.execute(insert(model), model_rows)
+        counts[model.__tablename__] = len(model_rows)
+    return counts
+
+
+async def store_analysis_signals(
+    db: AsyncSession,
+    analysis: ArticleAnalysis,
+    detected_at: Optional[datetime] = None,
+) -> dict[str, int]:
+    """
+    Write the normalized rows for a newly added analysis.
+
+    Flushes first if the analysis has no id yet; runs in the caller's
+    transaction, so the rows commit (or roll back) with the analysis.
+    """
+    if analysis.id is None:
+        await db.flush()
+    rows = build_signal_rows(
+        analysis.article_id,
+        analysis.id,
+        detected_at or datetime.now(UTC),
+        agent_version=analysis.analysis_version,
+        weak_signals=analysis.weak_signals,
+        pattern_anomalies=analysis.pattern_anomalies,
+        adjacent_connections=analysis.adjacent_connections,
+    )
+    return await insert_signal_rows(db, rows)
+
+
+_BACKFILL_CHUNK = select(
+    ArticleAnalysis.id,
+    ArticleAnalysis.article_id,
+    ArticleAnalysis.created_at,
+    ArticleAnalysis.analysis_version,
+    ArticleAnalysis.weak_signals,
+    ArticleAnalysis.pattern_anomalies,
+    ArticleAnalysis.adjacent_connections,
+).order_by(ArticleAnalysis.id)
+
+
+async def backfill_analysis_signals(
+    chunk_size: int = 500,
+    start_after_id: int = 0,
+    max_chunks: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Rebuild the normalized rows for existing analyses in id order.
+
+    Each chunk replaces the rows of its analyses (delete + bulk insert) in its
+    own transaction, so the job is idempotent and can be resumed from the
+    reported ``last_analysis_id``.
+
+    Args:
+        chunk_size: Analyses per chunk/transaction
+        start_after_id: Only analyses with a greater id are processed
+        max_chunks: Stop after this many chunks
+
+    Returns:
+        Report with counts per table and the last processed analysis id
+    """
+    started = time.monotonic()
+    last_id = start_after_id
+    chunks = 0
+    analyses = 0
+    totals = {model.__tablename__: 0 for model in SIGNAL_MODELS}
+
+    while max_chunks is None or chunks < max_chunks:
+        async with get_db_session() as db:
+            result = await db.execute(
+                _BACKFILL_CHUNK.where(ArticleAnalysis.id > last_id).limit(chunk_size)
+            )
+            batch = result.all()
+            if not batch:
+                break
+
+            ids = [row.id for row in batch]
+            for model in SIGNAL_MODELS:
+                await db.execute(delete(model).where(model.analysis_id.in_(ids)))
+
+            rows: dict[type, list[dict[str, Any]]] = {m: [] for m in SIGNAL_MODELS}
+            for row in batch:
+                analysis_rows = build_signal_rows(
+                    row.article_id,
+                    row.id,
+                    row.created_at or datetime.now(UTC),
+                    agent_version=row.analysis_version,
+                    weak_signals=row.weak_signals,
+                    pattern_anomalies=row.pattern_anomalies,
+                    adjacent_connections=row.adjacent_connections,
+                )
+                for model, model_rows in analysis_rows.items():
+                    rows[model].extend(model_rows)
+
+            for table, count in (await insert_signal_rows(db, rows)).items():
+                totals[table] += count
+
+        chunks += 1
+        analyses += len(batch)
+        last_id = ids[-1]
+        logger.info(
+            f"Signal backfill chunk {chunks}: {len(batch)} analyses "
+            f"up to id {last_id}"
+        )
+
+    return {
+        "analyses_processed": analyses,
+        "chunks": chunks,
+        "last_analysis_id": last_id,
+        **{f"{table}_rows": count for table, count in totals.items()},
+        "duration_seconds": round(time.monotonic() - started, 2),
+    }
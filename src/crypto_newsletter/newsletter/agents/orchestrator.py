@@ -4,6 +4,10 @@ import logging
 from datetime import datetime
 from typing import Any
 
+from pydantic_ai import Agent
+
+from ...analysis.agents.settings import analysis_settings
+from ...analysis.concurrency import run_agent
 from .newsletter_writer import newsletter_writer_agent
 from .story_selection import story_selection_agent
 from .synthesis import synthesis_agent
@@ -19,6 +23,15 @@ class NewsletterOrchestrator:
         self.synthesis_agent = synthesis_agent
         self.writer_agent = newsletter_writer_agent
 
+    async def _run_agent(self, agent: Agent, prompt: str) -> Any:
+        """
+        Run a newsletter agent within LLM_NEWSLETTER_TIMEOUT_SECONDS; its
+        prompts and outputs are far longer than an article analysis.
+        """
+        return await run_agent(
+            agent, prompt, timeout=analysis_settings.llm_newsletter_timeout_seconds
+        )
+
     async def generate_newsletter(
         self, articles: list[dict[str, Any]], newsletter_type: str = "DAILY"
     ) -> dict[str, Any]:
@@ -41,7 +54,9 @@ class NewsletterOrchestrator:
             logger.info(f"Starting story selection for {len(articles)} articles")
 
             formatted_articles = self.format_articles_for_selection(articles)
-            selection_result = await self.story_agent.run(formatted_articles)
+            selection_result = await self._run_agent(
+                self.story_agent, formatted_articles
+            )
 
             if len(selection_result.output.selected_stories) < 3:
                 raise ValueError("Not enough quality stories selected")
@@ -54,7 +69,9 @@ class NewsletterOrchestrator:
             synthesis_input = self.format_selection_for_synthesis(
                 selection_result.output, articles
             )
-            synthesis_result = await self.synthesis_agent.run(synthesis_input)
+            synthesis_result = await self._run_agent(
+                self.synthesis_agent, synthesis_input
+            )
 
             # Step 3: Newsletter Writing
             logger.info("Generating newsletter content")
@@ -62,7 +79,7 @@ class NewsletterOrchestrator:
             writing_input = self.format_synthesis_for_writing(
                 synthesis_result.output, selection_result.output
             )
-            newsletter_result = await self.writer_agent.run(writing_input)
+            newsletter_result = await self._run_agent(self.writer_agent, writing_input)
 
             # Calculate costs and metadata
             total_cost = self.calculate_generation_cost(
@@ -318,20 +335,20 @@ Please create compelling newsletter content that transforms this analysis into a
             )
 
             # Generate weekly synthesis from daily newsletters
-            synthesis_agent = SynthesisAgent()
-            weekly_synthesis = await synthesis_agent.run(
+            weekly_synthesis = await self._run_agent(
+                self.synthesis_agent,
                 f"Synthesize weekly insights from {len(daily_newsletters)} daily newsletters:\n\n"
                 + "\n\n".join(
                     [
                         f"Day {i+1} ({content['generation_date']}):\n{content['summary']}"
                         for i, content in enumerate(daily_contents)
                     ]
-                )
+                ),
             )
 
             # Generate weekly newsletter content
-            writer_agent = NewsletterWriterAgent()
-            weekly_content = await writer_agent.run(
+            weekly_content = await self._run_agent(
+                self.writer_agent,
                 f"Create weekly newsletter from daily newsletter synthesis:\n\n"
                 f"Weekly Synthesis: {weekly_synthesis.output.market_narrative}\n\n"
                 f"Key Themes: {', '.join(weekly_synthesis.output.primary_themes)}\n\n"
@@ -341,7 +358,7 @@ Please create compelling newsletter content that transforms this analysis into a
                         f"• {content['title']}: {content['summary']}"
                         for content in daily_contents
                     ]
-                )
+                ),
             )
 
             # Calculate costs
@@ -60,7 +60,9 @@ class ProgressAwareNewsletterOrchestrator(NewsletterOrchestrator):
 
                 # Use enhanced formatting with URLs
                 selection_input = self.format_articles_for_selection(articles)
-                selection_result = await self.story_agent.run(selection_input)
+                selection_result = await self._run_agent(
+                    self.story_agent, selection_input
+                )
 
                 # Validate selection quality
                 selection_quality = await self.validate_story_selection(
@@ -105,7 +107,9 @@ class ProgressAwareNewsletterOrchestrator(NewsletterOrchestrator):
                 synthesis_input = self.format_selection_for_synthesis(
                     selection_result.output, articles
                 )
-                synthesis_result = await self.synthesis_agent.run(synthesis_input)
+                synthesis_result = await self._run_agent(
+                    self.synthesis_agent, synthesis_input
+                )
 
                 synthesis_quality = await self.validate_synthesis(
                     synthesis_result.output
@@ -147,7 +151,9 @@ class ProgressAwareNewsletterOrchestrator(NewsletterOrchestrator):
                 writing_input = self.format_synthesis_for_writing(
                     synthesis_result.output, selection_result.output
                 )
-                newsletter_result = await self.writer_agent.run(writing_input)
+                newsletter_result = await self._run_agent(
+                    self.writer_agent, writing_input
+                )
 
                 writing_quality = await self.validate_newsletter_content(
                     newsletter_result.output, articles
@@ -29,6 +29,12 @@ class BatchProcessingConfig:
     # Processing limits
     MAX_ARTICLES_PER_SESSION: int = 200  # Safety limit
     MAX_CONCURRENT_BATCHES: int = 2  # Prevent system overload
+    MAX_CONCURRENT_ARTICLES: int = 5  # Analyses in flight per batch
+
+    @classmethod
+    def get_article_concurrency(cls, provider_limit: int) -> int:
+        """Articles analyzed at once: config cap, bounded by the provider limit."""
+        return max(1, min(cls.MAX_CONCURRENT_ARTICLES, provider_limit))
 
     @classmethod
     def get_estimated_total_cost(cls, article_count: int) -> float:
@@ -59,10 +65,10 @@ class BatchProcessingConfig:
         """Calculate estimated processing timeline."""
         batch_count = cls.get_batch_count(article_count)
 
-        # Estimate processing time per batch (including delays)
-        time_per_batch = (
-            cls.BATCH_SIZE * 30
-        ) + cls.BATCH_DELAY  # 30 seconds per article + delay
+        # Estimate processing time per batch (including delays): articles run
+        # MAX_CONCURRENT_ARTICLES at a time, ~30 seconds each
+        waves = -(-cls.BATCH_SIZE // cls.MAX_CONCURRENT_ARTICLES)
+        time_per_batch = waves * 30 + cls.BATCH_DELAY
         total_time_seconds = batch_count * time_per_batch
 
         return {
@@ -3,12 +3,109 @@
 import logging
 from typing import Any
 
-from sqlalchemy import text
+from sqlalchemy import BigInteger, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from crypto_newsletter.analysis.agents.settings import analysis_settings
+
 logger = logging.getLogger(__name__)
 
+MIN_ARTICLES_REQUIRED = 3
+BODY_PREVIEW_LENGTH = 200
+
+# Metadata, lengths and a 200-character preview; full bodies are never loaded
+_ARTICLE_METADATA_COLUMNS = f"""
+    a.id,
+    a.title,
+    a.url,
+    a.published_on,
+    LENGTH(a.body) AS content_length,
+    SUBSTR(a.body, 1, {BODY_PREVIEW_LENGTH}) AS body_head,
+    p.name AS publisher_name,
+    p.id AS publisher_id
+"""
+
+# Articles that can be analyzed, newest first
+_CANDIDATE_CONDITIONS = """
+    WHERE NOT EXISTS (  -- Not yet analyzed
+        SELECT 1 FROM article_analyses aa WHERE aa.article_id = a.id
+      )
+      AND LENGTH(a.body) > :min_length  -- Substantial content
+      AND a.body IS NOT NULL
+      AND a.body != ''
+      AND a.status = 'ACTIVE'  -- Only active articles
+    ORDER BY a.published_on DESC
+    LIMIT :limit
+"""
+
+ANALYZABLE_ARTICLES_SQL = text(
+    f"""
+    SELECT a.id
+    FROM articles a
+    {_CANDIDATE_CONDITIONS}
+    """
+)
+
+# Details and validation for a given set of IDs: one statement for any number
+# of IDs, since the list is bound as a single array parameter. already_analyzed
+# is the per-row anti-join flag used by validation.
+ARTICLES_BY_IDS_SQL = text(
+    f"""
+    SELECT {_ARTICLE_METADATA_COLUMNS},
+        EXISTS (
+            SELECT 1 FROM article_analyses aa WHERE aa.article_id = a.id
+        ) AS already_analyzed
+    FROM articles a
+    JOIN publishers p ON a.publisher_id = p.id
+    WHERE a.id = ANY(:ids)
+    ORDER BY a.published_on DESC
+    """
+).bindparams(bindparam("ids", type_=ARRAY(BigInteger)))
+
+# Candidate selection and validation in one pass; the candidate conditions
+# already exclude analyzed articles
+VALIDATED_CANDIDATES_SQL = text(
+    f"""
+    SELECT {_ARTICLE_METADATA_COLUMNS}, FALSE AS already_analyzed
+    FROM articles a
+    JOIN publishers p ON a.publisher_id = p.id
+    {_CANDIDATE_CONDITIONS}
+    """
+)
+
+
+def _article_details(row: Any) -> dict[str, Any]:
+    """Shape a metadata row for batch processing."""
+    content_length = row.content_length or 0
+    body_head = row.body_head or ""
+    return {
+        "id": row.id,
+        "title": row.title,
+        "url": row.url,
+        "published_on": row.published_on.isoformat() if row.published_on else None,
+        "content_length": content_length,
+        "publisher_name": row.publisher_name,
+        "publisher_id": row.publisher_id,
+        "body_preview": body_head + "..."
+        if content_length > BODY_PREVIEW_LENGTH
+        else body_head,
+    }
+
+
+def _empty_validation() -> dict[str, Any]:
+    return {
+        "valid_articles": [],
+        "invalid_articles": [],
+        "validation_summary": {
+            "total_articles": 0,
+            "valid_count": 0,
+            "invalid_count": 0,
+            "validation_passed": False,
+        },
+    }
+
 
 class BatchArticleIdentifier:
     """Identifies articles suitable for batch processing."""
@@ -16,6 +113,60 @@ class BatchArticleIdentifier:
     def __init__(self, min_content_length: int = 1000):
         self.min_content_length = min_content_length
 
+    def _summarize_validation(self, rows: list[Any]) -> dict[str, Any]:
+        """Split metadata rows into valid and invalid articles."""
+        valid_articles = []
+        invalid_articles = []
+
+        for row in rows:
+            article = _article_details(row)
+            validation_issues = []
+
+            # Check content length
+            if article["content_length"] < self.min_content_length:
+                validation_issues.append(
+                    f"Content too short: {article['content_length']} chars"
+                )
+
+            # Check if already analyzed (double-check)
+            if row.already_analyzed:
+                validation_issues.append("Already analyzed")
+
+            if validation_issues:
+                article["validation_issues"] = validation_issues
+                invalid_articles.append(article)
+            else:
+                valid_articles.append(article)
+
+        validation_summary = {
+            "total_articles": len(rows),
+            "valid_count": len(valid_articles),
+            "invalid_count": len(invalid_articles),
+            "validation_passed": len(valid_articles) >= MIN_ARTICLES_REQUIRED,
+            "min_articles_required": MIN_ARTICLES_REQUIRED,
+        }
+
+        logger.info(
+            f"Validation complete: {validation_summary['valid_count']}/"
+            f"{validation_summary['total_articles']} articles valid"
+        )
+
+        return {
+            "valid_articles": valid_articles,
+            "invalid_articles": invalid_articles,
+            "validation_summary": validation_summary,
+        }
+
+    def _candidate_params(self, limit: int) -> dict[str, Any]:
+        return {"min_length": self.min_content_length, "limit": limit}
+
+    def _analyzable_ids(self, article_ids: list[int], limit: int) -> list[int]:
+        logger.info(
+            f"Found {len(article_ids)} analyzable articles "
+            f"(min_length: {self.min_content_length}, limit: {limit})"
+        )
+        return list(article_ids)
+
     async def get_analyzable_articles(
         self, db: AsyncSession, limit: int = 200
     ) -> list[int]:
@@ -35,33 +186,10 @@ class BatchArticleIdentifier:
             List of article IDs suitable for batch processing
         """
         try:
-            query = text(
-                """
-                SELECT a.id
-                FROM articles a
-                LEFT JOIN article_analyses aa ON a.id = aa.article_id
-                WHERE aa.id IS NULL  -- Not yet analyzed
-                  AND LENGTH(a.body) > :min_length  -- Substantial content
-                  AND a.body IS NOT NULL
-                  AND a.body != ''
-                  AND a.status = 'ACTIVE'  -- Only active articles
-                ORDER BY a.published_on DESC
-                LIMIT :limit
-            """
-            )
-
             result = await db.execute(
-                query, {"min_length": self.min_content_length, "limit": limit}
+                ANALYZABLE_ARTICLES_SQL, self._candidate_params(limit)
             )
-
-            article_ids = [row[0] for row in result.fetchall()]
-
-            logger.info(
-                f"Found {len(article_ids)} analyzable articles "
-                f"(min_length: {self.min_content_length}, limit: {limit})"
-            )
-
-            return article_ids
+            return self._analyzable_ids(result.scalars().all(), limit)
 
         except Exception as e:
             logger.error(f"Failed to get analyzable articles: {e}")
@@ -84,49 +212,8 @@ class BatchArticleIdentifier:
             return []
 
         try:
-            # Use IN clause instead of ANY for better compatibility
-            ids_placeholder = ",".join([f":id_{i}" for i in range(len(article_ids))])
-            params = {f"id_{i}": article_id for i, article_id in enumerate(article_ids)}
-
-            query = text(
-                f"""
-                SELECT
-                    a.id,
-                    a.title,
-                    a.url,
-                    a.published_on,
-                    a.body,
-                    LENGTH(a.body) as content_length,
-                    p.name as publisher_name,
-                    p.id as publisher_id
-                FROM articles a
-                JOIN publishers p ON a.publisher_id = p.id
-                WHERE a.id IN ({ids_placeholder})
-                ORDER BY a.published_on DESC
-            """
-            )
-
-            result = await db.execute(query, params)
-            rows = result.fetchall()
-
-            articles = []
-            for row in rows:
-                articles.append(
-                    {
-                        "id": row.id,
-                        "title": row.title,
-                        "url": row.url,
-                        "published_on": row.published_on.isoformat()
-                        if row.published_on
-                        else None,
-                        "content_length": row.content_length,
-                        "publisher_name": row.publisher_name,
-                        "publisher_id": row.publisher_id,
-                        "body_preview": row.body[:200] + "..."
-                        if len(row.body) > 200
-                        else row.body,
-                    }
-                )
+            result = await db.execute(ARTICLES_BY_IDS_SQL, {"ids": list(article_ids)})
+            articles = [_article_details(row) for row in result.fetchall()]
 
             logger.info(f"Retrieved details for {len(articles)} articles")
             return articles
@@ -149,81 +236,41 @@ class BatchArticleIdentifier:
             Validation results with statistics
         """
         if not article_ids:
-            return {
-                "valid_articles": [],
-                "invalid_articles": [],
-                "validation_summary": {
-                    "total_articles": 0,
-                    "valid_count": 0,
-                    "invalid_count": 0,
-                    "validation_passed": False,
-                },
-            }
+            return _empty_validation()
 
         try:
-            # Get article details
-            articles = await self.get_article_details(db, article_ids)
-
-            valid_articles = []
-            invalid_articles = []
-
-            for article in articles:
-                # Validation criteria
-                is_valid = True
-                validation_issues = []
-
-                # Check content length
-                if article["content_length"] < self.min_content_length:
-                    is_valid = False
-                    validation_issues.append(
-                        f"Content too short: {article['content_length']} chars"
-                    )
-
-                # Check if already analyzed (double-check)
-                already_analyzed = await self._check_if_analyzed(db, article["id"])
-                if already_analyzed:
-                    is_valid = False
-                    validation_issues.append("Already analyzed")
-
-                if is_valid:
-                    valid_articles.append(article)
-                else:
-                    article["validation_issues"] = validation_issues
-                    invalid_articles.append(article)
-
-            validation_summary = {
-                "total_articles": len(articles),
-                "valid_count": len(valid_articles),
-                "invalid_count": len(invalid_articles),
-                "validation_passed": len(valid_articles)
-                >= 3,  # Minimum 3 articles needed
-                "min_articles_required": 3,
-            }
-
-            logger.info(
-                f"Validation complete: {validation_summary['valid_count']}/{validation_summary['total_articles']} articles valid"
-            )
-
-            return {
-                "valid_articles": valid_articles,
-                "invalid_articles": invalid_articles,
-                "validation_summary": validation_summary,
-            }
+            result = await db.execute(ARTICLES_BY_IDS_SQL, {"ids": list(article_ids)})
+            return self._summarize_validation(result.fetchall())
 
         except Exception as e:
             logger.error(f"Failed to validate articles: {e}")
             raise
 
-    async def _check_if_analyzed(self, db: AsyncSession, article_id: int) -> bool:
-        """Check if an article has already been analyzed."""
+    async def get_validated_articles(
+        self, db: AsyncSession, limit: int = 200
+    ) -> dict[str, Any]:
+        """
+        Select analyzable articles and validate them in a single query.
+
+        Equivalent to get_analyzable_articles() followed by
+        validate_articles_for_processing(), without the second round trip.
+
+        Args:
+            db: Database session
+            limit: Maximum number of articles to return
+
+        Returns:
+            Validation results with statistics
+        """
         try:
-            query = text(
-                "SELECT 1 FROM article_analyses WHERE article_id = :article_id LIMIT 1"
+            result = await db.execute(
+                VALIDATED_CANDIDATES_SQL, self._candidate_params(limit)
             )
-            result = await db.execute(query, {"article_id": article_id})
-            return result.fetchone() is not None
-        except Exception:
-            return False
+            return self._summarize_validation(result.fetchall())
+
+        except Exception as e:
+            logger.error(f"Failed to get validated articles: {e}")
+            raise
 
     # Synchronous versions for Celery tasks
     def get_analyzable_articles_sync(self, db: Session, limit: int = 200) -> list[int]:
@@ -243,33 +290,8 @@ class BatchArticleIdentifier:
             List of article IDs suitable for batch processing
         """
         try:
-            query = text(
-                """
-                SELECT a.id
-                FROM articles a
-                LEFT JOIN article_analyses aa ON a.id = aa.article_id
-                WHERE aa.id IS NULL  -- Not yet analyzed
-                  AND LENGTH(a.body) > :min_length  -- Substantial content
-                  AND a.body IS NOT NULL
-                  AND a.body != ''
-                  AND a.status = 'ACTIVE'  -- Only active articles
-                ORDER BY a.published_on DESC
-                LIMIT :limit
-            """
-            )
-
-            result = db.execute(
-                query, {"min_length": self.min_content_length, "limit": limit}
-            )
-
-            article_ids = [row[0] for row in result.fetchall()]
-
-            logger.info(
-                f"Found {len(article_ids)} analyzable articles "
-                f"(min_length: {self.min_content_length}, limit: {limit})"
-            )
-
-            return article_ids
+            result = db.execute(ANALYZABLE_ARTICLES_SQL, self._candidate_params(limit))
+            return self._analyzable_ids(result.scalars().all(), limit)
 
         except Exception as e:
             logger.error(f"Failed to get analyzable articles: {e}")
@@ -292,49 +314,8 @@ class BatchArticleIdentifier:
             return []
 
         try:
-            # Use IN clause instead of ANY for better compatibility
-            ids_placeholder = ",".join([f":id_{i}" for i in range(len(article_ids))])
-            params = {f"id_{i}": article_id for i, article_id in enumerate(article_ids)}
-
-            query = text(
-                f"""
-                SELECT
-                    a.id,
-                    a.title,
-                    a.url,
-                    a.published_on,
-                    a.body,
-                    LENGTH(a.body) as content_length,
-                    p.name as publisher_name,
-                    p.id as publisher_id
-                FROM articles a
-                JOIN publishers p ON a.publisher_id = p.id
-                WHERE a.id IN ({ids_placeholder})
-                ORDER BY a.published_on DESC
-            """
-            )
-
-            result = db.execute(query, params)
-            rows = result.fetchall()
-
-            articles = []
-            for row in rows:
-                articles.append(
-                    {
-                        "id": row.id,
-                        "title": row.title,
-                        "url": row.url,
-                        "published_on": row.published_on.isoformat()
-                        if row.published_on
-                        else None,
-                        "content_length": row.content_length,
-                        "publisher_name": row.publisher_name,
-                        "publisher_id": row.publisher_id,
-                        "body_preview": row.body[:200] + "..."
-                        if len(row.body) > 200
-                        else row.body,
-                    }
-                )
+            result = db.execute(ARTICLES_BY_IDS_SQL, {"ids": list(article_ids)})
+            articles = [_article_details(row) for row in result.fetchall()]
 
             logger.info(f"Retrieved details for {len(articles)} articles")
             return articles
@@ -357,81 +338,36 @@ class BatchArticleIdentifier:
             Validation results with statistics
         """
         if not article_ids:
-            return {
-                "valid_articles": [],
-                "invalid_articles": [],
-                "validation_summary": {
-                    "total_articles": 0,
-                    "valid_count": 0,
-                    "invalid_count": 0,
-                    "validation_passed": False,
-                },
-            }
+            return _empty_validation()
 
         try:
-            # Get article details
-            articles = self.get_article_details_sync(db, article_ids)
-
-            valid_articles = []
-            invalid_articles = []
-
-            for article in articles:
-                # Validation criteria
-                is_valid = True
-                validation_issues = []
-
-                # Check content length
-                if article["content_length"] < self.min_content_length:
-                    is_valid = False
-                    validation_issues.append(
-                        f"Content too short: {article['content_length']} chars"
-                    )
-
-                # Check if already analyzed (double-check)
-                already_analyzed = self._check_if_analyzed_sync(db, article["id"])
-                if already_analyzed:
-                    is_valid = False
-                    validation_issues.append("Already analyzed")
-
-                if is_valid:
-                    valid_articles.append(article)
-                else:
-                    article["validation_issues"] = validation_issues
-                    invalid_articles.append(article)
-
-            validation_summary = {
-                "total_articles": len(articles),
-                "valid_count": len(valid_articles),
-                "invalid_count": len(invalid_articles),
-                "validation_passed": len(valid_articles)
-                >= 3,  # Minimum 3 articles needed
-                "min_articles_required": 3,
-            }
-
-            logger.info(
-                f"Validation complete: {validation_summary['valid_count']}/{validation_summary['total_articles']} articles valid"
-            )
-
-            return {
-                "valid_articles": valid_articles,
-                "invalid_articles": invalid_articles,
-                "validation_summary": validation_summary,
-            }
+            result = db.execute(ARTICLES_BY_IDS_SQL, {"ids": list(article_ids)})
+            return self._summarize_validation(result.fetchall())
 
         except Exception as e:
             logger.error(f"Failed to validate articles: {e}")
             raise
 
-    def _check_if_analyzed_sync(self, db: Session, article_id: int) -> bool:
-        """Check if an article has already been analyzed (synchronous version)."""
+    def get_validated_articles_sync(
+        self, db: Session, limit: int = 200
+    ) -> dict[str, Any]:
+        """
+        Select analyzable articles and validate them in a single query (synchronous version).
+
+        Args:
+            db: Database session
+            limit: Maximum number of articles to return
+
+        Returns:
+            Validation results with statistics
+        """
         try:
-            query = text(
-                "SELECT 1 FROM article_analyses WHERE article_id = :article_id LIMIT 1"
-            )
-            result = db.execute(query, {"article_id": article_id})
-            return result.fetchone() is not None
-        except Exception:
-            return False
+            result = db.execute(VALIDATED_CANDIDATES_SQL, self._candidate_params(limit))
+            return self._summarize_validation(result.fetchall())
+
+        except Exception as e:
+            logger.error(f"Failed to get validated articles: {e}")
+            raise
 
     def get_recent_analyzable_articles_sync(
         self, db: Session, hours_back: int = 24, limit: int = 50
@@ -455,8 +391,9 @@ class BatchArticleIdentifier:
                 """
                 SELECT a.id
                 FROM articles a
-                LEFT JOIN article_analyses aa ON a.id = aa.article_id
-                WHERE aa.id IS NULL  -- Not yet analyzed
+                WHERE NOT EXISTS (  -- Not yet analyzed
+                    SELECT 1 FROM article_analyses aa WHERE aa.article_id = a.id
+                  )
                   AND LENGTH(a.body) > :min_length  -- Substantial content
                   AND a.body IS NOT NULL
                   AND a.body != ''
@@ -529,9 +466,10 @@ class BatchArticleIdentifier:
                     )
                     return recent_articles
 
-                # If not enough recent articles, supplement with older ones
+                # If not enough recent articles, supplement with older ones,
+                # unless the backlog goes to provider batch jobs instead
                 remaining_limit = limit - len(recent_articles)
-                if remaining_limit > 0:
+                if remaining_limit > 0 and not analysis_settings.backlog_batch_jobs:
                     older_articles = self._get_older_quality_articles_sync(
                         db, limit=remaining_limit, exclude_ids=recent_articles
                     )
@@ -557,29 +495,30 @@ class BatchArticleIdentifier:
     ) -> list[int]:
         """Get older articles with quality prioritization."""
         try:
-            exclude_clause = ""
-            params = {"min_length": self.min_content_length, "limit": limit}
-
-            if exclude_ids:
-                exclude_placeholder = ",".join(
-                    [f":exclude_{i}" for i in range(len(exclude_ids))]
-                )
-                exclude_clause = f"AND a.id NOT IN ({exclude_placeholder})"
-                for i, article_id in enumerate(exclude_ids):
-                    params[f"exclude_{i}"] = article_id
+            params = {
+                "min_length": self.min_content_length,
+                "limit": limit,
+                "exclude_ids": list(exclude_ids or []),
+            }
 
             query = text(
-                f"""
+                """
                 SELECT a.id
                 FROM articles a
-                LEFT JOIN article_analyses aa ON a.id = aa.article_id
                 LEFT JOIN publishers p ON a.publisher_id = p.id
-                WHERE aa.id IS NULL  -- Not yet analyzed
+                WHERE NOT EXISTS (  -- Not yet analyzed
+                    SELECT 1 FROM article_analyses aa WHERE aa.article_id = a.id
+                  )
                   AND LENGTH(a.body) > :min_length  -- Substantial content
                   AND a.body IS NOT NULL
                   AND a.body != ''
                   AND a.status = 'ACTIVE'  -- Only active articles
-                  {exclude_clause}
+                  AND a.id <> ALL(:exclude_ids)
+                  AND NOT EXISTS (  -- Not waiting on a batch job
+                    SELECT 1 FROM analysis_batch_jobs j
+                    WHERE j.status IN ('SUBMITTED', 'RUNNING')
+                      AND a.id = ANY(j.article_ids)
+                  )
                 ORDER BY
                   CASE WHEN p.name IN ('CoinDesk', 'NewsBTC', 'Crypto Potato', 'CoinTelegraph')
                        THEN 1 ELSE 2 END,  -- Quality publishers first
@@ -587,7 +526,7 @@ class BatchArticleIdentifier:
                   a.published_on DESC   -- Newer articles preferred
                 LIMIT :limit
                 """
-            )
+            ).bindparams(bindparam("exclude_ids", type_=ARRAY(BigInteger)))
 
             result = db.execute(query, params)
             article_ids = [row[0] for row in result.fetchall()]
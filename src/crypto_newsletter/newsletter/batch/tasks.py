@@ -38,8 +38,9 @@ async def batch_analyze_articles_async(
     """
     Process a batch of articles for analysis using native AsyncIO.
 
-    This async task uses the AsyncIO pool to run the entire batch processing
-    pipeline in a native async context with proper event loop integration.
+    Articles are analyzed concurrently, up to MAX_CONCURRENT_ARTICLES at a
+    time (bounded by LLM_MAX_CONCURRENCY), on the worker's analysis runtime.
+    Results are collected as articles complete.
 
     Args:
         article_ids: List of article IDs to process
@@ -52,108 +53,98 @@ async def batch_analyze_articles_async(
 
     async def _process_batch_async() -> dict[str, Any]:
         """Internal async function for batch processing."""
-        from crypto_newsletter.shared.database.connection import get_db_session
+        # Imported here to avoid circular imports
+        from crypto_newsletter.analysis.agents.settings import analysis_settings
+        from crypto_newsletter.analysis.concurrency import llm_concurrency_metrics
+        from crypto_newsletter.analysis.runtime import get_analysis_runtime
+        from crypto_newsletter.analysis.tasks import analyze_articles_concurrently
 
         batch_start = datetime.utcnow()
+        concurrency = BatchProcessingConfig.get_article_concurrency(
+            analysis_settings.llm_max_concurrency
+        )
         logger.info(
-            f"Starting async batch {batch_number} with {len(article_ids)} articles (session: {session_id})"
+            f"Starting async batch {batch_number} with {len(article_ids)} articles, "
+            f"{concurrency} at a time (session: {session_id})"
         )
 
         try:
-            async with get_db_session() as db:
-                # TODO: Update batch record status to PROCESSING (async version needed)
-                # TODO: Check budget constraint before processing (async version needed)
-                # For now, we'll focus on the core analysis functionality
-
-                # Process individual articles
-                results = []
-                batch_cost = 0.0
-                articles_processed = 0
-                articles_failed = 0
-
-                for article_id in article_ids:
-                    try:
-                        logger.info(
-                            f"Processing article {article_id} in batch {batch_number}"
-                        )
-
-                        # Call sync analysis function (hybrid approach)
-                        from crypto_newsletter.analysis.tasks import analyze_article_sync
-                        from crypto_newsletter.analysis.dependencies import CostTracker
-
-                        # Initialize cost tracker for this batch
-                        cost_tracker = CostTracker(
-                            daily_budget=BatchProcessingConfig.MAX_TOTAL_BUDGET
-                        )
-
-                        task_result = analyze_article_sync(
-                            article_id=article_id,
-                            cost_tracker=cost_tracker
-                        )
-
-                        if task_result.get("success", False):
-                            articles_processed += 1
-                            actual_cost = task_result.get("costs", {}).get("total", 0.0)
-                            batch_cost += actual_cost
-
-                            results.append(
-                                {
-                                    "article_id": article_id,
-                                    "status": "success",
-                                    "cost": actual_cost,
-                                    "signals_found": task_result.get("processing_metadata", {}).get("signals_found", 0),
-                                }
-                            )
-                        else:
-                            articles_failed += 1
-                            results.append(
-                                {
-                                    "article_id": article_id,
-                                    "status": "failed",
-                                    "error": task_result.get("error", "Unknown error"),
-                                }
-                            )
-
-                        # Brief pause between articles to manage load
-                        await asyncio.sleep(2)
-
-                    except Exception as e:
-                        logger.error(f"Failed to process article {article_id}: {e}")
-                        articles_failed += 1
-                        results.append(
-                            {
-                                "article_id": article_id,
-                                "status": "failed",
-                                "error": str(e),
-                            }
-                        )
-
-                # Update batch record with results
-                batch_completed = datetime.utcnow()
-                # TODO: Implement async storage manager methods
-                # For now, we'll skip the database updates and focus on the core analysis
-
-                # Commit the analysis results that were stored
-                await db.commit()
-
-                processing_time = (batch_completed - batch_start).total_seconds()
-
-                logger.info(
-                    f"Batch {batch_number} completed - "
-                    f"Processed: {articles_processed}, Failed: {articles_failed}, "
-                    f"Cost: ${batch_cost:.4f}, Time: {processing_time:.2f}s"
+            # TODO: Update batch record status to PROCESSING (async version needed)
+
+            # Articles run concurrently on the analysis runtime, each in its
+            # own session; LLM calls are paced by the provider rate limiter
+            task_results = await asyncio.wrap_future(
+                get_analysis_runtime().submit(
+                    analyze_articles_concurrently(
+                        article_ids,
+                        max_concurrency=concurrency,
+                        daily_budget=BatchProcessingConfig.MAX_TOTAL_BUDGET,
+                        timeout=BatchProcessingConfig.PROCESSING_TIMEOUT,
+                        # Every batch of the session draws on one sub-budget
+                        session_id=session_id,
+                        session_budget=BatchProcessingConfig.MAX_TOTAL_BUDGET,
+                    )
                 )
+            )
+
+            results = []
+            batch_cost = 0.0
+            articles_processed = 0
+            articles_failed = 0
+
+            for task_result in task_results:
+                article_id = task_result["article_id"]
+                if task_result.get("success", False):
+                    articles_processed += 1
+                    actual_cost = task_result.get("processing_cost", 0.0)
+                    batch_cost += actual_cost
+                    status = "skipped" if task_result.get("skipped") else "success"
+
+                    results.append(
+                        {
+                            "article_id": article_id,
+                            "status": status,
+                            "cost": actual_cost,
+                            "signals_found": task_result.get("signals_found", 0),
+                            "duration_seconds": task_result["duration_seconds"],
+                        }
+                    )
+                else:
+                    articles_failed += 1
+                    results.append(
+                        {
+                            "article_id": article_id,
+                            "status": "failed",
+                            "error": task_result.get("error", "Unknown error"),
+                            "duration_seconds": task_result["duration_seconds"],
+                        }
+                    )
 
-                return {
-                    "batch_number": batch_number,
-                    "session_id": session_id,
-                    "articles_processed": articles_processed,
-                    "articles_failed": articles_failed,
-                    "estimated_batch_cost": batch_cost,
-                    "processing_time_seconds": processing_time,
-                    "task_results": results,
-                    "status": "completed",
-                }
+            # Update batch record with results
+            batch_completed = datetime.utcnow()
+            # TODO: Implement async storage manager methods
+            # For now, we'll skip the database updates and focus on the core analysis
+
+            processing_time = (batch_completed - batch_start).total_seconds()
+
+            logger.info(
+                f"Batch {batch_number} completed - "
+                f"Processed: {articles_processed}, Failed: {articles_failed}, "
+                f"Cost: ${batch_cost:.4f}, Time: {processing_time:.2f}s"
+            )
+
+            return {
+                "batch_number": batch_number,
+                "session_id": session_id,
+                "articles_processed": articles_processed,
+                "articles_failed": articles_failed,
+                "estimated_batch_cost": batch_cost,
+                "processing_time_seconds": processing_time,
+                "max_concurrency": concurrency,
+                "llm_concurrency": llm_concurrency_metrics(),
+                "task_results": results,
+                "status": "completed",
+            }
 
         except Exception as exc:
             logger.error(f"Async batch {batch_number} failed: {exc}")
@@ -204,21 +195,16 @@ def initiate_batch_processing(self, force_processing: bool = False) -> dict[str,
                 identifier = BatchArticleIdentifier()
                 storage = BatchStorageManager()
 
-                # Step 1: Get articles to process
-                article_ids = identifier.get_analyzable_articles_sync(db)
+                # Steps 1-2: Select and validate articles in one query
+                validation = identifier.get_validated_articles_sync(db)
 
-                if len(article_ids) == 0:
+                if validation["validation_summary"]["total_articles"] == 0:
                     return {
                         "status": "no_articles",
                         "message": "No articles found for processing",
                         "initiation_time": initiation_start.isoformat(),
                     }
 
-                # Step 2: Validate articles and budget
-                validation = identifier.validate_articles_for_processing_sync(
-                    db, article_ids
-                )
-
                 if (
                     not validation["validation_summary"]["validation_passed"]
                     and not force_processing
@@ -5,7 +5,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Any, Optional
 
 from crypto_newsletter.core.storage.repository import NewsletterRepository
-from crypto_newsletter.shared.database.connection import get_db_session
+from crypto_newsletter.shared.database.connection import get_read_session
 from crypto_newsletter.shared.models import ArticleAnalysis, Newsletter
 from sqlalchemy import and_, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -25,7 +25,7 @@ class NewsletterTaskMonitor:
     async def __aenter__(self):
         """Async context manager entry."""
         if self.db is None:
-            self.db_session_manager = get_db_session()
+            self.db_session_manager = get_read_session()
             self.db = await self.db_session_manager.__aenter__()
         return self
 
@@ -0,0 +1,391 @@
+"""Render-once newsletter artifacts: web HTML, email-safe HTML and plain text."""
+
+import asyncio
+import hashlib
+import html
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+import markdown
+from jinja2 import DictLoader, Environment, select_autoescape
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crypto_newsletter.newsletter.models.newsletter import NewsletterContent
+from crypto_newsletter.shared.models import NewsletterRendition
+
+# Bump when templates or conversion change; stored renditions are re-rendered
+RENDER_VERSION = "1"
+
+HTML = "html"
+EMAIL = "email"
+TEXT = "text"
+VARIANTS = (HTML, EMAIL, TEXT)
+
+MARKDOWN_EXTENSIONS = [
+    "markdown.extensions.extra",
+    "markdown.extensions.codehilite",
+]
+
+_WEB_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }}</title>
+    <style>
+        body {
+            font-family:
+                -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f9f9f9;
+        }
+        .newsletter-container {
+            background: white;
+            padding: 40px;
+            border-radius: 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #f7931a;
+            border-bottom: 3px solid #f7931a;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #333;
+            margin-top: 30px;
+            border-bottom: 1px solid #eee;
+            padding-bottom: 5px;
+        }
+        h3 { color: #555; margin-top: 25px; }
+        a { color: #f7931a; text-decoration: none; }
+        a:hover { text-decoration: underline; }
+        ul { padding-left: 20px; }
+        li { margin-bottom: 8px; }
+        blockquote {
+            border-left: 4px solid #f7931a;
+            margin: 20px 0;
+            padding-left: 20px;
+            font-style: italic;
+        }
+        .footer {
+            margin-top: 40px;
+            padding-top: 20px;
+            border-top: 1px solid #eee;
+            font-size: 14px;
+            color: #666;
+        }
+    </style>
+</head>
+<body>
+    <div class="newsletter-container">
+        {{ content | safe }}
+        <div class="footer">
+            {% if read_time %}
+            <p><strong>Read Time:</strong> {{ read_time }} minutes</p>
+            {% endif %}
+            <p><strong>Quality Score:</strong> {{ quality_score }}/1.0</p>
+            <p><strong>Generated:</strong> {{ generation_date }}</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# Email clients drop <style> blocks and most layout CSS: a fixed-width table
+# with inline styles only (see EMAIL_STYLES)
+_EMAIL_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }}</title>
+</head>
+<body style="margin:0;padding:0;background-color:#f9f9f9;">
+<table role="presentation" width="100%" cellpadding="0" cellspacing="0" border="0"
+       style="background-color:#f9f9f9;">
+<tr><td align="center" style="padding:20px 10px;">
+<table role="presentation" width="600" cellpadding="0" cellspacing="0" border="0"
+       style="max-width:600px;width:100%;background-color:#ffffff;">
+<tr><td style="padding:32px;font-family:Arial,Helvetica,sans-serif;font-size:16px;
+               line-height:1.6;color:#333333;">
+{{ content | safe }}
+<p style="margin-top:32px;padding-top:16px;border-top:1px solid #eeeeee;
+          font-size:13px;color:#666666;">
+{% if read_time %}Read time: {{ read_time }} minutes &middot; {% endif %}
+Quality score: {{ quality_score }}/1.0 &middot; Generated {{ generation_date }}
+</p>
+</td></tr>
+</table>
+</td></tr>
+</table>
+</body>
+</html>
+"""
+
+# Compiled once per process; rendering a newsletter only fills them in
+_ENVIRONMENT = Environment(
+    loader=DictLoader({"web.html": _WEB_TEMPLATE, "email.html": _EMAIL_TEMPLATE}),
+    autoescape=select_autoescape(default=True),
+)
+WEB_TEMPLATE = _ENVIRONMENT.get_template("web.html")
+EMAIL_TEMPLATE = _ENVIRONMENT.get_template("email.html")
+
+EMAIL_STYLES = {
+    "h1": "color:#f7931a;font-size:26px;border-bottom:3px solid #f7931a;"
+    "padding-bottom:10px;margin:0 0 16px;",
+    "h2": "color:#333333;font-size:20px;margin:28px 0 12px;",
+    "h3": "color:#555555;font-size:17px;margin:22px 0 10px;",
+    "p": "margin:0 0 14px;",
+    "ul": "margin:0 0 14px;padding-left:20px;",
+    "ol": "margin:0 0 14px;padding-left:20px;",
+    "li": "margin-bottom:8px;",
+    "a": "color:#f7931a;text-decoration:none;",
+    "blockquote": "border-left:4px solid #f7931a;margin:20px 0;padding-left:16px;"
+    "font-style:italic;",
+    "hr": "border:none;border-top:1px solid #eeeeee;margin:24px 0;",
+}
+_EMAIL_TAG = re.compile(rf"<({'|'.join(EMAIL_STYLES)})(\s[^>]*)?>")
+
+_MD_HEADING = re.compile(r"^(#{1,6})\s+(.*)$", re.MULTILINE)
+_MD_LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+_MD_EMPHASIS = re.compile(r"(\*\*|__|\*|_)(\S(?:.*?\S)?)\1")
+
+
+@dataclass(frozen=True)
+class RenditionSource:
+    """The newsletter fields renditions are rendered from."""
+
+    id: int
+    title: str
+    content: str
+    quality_score: Optional[float]
+    generation_date: Optional[datetime]
+
+    @classmethod
+    def of(cls, newsletter: Any) -> "RenditionSource":
+        """Snapshot a loaded newsletter, so rendering can run in a thread."""
+        return cls(
+            id=newsletter.id,
+            title=newsletter.title,
+            content=newsletter.content,
+            quality_score=newsletter.quality_score,
+            generation_date=newsletter.generation_date,
+        )
+
+    @property
+    def hash(self) -> str:
+        """
+        Hash of the fields and RENDER_VERSION.
+
+        A stored rendition with a different hash is stale (content edited, or
+        templates changed).
+        """
+        source = json.dumps(
+            [
+                RENDER_VERSION,
+                self.title,
+                self.content,
+                self.quality_score,
+                self.generation_date.isoformat() if self.generation_date else None,
+            ]
+        )
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def format_newsletter_markdown(content: NewsletterContent) -> str:
+    """
+    Format structured newsletter content as the markdown that is stored.
+
+    Args:
+        content: NewsletterContent instance
+
+    Returns:
+        Formatted content string
+    """
+    sections = [
+        f"# {content.title}",
+        "",
+        "## Executive Summary",
+        "",
+    ]
+
+    for summary in content.executive_summary:
+        sections.append(f"- {summary}")
+
+    sections.extend(
+        [
+            "",
+            "## Main Analysis",
+            "",
+            content.main_analysis,
+            "",
+            "## Pattern Spotlight",
+            "",
+            content.pattern_spotlight,
+            "",
+            "## Adjacent Watch",
+            "",
+            content.adjacent_watch,
+            "",
+            "## Signal Radar",
+            "",
+            content.signal_radar,
+            "",
+            "## Action Items",
+            "",
+        ]
+    )
+
+    for i, action in enumerate(content.action_items, 1):
+        sections.append(f"{i}. {action}")
+
+    sections.extend(
+        [
+            "",
+            "## Conclusion & What This Means",
+            "",
+            "Based on the analysis above, readers should focus on monitoring "
+            "institutional adoption patterns, regulatory developments, and "
+            "cross-asset correlations as key indicators for the next phase of "
+            "market evolution. The convergence of traditional finance "
+            "infrastructure with crypto assets represents a fundamental shift "
+            "that demands careful attention to both opportunities and risks.",
+            "",
+            "## Sources & Citations",
+            "",
+        ]
+    )
+
+    for i, source in enumerate(content.source_citations, 1):
+        sections.append(f"{i}. {source}")
+
+    sections.extend(
+        [
+            "",
+            "---",
+            "",
+            f"*Estimated read time: {content.estimated_read_time} minutes*",
+            f"*Quality score: {content.editorial_quality_score:.2f}*",
+        ]
+    )
+
+    return "\n".join(sections)
+
+
+def _markdown_source(newsletter: Any) -> tuple[str, Optional[int]]:
+    """Markdown body and read time; legacy JSON content is formatted first."""
+    try:
+        content = NewsletterContent(**json.loads(newsletter.content))
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return newsletter.content, None
+    return format_newsletter_markdown(content), content.estimated_read_time
+
+
+def _inline_email_styles(body_html: str) -> str:
+    def add_style(match: re.Match) -> str:
+        tag, attributes = match.group(1), match.group(2) or ""
+        if "style=" in attributes:
+            return match.group(0)
+        return f'<{tag}{attributes} style="{EMAIL_STYLES[tag]}">'
+
+    return _EMAIL_TAG.sub(add_style, body_html)
+
+
+def markdown_to_text(markdown_content: str) -> str:
+    """Plain-text rendering: headings underlined, links spelled out."""
+
+    def heading(match: re.Match) -> str:
+        text = match.group(2).strip()
+        underline = "=" if len(match.group(1)) == 1 else "-"
+        return f"{text}\n{underline * len(text)}"
+
+    text = _MD_HEADING.sub(heading, markdown_content)
+    text = _MD_LINK.sub(r"\1 (\2)", text)
+    text = _MD_EMPHASIS.sub(r"\2", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return html.unescape(text).strip() + "\n"
+
+
+def render_newsletter(newsletter: Any) -> dict[str, str]:
+    """
+    Render all variants of a newsletter.
+
+    Args:
+        newsletter: Newsletter or RenditionSource; content is markdown or
+            legacy NewsletterContent JSON
+
+    Returns:
+        Dict of variant name (``html``, ``email``, ``text``) to body
+    """
+    markdown_content, read_time = _markdown_source(newsletter)
+    body_html = markdown.markdown(markdown_content, extensions=MARKDOWN_EXTENSIONS)
+    context = {
+        "title": newsletter.title,
+        "read_time": read_time,
+        "quality_score": f"{newsletter.quality_score:.2f}"
+        if newsletter.quality_score
+        else "N/A",
+        "generation_date": newsletter.generation_date.strftime("%Y-%m-%d %H:%M UTC")
+        if newsletter.generation_date
+        else "Unknown",
+    }
+
+    return {
+        HTML: WEB_TEMPLATE.render(content=body_html, **context),
+        EMAIL: EMAIL_TEMPLATE.render(
+            content=_inline_email_styles(body_html), **context
+        ),
+        TEXT: markdown_to_text(markdown_content),
+    }
+
+
+async def save_renditions(session: AsyncSession, newsletter: Any) -> dict[str, str]:
+    """
+    Render a newsletter and upsert its renditions in the session's transaction.
+
+    Call from write paths, after the newsletter is flushed and before commit,
+    so readers never render. Rendering runs in a worker thread.
+
+    Returns:
+        Dict of variant name to body
+    """
+    source = RenditionSource.of(newsletter)
+    renditions = await asyncio.to_thread(render_newsletter, source)
+    await store_renditions(session, source, renditions)
+    return renditions
+
+
+async def store_renditions(
+    session: AsyncSession, source: RenditionSource, renditions: dict[str, str]
+) -> None:
+    """Upsert already rendered variants of ``source``."""
+    statement = insert(NewsletterRendition).values(
+        [
+            {
+                "newsletter_id": source.id,
+                "variant": variant,
+                "source_hash": source.hash,
+                "body": body,
+            }
+            for variant, body in renditions.items()
+        ]
+    )
+    await session.execute(
+        statement.on_conflict_do_update(
+            constraint="uq_newsletter_rendition",
+            set_={
+                "source_hash": statement.excluded.source_hash,
+                "body": statement.excluded.body,
+                "created_at": func.now(),
+            },
+        )
+    )
@@ -1,18 +1,32 @@
 """Newsletter storage and database operations."""
 
+import asyncio
 import logging
 import re
 from datetime import date, datetime
 from typing import Any, Optional
 
-import markdown
 from crypto_newsletter.newsletter.models.newsletter import (
     NewsletterContent,
     NewsletterSynthesis,
     StorySelection,
 )
-from crypto_newsletter.shared.models import Newsletter, NewsletterArticle
-from jinja2 import Template
+from crypto_newsletter.newsletter.rendering import (
+    HTML,
+    VARIANTS,
+    RenditionSource,
+    format_newsletter_markdown,
+    render_newsletter,
+    save_renditions,
+    store_renditions,
+)
+from crypto_newsletter.shared.cache import NEWSLETTERS, invalidate_cache_tags
+from crypto_newsletter.shared.database.connection import get_db_session
+from crypto_newsletter.shared.models import (
+    Newsletter,
+    NewsletterArticle,
+    NewsletterRendition,
+)
 from sqlalchemy import and_, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -50,7 +64,7 @@ class NewsletterStorage:
             # Create newsletter record
             newsletter = Newsletter(
                 title=newsletter_content.title,
-                content=self._format_newsletter_content(newsletter_content),
+                content=format_newsletter_markdown(newsletter_content),
                 summary="\n".join(newsletter_content.executive_summary),
                 generation_date=datetime.now(),  # Use current datetime
                 status="DRAFT",
@@ -95,8 +109,13 @@ class NewsletterStorage:
                 )
                 self.db.add(newsletter_article)
 
+            # Render once here, with the values as stored, instead of per view
+            await self.db.refresh(newsletter)
+            await save_renditions(self.db, newsletter)
+
             await self.db.commit()
             await self.db.refresh(newsletter)
+            await invalidate_cache_tags(NEWSLETTERS)
 
             logger.info(f"Created newsletter {newsletter.id}: {newsletter.title}")
             return newsletter
@@ -218,6 +237,7 @@ class NewsletterStorage:
 
             await self.db.commit()
             await self.db.refresh(newsletter)
+            await invalidate_cache_tags(NEWSLETTERS)
 
             logger.info(f"Updated newsletter {newsletter_id} status to {status}")
             return newsletter
@@ -246,6 +266,7 @@ class NewsletterStorage:
         try:
             await self.db.delete(newsletter)
             await self.db.commit()
+            await invalidate_cache_tags(NEWSLETTERS)
 
             logger.info(f"Deleted newsletter {newsletter_id}")
             return True
@@ -255,317 +276,107 @@ class NewsletterStorage:
             logger.error(f"Failed to delete newsletter: {e}")
             raise
 
-    def _format_newsletter_content(self, content: NewsletterContent) -> str:
+    async def get_newsletter_html(self, newsletter_id: int) -> Optional[str]:
         """
-        Format newsletter content for storage.
+        Get newsletter content as HTML.
 
         Args:
-            content: NewsletterContent instance
+            newsletter_id: ID of the newsletter
 
         Returns:
-            Formatted content string
+            HTML formatted newsletter content or None if not found
         """
-        sections = [
-            f"# {content.title}",
-            "",
-            "## Executive Summary",
-            "",
-        ]
-
-        for summary in content.executive_summary:
-            sections.append(f"- {summary}")
-
-        sections.extend(
-            [
-                "",
-                "## Main Analysis",
-                "",
-                content.main_analysis,
-                "",
-                "## Pattern Spotlight",
-                "",
-                content.pattern_spotlight,
-                "",
-                "## Adjacent Watch",
-                "",
-                content.adjacent_watch,
-                "",
-                "## Signal Radar",
-                "",
-                content.signal_radar,
-                "",
-                "## Action Items",
-                "",
-            ]
-        )
-
-        for i, action in enumerate(content.action_items, 1):
-            sections.append(f"{i}. {action}")
-
-        sections.extend(
-            [
-                "",
-                "## Conclusion & What This Means",
-                "",
-                "Based on the analysis above, readers should focus on monitoring institutional adoption patterns, regulatory developments, and cross-asset correlations as key indicators for the next phase of market evolution. The convergence of traditional finance infrastructure with crypto assets represents a fundamental shift that demands careful attention to both opportunities and risks.",
-                "",
-                "## Sources & Citations",
-                "",
-            ]
-        )
-
-        for i, source in enumerate(content.source_citations, 1):
-            sections.append(f"{i}. {source}")
-
-        sections.extend(
-            [
-                "",
-                "---",
-                "",
-                f"*Estimated read time: {content.estimated_read_time} minutes*",
-                f"*Quality score: {content.editorial_quality_score:.2f}*",
-            ]
+        newsletter = await self.get_newsletter_by_id(
+            newsletter_id, include_articles=False
         )
+        if not newsletter:
+            return None
+        return await self.get_rendition(newsletter, HTML)
 
-        return "\n".join(sections)
-
-    def _generate_html_content(self, content: NewsletterContent) -> str:
-        """
-        Convert newsletter content to HTML format for email/web display.
-
-        Args:
-            content: NewsletterContent object to convert
-
-        Returns:
-            HTML formatted newsletter content
+    async def get_rendition(
+        self, newsletter: Newsletter, variant: str = HTML
+    ) -> Optional[str]:
         """
-        # Get the markdown content
-        markdown_content = self._format_newsletter_content(content)
-
-        # Convert markdown to HTML with extensions
-        html_content = markdown.markdown(
-            markdown_content,
-            extensions=[
-                "markdown.extensions.codehilite",
-                "markdown.extensions.tables",
-                "markdown.extensions.toc",
-                "markdown.extensions.fenced_code",
-                "markdown.extensions.nl2br",
-            ],
-        )
+        Get a pre-rendered representation of a loaded newsletter.
 
-        # Apply newsletter-specific HTML template
-        return self._apply_newsletter_template(html_content, content)
-
-    def _apply_newsletter_template(
-        self, html_content: str, content: NewsletterContent
-    ) -> str:
-        """
-        Apply HTML template to newsletter content.
+        Renditions are written with the newsletter. One that is missing
+        (newsletters created before renditions existed) or stale is rendered
+        now, off the event loop, and saved for the next request.
 
         Args:
-            html_content: Raw HTML content from markdown conversion
-            content: Original NewsletterContent for metadata
+            newsletter: Newsletter instance
+            variant: ``html``, ``email`` or ``text``
 
         Returns:
-            Templated HTML newsletter
-        """
-        template_str = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{{ title }}</title>
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f8f9fa;
-        }
-        .newsletter-container {
-            background: white;
-            padding: 40px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 {
-            color: #f7931a;
-            border-bottom: 3px solid #f7931a;
-            padding-bottom: 10px;
-        }
-        h2 {
-            color: #2c3e50;
-            margin-top: 30px;
-        }
-        .executive-summary {
-            background: #fff3cd;
-            border-left: 4px solid #f7931a;
-            padding: 20px;
-            margin: 20px 0;
-        }
-        .citation {
-            font-size: 0.9em;
-            color: #666;
-        }
-        .footer {
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #eee;
-            font-size: 0.9em;
-            color: #666;
-        }
-        a {
-            color: #f7931a;
-            text-decoration: none;
-        }
-        a:hover {
-            text-decoration: underline;
-        }
-        blockquote {
-            border-left: 4px solid #f7931a;
-            margin: 20px 0;
-            padding-left: 20px;
-            font-style: italic;
-        }
-    </style>
-</head>
-<body>
-    <div class="newsletter-container">
-        {{ content }}
-        <div class="footer">
-            <p><strong>Read Time:</strong> {{ read_time }} minutes</p>
-            <p><strong>Quality Score:</strong> {{ quality_score }}/1.0</p>
-            <p><strong>Generated:</strong> {{ generation_date }}</p>
-        </div>
-    </div>
-</body>
-</html>
+            Rendered body or None if rendering failed
         """
-
-        template = Template(template_str)
-
-        return template.render(
-            title=content.title,
-            content=html_content,
-            read_time=content.estimated_read_time,
-            quality_score=f"{content.editorial_quality_score:.2f}",
-            generation_date=datetime.now().strftime("%Y-%m-%d %H:%M UTC"),
+        source = RenditionSource.of(newsletter)
+        result = await self.db.execute(
+            select(NewsletterRendition.body, NewsletterRendition.source_hash).where(
+                NewsletterRendition.newsletter_id == source.id,
+                NewsletterRendition.variant == variant,
+            )
         )
+        row = result.one_or_none()
+        if row is not None and row.source_hash == source.hash:
+            return row.body
 
-    def _generate_html_from_markdown(self, markdown_content: str, newsletter) -> str:
-        """
-        Generate HTML from markdown content for newsletters stored as plain text.
-
-        Args:
-            markdown_content: Raw markdown content
-            newsletter: Newsletter database object
-
-        Returns:
-            HTML formatted newsletter content
-        """
-        import markdown
+        try:
+            renditions = await asyncio.to_thread(render_newsletter, source)
+        except Exception as e:
+            logger.error(f"Failed to render newsletter {source.id}: {e}")
+            return None
 
-        # Convert markdown to HTML
-        html_content = markdown.markdown(
-            markdown_content,
-            extensions=['markdown.extensions.extra', 'markdown.extensions.codehilite']
-        )
+        # This session may be a read-only replica session; save on the primary
+        try:
+            async with get_db_session() as session:
+                await store_renditions(session, source, renditions)
+        except Exception as e:
+            logger.warning(f"Failed to save renditions of newsletter {source.id}: {e}")
+        return renditions.get(variant)
 
-        # Create HTML template
-        template_str = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{{ title }}</title>
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f9f9f9;
-        }
-        .newsletter-container {
-            background: white;
-            padding: 40px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 { color: #f7931a; border-bottom: 3px solid #f7931a; padding-bottom: 10px; }
-        h2 { color: #333; margin-top: 30px; border-bottom: 1px solid #eee; padding-bottom: 5px; }
-        h3 { color: #555; margin-top: 25px; }
-        a { color: #f7931a; text-decoration: none; }
-        a:hover { text-decoration: underline; }
-        ul { padding-left: 20px; }
-        li { margin-bottom: 8px; }
-        .footer {
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #eee;
-            font-size: 14px;
-            color: #666;
-        }
-    </style>
-</head>
-<body>
-    <div class="newsletter-container">
-        {{ content }}
-        <div class="footer">
-            <p><strong>Quality Score:</strong> {{ quality_score }}/1.0</p>
-            <p><strong>Generated:</strong> {{ generation_date }}</p>
-        </div>
-    </div>
-</body>
-</html>
+    async def refresh_renditions(self, force: bool = False) -> dict[str, int]:
         """
+        Render every newsletter whose renditions are missing or stale.
 
-        template = Template(template_str)
-
-        return template.render(
-            title=newsletter.title,
-            content=html_content,
-            quality_score=f"{newsletter.quality_score:.2f}" if newsletter.quality_score else "N/A",
-            generation_date=newsletter.generation_date.strftime("%Y-%m-%d %H:%M UTC") if newsletter.generation_date else "Unknown",
-        )
-
-    async def get_newsletter_html(self, newsletter_id: int) -> Optional[str]:
-        """
-        Get newsletter content as HTML.
+        Run after deploying template changes (RENDER_VERSION) or to backfill
+        newsletters created before renditions existed.
 
         Args:
-            newsletter_id: ID of the newsletter
+            force: Re-render all newsletters
 
         Returns:
-            HTML formatted newsletter content or None if not found
+            Counts of newsletters checked and rendered
         """
-        newsletter = await self.get_newsletter_by_id(newsletter_id)
-        if not newsletter:
-            return None
-
-        # Parse the stored content back to NewsletterContent
-        try:
-            import json
-
-            # Try to parse as JSON first (structured content)
-            try:
-                content_dict = json.loads(newsletter.content)
-                content = NewsletterContent(**content_dict)
-                return self._generate_html_content(content)
-            except (json.JSONDecodeError, TypeError):
-                # Content is stored as markdown text, convert it to HTML directly
-                return self._generate_html_from_markdown(newsletter.content, newsletter)
-        except Exception as e:
-            logger.error(f"Failed to generate HTML for newsletter {newsletter_id}: {e}")
-            return None
+        stored = {
+            (row.newsletter_id, row.variant): row.source_hash
+            for row in await self.db.execute(
+                select(
+                    NewsletterRendition.newsletter_id,
+                    NewsletterRendition.variant,
+                    NewsletterRendition.source_hash,
+                )
+            )
+        }
+        result = await self.db.execute(select(Newsletter).order_by(Newsletter.id))
+        newsletters = result.scalars().all()
+
+        rendered = 0
+        for newsletter in newsletters:
+            source_hash = RenditionSource.of(newsletter).hash
+            if not force and all(
+                stored.get((newsletter.id, variant)) == source_hash
+                for variant in VARIANTS
+            ):
+                continue
+            await save_renditions(self.db, newsletter)
+            rendered += 1
+
+        await self.db.commit()
+        if rendered:
+            await invalidate_cache_tags(NEWSLETTERS)
+        logger.info(f"Rendered {rendered} of {len(newsletters)} newsletters")
+        return {"newsletters": len(newsletters), "rendered": rendered}
 
     def validate_citations(self, content: str) -> dict[str, int]:
         """
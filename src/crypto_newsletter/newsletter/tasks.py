@@ -17,60 +17,15 @@ from crypto_newsletter.shared.models import Newsletter
 logger = logging.getLogger(__name__)
 
 
-async def _convert_articles_for_agents(articles, db_session):
-    """Convert Article model instances to dictionary format for agent system."""
-    from crypto_newsletter.shared.models import ArticleAnalysis, Publisher
-    from sqlalchemy import select
-
-    articles_for_agents = []
-
-    for article in articles:
-        # Get analysis data for this article
-        analysis_query = (
-            select(ArticleAnalysis)
-            .where(ArticleAnalysis.article_id == article.id)
-            .order_by(ArticleAnalysis.created_at.desc())
-            .limit(1)
-        )
-
-        analysis_result = await db_session.execute(analysis_query)
-        analysis = analysis_result.scalar_one_or_none()
-
-        # Get publisher name
-        publisher_query = select(Publisher).where(Publisher.id == article.publisher_id)
-        publisher_result = await db_session.execute(publisher_query)
-        publisher = publisher_result.scalar_one_or_none()
-
-        # Convert to dictionary format expected by agents
-        article_dict = {
-            "id": article.id,
-            "title": article.title,
-            "body": article.body,
-            "published_on": article.published_on.isoformat()
-            if article.published_on
-            else None,
-            "publisher": publisher.name if publisher else "Unknown",
-            "url": article.url,
-            # Analysis fields with defaults
-            "weak_signals": analysis.weak_signals if analysis else [],
-            "pattern_anomalies": analysis.pattern_anomalies if analysis else [],
-            "adjacent_connections": analysis.adjacent_connections if analysis else [],
-            "signal_strength": float(analysis.signal_strength)
-            if analysis and analysis.signal_strength
-            else 0.0,
-            "uniqueness_score": float(analysis.uniqueness_score)
-            if analysis and analysis.uniqueness_score
-            else 0.0,
-            "analysis_confidence": float(analysis.analysis_confidence)
-            if analysis and analysis.analysis_confidence
-            else 0.0,
-            "narrative_gaps": analysis.narrative_gaps if analysis else [],
-            "edge_indicators": analysis.edge_indicators if analysis else [],
-        }
-
-        articles_for_agents.append(article_dict)
-
-    return articles_for_agents
+async def _get_articles_for_agents(
+    db_session, since_date: datetime, min_signal_strength: float = 0.0, limit: int = 100
+) -> list[dict[str, Any]]:
+    """Load analyzed articles in the dictionary format expected by the agent system."""
+    article_repo = ArticleRepository(db_session)
+    articles = await article_repo.get_agent_articles_since(
+        since_date, min_signal_strength=min_signal_strength, limit=limit
+    )
+    return [article.to_agent_dict() for article in articles]
 
 
 class NewsletterGenerationException(Exception):
@@ -111,7 +66,6 @@ async def generate_newsletter_manual_task_enhanced(
         orchestrator.set_task_id(task_id)
 
         async with get_db_session() as db:
-            article_repo = ArticleRepository(db)
             newsletter_repo = NewsletterRepository(db)
 
             if newsletter_type.upper() == "DAILY":
@@ -138,23 +92,24 @@ async def generate_newsletter_manual_task_enhanced(
 
                 # Get articles from last 7 days with analysis (temporary fix for testing)
                 cutoff_time = datetime.now() - timedelta(days=7)
-                articles = await article_repo.get_articles_with_analysis_since(
-                    cutoff_time, min_signal_strength=0.0
+                articles_for_agents = await _get_articles_for_agents(
+                    db, cutoff_time, min_signal_strength=0.0
                 )
 
-                if len(articles) < 10:
+                if len(articles_for_agents) < 10:
                     logger.warning(
-                        f"Only {len(articles)} articles available for daily newsletter"
+                        f"Only {len(articles_for_agents)} articles available "
+                        "for daily newsletter"
                     )
                     return {
                         "success": False,
-                        "message": f"Insufficient articles ({len(articles)}) for newsletter generation",
-                        "articles_found": len(articles),
+                        "message": (
+                            f"Insufficient articles ({len(articles_for_agents)}) "
+                            "for newsletter generation"
+                        ),
+                        "articles_found": len(articles_for_agents),
                     }
 
-                # Convert articles for agent processing
-                articles_for_agents = await _convert_articles_for_agents(articles, db)
-
                 # Generate newsletter with progress tracking
                 result = await orchestrator.generate_daily_newsletter_with_progress(
                     articles_for_agents, newsletter_type
@@ -277,12 +232,13 @@ async def generate_daily_newsletter_task(
         try:
             async with get_db_session() as db:
                 # Step 1: Get analyzed articles from past 24 hours
-                article_repo = ArticleRepository(db)
                 newsletter_repo = NewsletterRepository(db)
 
-                # Get articles with completed analysis from last 24 hours
+                # Get articles with completed analysis from last 24 hours,
+                # already in the dictionary format expected by the agent system
                 cutoff_time = datetime.utcnow() - timedelta(hours=24)
-                daily_articles = await article_repo.get_articles_with_analysis_since(
+                daily_articles = await _get_articles_for_agents(
+                    db,
                     since_date=cutoff_time,
                     min_signal_strength=0.5,  # Filter for quality articles
                     limit=100,
@@ -331,17 +287,12 @@ async def generate_daily_newsletter_task(
                         "generation_metadata": generation_metadata,
                     }
 
-                # Step 4: Convert articles to dictionary format for agent system
-                articles_for_agents = await _convert_articles_for_agents(
-                    daily_articles, db
-                )
-
-                # Step 5: Generate newsletter using orchestrator
+                # Step 4: Generate newsletter using orchestrator
                 logger.info("Starting daily newsletter generation with agent system")
 
                 orchestrator = NewsletterOrchestrator()
                 generation_result = await orchestrator.generate_newsletter(
-                    articles=articles_for_agents, newsletter_type="DAILY"
+                    articles=daily_articles, newsletter_type="DAILY"
                 )
 
                 if not generation_result["success"]:
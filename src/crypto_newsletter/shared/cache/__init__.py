@@ -0,0 +1,21 @@
+"""Response caching shared by the web app and the write paths that invalidate it."""
+
+from .response_cache import (
+    ARTICLES,
+    NEWSLETTERS,
+    PUBLISHERS,
+    ResponseCache,
+    cache_key,
+    get_response_cache,
+    invalidate_cache_tags,
+)
+
+__all__ = [
+    "ARTICLES",
+    "NEWSLETTERS",
+    "PUBLISHERS",
+    "ResponseCache",
+    "cache_key",
+    "get_response_cache",
+    "invalidate_cache_tags",
+]
@@ -0,0 +1,331 @@
+"""Two-level response cache: a per-process LRU (L1) in front of Redis (L2)."""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Optional
+
+from loguru import logger
+
+from crypto_newsletter.shared.config.settings import get_settings
+from crypto_newsletter.shared.monitoring.metrics import get_metrics_collector
+
+# Invalidation tags; cached entries name the data they were computed from
+ARTICLES = "articles"
+PUBLISHERS = "publishers"
+NEWSLETTERS = "newsletters"
+
+KEY_PREFIX = "response-cache"
+# Seconds to stop talking to Redis after an error
+REDIS_RETRY_SECONDS = 30.0
+# How long a process waits for another process computing the same entry
+LOCK_WAIT_SECONDS = 5.0
+LOCK_POLL_SECONDS = 0.05
+
+
+def cache_key(namespace: str, params: dict[str, Any]) -> str:
+    """
+    Build the key for a namespace (route) and its parameters.
+
+    None values are dropped and the rest sorted, so parameter order and
+    explicit defaults of None do not create separate entries.
+    """
+    normalized = json.dumps(
+        {name: value for name, value in params.items() if value is not None},
+        sort_keys=True,
+        default=str,
+        separators=(",", ":"),
+    )
+    digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=12).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+class ResponseCache:
+    """
+    Cache of JSON-serializable values with TTLs, tags and stampede protection.
+
+    Invalidation is by tag version: every entry's full key embeds the current
+    version counter of each of its tags, kept in Redis. ``invalidate`` bumps
+    the counters, so every process computes new keys on its next request and
+    old entries are never read again (they age out by TTL and LRU). Without
+    Redis the cache degrades to the per-process LRU with local tag versions.
+
+    Concurrent misses for one key are coalesced: within a process they await
+    a single computation, and across processes a short Redis lock lets one
+    process compute while the others poll L2 for its result.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        l1_size: int = 256,
+        default_ttl: int = 60,
+        redis_client: Any = None,
+    ) -> None:
+        self.redis_url = redis_url
+        self.l1_size = l1_size
+        self.default_ttl = default_ttl
+        self._l1: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._local_versions: dict[str, int] = {}
+        self._redis = redis_client
+        self._redis_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis_down_until = 0.0
+        self.stats = {"l1_hits": 0, "l2_hits": 0, "misses": 0, "coalesced": 0}
+
+    def _client(self) -> Any:
+        """Async Redis client for the running loop, or None while unavailable."""
+        if time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is not None and self._redis_loop is None:
+            return self._redis  # injected client
+        if self.redis_url is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(
+                self.redis_url, socket_timeout=0.5, socket_connect_timeout=0.5
+            )
+            self._redis_loop = loop
+        return self._redis
+
+    def _redis_failed(self, operation: str, error: Exception) -> None:
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(
+            f"Response cache {operation} failed, using local cache only for "
+            f"{REDIS_RETRY_SECONDS:.0f}s: {error}"
+        )
+
+    async def _tag_versions(self, tags: tuple[str, ...]) -> str:
+        if not tags:
+            return "0"
+        client = self._client()
+        if client is not None:
+            try:
+                versions = await client.mget(
+                    [f"{KEY_PREFIX}:tag:{tag}" for tag in tags]
+                )
+                return ".".join(
+                    (v.decode() if isinstance(v, bytes) else v) if v else "0"
+                    for v in versions
+                )
+            except Exception as e:
+                self._redis_failed("tag lookup", e)
+        return "l" + ".".join(str(self._local_versions.get(tag, 0)) for tag in tags)
+
+    def _l1_get(self, key: str) -> tuple[bool, Any]:
+        entry = self._l1.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._l1[key]
+            return False, None
+        self._l1.move_to_end(key)
+        return True, value
+
+    def _l1_set(self, key: str, value: Any, ttl: int) -> None:
+        self._l1[key] = (time.monotonic() + ttl, value)
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.l1_size:
+            self._l1.popitem(last=False)
+
+    async def _l2_get(self, key: str) -> tuple[bool, Any]:
+        client = self._client()
+        if client is None:
+            return False, None
+        try:
+            payload = await client.get(f"{KEY_PREFIX}:{key}")
+        except Exception as e:
+            self._redis_failed("read", e)
+            return False, None
+        if payload is None:
+            return False, None
+        return True, json.loads(payload)
+
+    async def _l2_set(self, key: str, value: Any, ttl: int) -> None:
+        client = self._client()
+        if client is None:
+            return
+        try:
+            await client.set(
+                f"{KEY_PREFIX}:{key}", json.dumps(value, default=str), ex=ttl
+            )
+        except Exception as e:
+            self._redis_failed("write", e)
+
+    async def get_or_set(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """
+        Get a cached value, computing and storing it on a miss.
+
+        Args:
+            key: Cache key (see ``cache_key``)
+            compute: Coroutine function producing a JSON-serializable value
+            ttl: Seconds to keep the value (default: ``default_ttl``)
+            tags: Tags whose invalidation should drop this value
+        """
+        ttl = ttl or self.default_ttl
+        full_key = await self.versioned_key(key, tags)
+        metrics = get_metrics_collector()
+
+        found, value = self._l1_get(full_key)
+        if found:
+            self.stats["l1_hits"] += 1
+            metrics.record_cache_hit()
+            return value
+
+        # Singleflight: concurrent misses share one computation, which runs as
+        # its own task so a disconnecting client does not cancel it for others
+        task = self._inflight.get(full_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fill(full_key, compute, ttl))
+            self._inflight[full_key] = task
+            task.add_done_callback(lambda done: self._finish(full_key, done))
+        else:
+            self.stats["coalesced"] += 1
+            metrics.record_cache_hit()
+            _, value = await asyncio.shield(task)
+            return value
+
+        hit, value = await asyncio.shield(task)
+        if hit:
+            metrics.record_cache_hit()
+        else:
+            metrics.record_cache_miss()
+        return value
+
+    def _finish(self, full_key: str, task: asyncio.Future) -> None:
+        self._inflight.pop(full_key, None)
+        if not task.cancelled():
+            # Retrieve the exception so one nobody awaited is not logged
+            task.exception()
+
+    async def _fill(
+        self,
+        full_key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int,
+    ) -> tuple[bool, Any]:
+        """Read L2, or compute under a cross-process lock; returns (hit, value)."""
+        found, value = await self._l2_get(full_key)
+        if found:
+            self.stats["l2_hits"] += 1
+            self._l1_set(full_key, value, ttl)
+            return True, value
+
+        lock_key = f"{KEY_PREFIX}:lock:{full_key}"
+        client = self._client()
+        locked = False
+        if client is not None:
+            try:
+                locked = bool(
+                    await client.set(
+                        lock_key, "1", nx=True, px=int(LOCK_WAIT_SECONDS * 1000)
+                    )
+                )
+                if not locked:
+                    deadline = time.monotonic() + LOCK_WAIT_SECONDS
+                    while time.monotonic() < deadline:
+                        await asyncio.sleep(LOCK_POLL_SECONDS)
+                        found, value = await self._l2_get(full_key)
+                        if found:
+                            self.stats["l2_hits"] += 1
+                            self._l1_set(full_key, value, ttl)
+                            return True, value
+            except Exception as e:
+                self._redis_failed("lock", e)
+
+        self.stats["misses"] += 1
+        try:
+            # Store the JSON form so L1 and L2 hits return identical values
+            value = json.loads(json.dumps(await compute(), default=str))
+            self._l1_set(full_key, value, ttl)
+            await self._l2_set(full_key, value, ttl)
+            return False, value
+        finally:
+            if locked and client is not None:
+                try:
+                    await client.delete(lock_key)
+                except Exception as e:
+                    self._redis_failed("unlock", e)
+
+    async def versioned_key(self, key: str, tags: Iterable[str] = ()) -> str:
+        """
+        Qualify a key with the current versions of its tags.
+
+        Take the key before reading the data it caches, so an invalidation
+        racing with the read leaves the value under the old, unreachable key.
+        """
+        return f"{key}:{await self._tag_versions(tuple(tags))}"
+
+    def get_local(self, full_key: str) -> Optional[Any]:
+        """Get a value from the per-process LRU only (no computation, no L2)."""
+        found, value = self._l1_get(full_key)
+        return value if found else None
+
+    def set_local(self, full_key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a small per-process value, such as an HTTP validator."""
+        self._l1_set(full_key, value, ttl or self.default_ttl)
+
+    async def invalidate(self, *tags: str) -> None:
+        """Drop every entry tagged with any of ``tags``, in all processes."""
+        for tag in tags:
+            self._local_versions[tag] = self._local_versions.get(tag, 0) + 1
+        # Entries keyed by local versions are unreachable now; clear L1 anyway
+        # so a process that just wrote data frees the memory immediately
+        self._l1.clear()
+
+        client = self._client()
+        if client is None:
+            return
+        try:
+            for tag in tags:
+                await client.incr(f"{KEY_PREFIX}:tag:{tag}")
+        except Exception as e:
+            self._redis_failed("invalidation", e)
+
+    def clear_local(self) -> None:
+        """Empty the per-process LRU (tests, memory pressure)."""
+        self._l1.clear()
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache."""
+    global _response_cache
+    if _response_cache is None:
+        settings = get_settings()
+        _response_cache = ResponseCache(
+            redis_url=settings.redis_url,
+            l1_size=settings.response_cache_l1_size,
+            default_ttl=settings.response_cache_ttl_seconds,
+        )
+    return _response_cache
+
+
+async def invalidate_cache_tags(*tags: str) -> None:
+    """
+    Invalidate cached responses built from the tagged data.
+
+    Call after the transaction that changed the data has committed; never
+    raises, so a cache problem cannot fail the write path.
+    """
+    try:
+        await get_response_cache().invalidate(*tags)
+        logger.debug(f"Invalidated response cache tags: {', '.join(tags)}")
+    except Exception as e:
+        logger.warning(f"Response cache invalidation failed for {tags}: {e}")
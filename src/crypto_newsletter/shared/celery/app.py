@@ -47,6 +47,12 @@ def create_celery_app() -> Celery:
             "crypto_newsletter.core.scheduling.tasks.cleanup_old_articles": {
                 "queue": "maintenance"
             },
+            "crypto_newsletter.core.scheduling.tasks.maintain_partitions": {
+                "queue": "maintenance"
+            },
+            "crypto_newsletter.core.scheduling.tasks.backfill_analysis_signals": {
+                "queue": "maintenance"
+            },
             "crypto_newsletter.analysis.tasks.*": {"queue": "analysis"},
             "crypto_newsletter.newsletter.tasks.check_newsletter_alerts_task": {
                 "queue": "monitoring"
@@ -128,6 +134,11 @@ def create_celery_app() -> Celery:
                 "schedule": crontab(minute=0, hour=2),  # Daily at 2 AM UTC
                 "options": {"priority": 5},
             },
+            "maintain-partitions-daily": {
+                "task": "crypto_newsletter.core.scheduling.tasks.maintain_partitions",
+                "schedule": crontab(minute=30, hour=1),  # Daily at 1:30 AM UTC
+                "options": {"priority": 5},
+            },
             # Newsletter generation tasks
             "generate-daily-newsletter": {
                 "task": "crypto_newsletter.newsletter.tasks.generate_daily_newsletter",
@@ -177,6 +188,14 @@ def create_celery_app() -> Celery:
                 "schedule": crontab(minute=0, hour=3),  # Daily at 3 AM UTC
                 "options": {"priority": 3},
             },
+            # Backlog analysis through provider batch jobs (BACKLOG_BATCH_JOBS)
+            "submit-backlog-analysis-batch-daily": {
+                "task": (
+                    "crypto_newsletter.analysis.tasks.submit_backlog_analysis_batch"
+                ),
+                "schedule": crontab(minute=0, hour=4),  # Daily at 4 AM UTC
+                "options": {"priority": 3},
+            },
             # Note: analyze-recent-articles task removed - batch processing is now handled
             # by the dedicated batch processing system via manual/API triggers
         },
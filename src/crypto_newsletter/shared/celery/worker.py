@@ -2,6 +2,7 @@
 
 import signal
 import sys
+import threading
 from typing import Any
 
 from celery.signals import (
@@ -10,6 +11,8 @@ from celery.signals import (
     task_prerun,
     task_retry,
     task_success,
+    worker_process_init,
+    worker_process_shutdown,
     worker_ready,
     worker_shutdown,
 )
@@ -76,6 +79,42 @@ def worker_ready_handler(sender=None, **kwds):
 def worker_shutdown_handler(sender=None, **kwds):
     """Handle worker shutdown events."""
     logger.info(f"Celery worker shutting down: {sender.hostname}")
+    _drain_analysis_runtime()
+
+
+@worker_process_init.connect
+def worker_process_init_handler(**kwds):
+    """Warm the analysis event loop of a new pool process."""
+    # In the background: process init must finish within a few seconds
+    threading.Thread(
+        target=_warm_analysis_runtime, name="analysis-warm-up", daemon=True
+    ).start()
+
+
+def _warm_analysis_runtime() -> None:
+    """Open the analysis loop's DB pool and model clients before the first task."""
+    try:
+        from crypto_newsletter.analysis.runtime import get_analysis_runtime
+
+        get_analysis_runtime().warm_up()
+    except Exception as e:
+        logger.warning(f"Analysis runtime warm-up failed: {e}")
+
+
+@worker_process_shutdown.connect
+def worker_process_shutdown_handler(pid=None, exitcode=None, **kwds):
+    """Drain analyses running in a pool process before it exits."""
+    _drain_analysis_runtime()
+
+
+def _drain_analysis_runtime() -> None:
+    """Let in-flight analyses finish, then close the analysis event loop."""
+    from crypto_newsletter.analysis.runtime import shutdown_analysis_runtime
+
+    try:
+        shutdown_analysis_runtime()
+    except Exception as e:
+        logger.warning(f"Analysis runtime shutdown failed: {e}")
 
 
 def setup_signal_handlers():
@@ -27,10 +27,88 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = Field(..., alias="DATABASE_URL")
+    # Per-event-loop async pool sizing (DB_POOL_SIZE=0 falls back to NullPool)
+    db_pool_size: int = Field(default=5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=5, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: int = Field(default=30, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    # Prepared statements kept per pooled asyncpg connection (0 behind pgbouncer
+    # in transaction mode, where server-side statements do not survive)
+    db_prepared_statement_cache_size: int = Field(
+        default=256, alias="DB_PREPARED_STATEMENT_CACHE_SIZE"
+    )
+    # Comma-separated read replica URLs used by get_read_session()
+    database_replica_urls: str = Field(default="", alias="DATABASE_REPLICA_URLS")
+    # Skip replicas lagging further behind the primary (unset = no bound)
+    db_replica_max_lag_seconds: Optional[float] = Field(
+        default=None, alias="DB_REPLICA_MAX_LAG_SECONDS"
+    )
+    db_replica_retry_seconds: int = Field(default=30, alias="DB_REPLICA_RETRY_SECONDS")
+    # Per-statement latency tracking (see shared/database/instrumentation.py)
+    db_query_instrumentation: bool = Field(
+        default=True, alias="DB_QUERY_INSTRUMENTATION"
+    )
+    db_slow_query_threshold_ms: float = Field(
+        default=500.0, alias="DB_SLOW_QUERY_THRESHOLD_MS"
+    )
+    db_slow_query_top_n: int = Field(default=20, alias="DB_SLOW_QUERY_TOP_N")
+
+    # Monthly partition maintenance and retention for articles/article_analyses
+    partition_months_ahead: int = Field(default=3, alias="PARTITION_MONTHS_AHEAD")
+    partition_retention_mode: str = Field(
+        default="archive", alias="PARTITION_RETENTION_MODE"
+    )  # archive, detach or drop
+    partition_archive_schema: str = Field(
+        default="archive", alias="PARTITION_ARCHIVE_SCHEMA"
+    )
+
+    # Chunked article archiving (cold export before soft-delete)
+    archive_dir: str = Field(default="archive", alias="ARCHIVE_DIR")
+    archive_format: str = Field(
+        default="auto", alias="ARCHIVE_FORMAT"
+    )  # auto, parquet, ndjson-zstd or ndjson-gzip
+    archive_chunk_size: int = Field(default=1000, alias="ARCHIVE_CHUNK_SIZE")
+    archive_chunk_sleep_seconds: float = Field(
+        default=0.5, alias="ARCHIVE_CHUNK_SLEEP_SECONDS"
+    )
+
+    # Article embeddings and the local similarity index
+    embeddings_enabled: bool = Field(default=True, alias="EMBEDDINGS_ENABLED")
+    embedding_backend: str = Field(
+        default="hashing", alias="EMBEDDING_BACKEND"
+    )  # hashing or "package.module:EmbedderClass"
+    embedding_dimension: int = Field(default=256, alias="EMBEDDING_DIMENSION")
+    embedding_batch_size: int = Field(default=256, alias="EMBEDDING_BATCH_SIZE")
+    embedding_index_path: str = Field(
+        default="data/embeddings/articles", alias="EMBEDDING_INDEX_PATH"
+    )
+    # How often a serving process pulls embeddings written by other processes
+    embedding_sync_seconds: int = Field(default=60, alias="EMBEDDING_SYNC_SECONDS")
+    # Window re-read before the index watermark, for rows that committed late
+    embedding_sync_overlap_seconds: int = Field(
+        default=600, alias="EMBEDDING_SYNC_OVERLAP_SECONDS"
+    )
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
 
+    # Response cache for read-heavy endpoints (per-process LRU in front of Redis)
+    response_cache_enabled: bool = Field(default=True, alias="RESPONSE_CACHE_ENABLED")
+    response_cache_ttl_seconds: int = Field(
+        default=60, alias="RESPONSE_CACHE_TTL_SECONDS"
+    )
+    response_cache_l1_size: int = Field(default=256, alias="RESPONSE_CACHE_L1_SIZE")
+
+    # API response encoding: orjson rendering (opt-in) and gzip/brotli bodies
+    fast_json_responses: bool = Field(default=False, alias="FAST_JSON_RESPONSES")
+    response_compression_enabled: bool = Field(
+        default=True, alias="RESPONSE_COMPRESSION_ENABLED"
+    )
+    response_compression_min_size: int = Field(
+        default=1024, alias="RESPONSE_COMPRESSION_MIN_SIZE"
+    )
+
     # CoinDesk API
     coindesk_api_key: str = Field(..., alias="COINDESK_API_KEY")
     coindesk_base_url: str = Field(
@@ -124,6 +202,13 @@ class Settings(BaseSettings):
         """Check if running in development environment."""
         return self.effective_environment == "development"
 
+    @property
+    def replica_database_urls(self) -> list[str]:
+        """Get the configured read replica URLs."""
+        return [
+            url.strip() for url in self.database_replica_urls.split(",") if url.strip()
+        ]
+
     @property
     def effective_celery_broker_url(self) -> str:
         """Get effective Celery broker URL."""
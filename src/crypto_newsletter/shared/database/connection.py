@@ -1,11 +1,20 @@
 """Database connection and session management."""
 
+import asyncio
+import itertools
+import os
+import threading
+import time
+import weakref
 from collections.abc import AsyncGenerator, Generator
-from contextlib import asynccontextmanager, contextmanager
-from typing import Optional
+from contextlib import asynccontextmanager, contextmanager, suppress
+from typing import Any, Optional
 
 from crypto_newsletter.shared.config.settings import get_settings
-from sqlalchemy import create_engine, Engine
+from crypto_newsletter.shared.database.instrumentation import instrument_engine
+from loguru import logger
+from sqlalchemy import create_engine, Engine, make_url, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -13,62 +22,356 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+# Registry key: (process id, id of the running event loop or 0 outside a loop)
+EngineKey = tuple[int, int]
+
+
+class _LoopEngine:
+    """Async engine and session factory owned by a single event loop."""
+
+    def __init__(
+        self, engine: AsyncEngine, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        self.engine = engine
+        self.session_factory = async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        self.pid = os.getpid()
+        self._loop_ref = weakref.ref(loop) if loop is not None else None
+        self._shutdown_hook: Optional[AsyncGenerator[None, None]] = None
+
+    def owned_by(self, loop: Optional[asyncio.AbstractEventLoop]) -> bool:
+        """Check that this entry belongs to ``loop`` (guards against id() reuse)."""
+        if self._loop_ref is None:
+            return loop is None
+        return self._loop_ref() is loop
+
+    @property
+    def is_stale(self) -> bool:
+        """Entry was inherited across a fork or its event loop has gone away."""
+        if self.pid != os.getpid():
+            return True
+        if self._loop_ref is None:
+            return False
+        loop = self._loop_ref()
+        return loop is None or loop.is_closed()
+
+    async def install_shutdown_hook(self, on_shutdown) -> None:
+        """
+        Dispose the engine gracefully when its event loop shuts down.
+
+        An async generator that has been advanced once is tracked by the loop, and
+        asyncio.run() / loop.shutdown_asyncgens() close it before the loop itself
+        is closed. Its finally block runs inside the still-open loop, so pooled
+        connections are closed cleanly instead of being dropped on the floor.
+        """
+        if self._shutdown_hook is not None or self._loop_ref is None:
+            return
+
+        async def _lifetime() -> AsyncGenerator[None, None]:
+            try:
+                yield
+            finally:
+                on_shutdown(self)
+                await self.engine.dispose()
+
+        self._shutdown_hook = _lifetime()
+        await self._shutdown_hook.__anext__()
+
+    def abandon(self) -> None:
+        """Drop the pool without I/O (its loop is closed, or in a forked child)."""
+        self.engine.sync_engine.dispose(close=False)
+
+
+class _EngineRegistry:
+    """
+    Async engines for one database URL, one engine per (pid, event loop).
+
+    asyncpg connections belong to the event loop that opened them, so a single
+    pooled engine cannot be shared by the FastAPI loop, Celery's asyncio pool and
+    the short-lived loops used by analysis threads. Each loop gets its own
+    bounded pool; an entry is disposed when its loop shuts down, and entries for
+    closed loops or inherited across a fork are discarded.
+    """
+
+    def __init__(
+        self, url: str, engine_kwargs: dict[str, Any], instrument: bool = False
+    ) -> None:
+        self.url = url
+        self._engine_kwargs = engine_kwargs
+        self._instrument = instrument
+        self._engines: dict[EngineKey, _LoopEngine] = {}
+        self._lock = threading.Lock()
+
+    def get(self) -> _LoopEngine:
+        """Get (or create) the engine owned by the current process and loop."""
+        loop = _running_loop()
+        key = (os.getpid(), id(loop) if loop is not None else 0)
+
+        entry = self._engines.get(key)
+        if entry is not None and not entry.is_stale and entry.owned_by(loop):
+            return entry
+
+        with self._lock:
+            self._prune()
+            entry = self._engines.get(key)
+            if entry is None or not entry.owned_by(loop):
+                if entry is not None:
+                    entry.abandon()
+                engine = create_async_engine(self.url, **self._engine_kwargs)
+                if self._instrument:
+                    instrument_engine(engine.sync_engine)
+                entry = _LoopEngine(engine, loop)
+                self._engines[key] = entry
+                if loop is not None:
+                    weakref.finalize(loop, self._forget, key, entry)
+            return entry
+
+    async def get_ready(self) -> _LoopEngine:
+        """Get the current loop's engine with its shutdown hook installed."""
+        entry = self.get()
+        await entry.install_shutdown_hook(self.forget_entry)
+        return entry
+
+    def _prune(self) -> None:
+        """Discard entries for closed/collected loops and other processes."""
+        for key, entry in list(self._engines.items()):
+            if entry.is_stale:
+                del self._engines[key]
+                entry.abandon()
+
+    def _forget(self, key: EngineKey, entry: _LoopEngine) -> None:
+        """Remove ``entry`` from the registry if still registered under ``key``."""
+        if self._engines.get(key) is entry:
+            del self._engines[key]
+
+    def forget_entry(self, entry: _LoopEngine) -> None:
+        for key, registered in list(self._engines.items()):
+            if registered is entry:
+                del self._engines[key]
+
+    def discard_all(self) -> None:
+        """Drop every engine without I/O."""
+        engines, self._engines = self._engines, {}
+        for entry in engines.values():
+            entry.abandon()
+
+    def after_fork_in_child(self) -> None:
+        """Reset state inherited from the parent process."""
+        self._lock = threading.Lock()
+        self.discard_all()
+
+    @property
+    def count(self) -> int:
+        return len(self._engines)
+
+    async def close(self) -> None:
+        """Dispose the current loop's engine; drop the rest without I/O."""
+        loop = _running_loop()
+        engines, self._engines = self._engines, {}
+        for entry in engines.values():
+            if not entry.is_stale and entry.owned_by(loop):
+                await entry.engine.dispose()
+            else:
+                entry.abandon()
+
+
+class _ReplicaTarget:
+    """A read replica with its engines and health state."""
+
+    def __init__(self, registry: _EngineRegistry) -> None:
+        self.registry = registry
+        self.name = make_url(registry.url).render_as_string(hide_password=True)
+        self.unavailable_until = 0.0
+        self.lag_checked_at = 0.0
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self.unavailable_until
+
+    def mark_unavailable(self, seconds: float) -> None:
+        self.unavailable_until = time.monotonic() + seconds
+
+
+# Replication lag in seconds; 0 when the replica has replayed everything it received
+REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+REPLICA_LAG_CHECK_INTERVAL = 5.0
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _async_url(url: str) -> str:
+    """Convert postgresql:// to postgresql+asyncpg://."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql+asyncpg://", 1)
+    return url
+
+
+def _engine_kwargs_for(
+    url: str, engine_kwargs: dict[str, Any], statement_cache_size: int
+) -> dict[str, Any]:
+    """
+    Add asyncpg's prepared statement cache size for asyncpg URLs.
+
+    The cache lives on each pooled connection, so it only pays off with a
+    persistent pool; a ``prepared_statement_cache_size`` in the URL wins.
+    """
+    parsed = make_url(url)
+    if (
+        parsed.get_driver_name() != "asyncpg"
+        or "prepared_statement_cache_size" in parsed.query
+    ):
+        return engine_kwargs
+    return {
+        **engine_kwargs,
+        "connect_args": {"prepared_statement_cache_size": statement_cache_size},
+    }
 
 
 class DatabaseManager:
-    """Database connection manager."""
+    """
+    Database connection manager with pooled async engines per event loop.
 
-    def __init__(self) -> None:
-        self._engine: Optional[AsyncEngine] = None
-        self._session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+    Writes and read-your-writes paths use ``get_session()`` on the primary.
+    Read-only callers (dashboards, stats, listings) can use
+    ``get_read_session()``, which picks a configured read replica round-robin,
+    skips replicas that failed recently or exceed the staleness bound, and falls
+    back to the primary when none is usable.
+    """
 
-    def initialize(self, database_url: Optional[str] = None) -> None:
-        """Initialize database engine and session factory."""
+    def __init__(self) -> None:
+        self._primary: Optional[_EngineRegistry] = None
+        self._replicas: list[_ReplicaTarget] = []
+        self._replica_cursor = itertools.count()
+        self._replica_max_lag: Optional[float] = None
+        self._replica_retry_seconds: float = 30
+        _live_managers.add(self)
+
+    def initialize(
+        self,
+        database_url: Optional[str] = None,
+        replica_urls: Optional[list[str]] = None,
+    ) -> None:
+        """Initialize engine settings; engines are created lazily per event loop."""
         settings = get_settings()
-        url = database_url or settings.database_url
+        url = _async_url(database_url or settings.database_url)
+        if replica_urls is None:
+            replica_urls = [] if database_url else settings.replica_database_urls
+
+        engine_kwargs: dict[str, Any] = {
+            "echo": settings.debug and not settings.testing,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+        }
+        if settings.db_pool_size > 0:
+            engine_kwargs.update(
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                pool_timeout=settings.db_pool_timeout,
+                pool_recycle=settings.db_pool_recycle,
+            )
+        else:
+            engine_kwargs["poolclass"] = NullPool
+
+        self._discard_all()
+        instrument = settings.db_query_instrumentation
+        cache_size = settings.db_prepared_statement_cache_size
+
+        def registry(registry_url: str) -> _EngineRegistry:
+            return _EngineRegistry(
+                registry_url,
+                _engine_kwargs_for(registry_url, engine_kwargs, cache_size),
+                instrument,
+            )
+
+        self._primary = registry(url)
+        self._replicas = [
+            _ReplicaTarget(registry(_async_url(replica_url)))
+            for replica_url in replica_urls
+        ]
+        self._replica_max_lag = settings.db_replica_max_lag_seconds
+        self._replica_retry_seconds = settings.db_replica_retry_seconds
 
-        # Convert postgresql:// to postgresql+asyncpg://
-        if url.startswith("postgresql://"):
-            url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
-        elif url.startswith("postgres://"):
-            url = url.replace("postgres://", "postgresql+asyncpg://", 1)
+    @property
+    def _primary_registry(self) -> _EngineRegistry:
+        if self._primary is None:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        return self._primary
 
-        # Create async engine with NullPool for worker processes
-        # This prevents connection sharing across different event loops
-        self._engine = create_async_engine(
-            url,
-            echo=settings.debug and not settings.testing,
-            poolclass=NullPool,  # Always use NullPool for async engines
-            pool_pre_ping=True,
-            pool_recycle=3600,  # 1 hour
-        )
+    def _registries(self) -> list[_EngineRegistry]:
+        registries = [replica.registry for replica in self._replicas]
+        if self._primary is not None:
+            registries.append(self._primary)
+        return registries
 
-        # Create session factory
-        self._session_factory = async_sessionmaker(
-            bind=self._engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
+    def _discard_all(self) -> None:
+        """Drop every engine without I/O."""
+        for registry in self._registries():
+            registry.discard_all()
+
+    def _after_fork_in_child(self) -> None:
+        """Reset state inherited from the parent process."""
+        for registry in self._registries():
+            registry.after_fork_in_child()
 
     @property
     def engine(self) -> AsyncEngine:
-        """Get database engine."""
-        if self._engine is None:
-            raise RuntimeError("Database not initialized. Call initialize() first.")
-        return self._engine
+        """Get primary database engine for the current event loop."""
+        return self._primary_registry.get().engine
 
     @property
     def session_factory(self) -> async_sessionmaker[AsyncSession]:
-        """Get session factory."""
-        if self._session_factory is None:
-            raise RuntimeError("Database not initialized. Call initialize() first.")
-        return self._session_factory
+        """Get primary session factory for the current event loop."""
+        return self._primary_registry.get().session_factory
+
+    @property
+    def engine_count(self) -> int:
+        """Number of live primary engines in the registry."""
+        return self._primary.count if self._primary is not None else 0
+
+    @property
+    def replica_count(self) -> int:
+        """Number of configured read replicas."""
+        return len(self._replicas)
+
+    def replica_status(self) -> list[dict[str, Any]]:
+        """Get health state of configured read replicas."""
+        now = time.monotonic()
+        return [
+            {
+                "replica": replica.name,
+                "available": replica.available,
+                "retry_in_seconds": max(0.0, round(replica.unavailable_until - now, 1)),
+            }
+            for replica in self._replicas
+        ]
 
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get database session context manager."""
-        async with self.session_factory() as session:
+        entry = await self._primary_registry.get_ready()
+        async with entry.session_factory() as session:
             try:
                 yield session
                 await session.commit()
@@ -78,12 +381,80 @@ class DatabaseManager:
             finally:
                 await session.close()
 
+    @asynccontextmanager
+    async def get_read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Get a read-only session, served by a replica when one is usable.
+
+        The transaction is always rolled back, so anything written through a
+        read session is discarded even when it falls back to the primary.
+        """
+        session = await self._open_replica_session()
+        if session is None:
+            entry = await self._primary_registry.get_ready()
+            session = entry.session_factory()
+
+        async with session:
+            try:
+                yield session
+            finally:
+                await session.rollback()
+
+    def _replica_candidates(self) -> list[_ReplicaTarget]:
+        """Available replicas in round-robin order."""
+        if not self._replicas:
+            return []
+        start = next(self._replica_cursor) % len(self._replicas)
+        ordered = self._replicas[start:] + self._replicas[:start]
+        return [replica for replica in ordered if replica.available]
+
+    async def _open_replica_session(self) -> Optional[AsyncSession]:
+        """Open a session on the first healthy, fresh-enough replica."""
+        for replica in self._replica_candidates():
+            entry = await replica.registry.get_ready()
+            session = entry.session_factory()
+            try:
+                # Check out a connection now so dead replicas are skipped here
+                await session.connection()
+                if await self._replica_too_stale(replica, session):
+                    await session.close()
+                    continue
+                return session
+            except (SQLAlchemyError, OSError, asyncio.TimeoutError) as e:
+                logger.warning(
+                    f"Read replica {replica.name} unavailable, "
+                    f"retrying in {self._replica_retry_seconds}s: {e}"
+                )
+                replica.mark_unavailable(self._replica_retry_seconds)
+                with suppress(Exception):
+                    await session.close()
+        return None
+
+    async def _replica_too_stale(
+        self, replica: _ReplicaTarget, session: AsyncSession
+    ) -> bool:
+        """Check replication lag against the staleness bound (rate limited)."""
+        if self._replica_max_lag is None:
+            return False
+        now = time.monotonic()
+        if now - replica.lag_checked_at < REPLICA_LAG_CHECK_INTERVAL:
+            return False
+        replica.lag_checked_at = now
+
+        lag = float((await session.execute(REPLICA_LAG_SQL)).scalar() or 0)
+        if lag <= self._replica_max_lag:
+            return False
+        logger.warning(
+            f"Read replica {replica.name} is {lag:.1f}s behind "
+            f"(bound {self._replica_max_lag}s), routing reads elsewhere"
+        )
+        replica.mark_unavailable(self._replica_retry_seconds)
+        return True
+
     async def close(self) -> None:
-        """Close database connections."""
-        if self._engine:
-            await self._engine.dispose()
-            self._engine = None
-            self._session_factory = None
+        """Close database connections for every engine owned by this process."""
+        for registry in self._registries():
+            await registry.close()
 
 
 class SyncDatabaseManager:
@@ -112,6 +483,8 @@ class SyncDatabaseManager:
             pool_pre_ping=True,
             pool_recycle=3600,  # 1 hour
         )
+        if settings.db_query_instrumentation:
+            instrument_engine(self._engine)
 
         # Create session factory
         self._session_factory = sessionmaker(
@@ -124,14 +497,18 @@ class SyncDatabaseManager:
     def engine(self) -> Engine:
         """Get database engine."""
         if self._engine is None:
-            raise RuntimeError("Sync database not initialized. Call initialize() first.")
+            raise RuntimeError(
+                "Sync database not initialized. Call initialize() first."
+            )
         return self._engine
 
     @property
     def session_factory(self) -> sessionmaker[Session]:
         """Get session factory."""
         if self._session_factory is None:
-            raise RuntimeError("Sync database not initialized. Call initialize() first.")
+            raise RuntimeError(
+                "Sync database not initialized. Call initialize() first."
+            )
         return self._session_factory
 
     @contextmanager
@@ -154,44 +531,43 @@ class SyncDatabaseManager:
             self._engine = None
             self._session_factory = None
 
+    def _after_fork_in_child(self) -> None:
+        """Forget pooled connections inherited from the parent process."""
+        if self._engine:
+            self._engine.dispose(close=False)
+
+
+_live_managers: "weakref.WeakSet[DatabaseManager]" = weakref.WeakSet()
 
 # Global database manager instances
 _db_manager: Optional[DatabaseManager] = None
 _sync_db_manager: Optional[SyncDatabaseManager] = None
 
 
-def get_db_manager() -> DatabaseManager:
-    """
-    Get database manager singleton with per-process initialization.
+def _reset_pools_after_fork() -> None:
+    """Never reuse the parent's sockets in a forked child (Celery prefork, gunicorn)."""
+    for manager in list(_live_managers):
+        manager._after_fork_in_child()
+    if _sync_db_manager is not None:
+        _sync_db_manager._after_fork_in_child()
 
-    This ensures the async engine is initialized in the correct event loop
-    context for each worker process, preventing greenlet_spawn errors.
-    """
-    import os
-    global _db_manager
 
-    # Get current process ID to detect worker process changes
-    current_pid = os.getpid()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
 
-    # Check if we need to reinitialize for a new process
-    if (_db_manager is None or
-        not hasattr(_db_manager, '_process_id') or
-        _db_manager._process_id != current_pid):
 
-        # Close existing manager if it exists
-        if _db_manager is not None:
-            try:
-                # Use asyncio.run to properly close in sync context
-                import asyncio
-                asyncio.run(_db_manager.close())
-            except Exception:
-                pass  # Ignore errors during cleanup
+def get_db_manager() -> DatabaseManager:
+    """
+    Get database manager singleton.
 
-        # Create new manager for this process
+    The manager itself is process-wide; connection pools are created per
+    (process, event loop) on first use, so worker processes and threads with
+    their own loops never share asyncpg connections.
+    """
+    global _db_manager
+    if _db_manager is None:
         _db_manager = DatabaseManager()
-        _db_manager._process_id = current_pid
         _db_manager.initialize()
-
     return _db_manager
 
 
@@ -203,6 +579,14 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@asynccontextmanager
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get read-only session context manager (replica when available)."""
+    db_manager = get_db_manager()
+    async with db_manager.get_read_session() as session:
+        yield session
+
+
 async def close_db_connections() -> None:
     """Close all database connections."""
     global _db_manager
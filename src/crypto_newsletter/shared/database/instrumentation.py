@@ -0,0 +1,334 @@
+"""SQL statement instrumentation for async and sync engines.
+
+``instrument_engine`` attaches ``before_cursor_execute``/``after_cursor_execute``
+hooks that time every statement and record it in the process-wide
+``QueryStats`` registry under a normalized fingerprint (literals, bind
+parameters and IN lists collapsed), so ``WHERE id = 1`` and ``WHERE id = 2``
+share one entry. Each fingerprint keeps a fixed-bucket latency histogram; the
+number of fingerprints and of retained slow samples is bounded.
+
+Statements slower than ``DB_SLOW_QUERY_THRESHOLD_MS`` are logged and kept
+(top ``DB_SLOW_QUERY_TOP_N`` by duration) together with the application
+method that issued them, e.g.
+``crypto_newsletter.core.storage.repository.ArticleRepository.get_statistics``.
+Stats are per process; ``/health/metrics`` and ``crypto-newsletter db-profile``
+report the API process's view.
+"""
+
+import hashlib
+import heapq
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from types import FrameType
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy import Engine, event
+
+try:
+    import greenlet
+except ImportError:  # pragma: no cover - installed with SQLAlchemy[asyncio]
+    greenlet = None
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Fingerprints beyond this many are folded into a single overflow entry
+MAX_FINGERPRINTS = 500
+OVERFLOW_FINGERPRINT = "<other statements>"
+
+MAX_STATEMENT_LENGTH = 1000
+
+_APP_PACKAGE = "crypto_newsletter."
+# Frames from these modules never count as the "calling" method
+_IGNORED_MODULES = (
+    "crypto_newsletter.shared.database.",
+    "sqlalchemy.",
+    "asyncio.",
+    "contextlib",
+)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_ROWS = re.compile(r"\)(?:\s*,\s*\((?:\s*\?\s*,?)+\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint_statement(statement: str) -> str:
+    """Normalize a SQL statement so executions differing only in values match."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    normalized = _VALUES_ROWS.sub("), ...", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return normalized[:MAX_STATEMENT_LENGTH]
+
+
+def _fingerprint_id(fingerprint: str) -> str:
+    return hashlib.sha1(fingerprint.encode()).hexdigest()[:16]
+
+
+def _app_frame(frame: Optional[FrameType]) -> Optional[str]:
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(_APP_PACKAGE) and not module.startswith(_IGNORED_MODULES):
+            return f"{module}.{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return None
+
+
+def find_calling_method() -> Optional[str]:
+    """
+    Find the application method that issued the current statement.
+
+    Async sessions run the DBAPI call in a greenlet whose stack starts inside
+    SQLAlchemy; the awaiting coroutine (e.g. a repository method) is on the
+    parent greenlet's suspended stack, so that is searched next.
+    """
+    caller = _app_frame(sys._getframe(1))
+    if caller is None and greenlet is not None:
+        parent = greenlet.getcurrent().parent
+        if parent is not None:
+            caller = _app_frame(parent.gr_frame)
+    return caller
+
+
+@dataclass
+class StatementStats:
+    """Latency statistics for one statement fingerprint."""
+
+    fingerprint_id: str
+    statement: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    slow_calls: int = 0
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    last_caller: Optional[str] = None
+
+    def record(self, duration_ms: float) -> None:
+        self.calls += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the histogram bucket holding the given percentile."""
+        if not self.calls:
+            return 0.0
+        target = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target and count:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return float(LATENCY_BUCKETS_MS[index])
+                break
+        return round(self.max_ms, 2)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint_id,
+            "statement": self.statement,
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 2),
+            "mean_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 2),
+            "slow_calls": self.slow_calls,
+            "last_slow_caller": self.last_caller,
+            "histogram_ms": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)
+                },
+                "gt_max": self.buckets[-1],
+            },
+        }
+
+
+class QueryStats:
+    """Thread-safe, bounded registry of per-fingerprint statement latency."""
+
+    ORDERINGS = ("total", "mean", "max", "calls")
+
+    def __init__(
+        self,
+        slow_threshold_ms: float = 500.0,
+        top_n: int = 20,
+        max_fingerprints: int = MAX_FINGERPRINTS,
+    ) -> None:
+        self.slow_threshold_ms = slow_threshold_ms
+        self.top_n = top_n
+        self.max_fingerprints = max_fingerprints
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self) -> None:
+        self._statements: dict[str, StatementStats] = {}
+        self._slowest: list[tuple[float, int, dict[str, Any]]] = []
+        self._sequence = 0
+        self.total_queries = 0
+        self.total_ms = 0.0
+        self.slow_queries = 0
+        self.started_at = datetime.now(UTC)
+
+    def reset(self) -> None:
+        """Forget all recorded statements."""
+        with self._lock:
+            self._clear()
+
+    def after_fork_in_child(self) -> None:
+        """Start empty with a fresh lock (the parent's may have been held)."""
+        self._lock = threading.Lock()
+        self._clear()
+
+    def record(
+        self, statement: str, duration_ms: float, caller: Optional[str] = None
+    ) -> None:
+        """Record one execution; ``caller`` is only looked up for slow ones."""
+        fingerprint = fingerprint_statement(statement)
+        slow = duration_ms >= self.slow_threshold_ms
+        if slow and caller is None:
+            caller = find_calling_method()
+
+        with self._lock:
+            stats = self._statements.get(fingerprint)
+            if stats is None:
+                if len(self._statements) >= self.max_fingerprints:
+                    fingerprint = OVERFLOW_FINGERPRINT
+                    stats = self._statements.get(fingerprint)
+                if stats is None:
+                    stats = StatementStats(_fingerprint_id(fingerprint), fingerprint)
+                    self._statements[fingerprint] = stats
+            stats.record(duration_ms)
+            self.total_queries += 1
+            self.total_ms += duration_ms
+
+            if not slow:
+                return
+            stats.slow_calls += 1
+            stats.last_caller = caller
+            self.slow_queries += 1
+            self._sequence += 1
+            sample = {
+                "fingerprint": stats.fingerprint_id,
+                "statement": fingerprint,
+                "duration_ms": round(duration_ms, 2),
+                "caller": caller,
+                "at": datetime.now(UTC).isoformat(),
+            }
+            entry = (duration_ms, self._sequence, sample)
+            if len(self._slowest) < self.top_n:
+                heapq.heappush(self._slowest, entry)
+            else:
+                heapq.heappushpop(self._slowest, entry)
+
+        logger.warning(
+            f"Slow query ({duration_ms:.1f} ms) from {caller or 'unknown caller'}: "
+            f"{fingerprint[:200]}"
+        )
+
+    @property
+    def avg_query_time_ms(self) -> float:
+        return self.total_ms / self.total_queries if self.total_queries else 0.0
+
+    def heaviest(self, limit: int = 10, order_by: str = "total") -> list[dict]:
+        """Get the heaviest statement fingerprints, heaviest first."""
+        if order_by not in self.ORDERINGS:
+            raise ValueError(
+                f"Unknown ordering {order_by!r}; expected one of {self.ORDERINGS}"
+            )
+        keys = {
+            "total": lambda stats: stats.total_ms,
+            "mean": lambda stats: stats.total_ms / stats.calls,
+            "max": lambda stats: stats.max_ms,
+            "calls": lambda stats: stats.calls,
+        }
+        with self._lock:
+            statements = list(self._statements.values())
+            ranked = sorted(statements, key=keys[order_by], reverse=True)[:limit]
+            return [stats.to_dict() for stats in ranked]
+
+    def slowest(self) -> list[dict[str, Any]]:
+        """Get the retained slow executions, slowest first."""
+        with self._lock:
+            return [sample for _, _, sample in sorted(self._slowest, reverse=True)]
+
+    def snapshot(self, limit: int = 10) -> dict[str, Any]:
+        """Summary for metrics endpoints."""
+        with self._lock:
+            fingerprints = len(self._statements)
+        return {
+            "since": self.started_at.isoformat(),
+            "total_queries": self.total_queries,
+            "avg_query_time_ms": round(self.avg_query_time_ms, 3),
+            "slow_queries_count": self.slow_queries,
+            "slow_threshold_ms": self.slow_threshold_ms,
+            "fingerprints": fingerprints,
+            "heaviest": self.heaviest(limit),
+            "slowest": self.slowest(),
+        }
+
+
+_query_stats: Optional[QueryStats] = None
+
+
+def get_query_stats() -> QueryStats:
+    """Get the process-wide query statistics registry."""
+    global _query_stats
+    if _query_stats is None:
+        from crypto_newsletter.shared.config.settings import get_settings
+
+        settings = get_settings()
+        _query_stats = QueryStats(
+            slow_threshold_ms=settings.db_slow_query_threshold_ms,
+            top_n=settings.db_slow_query_top_n,
+        )
+    return _query_stats
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_query_start_time", None)
+    if start is None:
+        return
+    try:
+        get_query_stats().record(statement, (time.perf_counter() - start) * 1000)
+    except Exception as e:  # never fail the query because of bookkeeping
+        logger.debug(f"Query instrumentation failed: {e}")
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach the timing hooks to a sync engine (use ``AsyncEngine.sync_engine``)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _reset_after_fork() -> None:
+    """Each forked worker reports only its own queries."""
+    if _query_stats is not None:
+        _query_stats.after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
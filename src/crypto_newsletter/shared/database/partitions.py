@@ -0,0 +1,299 @@
+"""Monthly range-partition maintenance for articles and article_analyses.
+
+``articles`` is partitioned on ``published_on`` and ``article_analyses`` on
+``created_at`` (see migration 7b2d4f6a8c1e). Partitions are named
+``<table>_pYYYY_MM`` and cover one UTC calendar month; a ``<table>_default``
+partition catches rows outside the pre-created range.
+
+Retention works on whole partitions: a month whose upper bound is at or before
+the cutoff is detached, dropped, or detached and moved to an archive schema.
+That is a catalog operation, independent of how many rows the month holds.
+
+Unique constraints on a partitioned table must include the partition key, so
+``external_id``, ``guid`` and ``url`` are only unique per ``published_on`` and
+``uq_article_analysis_version`` only per ``created_at``. Writers keep those
+keys unique across months by taking ``lock_unique_key`` before checking the
+parent table for an existing row.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Partitioned table -> partition key column
+PARTITIONED_TABLES: dict[str, str] = {
+    "articles": "published_on",
+    "article_analyses": "created_at",
+}
+
+RETENTION_MODES = ("archive", "detach", "drop")
+
+# Rows that reference a partitioned table, as (table, column). Drop mode deletes
+# them with the partition; archive and detach keep them for a reattach.
+PARTITION_CHILD_TABLES: dict[str, tuple[tuple[str, str], ...]] = {
+    "articles": (
+        ("article_categories", "article_id"),
+        ("article_analyses", "article_id"),
+        ("newsletter_articles", "article_id"),
+        ("signals", "article_id"),
+        ("signal_anomalies", "article_id"),
+        ("signal_connections", "article_id"),
+        ("article_embeddings", "article_id"),
+    ),
+    "article_analyses": (
+        ("signals", "analysis_id"),
+        ("signal_anomalies", "analysis_id"),
+        ("signal_connections", "analysis_id"),
+    ),
+}
+
+
+@dataclass(frozen=True)
+class MonthlyPartition:
+    """A monthly partition and its [start, end) bounds."""
+
+    table: str
+    name: str
+    start: datetime
+    end: datetime
+
+
+def month_floor(moment: datetime) -> datetime:
+    """Get the first instant of the UTC month containing ``moment``."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    moment = moment.astimezone(UTC)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """Shift a month start by ``months`` (may be negative)."""
+    index = month.year * 12 + (month.month - 1) + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """Get the partition name for ``table`` covering ``month``."""
+    return f"{table}_p{month:%Y_%m}"
+
+
+def monthly_partition(table: str, month: datetime) -> MonthlyPartition:
+    """Build the partition descriptor for the month containing ``month``."""
+    start = month_floor(month)
+    return MonthlyPartition(
+        table=table,
+        name=partition_name(table, start),
+        start=start,
+        end=add_months(start, 1),
+    )
+
+
+def _parse_partition(table: str, name: str) -> MonthlyPartition | None:
+    match = re.fullmatch(rf"{re.escape(table)}_p(\d{{4}})_(\d{{2}})", name)
+    if not match:
+        return None
+    year, month = int(match.group(1)), int(match.group(2))
+    return monthly_partition(table, datetime(year, month, 1, tzinfo=UTC))
+
+
+async def is_partitioned(db: AsyncSession, table: str = "articles") -> bool:
+    """Check whether ``table`` is a partitioned table in the current schema."""
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+
+    result = await db.execute(
+        text(
+            """
+            SELECT EXISTS (
+                SELECT 1
+                FROM pg_partitioned_table pt
+                JOIN pg_class c ON c.oid = pt.partrelid
+                WHERE c.relname = :table
+                  AND c.relnamespace = current_schema()::regnamespace
+            )
+            """
+        ),
+        {"table": table},
+    )
+    return bool(result.scalar())
+
+
+async def lock_unique_key(db: AsyncSession, table: str, *values: Any) -> None:
+    """
+    Serialize writers of one logical key of a partitioned table.
+
+    Takes a transaction-scoped advisory lock, so a writer that checks for an
+    existing row after taking it cannot race another writer of the same key
+    into a different partition. No-op outside PostgreSQL.
+    """
+    if db.bind is None or db.bind.dialect.name != "postgresql":
+        return
+
+    key = ":".join(str(part) for part in (table, *values))
+    await db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": key})
+
+
+async def list_partitions(db: AsyncSession, table: str) -> list[MonthlyPartition]:
+    """List attached monthly partitions of ``table``, oldest first."""
+    result = await db.execute(
+        text(
+            """
+            SELECT child.relname
+            FROM pg_inherits i
+            JOIN pg_class parent ON parent.oid = i.inhparent
+            JOIN pg_class child ON child.oid = i.inhrelid
+            WHERE parent.relname = :table
+              AND parent.relnamespace = current_schema()::regnamespace
+            """
+        ),
+        {"table": table},
+    )
+    partitions = [
+        partition
+        for (name,) in result.all()
+        if (partition := _parse_partition(table, name)) is not None
+    ]
+    return sorted(partitions, key=lambda partition: partition.start)
+
+
+async def create_partition(db: AsyncSession, partition: MonthlyPartition) -> None:
+    """
+    Create and attach a monthly partition.
+
+    Rows for the month that already landed in the default partition are moved
+    into the new partition first, since ATTACH refuses to create a partition
+    whose range overlaps rows in the default partition.
+    """
+    table = partition.table
+    key = PARTITIONED_TABLES[table]
+    bounds = {"start": partition.start, "end": partition.end}
+
+    await db.execute(
+        text(
+            f"CREATE TABLE {partition.name} "
+            f"(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    await db.execute(
+        text(
+            f"""
+            WITH moved AS (
+                DELETE FROM {table}_default
+                WHERE {key} >= :start AND {key} < :end
+                RETURNING *
+            )
+            INSERT INTO {partition.name} SELECT * FROM moved
+            """
+        ),
+        bounds,
+    )
+    await db.execute(
+        text(
+            f"ALTER TABLE {table} ATTACH PARTITION {partition.name} "
+            f"FOR VALUES FROM ('{partition.start.isoformat()}') "
+            f"TO ('{partition.end.isoformat()}')"
+        )
+    )
+
+
+async def ensure_partitions(
+    db: AsyncSession, months_ahead: int = 3, now: datetime | None = None
+) -> list[str]:
+    """
+    Pre-create partitions for the current month and ``months_ahead`` months after.
+
+    Returns:
+        Names of the partitions that were created
+    """
+    current = month_floor(now or datetime.now(UTC))
+    created = []
+
+    for table in PARTITIONED_TABLES:
+        existing = {partition.name for partition in await list_partitions(db, table)}
+        for offset in range(months_ahead + 1):
+            partition = monthly_partition(table, add_months(current, offset))
+            if partition.name in existing:
+                continue
+            await create_partition(db, partition)
+            created.append(partition.name)
+            logger.info(f"Created partition {partition.name}")
+
+    return created
+
+
+async def expired_partitions(
+    db: AsyncSession, cutoff: datetime
+) -> list[MonthlyPartition]:
+    """Get partitions that only hold rows older than ``cutoff``."""
+    cutoff = cutoff if cutoff.tzinfo else cutoff.replace(tzinfo=UTC)
+    expired = []
+    for table in PARTITIONED_TABLES:
+        expired.extend(
+            partition
+            for partition in await list_partitions(db, table)
+            if partition.end <= cutoff
+        )
+    return expired
+
+
+async def apply_partition_retention(
+    db: AsyncSession,
+    cutoff: datetime,
+    mode: str = "archive",
+    archive_schema: str = "archive",
+    dry_run: bool = False,
+) -> list[MonthlyPartition]:
+    """
+    Retire every partition whose rows are all older than ``cutoff``.
+
+    Args:
+        db: Database session (the caller commits)
+        cutoff: Rows published before this instant are out of retention
+        mode: "archive" moves partitions to ``archive_schema``, "detach" leaves
+            them as standalone tables, "drop" deletes them together with the
+            rows that reference them (``PARTITION_CHILD_TABLES``)
+        archive_schema: Target schema for "archive" mode
+        dry_run: Only report the partitions that would be retired
+
+    Returns:
+        The partitions that were (or would be) retired
+    """
+    if mode not in RETENTION_MODES:
+        raise ValueError(
+            f"Unknown retention mode {mode!r}; expected one of {RETENTION_MODES}"
+        )
+
+    expired = await expired_partitions(db, cutoff)
+    if dry_run or not expired:
+        return expired
+
+    if mode == "archive":
+        await db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}"))
+
+    for partition in expired:
+        if mode == "drop":
+            for child, column in PARTITION_CHILD_TABLES[partition.table]:
+                await db.execute(
+                    text(
+                        f"DELETE FROM {child} "
+                        f"WHERE {column} IN (SELECT id FROM {partition.name})"
+                    )
+                )
+
+        await db.execute(
+            text(f"ALTER TABLE {partition.table} DETACH PARTITION {partition.name}")
+        )
+        if mode == "drop":
+            await db.execute(text(f"DROP TABLE {partition.name}"))
+        elif mode == "archive":
+            await db.execute(
+                text(f"ALTER TABLE {partition.name} SET SCHEMA {archive_schema}")
+            )
+        logger.info(f"Retention ({mode}) applied to partition {partition.name}")
+
+    return expired
@@ -2,15 +2,22 @@
 
 from .base import Base, TimestampMixin
 from .models import (
+    AnalysisBatchJob,
     Article,
     ArticleAnalysis,
     ArticleCategory,
+    ArticleEmbedding,
     BatchProcessingRecord,
     BatchProcessingSession,
     Category,
+    LLMCacheEntry,
     Newsletter,
     NewsletterArticle,
+    NewsletterRendition,
     Publisher,
+    Signal,
+    SignalAnomaly,
+    SignalConnection,
 )
 
 __all__ = [
@@ -21,8 +28,15 @@ __all__ = [
     "Article",
     "ArticleCategory",
     "ArticleAnalysis",
+    "ArticleEmbedding",
+    "Signal",
+    "SignalAnomaly",
+    "SignalConnection",
     "BatchProcessingSession",
     "BatchProcessingRecord",
     "Newsletter",
     "NewsletterArticle",
+    "NewsletterRendition",
+    "LLMCacheEntry",
+    "AnalysisBatchJob",
 ]
@@ -9,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -87,7 +88,8 @@ class Article(Base, TimestampMixin):
     keywords: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     language: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     image_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    published_on: Mapped[Optional[datetime]] = mapped_column(nullable=True)
+    # Partition key of the monthly-partitioned articles table
+    published_on: Mapped[datetime] = mapped_column(nullable=False)
     published_on_ns: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     upvotes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     downvotes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -117,6 +119,15 @@ class Article(Base, TimestampMixin):
         CheckConstraint(
             "status IN ('ACTIVE', 'INACTIVE', 'DELETED')", name="check_article_status"
         ),
+        # Hot-path indexes (see migration 6a1f3c9d2e7b)
+        Index("idx_articles_status_published_on", "status", "published_on"),
+        Index("idx_articles_status_created_at", "status", "created_at"),
+        Index(
+            "idx_articles_publisher_status_published_on",
+            "publisher_id",
+            "status",
+            "published_on",
+        ),
     )
 
 
@@ -148,6 +159,7 @@ class ArticleCategory(Base):
 
     __table_args__ = (
         UniqueConstraint("article_id", "category_id", name="uq_article_category"),
+        Index("idx_article_categories_category_id", "category_id"),
     )
 
 
@@ -213,6 +225,9 @@ class ArticleAnalysis(Base, TimestampMixin):
     processing_time_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     token_usage: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     cost_usd: Mapped[Optional[float]] = mapped_column(Numeric(6, 4), nullable=True)
+    # Estimated tokens of the article body before and after condensation
+    article_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    condensed_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Relationships
     article: Mapped["Article"] = relationship("Article")
@@ -245,6 +260,166 @@ class ArticleAnalysis(Base, TimestampMixin):
         UniqueConstraint(
             "article_id", "analysis_version", name="uq_article_analysis_version"
         ),
+        Index("idx_article_analyses_article_created", "article_id", "created_at"),
+        Index(
+            "idx_article_analyses_validation_created",
+            "validation_status",
+            "created_at",
+            "signal_strength",
+            postgresql_include=["article_id"],
+        ),
+        Index(
+            "idx_article_analyses_created_at",
+            "created_at",
+            postgresql_include=["cost_usd"],
+        ),
+    )
+
+
+class Signal(Base, TimestampMixin):
+    """Weak signal from an analysis, one row per ``weak_signals`` entry."""
+
+    __tablename__ = "signals"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    article_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("articles.id"), nullable=False
+    )
+    analysis_id: Mapped[Optional[int]] = mapped_column(
+        BigInteger, ForeignKey("article_analyses.id"), nullable=True
+    )
+    signal_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    confidence: Mapped[float] = mapped_column(Float, nullable=False)
+    implications: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    detected_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    agent_version: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    # Evidence and timeframe ("metadata" is reserved on declarative classes)
+    signal_metadata: Mapped[Optional[dict]] = mapped_column(
+        "metadata", JSONB, nullable=True
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "confidence >= 0 AND confidence <= 1", name="check_signal_confidence"
+        ),
+        Index("idx_signals_article_id", "article_id"),
+        Index("idx_signals_analysis_id", "analysis_id"),
+        Index("idx_signals_type_confidence", "signal_type", "confidence"),
+        Index("idx_signals_detected_at", "detected_at"),
+    )
+
+
+class ArticleEmbedding(Base):
+    """Embedding vector of an article for one embedding model and version."""
+
+    __tablename__ = "article_embeddings"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    article_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("articles.id"), nullable=False
+    )
+    embedding: Mapped[list[float]] = mapped_column(ARRAY(Float), nullable=False)
+    embedding_model: Mapped[str] = mapped_column(String(100), nullable=False)
+    embedding_version: Mapped[str] = mapped_column(String(50), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "article_id",
+            "embedding_model",
+            "embedding_version",
+            name="uq_article_embedding",
+        ),
+        Index("idx_article_embeddings_article_id", "article_id"),
+    )
+
+
+class SignalAnomaly(Base):
+    """Pattern anomaly from an analysis, one row per ``pattern_anomalies`` entry."""
+
+    __tablename__ = "signal_anomalies"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    article_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("articles.id"), nullable=False
+    )
+    analysis_id: Mapped[Optional[int]] = mapped_column(
+        BigInteger, ForeignKey("article_analyses.id"), nullable=True
+    )
+    expected_pattern: Mapped[str] = mapped_column(Text, nullable=False)
+    observed_pattern: Mapped[str] = mapped_column(Text, nullable=False)
+    deviation_significance: Mapped[float] = mapped_column(Float, nullable=False)
+    historical_context: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    potential_causes: Mapped[Optional[dict]] = mapped_column(
+        JSONB, default=lambda: [], nullable=True
+    )
+    detected_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "deviation_significance >= 0 AND deviation_significance <= 1",
+            name="check_anomaly_significance",
+        ),
+        Index("idx_signal_anomalies_article_id", "article_id"),
+        Index("idx_signal_anomalies_analysis_id", "analysis_id"),
+        Index(
+            "idx_signal_anomalies_significance_detected",
+            "deviation_significance",
+            "detected_at",
+        ),
+        Index("idx_signal_anomalies_detected_at", "detected_at"),
+    )
+
+
+class SignalConnection(Base):
+    """Adjacent connection from an analysis, one row per ``adjacent_connections``."""
+
+    __tablename__ = "signal_connections"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    article_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("articles.id"), nullable=False
+    )
+    analysis_id: Mapped[Optional[int]] = mapped_column(
+        BigInteger, ForeignKey("article_analyses.id"), nullable=True
+    )
+    crypto_element: Mapped[str] = mapped_column(Text, nullable=False)
+    external_domain: Mapped[str] = mapped_column(String(100), nullable=False)
+    connection_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    relevance: Mapped[float] = mapped_column(Float, nullable=False)
+    opportunity_description: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True
+    )
+    development_indicators: Mapped[Optional[dict]] = mapped_column(
+        JSONB, default=lambda: [], nullable=True
+    )
+    detected_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "relevance >= 0 AND relevance <= 1", name="check_connection_relevance"
+        ),
+        Index("idx_signal_connections_article_id", "article_id"),
+        Index("idx_signal_connections_analysis_id", "analysis_id"),
+        Index(
+            "idx_signal_connections_domain_relevance", "external_domain", "relevance"
+        ),
+        Index("idx_signal_connections_detected_at", "detected_at"),
     )
 
 
@@ -353,6 +528,12 @@ class Newsletter(Base, TimestampMixin):
     newsletter_articles: Mapped[list["NewsletterArticle"]] = relationship(
         "NewsletterArticle", back_populates="newsletter", cascade="all, delete-orphan"
     )
+    renditions: Mapped[list["NewsletterRendition"]] = relationship(
+        "NewsletterRendition",
+        back_populates="newsletter",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
     __table_args__ = (
         CheckConstraint(
@@ -363,6 +544,7 @@ class Newsletter(Base, TimestampMixin):
             "quality_score IS NULL OR (quality_score >= 0 AND quality_score <= 1)",
             name="check_quality_score",
         ),
+        Index("idx_newsletters_status_created_at", "status", "created_at"),
     )
 
 
@@ -393,3 +575,105 @@ class NewsletterArticle(Base):
     __table_args__ = (
         UniqueConstraint("newsletter_id", "article_id", name="uq_newsletter_article"),
     )
+
+
+class NewsletterRendition(Base):
+    """Pre-rendered representation of a newsletter (web HTML, email, text)."""
+
+    __tablename__ = "newsletter_renditions"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    newsletter_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("newsletters.id", ondelete="CASCADE"), nullable=False
+    )
+    variant: Mapped[str] = mapped_column(String(20), nullable=False)
+    # Hash of the newsletter fields and render version the body was built from
+    source_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    # Relationships
+    newsletter: Mapped["Newsletter"] = relationship(
+        "Newsletter", back_populates="renditions"
+    )
+
+    __table_args__ = (
+        UniqueConstraint("newsletter_id", "variant", name="uq_newsletter_rendition"),
+    )
+
+
+class LLMCacheEntry(Base):
+    """Validated agent output cached by a hash of everything that produced it."""
+
+    __tablename__ = "llm_cache_entries"
+
+    # sha256 of agent name, model, system prompt hash and input hash
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    agent: Mapped[str] = mapped_column(String(100), nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    output: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    usage: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    hits: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    __table_args__ = (
+        Index("idx_llm_cache_last_used", "last_used_at"),
+        Index("idx_llm_cache_expires", "expires_at"),
+    )
+
+
+class AnalysisBatchJob(Base, TimestampMixin):
+    """Provider batch job analyzing backlog articles off the interactive path."""
+
+    __tablename__ = "analysis_batch_jobs"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    # Job name at the provider (or stub), used to poll and fetch results
+    provider_job_id: Mapped[str] = mapped_column(
+        String(255), unique=True, nullable=False
+    )
+    backend: Mapped[str] = mapped_column(String(20), nullable=False)
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    article_ids: Mapped[list[int]] = mapped_column(ARRAY(BigInteger), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), default="SUBMITTED", server_default="SUBMITTED", nullable=False
+    )
+    articles_stored: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    articles_failed: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    cost_usd: Mapped[Optional[float]] = mapped_column(Numeric(8, 4), nullable=True)
+    # Budget held from submission until the job is settled (see budget.py)
+    estimated_cost_usd: Mapped[Optional[float]] = mapped_column(
+        Numeric(8, 4), nullable=True
+    )
+    budget_hold_id: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+    budget_day: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    submitted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('SUBMITTED', 'RUNNING', 'COMPLETED', 'FAILED', "
+            "'CANCELLED', 'EXPIRED')",
+            name="check_analysis_batch_job_status",
+        ),
+        Index("idx_analysis_batch_jobs_status", "status"),
+    )
@@ -2,7 +2,7 @@
 
 import time
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -53,6 +53,9 @@ class DatabaseMetrics:
     articles_today: int
     avg_query_time_ms: float
     slow_queries_count: int
+    total_queries: int = 0
+    heaviest_queries: list[dict[str, Any]] = field(default_factory=list)
+    slowest_queries: list[dict[str, Any]] = field(default_factory=list)
 
 
 @dataclass
@@ -157,23 +160,38 @@ class MetricsCollector:
 
     async def collect_database_metrics(self) -> DatabaseMetrics:
         """Collect database performance metrics."""
+        from crypto_newsletter.shared.database.instrumentation import get_query_stats
+
+        query_stats = get_query_stats().snapshot()
+        query_metrics = {
+            "avg_query_time_ms": query_stats["avg_query_time_ms"],
+            "slow_queries_count": query_stats["slow_queries_count"],
+            "total_queries": query_stats["total_queries"],
+            "heaviest_queries": query_stats["heaviest"],
+            "slowest_queries": query_stats["slowest"],
+        }
+
         try:
             from crypto_newsletter.core.storage.repository import ArticleRepository
-            from crypto_newsletter.shared.database.connection import get_db_session
+            from crypto_newsletter.shared.database.connection import get_read_session
+            from sqlalchemy import text
 
-            async with get_db_session() as db:
+            async with get_read_session() as db:
                 repo = ArticleRepository(db)
                 stats = await repo.get_article_statistics()
 
                 # Get connection count (PostgreSQL specific)
                 connection_result = await db.execute(
-                    "SELECT count(*) FROM pg_stat_activity WHERE state = 'active'"
+                    text("SELECT count(*) FROM pg_stat_activity WHERE state = 'active'")
                 )
                 connection_count = connection_result.scalar() or 0
 
                 # Get active queries count
                 active_queries_result = await db.execute(
-                    "SELECT count(*) FROM pg_stat_activity WHERE state = 'active' AND query != '<IDLE>'"
+                    text(
+                        "SELECT count(*) FROM pg_stat_activity "
+                        "WHERE state = 'active' AND query != '<IDLE>'"
+                    )
                 )
                 active_queries = active_queries_result.scalar() or 0
 
@@ -183,8 +201,7 @@ class MetricsCollector:
                     active_queries=active_queries,
                     total_articles=stats.get("total_articles", 0),
                     articles_today=stats.get("recent_articles_24h", 0),
-                    avg_query_time_ms=0.0,  # Would need query performance tracking
-                    slow_queries_count=0,  # Would need slow query log analysis
+                    **query_metrics,
                 )
         except Exception as e:
             logger.error(f"Failed to collect database metrics: {e}")
@@ -194,8 +211,7 @@ class MetricsCollector:
                 active_queries=0,
                 total_articles=0,
                 articles_today=0,
-                avg_query_time_ms=0.0,
-                slow_queries_count=0,
+                **query_metrics,
             )
 
     def collect_task_metrics(self) -> TaskMetrics:
@@ -294,10 +310,10 @@ class MetricsCollector:
     async def collect_newsletter_generation_metrics(self) -> dict[str, Any]:
         """Collect newsletter generation progress and quality metrics."""
         try:
-            from crypto_newsletter.shared.database.connection import get_db_session
+            from crypto_newsletter.shared.database.connection import get_read_session
             from sqlalchemy import select
 
-            async with get_db_session() as db:
+            async with get_read_session() as db:
                 # Get recent generation progress (use naive datetime for database query)
                 cutoff_time = datetime.now() - timedelta(hours=24)
                 recent_progress_query = (
@@ -0,0 +1,227 @@
+"""Response caching and conditional GET support for the API."""
+
+import functools
+import hashlib
+import inspect
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from crypto_newsletter.shared.cache import cache_key, get_response_cache
+from crypto_newsletter.shared.config.settings import get_settings
+from crypto_newsletter.shared.monitoring.metrics import get_metrics_collector
+
+# Endpoint parameters that never change the response
+UNCACHED_PARAMS = frozenset({"api_key", "request", "response"})
+
+# Cache-Control by newsletter status; published newsletters do not change.
+# Routes sit behind the API key, so only the caller's own cache may keep them.
+NEWSLETTER_CACHE_CONTROL = {
+    "PUBLISHED": "private, max-age=86400, immutable",
+    "ARCHIVED": "private, max-age=3600",
+}
+# Drafts and anything editable: cache, but revalidate on every use
+REVALIDATE = "private, no-cache"
+
+
+def cached_endpoint(
+    tags: Iterable[str],
+    ttl: Optional[int] = None,
+    namespace: Optional[str] = None,
+) -> Callable:
+    """
+    Cache an endpoint's response, keyed by route and normalized parameters.
+
+    The endpoint's return value is stored in its JSON form; FastAPI validates
+    and serializes a cached value against ``response_model`` like a fresh one.
+    HTTP errors raised by the endpoint are not cached.
+
+    Args:
+        tags: Data the response is built from (``crypto_newsletter.shared.cache``
+            tags); writes to that data invalidate the entry
+        ttl: Seconds to cache (default: ``RESPONSE_CACHE_TTL_SECONDS``)
+        namespace: Key prefix (default: the endpoint's module and name)
+
+    Usage:
+        @router.get("/stats")
+        @cached_endpoint(tags=[ARTICLES])
+        async def get_stats(...): ...
+    """
+    tags = tuple(tags)
+
+    def decorator(endpoint: Callable) -> Callable:
+        route = namespace or f"{endpoint.__module__}.{endpoint.__name__}"
+        signature = inspect.signature(endpoint)
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not get_settings().response_cache_enabled:
+                # Same JSON form as a cached value, so callers see one shape
+                return jsonable_encoder(await endpoint(*args, **kwargs))
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {
+                name: value
+                for name, value in bound.arguments.items()
+                if name not in UNCACHED_PARAMS
+            }
+
+            async def compute() -> Any:
+                return jsonable_encoder(await endpoint(*args, **kwargs))
+
+            return await get_response_cache().get_or_set(
+                cache_key(route, params), compute, ttl=ttl, tags=tags
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def strong_etag(*parts: Any) -> str:
+    """Strong ETag over the given version parts, e.g. (id, updated_at, variant)."""
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def http_date(value: datetime) -> str:
+    """Format a datetime as an HTTP date (naive values are taken as UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return format_datetime(value.astimezone(UTC), usegmt=True)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison: W/ prefixes are ignored
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+@dataclass(frozen=True)
+class Validator:
+    """HTTP validators and caching policy of one representation."""
+
+    etag: str
+    last_modified: Optional[str] = None
+    cache_control: str = REVALIDATE
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": self.cache_control}
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+        return headers
+
+    def matches(self, request: Request) -> bool:
+        """
+        Whether the client's copy is current (RFC 9110 conditional GET).
+
+        If-None-Match takes precedence; If-Modified-Since is only consulted
+        without it, at one-second resolution.
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            return _etag_matches(if_none_match, self.etag)
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if not (if_modified_since and self.last_modified):
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        return parsedate_to_datetime(self.last_modified) <= since
+
+    def not_modified(self) -> Response:
+        return Response(status_code=304, headers=self.headers)
+
+    def respond(self, request: Request, response: Response) -> Response:
+        """304 if the client's copy matches, else ``response`` with validators."""
+        if self.matches(request):
+            return self.not_modified()
+        response.headers.update(self.headers)
+        return response
+
+
+class ValidatorCache:
+    """
+    Per-process cache of a resource's validators, invalidated by tag.
+
+    A conditional request whose validator is cached is answered with 304
+    without touching the database. Take the key with ``key`` before loading
+    the resource, then ``store`` the validator built from what was loaded.
+    """
+
+    def __init__(self, resource: str, tags: Iterable[str]) -> None:
+        self.resource = resource
+        self.tags = tuple(tags)
+        self._key: Optional[str] = None
+
+    async def key(self) -> str:
+        if self._key is None:
+            self._key = await get_response_cache().versioned_key(
+                f"validator:{self.resource}", self.tags
+            )
+        return self._key
+
+    async def lookup(self, request: Request) -> Optional[Response]:
+        """The 304 response if the request is conditional and still current."""
+        if not get_settings().response_cache_enabled:
+            return None
+        key = await self.key()
+        if not (
+            request.headers.get("if-none-match")
+            or request.headers.get("if-modified-since")
+        ):
+            return None
+
+        cached = get_response_cache().get_local(key)
+        metrics = get_metrics_collector()
+        if cached is not None:
+            validator = Validator(**cached)
+            if validator.matches(request):
+                metrics.record_cache_hit()
+                return validator.not_modified()
+        metrics.record_cache_miss()
+        return None
+
+    async def store(self, validator: Validator) -> None:
+        if get_settings().response_cache_enabled:
+            get_response_cache().set_local(await self.key(), asdict(validator))
+
+
+def article_validator(article: dict[str, Any]) -> Validator:
+    """Validators of an article as returned by ``get_article_by_id``."""
+    updated_at = article.get("updated_at")
+    return Validator(
+        etag=strong_etag("article", article["id"], updated_at),
+        last_modified=http_date(datetime.fromisoformat(updated_at))
+        if updated_at
+        else None,
+        cache_control=REVALIDATE,
+    )
+
+
+def newsletter_validator(newsletter: Any, variant: str) -> Validator:
+    """Validators of a newsletter representation (``json`` or ``html``)."""
+    return Validator(
+        etag=strong_etag(
+            "newsletter", newsletter.id, newsletter.updated_at.isoformat(), variant
+        ),
+        last_modified=http_date(newsletter.updated_at),
+        cache_control=NEWSLETTER_CACHE_CONTROL.get(newsletter.status, REVALIDATE),
+    )
@@ -16,6 +16,8 @@ from crypto_newsletter.shared.config.settings import get_settings
 from crypto_newsletter.shared.database.connection import get_db_session
 from crypto_newsletter.shared.logging.config import configure_logging, get_logger
 from crypto_newsletter.shared.monitoring.metrics import get_metrics_collector
+from crypto_newsletter.web.middleware import CompressionMiddleware
+from crypto_newsletter.web.responses import default_response_class
 from crypto_newsletter.web.routers import admin, api, health
 
 
@@ -50,6 +52,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         })
         app_logger.info("Service will start anyway - database will be checked on first request")
     
+    # Load the article similarity index (memory-mapped) - non-blocking for startup
+    if settings.embeddings_enabled:
+        try:
+            from crypto_newsletter.core.embeddings import get_similarity_index
+
+            index = await get_similarity_index()
+            app_logger.info(f"Similarity index loaded: {len(index)} articles")
+        except Exception as e:
+            app_logger.warning(f"Similarity index will load on first request: {e}")
+
     # Verify Celery connection (if enabled) - non-blocking for startup
     if settings.enable_celery:
         try:
@@ -84,6 +96,7 @@ def create_app() -> FastAPI:
         docs_url="/docs" if settings.effective_environment == "development" else None,
         redoc_url="/redoc" if settings.effective_environment == "development" else None,
         lifespan=lifespan,
+        default_response_class=default_response_class(),
     )
     
     # CORS middleware
@@ -92,6 +105,13 @@ def create_app() -> FastAPI:
         "http://localhost:3000",  # Development frontend
     ]
 
+    # Compress large bodies (brotli when installed, gzip otherwise)
+    if settings.response_compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.response_compression_min_size,
+        )
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=allowed_origins,
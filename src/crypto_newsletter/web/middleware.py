@@ -1,11 +1,14 @@
-"""FastAPI middleware for logging and monitoring."""
+"""FastAPI middleware for logging, monitoring and response compression."""
 
 import time
-from typing import Callable
+import zlib
+from typing import Callable, Optional
 
 from fastapi import Request, Response
 from loguru import logger
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 class LoggingMiddleware(BaseHTTPMiddleware):
@@ -74,3 +77,179 @@ class HealthCheckMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
         
         return await call_next(request)
+
+
+try:
+    import brotli
+except ImportError:  # optional: pip install crypto-newsletter[web]
+    brotli = None
+
+# Sent as they are: already compressed payloads (e.g. /api/export downloads)
+# and event streams
+EXCLUDED_CONTENT_TYPES = frozenset(
+    {
+        "application/gzip",
+        "application/x-gzip",
+        "application/zip",
+        "application/zstd",
+        "application/vnd.apache.parquet",
+        "font/woff",
+        "font/woff2",
+        "image/avif",
+        "image/gif",
+        "image/jpeg",
+        "image/png",
+        "image/webp",
+        "text/event-stream",
+    }
+)
+EXCLUDED_MEDIA_GROUPS = ("audio/", "video/")
+
+
+def _excluded(content_type: str) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type in EXCLUDED_CONTENT_TYPES or media_type.startswith(
+        EXCLUDED_MEDIA_GROUPS
+    )
+
+
+class GzipEncoder:
+    content_encoding = "gzip"
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def encode(self, body: bytes, more_body: bool) -> bytes:
+        compressed = self._compressor.compress(body)
+        if more_body:
+            return compressed + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return compressed + self._compressor.flush()
+
+
+class BrotliEncoder:
+    content_encoding = "br"
+
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def encode(self, body: bytes, more_body: bool) -> bytes:
+        compressed = self._compressor.process(body)
+        if more_body:
+            return compressed + self._compressor.flush()
+        return compressed + self._compressor.finish()
+
+
+class CompressingSend:
+    """
+    ``send`` of one response, encoding its body.
+
+    The start message is held back until the first body chunk shows whether
+    the response is worth compressing.
+    """
+
+    def __init__(
+        self, send: Send, encoder: GzipEncoder | BrotliEncoder, minimum_size: int
+    ) -> None:
+        self.send = send
+        self.encoder = encoder
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                message["status"] in (204, 206, 304)
+                or "content-encoding" in headers
+                or _excluded(headers.get("content-type", ""))
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            # e.g. http.response.pathsend: nothing to encode
+            if self.start is not None:
+                self.passthrough = True
+                await self.send(self.start)
+                self.start = None
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is None:
+            message["body"] = self.encoder.encode(body, more_body)
+            await self.send(message)
+            return
+
+        start, self.start = self.start, None
+        headers = MutableHeaders(raw=start["headers"])
+        headers.add_vary_header("Accept-Encoding")
+        if len(body) < self.minimum_size and not more_body:
+            self.passthrough = True
+        else:
+            message["body"] = self.encoder.encode(body, more_body)
+            headers["Content-Encoding"] = self.encoder.content_encoding
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(message["body"]))
+        await self.send(start)
+        await self.send(message)
+
+
+def _accepts(accept_encoding: str, coding: str) -> bool:
+    """Whether an Accept-Encoding header allows ``coding`` (``q=0`` refuses)."""
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.partition(";")
+        if name.strip() != coding:
+            continue
+        weight = params.replace(" ", "").removeprefix("q=")
+        try:
+            return not params or float(weight) > 0
+        except ValueError:
+            return True
+    return False
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies of at least ``minimum_size`` bytes.
+
+    Brotli is used when the client accepts it and the ``brotli`` package is
+    installed, gzip otherwise. Small bodies, 304s, already-encoded responses
+    and binary media types are sent as they are.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 5,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        if brotli is not None and _accepts(accept_encoding, "br"):
+            encoder = BrotliEncoder(self.brotli_quality)
+        elif _accepts(accept_encoding, "gzip"):
+            encoder = GzipEncoder(self.gzip_level)
+        else:
+            await self.app(scope, receive, send)
+            return
+        await self.app(
+            scope, receive, CompressingSend(send, encoder, self.minimum_size)
+        )
@@ -52,6 +52,17 @@ class ArticleResponse(BaseModel):
     body_length: Optional[int] = None
 
 
+class SimilarArticleResponse(BaseModel):
+    """Response model for a similar article."""
+
+    id: int
+    title: str
+    url: str
+    published_on: Optional[str] = None
+    publisher_id: Optional[int] = None
+    similarity: float
+
+
 class PublisherResponse(BaseModel):
     """Response model for publisher data."""
 
@@ -384,3 +395,64 @@ class NewsletterAnalyticsResponse(BaseModel):
     performance_metrics: dict[str, Any]
     top_performing_newsletters: list[NewsletterContentSummary]
     timestamp: str
+
+
+# Normalized signal models
+class SignalResponse(BaseModel):
+    """Response model for a weak signal."""
+
+    id: int
+    article_id: int
+    analysis_id: Optional[int] = None
+    signal_type: str
+    description: str
+    confidence: float
+    implications: Optional[str] = None
+    detected_at: str
+    agent_version: Optional[str] = None
+    metadata: dict[str, Any] = Field(default_factory=dict)
+    article_title: Optional[str] = None
+    article_url: Optional[str] = None
+
+
+class SignalTypeSummaryResponse(BaseModel):
+    """Response model for per-type signal counts."""
+
+    signal_type: str
+    count: int
+    avg_confidence: float
+    max_confidence: float
+    last_detected_at: str
+
+
+class SignalAnomalyResponse(BaseModel):
+    """Response model for a pattern anomaly."""
+
+    id: int
+    article_id: int
+    analysis_id: Optional[int] = None
+    expected_pattern: str
+    observed_pattern: str
+    deviation_significance: float
+    historical_context: Optional[str] = None
+    potential_causes: list[Any] = Field(default_factory=list)
+    detected_at: str
+    article_title: Optional[str] = None
+    article_url: Optional[str] = None
+
+
+class SignalConnectionResponse(BaseModel):
+    """Response model for an adjacent connection."""
+
+    id: int
+    article_id: int
+    analysis_id: Optional[int] = None
+    crypto_element: str
+    external_domain: str
+    connection_type: Optional[str] = None
+    relevance: float
+    opportunity_description: Optional[str] = None
+    development_indicators: list[Any] = Field(default_factory=list)
+    detected_at: str
+    article_title: Optional[str] = None
+    article_url: Optional[str] = None
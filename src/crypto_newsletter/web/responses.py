@@ -0,0 +1,73 @@
+"""JSON response rendering for the API."""
+
+import json
+from collections.abc import Mapping
+from typing import Any, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from crypto_newsletter.shared.config.settings import get_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson (stdlib json when it is not installed).
+
+    orjson natively serializes datetimes, dates, UUIDs and dataclasses, and
+    produces compact UTF-8 directly; stdlib output matches Starlette's.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+
+
+def default_response_class() -> type[JSONResponse]:
+    """Response class for routes returning plain data (``FAST_JSON_RESPONSES``)."""
+    return FastJSONResponse if get_settings().fast_json_responses else JSONResponse
+
+
+def _dump(content: Any) -> Any:
+    if isinstance(content, BaseModel):
+        return content.model_dump(mode="json")
+    if isinstance(content, list | tuple):
+        return [_dump(item) for item in content]
+    return content
+
+
+def json_response(
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> JSONResponse:
+    """
+    Build a JSON response from already-validated data.
+
+    Returning a Response skips FastAPI's ``response_model`` validation, which
+    only re-checks what the route built from its response models (or read
+    back from the response cache) anyway; ``response_model`` still documents
+    the route. On the fast path models are dumped by pydantic-core and dicts
+    go to orjson as they are, without ``jsonable_encoder``.
+
+    Args:
+        content: Response model(s), or JSON-compatible dicts and lists
+        status_code: HTTP status
+        headers: Extra response headers
+    """
+    if get_settings().fast_json_responses:
+        return FastJSONResponse(
+            _dump(content), status_code=status_code, headers=headers
+        )
+    return JSONResponse(
+        jsonable_encoder(content), status_code=status_code, headers=headers
+    )
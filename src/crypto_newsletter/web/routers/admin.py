@@ -1,6 +1,6 @@
 """Admin endpoints for task management and system administration."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from crypto_newsletter.core.storage.repository import (
@@ -12,8 +12,13 @@ from crypto_newsletter.newsletter.services.progress_tracker import ProgressTrack
 from crypto_newsletter.newsletter.tasks import (
     generate_newsletter_manual_task_enhanced,
 )
+from crypto_newsletter.shared.cache import NEWSLETTERS
 from crypto_newsletter.shared.config.settings import get_settings
-from crypto_newsletter.shared.database.connection import get_db_session
+from crypto_newsletter.shared.database.connection import (
+    get_db_session,
+    get_read_session,
+)
+from crypto_newsletter.web.cache import cached_endpoint
 from crypto_newsletter.web.models import (
     ManualIngestRequest,
     NewsletterGenerationRequest,
@@ -38,7 +43,7 @@ async def admin_status() -> dict[str, Any]:
         settings = get_settings()
 
         # Get database statistics
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             repo = ArticleRepository(db)
             stats = await repo.get_article_statistics()
 
@@ -351,7 +356,7 @@ async def get_system_stats() -> dict[str, Any]:
     """
     try:
         # Get database statistics
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             repo = ArticleRepository(db)
             stats = await repo.get_article_statistics()
 
@@ -383,55 +388,19 @@ async def generate_newsletter(force_generation: bool = False) -> dict[str, Any]:
         from crypto_newsletter.newsletter.agents.orchestrator import (
             newsletter_orchestrator,
         )
-        from crypto_newsletter.shared.database.connection import get_db_session
-        from sqlalchemy import text
 
         # Get analyzed articles from the last 24 hours
         async with get_db_session() as db:
-            query = text(
-                """
-                SELECT
-                    a.id,
-                    a.title,
-                    p.name as publisher,
-                    a.published_on,
-                    a.body,
-                    aa.signal_strength,
-                    aa.uniqueness_score,
-                    aa.analysis_confidence,
-                    aa.weak_signals,
-                    aa.pattern_anomalies,
-                    aa.adjacent_connections
-                FROM articles a
-                JOIN publishers p ON a.publisher_id = p.id
-                JOIN article_analyses aa ON a.id = aa.article_id
-                WHERE aa.created_at >= NOW() - INTERVAL '24 hours'
-                  AND LENGTH(a.body) > 2000
-                  AND aa.signal_strength > 0.6
-                ORDER BY aa.signal_strength DESC
-                LIMIT 10
-            """
+            article_repo = ArticleRepository(db)
+            agent_articles = await article_repo.get_agent_articles_since(
+                datetime.now(UTC) - timedelta(hours=24),
+                min_signal_strength=0.6,
+                limit=10,
+                min_content_length=2000,
+                order_by_signal=True,
+                completed_only=False,
             )
-
-            result = await db.execute(query)
-            articles = []
-
-            for row in result.fetchall():
-                articles.append(
-                    {
-                        "id": row[0],
-                        "title": row[1],
-                        "publisher": row[2],
-                        "published_on": row[3].isoformat() if row[3] else None,
-                        "body": row[4],
-                        "signal_strength": float(row[5]) if row[5] else 0.0,
-                        "uniqueness_score": float(row[6]) if row[6] else 0.0,
-                        "analysis_confidence": float(row[7]) if row[7] else 0.0,
-                        "weak_signals": row[8] if row[8] else [],
-                        "pattern_anomalies": row[9] if row[9] else [],
-                        "adjacent_connections": row[10] if row[10] else [],
-                    }
-                )
+            articles = [article.to_agent_dict() for article in agent_articles]
 
         if len(articles) < 3 and not force_generation:
             return {
@@ -451,7 +420,7 @@ async def generate_newsletter(force_generation: bool = False) -> dict[str, Any]:
             "success": True,
             "newsletter_result": newsletter_result,
             "articles_processed": len(articles),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.now(UTC).isoformat(),
         }
 
     except Exception as e:
@@ -516,6 +485,7 @@ async def admin_generate_newsletter(
 
 
 @router.get("/newsletters/stats")
+@cached_endpoint(tags=[NEWSLETTERS])
 async def get_newsletter_stats() -> dict[str, Any]:
     """
     Get newsletter generation statistics for admin dashboard.
@@ -524,7 +494,7 @@ async def get_newsletter_stats() -> dict[str, Any]:
         Newsletter statistics and metrics
     """
     try:
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             newsletter_repo = NewsletterRepository(db)
 
             # Get recent newsletters (past 30 days)
@@ -634,7 +604,7 @@ async def get_admin_newsletters(
         List of newsletters with admin metadata
     """
     try:
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             newsletter_repo = NewsletterRepository(db)
 
             newsletters = await newsletter_repo.get_newsletters_with_filters(
@@ -705,7 +675,7 @@ async def get_admin_newsletter_detail(newsletter_id: int) -> NewsletterResponse:
         Complete newsletter details with admin metadata
     """
     try:
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             newsletter_repo = NewsletterRepository(db)
 
             newsletter = await newsletter_repo.get_newsletter_by_id(
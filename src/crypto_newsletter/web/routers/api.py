@@ -1,16 +1,40 @@
 """Public API endpoints for external integrations."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any, Optional
 
+from crypto_newsletter.core.storage.export import (
+    ExportQuery,
+    check_export_options,
+    export_filename,
+    export_media_type,
+    stream_export,
+)
 from crypto_newsletter.core.storage.repository import (
     ArticleRepository,
+    EmbeddingRepository,
     NewsletterRepository,
+    SignalRepository,
 )
+from crypto_newsletter.newsletter.rendering import RENDER_VERSION, TEXT
 from crypto_newsletter.newsletter.storage import NewsletterStorage
 from crypto_newsletter.newsletter.tasks import generate_newsletter_manual_task
+from crypto_newsletter.shared.cache import ARTICLES, NEWSLETTERS, PUBLISHERS
 from crypto_newsletter.shared.config.settings import get_settings
-from crypto_newsletter.shared.database.connection import get_db_session
+from crypto_newsletter.shared.database.connection import (
+    get_db_session,
+    get_read_session,
+)
+from crypto_newsletter.web.cache import (
+    REVALIDATE,
+    Validator,
+    ValidatorCache,
+    article_validator,
+    cached_endpoint,
+    http_date,
+    newsletter_validator,
+    strong_etag,
+)
 from crypto_newsletter.web.models import (
     ArticleResponse,
     NewsletterGenerationRequest,
@@ -18,10 +42,17 @@ from crypto_newsletter.web.models import (
     NewsletterResponse,
     NewsletterUpdateRequest,
     PublisherResponse,
+    SignalAnomalyResponse,
+    SignalConnectionResponse,
+    SignalResponse,
+    SignalTypeSummaryResponse,
+    SimilarArticleResponse,
     StatsResponse,
     TaskScheduleRequest,
 )
-from fastapi import APIRouter, HTTPException, Query, Response, Security
+from crypto_newsletter.web.responses import json_response
+from fastapi import APIRouter, HTTPException, Query, Request, Response, Security
+from fastapi.responses import StreamingResponse
 from fastapi.security.api_key import APIKeyHeader
 
 router = APIRouter()
@@ -87,7 +118,7 @@ async def get_articles(
         List of articles matching criteria
     """
     try:
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             repo = ArticleRepository(db)
 
             # Get articles with filters
@@ -106,27 +137,30 @@ async def get_articles(
             )
 
             # Convert to response models
-            return [
-                ArticleResponse(
-                    id=article["id"],
-                    external_id=article.get("external_id", 0),
-                    title=article["title"],
-                    subtitle=article.get("subtitle"),
-                    url=article["url"],
-                    published_on=article["published_on"],
-                    publisher_id=article.get("publisher_id"),
-                    language=article.get("language"),
-                    status=article.get("status", "ACTIVE"),
-                    body_length=article.get("body_length", 0),
-                )
-                for article in articles
-            ]
+            return json_response(
+                [
+                    ArticleResponse(
+                        id=article["id"],
+                        external_id=article.get("external_id", 0),
+                        title=article["title"],
+                        subtitle=article.get("subtitle"),
+                        url=article["url"],
+                        published_on=article["published_on"],
+                        publisher_id=article.get("publisher_id"),
+                        language=article.get("language"),
+                        status=article.get("status", "ACTIVE"),
+                        body_length=article.get("body_length", 0),
+                    )
+                    for article in articles
+                ]
+            )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch articles: {e}")
 
 
 @router.get("/publishers", response_model=list[PublisherResponse])
+@cached_endpoint(tags=[PUBLISHERS], ttl=300)
 async def get_publishers(
     api_key: Optional[str] = Security(get_api_key),
 ) -> list[PublisherResponse]:
@@ -140,7 +174,7 @@ async def get_publishers(
         List of all publishers
     """
     try:
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             repo = ArticleRepository(db)
             publishers = await repo.get_all_publishers_dict()
 
@@ -162,6 +196,7 @@ async def get_publishers(
 
 
 @router.get("/stats", response_model=StatsResponse)
+@cached_endpoint(tags=[ARTICLES, PUBLISHERS])
 async def get_stats(
     api_key: Optional[str] = Security(get_api_key),
 ) -> StatsResponse:
@@ -175,7 +210,7 @@ async def get_stats(
         System statistics
     """
     try:
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             repo = ArticleRepository(db)
             stats = await repo.get_article_statistics()
 
@@ -193,6 +228,7 @@ async def get_stats(
 
 
 @router.get("/newsletters/stats", response_model=dict)
+@cached_endpoint(tags=[NEWSLETTERS])
 async def get_newsletter_stats(
     days: int = Query(30, description="Number of days to include in stats", le=365),
     api_key: Optional[str] = Security(get_api_key),
@@ -208,7 +244,7 @@ async def get_newsletter_stats(
         Enhanced newsletter statistics with quality and content metrics
     """
     try:
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             newsletter_repo = NewsletterRepository(db)
 
             # Get newsletters from the specified period
@@ -254,7 +290,7 @@ async def get_analysis_ready_articles(
         List of analysis-ready articles
     """
     try:
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             repo = ArticleRepository(db)
 
             # Get analysis-ready articles
@@ -266,21 +302,23 @@ async def get_analysis_ready_articles(
             )
 
             # Convert to response models
-            return [
-                ArticleResponse(
-                    id=article["id"],
-                    external_id=article.get("external_id", 0),
-                    title=article["title"],
-                    subtitle=article.get("subtitle"),
-                    url=article["url"],
-                    published_on=article["published_on"],
-                    publisher_id=article.get("publisher_id"),
-                    language=article.get("language"),
-                    status=article.get("status", "ACTIVE"),
-                    body_length=article.get("body_length", 0),
-                )
-                for article in articles
-            ]
+            return json_response(
+                [
+                    ArticleResponse(
+                        id=article["id"],
+                        external_id=article.get("external_id", 0),
+                        title=article["title"],
+                        subtitle=article.get("subtitle"),
+                        url=article["url"],
+                        published_on=article["published_on"],
+                        publisher_id=article.get("publisher_id"),
+                        language=article.get("language"),
+                        status=article.get("status", "ACTIVE"),
+                        body_length=article.get("body_length", 0),
+                    )
+                    for article in articles
+                ]
+            )
 
     except Exception as e:
         raise HTTPException(
@@ -291,11 +329,15 @@ async def get_analysis_ready_articles(
 @router.get("/articles/{article_id}")
 async def get_article(
     article_id: int,
+    request: Request,
     api_key: Optional[str] = Security(get_api_key),
 ) -> dict[str, Any]:
     """
     Get detailed information about a specific article.
 
+    Supports conditional GET: a matching If-None-Match or If-Modified-Since
+    gets a 304, without a database query when the validator is cached.
+
     Args:
         article_id: ID of the article to retrieve
         api_key: Optional API key for authentication
@@ -303,8 +345,13 @@ async def get_article(
     Returns:
         Detailed article information
     """
+    validators = ValidatorCache(f"article:{article_id}", [ARTICLES])
+    not_modified = await validators.lookup(request)
+    if not_modified is not None:
+        return not_modified
+
     try:
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             repo = ArticleRepository(db)
             article = await repo.get_article_by_id(article_id)
 
@@ -313,7 +360,9 @@ async def get_article(
                     status_code=404, detail=f"Article with ID {article_id} not found"
                 )
 
-            return article
+        validator = article_validator(article)
+        await validators.store(validator)
+        return validator.respond(request, json_response(article))
 
     except HTTPException:
         raise
@@ -321,6 +370,289 @@ async def get_article(
         raise HTTPException(status_code=500, detail=f"Failed to fetch article: {e}")
 
 
+@router.get(
+    "/articles/{article_id}/similar", response_model=list[SimilarArticleResponse]
+)
+async def get_similar_articles(
+    article_id: int,
+    k: int = Query(10, ge=1, le=100, description="Number of similar articles"),
+    api_key: Optional[str] = Security(get_api_key),
+) -> list[SimilarArticleResponse]:
+    """
+    Get the articles most similar to an article by embedding cosine similarity.
+
+    Neighbours come from the in-memory vector index, so this does not scan
+    article_embeddings.
+    """
+    try:
+        async with get_read_session() as db:
+            similar = await EmbeddingRepository(db).find_similar_to_article(
+                article_id, k=k
+            )
+
+        if similar is None:
+            raise HTTPException(
+                status_code=404, detail=f"Article with ID {article_id} not found"
+            )
+        return json_response([SimilarArticleResponse(**article) for article in similar])
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to fetch similar articles: {e}"
+        )
+
+
+def _signal_window(
+    hours_back: int, start_date: Optional[str], end_date: Optional[str]
+) -> tuple[datetime, Optional[datetime]]:
+    """Resolve the detection window; start_date overrides hours_back."""
+    try:
+        since = (
+            datetime.fromisoformat(start_date)
+            if start_date
+            else datetime.now(UTC) - timedelta(hours=hours_back)
+        )
+        until = datetime.fromisoformat(end_date) if end_date else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid date: {e}")
+    return since, until
+
+
+@router.get("/signals", response_model=list[SignalResponse])
+async def get_signals(
+    signal_type: Optional[str] = Query(None, description="Exact signal type"),
+    min_confidence: float = Query(
+        0.0, ge=0.0, le=1.0, description="Minimum signal confidence"
+    ),
+    hours_back: int = Query(168, ge=1, description="Detected in the last N hours"),
+    start_date: Optional[str] = Query(
+        None, description="Detected at or after (ISO 8601, overrides hours_back)"
+    ),
+    end_date: Optional[str] = Query(None, description="Detected before (ISO 8601)"),
+    order_by: str = Query("detected_at", description="detected_at or score"),
+    limit: int = Query(100, description="Maximum number of signals", le=500),
+    offset: int = Query(0, description="Number of signals to skip"),
+    api_key: Optional[str] = Security(get_api_key),
+) -> list[SignalResponse]:
+    """
+    Get weak signals by type, confidence and detection time.
+
+    Served from the normalized signals table, e.g. all regulatory signals
+    above 0.7 confidence this week:
+    ``/api/signals?signal_type=regulatory_shift&min_confidence=0.7``
+    """
+    since, until = _signal_window(hours_back, start_date, end_date)
+    try:
+        async with get_read_session() as db:
+            signals = await SignalRepository(db).get_signals(
+                since,
+                until=until,
+                signal_type=signal_type,
+                min_confidence=min_confidence,
+                limit=limit,
+                offset=offset,
+                order_by=order_by,
+            )
+        return json_response([SignalResponse(**signal) for signal in signals])
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch signals: {e}")
+
+
+@router.get("/signals/types", response_model=list[SignalTypeSummaryResponse])
+async def get_signal_types(
+    min_confidence: float = Query(
+        0.0, ge=0.0, le=1.0, description="Minimum signal confidence"
+    ),
+    hours_back: int = Query(168, ge=1, description="Detected in the last N hours"),
+    start_date: Optional[str] = Query(
+        None, description="Detected at or after (ISO 8601, overrides hours_back)"
+    ),
+    end_date: Optional[str] = Query(None, description="Detected before (ISO 8601)"),
+    api_key: Optional[str] = Security(get_api_key),
+) -> list[SignalTypeSummaryResponse]:
+    """Get signal counts and confidence per signal type in a time window."""
+    since, until = _signal_window(hours_back, start_date, end_date)
+    try:
+        async with get_read_session() as db:
+            summary = await SignalRepository(db).get_signal_type_summary(
+                since, until=until, min_confidence=min_confidence
+            )
+        return json_response([SignalTypeSummaryResponse(**row) for row in summary])
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to fetch signal types: {e}"
+        )
+
+
+@router.get("/signals/anomalies", response_model=list[SignalAnomalyResponse])
+async def get_signal_anomalies(
+    min_significance: float = Query(
+        0.0, ge=0.0, le=1.0, description="Minimum deviation significance"
+    ),
+    hours_back: int = Query(168, ge=1, description="Detected in the last N hours"),
+    start_date: Optional[str] = Query(
+        None, description="Detected at or after (ISO 8601, overrides hours_back)"
+    ),
+    end_date: Optional[str] = Query(None, description="Detected before (ISO 8601)"),
+    order_by: str = Query("detected_at", description="detected_at or score"),
+    limit: int = Query(100, description="Maximum number of anomalies", le=500),
+    offset: int = Query(0, description="Number of anomalies to skip"),
+    api_key: Optional[str] = Security(get_api_key),
+) -> list[SignalAnomalyResponse]:
+    """Get pattern anomalies by significance and detection time."""
+    since, until = _signal_window(hours_back, start_date, end_date)
+    try:
+        async with get_read_session() as db:
+            anomalies = await SignalRepository(db).get_anomalies(
+                since,
+                until=until,
+                min_significance=min_significance,
+                limit=limit,
+                offset=offset,
+                order_by=order_by,
+            )
+        return json_response(
+            [SignalAnomalyResponse(**anomaly) for anomaly in anomalies]
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch anomalies: {e}")
+
+
+@router.get("/signals/connections", response_model=list[SignalConnectionResponse])
+async def get_signal_connections(
+    external_domain: Optional[str] = Query(
+        None, description="Exact external domain (e.g. regulation)"
+    ),
+    min_relevance: float = Query(
+        0.0, ge=0.0, le=1.0, description="Minimum connection relevance"
+    ),
+    hours_back: int = Query(168, ge=1, description="Detected in the last N hours"),
+    start_date: Optional[str] = Query(
+        None, description="Detected at or after (ISO 8601, overrides hours_back)"
+    ),
+    end_date: Optional[str] = Query(None, description="Detected before (ISO 8601)"),
+    order_by: str = Query("detected_at", description="detected_at or score"),
+    limit: int = Query(100, description="Maximum number of connections", le=500),
+    offset: int = Query(0, description="Number of connections to skip"),
+    api_key: Optional[str] = Security(get_api_key),
+) -> list[SignalConnectionResponse]:
+    """Get adjacent connections by domain, relevance and detection time."""
+    since, until = _signal_window(hours_back, start_date, end_date)
+    try:
+        async with get_read_session() as db:
+            connections = await SignalRepository(db).get_connections(
+                since,
+                until=until,
+                external_domain=external_domain,
+                min_relevance=min_relevance,
+                limit=limit,
+                offset=offset,
+                order_by=order_by,
+            )
+        return json_response(
+            [SignalConnectionResponse(**connection) for connection in connections]
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch connections: {e}")
+
+
+# Exports without an API key: recent articles only, no bodies
+ANONYMOUS_EXPORT_MAX_DAYS = 7
+
+
+def _check_anonymous_export(query: ExportQuery) -> None:
+    """Refuse bodies and windows past ANONYMOUS_EXPORT_MAX_DAYS without a key."""
+    if query.include_body:
+        raise HTTPException(
+            status_code=403, detail="An API key is required to export bodies"
+        )
+    earliest = datetime.now(UTC) - timedelta(days=ANONYMOUS_EXPORT_MAX_DAYS)
+    since = query.since
+    if since is not None and since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    if since is None or since < earliest - timedelta(minutes=1):
+        raise HTTPException(
+            status_code=403,
+            detail=(
+                "An API key is required to export more than the last "
+                f"{ANONYMOUS_EXPORT_MAX_DAYS} days"
+            ),
+        )
+
+
+@router.get("/export")
+async def export_articles(
+    format: str = Query("ndjson", description="ndjson, csv or parquet"),
+    compression: str = Query("none", description="none, gzip or zstd"),
+    days: Optional[int] = Query(
+        7, ge=0, description="Published in the last N days (0 for all)"
+    ),
+    start_date: Optional[str] = Query(
+        None, description="Published at or after (ISO 8601, overrides days)"
+    ),
+    end_date: Optional[str] = Query(None, description="Published before (ISO 8601)"),
+    status: Optional[str] = Query("ACTIVE", description="Filter by article status"),
+    publisher_id: Optional[int] = Query(None, description="Filter by publisher ID"),
+    include_analysis: bool = Query(
+        False, description="Add fields from each article's latest analysis"
+    ),
+    include_body: bool = Query(False, description="Include article bodies"),
+    api_key: Optional[str] = Security(get_api_key),
+) -> StreamingResponse:
+    """
+    Stream articles as NDJSON, CSV or Parquet.
+
+    Rows are read through a server-side cursor and encoded chunk by chunk, so
+    exports of any size run in constant memory on both ends, e.g.
+    ``/api/export?format=parquet&days=0&include_analysis=true``
+
+    Without an API key, exports are limited to the last
+    ANONYMOUS_EXPORT_MAX_DAYS days and exclude article bodies.
+    """
+    try:
+        check_export_options(format, compression)
+        query = ExportQuery.last_days(
+            days,
+            status=status,
+            publisher_id=publisher_id,
+            include_body=include_body,
+            include_analysis=include_analysis,
+        )
+        if start_date:
+            query.since = datetime.fromisoformat(start_date)
+        if end_date:
+            query.until = datetime.fromisoformat(end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ImportError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    if api_key is None:
+        _check_anonymous_export(query)
+
+    filename = export_filename(format, compression)
+    return StreamingResponse(
+        stream_export(query, format, compression),
+        media_type=export_media_type(format, compression),
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+        },
+    )
+
+
 # Webhook endpoint for external triggers (future use)
 @router.post("/webhook/trigger-ingest")
 async def webhook_trigger_ingest(
@@ -393,6 +725,7 @@ async def webhook_trigger_ingest(
 # Newsletter endpoints
 @router.get("/newsletters", response_model=NewsletterListResponse)
 async def get_newsletters(
+    request: Request,
     limit: int = Query(
         10, description="Maximum number of newsletters to return", le=100
     ),
@@ -410,6 +743,9 @@ async def get_newsletters(
     """
     Get list of newsletters with optional filtering.
 
+    The response carries an ETag and a Last-Modified of the newest newsletter
+    on the page; conditional requests get a 304.
+
     Args:
         limit: Maximum number of newsletters to return
         offset: Number of newsletters to skip for pagination
@@ -422,8 +758,43 @@ async def get_newsletters(
     Returns:
         List of newsletters matching criteria with pagination info
     """
+    page = await _newsletter_page(
+        limit=limit,
+        offset=offset,
+        status=status,
+        newsletter_type=newsletter_type,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    return _newsletter_page_validator(page).respond(request, json_response(page))
+
+
+def _newsletter_page_validator(page: dict[str, Any]) -> Validator:
+    """Validators of a newsletter list page, from its items' versions."""
+    newsletters = page["newsletters"]
+    versions = [(n["id"], n["updated_at"]) for n in newsletters]
+    last_modified = max(
+        (datetime.fromisoformat(n["updated_at"]) for n in newsletters), default=None
+    )
+    return Validator(
+        etag=strong_etag("newsletters", page["total_count"], *versions),
+        last_modified=http_date(last_modified) if last_modified else None,
+        cache_control=REVALIDATE,
+    )
+
+
+@cached_endpoint(tags=[NEWSLETTERS], namespace="api.newsletters")
+async def _newsletter_page(
+    limit: int,
+    offset: int,
+    status: Optional[str],
+    newsletter_type: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+) -> NewsletterListResponse:
+    """Load one page of newsletters (cached; see get_newsletters)."""
     try:
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             newsletter_repo = NewsletterRepository(db)
 
             # Get newsletters with filters
@@ -483,6 +854,7 @@ async def get_newsletters(
 @router.get("/newsletters/{newsletter_id}", response_model=NewsletterResponse)
 async def get_newsletter(
     newsletter_id: int,
+    request: Request,
     api_key: Optional[str] = Security(get_api_key),
 ) -> NewsletterResponse:
     """
@@ -493,10 +865,15 @@ async def get_newsletter(
         api_key: Optional API key for authentication
 
     Returns:
-        Newsletter details
+        Newsletter details (304 if the client's copy is current)
     """
+    validators = ValidatorCache(f"newsletter:{newsletter_id}:json", [NEWSLETTERS])
+    not_modified = await validators.lookup(request)
+    if not_modified is not None:
+        return not_modified
+
     try:
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             newsletter_repo = NewsletterRepository(db)
 
             newsletter = await newsletter_repo.get_newsletter_by_id(newsletter_id)
@@ -506,7 +883,8 @@ async def get_newsletter(
                     detail=f"Newsletter with ID {newsletter_id} not found",
                 )
 
-            return NewsletterResponse(
+            validator = newsletter_validator(newsletter, "json")
+            body = NewsletterResponse(
                 id=newsletter.id,
                 title=newsletter.title,
                 content=newsletter.content,
@@ -523,6 +901,9 @@ async def get_newsletter(
                 updated_at=newsletter.updated_at.isoformat(),
             )
 
+        await validators.store(validator)
+        return validator.respond(request, json_response(body))
+
     except HTTPException:
         raise
     except Exception as e:
@@ -531,9 +912,53 @@ async def get_newsletter(
         )
 
 
+async def _rendition_response(
+    newsletter_id: int, variant: str, media_type: str, request: Request
+) -> Response:
+    """Serve a pre-rendered newsletter variant with conditional GET support."""
+    validators = ValidatorCache(f"newsletter:{newsletter_id}:{variant}", [NEWSLETTERS])
+    not_modified = await validators.lookup(request)
+    if not_modified is not None:
+        return not_modified
+
+    try:
+        async with get_read_session() as db:
+            newsletter_storage = NewsletterStorage(db)
+            newsletter = await newsletter_storage.get_newsletter_by_id(
+                newsletter_id, include_articles=False
+            )
+            body = (
+                await newsletter_storage.get_rendition(newsletter, variant)
+                if newsletter
+                else None
+            )
+
+            if not body:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Newsletter with ID {newsletter_id} not found",
+                )
+            # Template changes re-render without touching updated_at
+            validator = newsletter_validator(newsletter, f"{variant}:{RENDER_VERSION}")
+
+        await validators.store(validator)
+        return validator.respond(request, Response(content=body, media_type=media_type))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to retrieve newsletter {variant}: {e}"
+        )
+
+
 @router.get("/newsletters/{newsletter_id}/html")
 async def get_newsletter_html(
     newsletter_id: int,
+    request: Request,
+    variant: str = Query(
+        "html", pattern="^(html|email)$", description="html (web) or email"
+    ),
     api_key: Optional[str] = Security(get_api_key),
 ):
     """
@@ -541,30 +966,33 @@ async def get_newsletter_html(
 
     Args:
         newsletter_id: Newsletter ID to retrieve
+        variant: ``html`` for the web page, ``email`` for email-safe HTML
+            with inline styles
         api_key: Optional API key for authentication
 
     Returns:
-        HTML formatted newsletter content
+        HTML formatted newsletter content (304 if the client's copy is current)
     """
-    try:
-        async with get_db_session() as db:
-            newsletter_storage = NewsletterStorage(db)
-            html_content = await newsletter_storage.get_newsletter_html(newsletter_id)
+    return await _rendition_response(newsletter_id, variant, "text/html", request)
 
-            if not html_content:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Newsletter with ID {newsletter_id} not found",
-                )
 
-            return Response(content=html_content, media_type="text/html")
+@router.get("/newsletters/{newsletter_id}/text")
+async def get_newsletter_text(
+    newsletter_id: int,
+    request: Request,
+    api_key: Optional[str] = Security(get_api_key),
+):
+    """
+    Get newsletter content as plain text (e.g. the text part of an email).
+
+    Args:
+        newsletter_id: Newsletter ID to retrieve
+        api_key: Optional API key for authentication
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to retrieve newsletter HTML: {e}"
-        )
+    Returns:
+        Plain text newsletter content (304 if the client's copy is current)
+    """
+    return await _rendition_response(newsletter_id, TEXT, "text/plain", request)
 
 
 @router.post("/newsletters/generate")
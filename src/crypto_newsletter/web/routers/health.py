@@ -7,7 +7,11 @@ from typing import Any
 from crypto_newsletter.core.ingestion import pipeline_health_check
 from crypto_newsletter.newsletter.monitoring import get_newsletter_health_status
 from crypto_newsletter.shared.config.settings import get_settings
-from crypto_newsletter.shared.database.connection import get_db_session
+from crypto_newsletter.shared.database.connection import (
+    get_db_manager,
+    get_db_session,
+    get_read_session,
+)
 from crypto_newsletter.shared.logging.config import get_logger
 from crypto_newsletter.shared.monitoring.metrics import (
     get_metrics_collector,
@@ -194,10 +198,13 @@ async def metrics_endpoint() -> dict[str, Any]:
         db_metrics = await collector.collect_database_metrics()
         task_metrics = collector.collect_task_metrics()
 
+        # Adaptive LLM concurrency of this process, per model
+        from crypto_newsletter.analysis.concurrency import llm_concurrency_metrics
+
         # Legacy database statistics for backward compatibility
         from crypto_newsletter.core.storage.repository import ArticleRepository
 
-        async with get_db_session() as db:
+        async with get_read_session() as db:
             repo = ArticleRepository(db)
             legacy_stats = await repo.get_statistics()
 
@@ -227,9 +234,15 @@ async def metrics_endpoint() -> dict[str, Any]:
                 "articles_today": db_metrics.articles_today,
                 "connection_count": db_metrics.connection_count,
                 "active_queries": db_metrics.active_queries,
+                "avg_query_time_ms": db_metrics.avg_query_time_ms,
+                "slow_queries_count": db_metrics.slow_queries_count,
+                "total_queries": db_metrics.total_queries,
+                "heaviest_queries": db_metrics.heaviest_queries,
+                "slowest_queries": db_metrics.slowest_queries,
                 # Legacy compatibility
                 "total_publishers": legacy_stats.get("total_publishers", 0),
                 "total_categories": legacy_stats.get("total_categories", 0),
+                "read_replicas": get_db_manager().replica_status(),
             },
             "tasks": {
                 "active_tasks": task_metrics.active_tasks,
@@ -238,6 +251,7 @@ async def metrics_endpoint() -> dict[str, Any]:
                 "failed_today": task_metrics.failed_tasks_today,
                 "queue_lengths": task_metrics.queue_lengths,
             },
+            "llm_concurrency": llm_concurrency_metrics(),
         }
 
         metrics_logger.info(
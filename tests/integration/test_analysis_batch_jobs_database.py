@@ -0,0 +1,215 @@
+"""Integration tests for backlog analysis through provider batch jobs.
+
+Submits, polls and stores a job through the stub backend against
+PostgreSQL. Requires DATABASE_URL to point at a PostgreSQL server; skipped
+otherwise.
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+from sqlalchemy import create_engine, select, text
+
+from crypto_newsletter.analysis import budget
+from crypto_newsletter.analysis.agents import orchestrator as orchestrator_module
+from crypto_newsletter.analysis.agents.settings import analysis_settings
+from crypto_newsletter.analysis.batch_jobs import (
+    StubBatchBackend,
+    poll_analysis_batch,
+    stub_content_analysis,
+    submit_analysis_batch,
+)
+from crypto_newsletter.analysis.budget import LocalBudgetLedger
+from crypto_newsletter.shared.database import connection
+from crypto_newsletter.shared.database.connection import DatabaseManager
+from crypto_newsletter.shared.models import AnalysisBatchJob, ArticleAnalysis, Base
+
+DATABASE = "analysis_batch_jobs_check"
+BODY = "Bitcoin miners moved 12,000 BTC to exchanges on Monday. " * 60
+
+
+def _base_url() -> str | None:
+    url = os.environ.get("DATABASE_URL", "")
+    if not url.startswith(("postgresql", "postgres")):
+        return None
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1).replace(
+        "postgres://", "postgresql://", 1
+    )
+
+
+@pytest.fixture
+def batch_db():
+    """Dedicated database with five backlog articles, one already analyzed."""
+    url = _base_url()
+    if url is None:
+        pytest.skip("DATABASE_URL is not a PostgreSQL URL")
+
+    admin_engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE}"))
+            conn.execute(text(f"CREATE DATABASE {DATABASE}"))
+    except Exception as e:
+        admin_engine.dispose()
+        pytest.skip(f"PostgreSQL not reachable: {e}")
+
+    database_url = admin_engine.url.set(database=DATABASE)
+    engine = create_engine(database_url)
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        conn.execute(
+            text(
+                "INSERT INTO publishers (id, source_id, source_key, name, status) "
+                "VALUES (1, 1, 'coindesk', 'CoinDesk', 'ACTIVE')"
+            )
+        )
+        for n in range(1, 6):
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO articles (
+                        id, external_id, guid, title, url, body, status,
+                        publisher_id, upvotes, downvotes, score, published_on
+                    )
+                    VALUES (:n, :n, 'guid-' || :n, 'Article ' || :n,
+                            'https://x/' || :n, :body, 'ACTIVE', 1, 0, 0, 0,
+                            now())
+                    """
+                ),
+                {"n": n, "body": BODY},
+            )
+        conn.execute(
+            text(
+                "INSERT INTO article_analyses "
+                "(article_id, analysis_version, sentiment, validation_status) "
+                "VALUES (5, '1.0', 'NEUTRAL', 'COMPLETED')"
+            )
+        )
+    engine.dispose()
+
+    manager = DatabaseManager()
+    manager.initialize(database_url.render_as_string(hide_password=False))
+    patch = pytest.MonkeyPatch()
+    patch.setattr(connection, "_db_manager", manager)
+
+    yield
+
+    patch.undo()
+    manager._discard_all()
+    with admin_engine.connect() as conn:
+        conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE} WITH (FORCE)"))
+    admin_engine.dispose()
+
+
+def _responder(request: dict) -> str:
+    prompt = request["contents"][0]["parts"][0]["text"]
+    if prompt.startswith("TITLE: Article 3\n"):
+        return json.dumps({"sentiment": "POSITIVE"})  # fails validation
+    return stub_content_analysis(request)
+
+
+@pytest.mark.integration
+def test_backlog_job_is_submitted_polled_and_stored(batch_db, tmp_path, monkeypatch):
+    def no_interactive_calls():
+        raise AssertionError("batch jobs must not use the interactive rate limiter")
+
+    monkeypatch.setattr(
+        orchestrator_module, "get_llm_rate_limiter", no_interactive_calls
+    )
+    ledger = LocalBudgetLedger(daily_budget=10.0)
+    monkeypatch.setattr(budget, "_budget_ledger", ledger)
+    backend = StubBatchBackend(tmp_path, completion_seconds=0.3, responder=_responder)
+
+    async def scenario():
+        async with connection.get_db_session() as db:
+            job = await submit_analysis_batch(db, [1, 2, 3, 4, 5], backend)
+            held = ledger.usage_sync()
+            # Articles of an open job are not submitted twice
+            duplicate = await submit_analysis_batch(db, [1, 2], backend)
+            running = await poll_analysis_batch(db, job, backend)
+            # Article 4 gets analyzed interactively meanwhile
+            await db.execute(
+                text(
+                    "INSERT INTO article_analyses "
+                    "(article_id, analysis_version, sentiment, validation_status) "
+                    "VALUES (4, '1.0', 'NEUTRAL', 'COMPLETED')"
+                )
+            )
+            await asyncio.sleep(0.35)
+            finished = await poll_analysis_batch(db, job, backend)
+            again = await poll_analysis_batch(db, job, backend)
+            rows = (
+                await db.execute(
+                    select(
+                        ArticleAnalysis.article_id,
+                        ArticleAnalysis.summary,
+                        ArticleAnalysis.validation_status,
+                        ArticleAnalysis.cost_usd,
+                    ).order_by(ArticleAnalysis.article_id)
+                )
+            ).all()
+            stored_job = await db.get(AnalysisBatchJob, job.id)
+            return job, held, duplicate, running, finished, again, rows, stored_job
+
+    job, held, duplicate, running, finished, again, rows, stored_job = asyncio.run(
+        scenario()
+    )
+
+    assert job.article_ids == [1, 2, 3, 4]
+    assert duplicate is None
+    assert running == {"done": False, "job_id": job.id, "status": "RUNNING"}
+    assert finished["status"] == "COMPLETED"
+    assert finished["articles_stored"] == 2
+    # Article 3's response failed validation; it stays unanalyzed
+    assert finished["articles_failed"] == 1
+    assert finished["cost_usd"] > 0
+    assert again == {"done": True, "job_id": job.id, "status": "COMPLETED"}
+
+    batch_rows = {row.article_id: row for row in rows if row.article_id in (1, 2)}
+    assert [row.article_id for row in rows] == [1, 2, 4, 5]
+    assert batch_rows[1].summary == "Stub analysis of Article 1."
+    assert batch_rows[1].validation_status == "PENDING"
+    assert batch_rows[1].cost_usd > 0
+    assert stored_job.completed_at is not None
+
+    # The estimate was held from submission and settled with the actual cost
+    assert held["reserved"] == pytest.approx(float(job.estimated_cost_usd), abs=1e-4)
+    assert held["reserved"] > finished["cost_usd"]
+    settled = ledger.usage_sync()
+    assert settled["reserved"] == 0 and settled["analyses"] == 2
+    assert settled["spent"] == pytest.approx(finished["cost_usd"], abs=1e-6)
+
+
+@pytest.mark.integration
+def test_timed_out_job_is_cancelled_at_the_provider(batch_db, tmp_path, monkeypatch):
+    ledger = LocalBudgetLedger(daily_budget=10.0)
+    monkeypatch.setattr(budget, "_budget_ledger", ledger)
+    backend = StubBatchBackend(tmp_path, completion_seconds=3600)
+    cancel = backend.cancel
+    failures = [ConnectionError("provider unreachable")]
+
+    async def flaky_cancel(job_id):
+        if failures:
+            raise failures.pop()
+        await cancel(job_id)
+
+    monkeypatch.setattr(backend, "cancel", flaky_cancel)
+
+    async def scenario():
+        async with connection.get_db_session() as db:
+            job = await submit_analysis_batch(db, [1, 2], backend)
+            monkeypatch.setattr(analysis_settings, "batch_job_timeout_hours", 0.0)
+            # The cancel request fails: the job stays open and is polled again
+            retried = await poll_analysis_batch(db, job, backend)
+            expired = await poll_analysis_batch(db, job, backend)
+            return job, retried, expired, await backend.status(job.provider_job_id)
+
+    job, retried, expired, provider_status = asyncio.run(scenario())
+
+    assert retried == {"done": False, "job_id": job.id, "status": "RUNNING"}
+    assert expired["status"] == "EXPIRED"
+    assert provider_status.state == "CANCELLED"
+    usage = ledger.usage_sync()
+    assert usage["reserved"] == 0 and usage["spent"] == 0
@@ -0,0 +1,208 @@
+"""Integration tests for article embeddings and similar-article search.
+
+Requires DATABASE_URL to point at a PostgreSQL server; skipped otherwise.
+"""
+
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+
+from crypto_newsletter.core.embeddings import (
+    EmbeddingService,
+    HashingEmbedder,
+    VectorIndex,
+    reset_similarity_index,
+)
+from crypto_newsletter.core.storage.repository import EmbeddingRepository
+from crypto_newsletter.shared.database import connection
+from crypto_newsletter.shared.database.connection import DatabaseManager
+from crypto_newsletter.shared.models import ArticleEmbedding, Base
+
+DATABASE = "article_similarity_check"
+
+ARTICLES = {
+    1: ("SEC approves spot Bitcoin ETF for BlackRock", "ACTIVE"),
+    2: ("Bitcoin ETF inflows surge after SEC approval", "ACTIVE"),
+    3: ("Solana validators ship fee reduction upgrade", "ACTIVE"),
+    4: ("Ethereum staking withdrawals hit record", "ACTIVE"),
+    5: ("Bitcoin ETF approval rumours denied by SEC", "DELETED"),
+}
+
+
+def _base_url() -> str | None:
+    url = os.environ.get("DATABASE_URL", "")
+    if not url.startswith(("postgresql", "postgres")):
+        return None
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1).replace(
+        "postgres://", "postgresql://", 1
+    )
+
+
+@pytest.fixture(scope="module")
+def similarity_db_url():
+    """Dedicated database with a handful of articles and no embeddings."""
+    url = _base_url()
+    if url is None:
+        pytest.skip("DATABASE_URL is not a PostgreSQL URL")
+
+    admin_engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE}"))
+            conn.execute(text(f"CREATE DATABASE {DATABASE}"))
+    except Exception as e:
+        admin_engine.dispose()
+        pytest.skip(f"PostgreSQL not reachable: {e}")
+
+    database_url = admin_engine.url.set(database=DATABASE)
+    engine = create_engine(database_url)
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        conn.execute(
+            text(
+                "INSERT INTO publishers (id, source_id, source_key, name, status) "
+                "VALUES (1, 1, 'coindesk', 'CoinDesk', 'ACTIVE')"
+            )
+        )
+        for article_id, (title, status) in ARTICLES.items():
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO articles (
+                        id, external_id, guid, title, url, status, body,
+                        publisher_id, upvotes, downvotes, score, published_on
+                    )
+                    VALUES (:n, :n, 'guid-' || :n, :title, 'https://x/' || :n,
+                            :status, :title, 1, 0, 0, 0, now())
+                    """
+                ),
+                {"n": article_id, "title": title, "status": status},
+            )
+    engine.dispose()
+
+    yield database_url.render_as_string(hide_password=False)
+
+    with admin_engine.connect() as conn:
+        conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE} WITH (FORCE)"))
+    admin_engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def service(similarity_db_url, tmp_path_factory):
+    """Embedding service bound to the similarity database with a temp index."""
+    manager = DatabaseManager()
+    manager.initialize(similarity_db_url)
+    patch = pytest.MonkeyPatch()
+    patch.setattr(connection, "_db_manager", manager)
+    reset_similarity_index()
+
+    yield EmbeddingService(
+        embedder=HashingEmbedder(dimension=128),
+        index_path=str(tmp_path_factory.mktemp("embeddings") / "articles"),
+        batch_size=2,
+    )
+
+    reset_similarity_index()
+    patch.undo()
+    manager._discard_all()
+
+
+async def _embedding_count() -> int:
+    async with connection.get_db_session() as db:
+        return await db.scalar(select(func.count(ArticleEmbedding.id)))
+
+
+async def _similar(service: EmbeddingService, article_id: int, k: int = 2):
+    async with connection.get_db_session() as db:
+        return await EmbeddingRepository(db, service).find_similar_to_article(
+            article_id, k=k
+        )
+
+
+@pytest.mark.integration
+def test_update_embeds_active_articles_and_saves_index(service):
+    report = asyncio.run(service.update())
+
+    assert report["articles_embedded"] == 4
+    assert report["index_size"] == 4
+    assert asyncio.run(_embedding_count()) == 4
+    # Nothing pending: a second run embeds nothing
+    assert asyncio.run(service.embed_pending_articles()) == 0
+
+    saved = VectorIndex.load(service.index_path)
+    assert len(saved) == 4
+    assert saved.watermark is not None
+
+
+@pytest.mark.integration
+def test_find_similar_to_article(service):
+    asyncio.run(service.update())
+
+    similar = asyncio.run(_similar(service, 1))
+    assert [article["id"] for article in similar][0] == 2
+    assert all(article["id"] != 1 for article in similar)
+    assert similar[0]["title"] == ARTICLES[2][0]
+    assert 0 < similar[0]["similarity"] <= 1
+
+    assert asyncio.run(_similar(service, 999)) is None
+
+
+@pytest.mark.integration
+def test_load_index_syncs_rows_written_since_save(service):
+    asyncio.run(service.update())
+    saved = VectorIndex.load(service.index_path)
+
+    async def add_article() -> None:
+        async with connection.get_db_session() as db:
+            await db.execute(
+                text(
+                    """
+                    INSERT INTO articles (
+                        id, external_id, guid, title, url, status,
+                        publisher_id, upvotes, downvotes, score, published_on
+                    )
+                    VALUES (6, 6, 'guid-6', 'Solana fee upgrade goes live',
+                            'https://x/6', 'ACTIVE', 1, 0, 0, 0, now())
+                    """
+                )
+            )
+
+    asyncio.run(add_article())
+    assert asyncio.run(service.embed_pending_articles()) == 1
+
+    index = asyncio.run(service.load_index())
+    assert len(index) == len(saved) + 1
+    assert index.search(index.get(6), k=2, exclude=[6])[0][0] == 3
+
+
+@pytest.mark.integration
+def test_sync_picks_up_rows_that_committed_late(service):
+    asyncio.run(service.update())
+    index = asyncio.run(service.load_index())
+
+    async def commit_late() -> None:
+        # Id and created_at taken before the index's newest row, committed
+        # after the index synced
+        async with connection.get_db_session() as db:
+            await db.execute(
+                text(
+                    """
+                    INSERT INTO article_embeddings (
+                        id, article_id, embedding, embedding_model,
+                        embedding_version, created_at
+                    )
+                    SELECT 0, 5, embedding, embedding_model, embedding_version,
+                           created_at - interval '1 second'
+                    FROM article_embeddings
+                    WHERE article_id = 1
+                    """
+                )
+            )
+
+    asyncio.run(commit_late())
+    assert 5 not in index
+
+    asyncio.run(service.sync_index(index))
+    assert 5 in index
@@ -0,0 +1,212 @@
+"""Integration tests for set-based article validation in BatchArticleIdentifier.
+
+Requires DATABASE_URL to point at a PostgreSQL server; skipped otherwise.
+"""
+
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from crypto_newsletter.newsletter.batch.identifier import BatchArticleIdentifier
+from crypto_newsletter.shared.models import Base
+
+SCHEMA = "batch_identifier_check"
+ARTICLE_COUNT = 12
+NOW = datetime.now(UTC)
+
+
+def _base_url() -> str | None:
+    url = os.environ.get("DATABASE_URL", "")
+    if not url.startswith(("postgresql", "postgres")):
+        return None
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1).replace(
+        "postgres://", "postgresql://", 1
+    )
+
+
+def _article_kind(n: int) -> str:
+    if n % 4 == 0:
+        return "analyzed"
+    if n % 5 == 0:
+        return "short"
+    return "valid"
+
+
+@pytest.fixture(scope="module")
+def seeded_engine():
+    """Schema with a mix of valid, short and already analyzed articles."""
+    url = _base_url()
+    if url is None:
+        pytest.skip("DATABASE_URL is not a PostgreSQL URL")
+
+    admin_engine = create_engine(url)
+    try:
+        with admin_engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    except Exception as e:
+        admin_engine.dispose()
+        pytest.skip(f"PostgreSQL not reachable: {e}")
+
+    engine = create_engine(url, connect_args={"options": f"-csearch_path={SCHEMA}"})
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        conn.execute(
+            text(
+                "INSERT INTO publishers (id, source_id, source_key, name, status) "
+                "VALUES (1, 1, 'coindesk', 'CoinDesk', 'ACTIVE')"
+            )
+        )
+        for n in range(1, ARTICLE_COUNT + 1):
+            body = "x" * (300 if _article_kind(n) == "short" else 1500 + n)
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO articles (
+                        id, external_id, guid, title, url, body, status,
+                        publisher_id, upvotes, downvotes, score, published_on
+                    )
+                    VALUES (:n, :n, 'guid-' || :n, 'Article ' || :n,
+                            'https://x/' || :n, :body, 'ACTIVE', 1, 0, 0, 0,
+                            :published)
+                    """
+                ),
+                {"n": n, "body": body, "published": NOW - timedelta(hours=n)},
+            )
+        conn.execute(
+            text(
+                """
+                INSERT INTO article_analyses (
+                    article_id, analysis_version, sentiment, validation_status
+                )
+                SELECT id, '1.0', 'NEUTRAL', 'COMPLETED'
+                FROM articles WHERE id % 4 = 0
+                """
+            )
+        )
+
+    yield engine
+
+    engine.dispose()
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    admin_engine.dispose()
+
+
+@pytest.fixture
+def statements(seeded_engine):
+    """Capture the SQL emitted through the sync engine."""
+    captured: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append(statement)
+
+    event.listen(seeded_engine, "before_cursor_execute", capture)
+    yield captured
+    event.remove(seeded_engine, "before_cursor_execute", capture)
+
+
+@pytest_asyncio.fixture
+async def async_db(seeded_engine):
+    engine = create_async_engine(
+        seeded_engine.url.set(drivername="postgresql+asyncpg"),
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+        yield session
+    await engine.dispose()
+
+
+def _ids(articles: list[dict]) -> set[int]:
+    return {article["id"] for article in articles}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_validation_single_query_matches_async(
+    seeded_engine, statements, async_db
+):
+    identifier = BatchArticleIdentifier()
+    all_ids = list(range(1, ARTICLE_COUNT + 1))
+
+    with Session(seeded_engine) as db:
+        few = identifier.validate_articles_for_processing_sync(db, all_ids[:3])
+        many = identifier.validate_articles_for_processing_sync(db, all_ids)
+
+    # One statement per call, identical text for any number of IDs
+    assert len(statements) == 2
+    assert statements[0] == statements[1]
+    assert few["validation_summary"]["total_articles"] == 3
+
+    expected_valid = {n for n in all_ids if _article_kind(n) == "valid"}
+    assert _ids(many["valid_articles"]) == expected_valid
+    issues = {
+        article["id"]: article["validation_issues"]
+        for article in many["invalid_articles"]
+    }
+    assert issues[4] == ["Already analyzed"]
+    assert issues[5] == ["Content too short: 300 chars"]
+    assert many["validation_summary"]["validation_passed"] is True
+
+    async_result = await identifier.validate_articles_for_processing(async_db, all_ids)
+    assert async_result == many
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_validated_candidates_in_one_query(seeded_engine, statements, async_db):
+    identifier = BatchArticleIdentifier()
+
+    with Session(seeded_engine) as db:
+        merged = identifier.get_validated_articles_sync(db, limit=5)
+        assert len(statements) == 1
+
+        candidates = identifier.get_analyzable_articles_sync(db, limit=5)
+        two_step = identifier.validate_articles_for_processing_sync(db, candidates)
+
+    assert merged == two_step
+    assert [article["id"] for article in merged["valid_articles"]] == [1, 2, 3, 6, 7]
+    assert merged["valid_articles"][0]["body_preview"].endswith("...")
+    assert await identifier.get_validated_articles(async_db, limit=5) == merged
+
+
+@pytest.mark.integration
+def test_older_quality_articles_excludes_by_array(seeded_engine):
+    identifier = BatchArticleIdentifier()
+
+    with Session(seeded_engine) as db:
+        everything = identifier._get_older_quality_articles_sync(db, limit=50)
+        remaining = identifier._get_older_quality_articles_sync(
+            db, limit=50, exclude_ids=everything[:3]
+        )
+
+    assert set(everything) == {
+        n for n in range(1, ARTICLE_COUNT + 1) if _article_kind(n) == "valid"
+    }
+    assert set(remaining) == set(everything[3:])
+
+
+@pytest.mark.integration
+def test_older_quality_articles_skip_open_batch_jobs(seeded_engine):
+    identifier = BatchArticleIdentifier()
+    jobs = text(
+        "INSERT INTO analysis_batch_jobs "
+        "(provider_job_id, backend, model, article_ids, status) VALUES "
+        "('open', 'stub', 'stub', '{1,2}', 'RUNNING'), "
+        "('done', 'stub', 'stub', '{3}', 'FAILED')"
+    )
+
+    with Session(seeded_engine) as db:
+        db.execute(jobs)
+        try:
+            candidates = identifier._get_older_quality_articles_sync(db, limit=50)
+        finally:
+            db.rollback()
+
+    assert {1, 2}.isdisjoint(candidates)
+    assert 3 in candidates
@@ -0,0 +1,84 @@
+"""Integration tests for the Redis budget ledger.
+
+Runs the ledger's Lua scripts against the server at REDIS_URL; skipped when
+no Redis server is reachable.
+"""
+
+import asyncio
+import os
+import uuid
+
+import pytest
+import redis
+
+from crypto_newsletter.analysis import budget
+from crypto_newsletter.analysis.budget import BudgetExceededError, RedisBudgetLedger
+
+
+@pytest.fixture
+def redis_url(monkeypatch):
+    url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+    client = redis.Redis.from_url(url)
+    try:
+        client.ping()
+    except redis.RedisError as e:
+        pytest.skip(f"Redis not reachable: {e}")
+    prefix = f"analysis-budget-test-{uuid.uuid4().hex}"
+    monkeypatch.setattr(budget, "KEY_PREFIX", prefix)
+
+    yield url
+
+    for key in client.scan_iter(f"{prefix}:*"):
+        client.delete(key)
+    client.close()
+
+
+@pytest.mark.integration
+def test_workers_share_one_budget(redis_url):
+    # Two workers, each with its own client and ledger
+    workers = [RedisBudgetLedger(1.0, redis_url=redis_url) for _ in range(2)]
+
+    async def analysis(ledger):
+        try:
+            reservation = await ledger.reserve(0.25, session_id="batch-1")
+        except BudgetExceededError:
+            return False
+        await asyncio.sleep(0.05)
+        await ledger.commit(reservation, 0.2)
+        return True
+
+    async def scenario():
+        await workers[0].open_session("batch-1", 0.75)
+        started = await asyncio.gather(*(analysis(workers[n % 2]) for n in range(10)))
+        return started, await workers[1].usage("batch-1")
+
+    started, session = asyncio.run(scenario())
+
+    # The session's sub-budget admits three of the ten
+    assert sum(started) == 3
+    assert session["spent"] == pytest.approx(0.6)
+    assert session["reserved"] == 0
+    usage = workers[0].usage_sync()
+    assert usage["spent"] == pytest.approx(0.6) and usage["analyses"] == 3
+    assert usage["remaining"] == pytest.approx(0.4)
+
+
+@pytest.mark.integration
+def test_expired_holds_are_reclaimed(redis_url):
+    ledger = RedisBudgetLedger(0.5, redis_url=redis_url, hold_seconds=0.1)
+
+    async def scenario():
+        abandoned = await ledger.reserve(0.5)
+        with pytest.raises(BudgetExceededError, match="Daily analysis budget"):
+            await ledger.reserve(0.25)
+        await asyncio.sleep(0.15)
+        reservation = await ledger.reserve(0.25)
+        await ledger.commit(abandoned, 0.05)
+        await ledger.commit(reservation, 0.05)
+        await ledger.record(0.1, analyses=2)
+        return await ledger.usage()
+
+    usage = asyncio.run(scenario())
+
+    assert usage["spent"] == pytest.approx(0.2)
+    assert usage["reserved"] == 0 and usage["analyses"] == 3
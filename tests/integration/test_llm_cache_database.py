@@ -0,0 +1,116 @@
+"""Integration tests for the PostgreSQL backend of the LLM result cache.
+
+Requires DATABASE_URL to point at a PostgreSQL server; skipped otherwise.
+"""
+
+import asyncio
+import os
+
+import pytest
+from pydantic import BaseModel
+from pydantic_ai import Agent
+from pydantic_ai.models.test import TestModel
+from pydantic_ai.usage import Usage
+from sqlalchemy import create_engine, select, text, update
+
+from crypto_newsletter.analysis.cache import DatabaseLLMCacheBackend, LLMCache
+from crypto_newsletter.shared.database import connection
+from crypto_newsletter.shared.database.connection import DatabaseManager
+from crypto_newsletter.shared.models import Base, LLMCacheEntry
+
+DATABASE = "llm_cache_check"
+
+
+class Summary(BaseModel):
+    text: str
+
+
+def _base_url() -> str | None:
+    url = os.environ.get("DATABASE_URL", "")
+    if not url.startswith(("postgresql", "postgres")):
+        return None
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1).replace(
+        "postgres://", "postgresql://", 1
+    )
+
+
+@pytest.fixture
+def cache_db():
+    """Dedicated database bound to the global database manager."""
+    url = _base_url()
+    if url is None:
+        pytest.skip("DATABASE_URL is not a PostgreSQL URL")
+
+    admin_engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE}"))
+            conn.execute(text(f"CREATE DATABASE {DATABASE}"))
+    except Exception as e:
+        admin_engine.dispose()
+        pytest.skip(f"PostgreSQL not reachable: {e}")
+
+    database_url = admin_engine.url.set(database=DATABASE)
+    engine = create_engine(database_url)
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn, tables=[LLMCacheEntry.__table__])
+    engine.dispose()
+
+    manager = DatabaseManager()
+    manager.initialize(database_url.render_as_string(hide_password=False))
+    patch = pytest.MonkeyPatch()
+    patch.setattr(connection, "_db_manager", manager)
+
+    yield
+
+    patch.undo()
+    manager._discard_all()
+    with admin_engine.connect() as conn:
+        conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE} WITH (FORCE)"))
+    admin_engine.dispose()
+
+
+@pytest.mark.integration
+def test_database_cache_round_trip_and_eviction(cache_db):
+    cache = LLMCache(DatabaseLLMCacheBackend(), ttl_seconds=3600, max_entries=2)
+    agent = Agent(TestModel(), output_type=Summary, system_prompt="Summarize.")
+    keys = [cache.key("summary", agent, f"article {n}") for n in range(4)]
+
+    async def scenario():
+        for n, key in enumerate(keys):
+            await cache.set(
+                key, "summary", agent, Summary(text=str(n)), Usage(total_tokens=n)
+            )
+        hit = await cache.get(keys[0], Summary)
+        await cache.get(keys[0], Summary)
+        async with connection.get_db_session() as db:
+            # keys[1] expired, keys[2] and keys[3] were used before keys[0]
+            await db.execute(
+                update(LLMCacheEntry)
+                .where(LLMCacheEntry.key == keys[1])
+                .values(expires_at=text("now() - interval '1 second'"))
+            )
+            await db.execute(
+                update(LLMCacheEntry)
+                .where(LLMCacheEntry.key.in_(keys[2:]))
+                .values(last_used_at=text("now() - interval '1 hour'"))
+            )
+        expired = await cache.get(keys[1], Summary)
+        evicted = await cache.prune()
+        async with connection.get_db_session() as db:
+            rows = (
+                await db.execute(select(LLMCacheEntry.key, LLMCacheEntry.hits))
+            ).all()
+        summary = await cache.backend.summary()
+        return hit, expired, evicted, {key: hits for key, hits in rows}, summary
+
+    hit, expired, evicted, rows, summary = asyncio.run(scenario())
+
+    assert hit.output == Summary(text="0") and hit.usage.total_tokens == 0
+    assert expired is None
+    # The expired entry and the least recently used one over the bound
+    assert evicted == 2
+    assert set(rows) == {keys[0], keys[3]} or set(rows) == {keys[0], keys[2]}
+    assert rows[keys[0]] == 2
+    assert summary == {"entries": 2, "lifetime_hits": 2}
+    assert cache.report()["hit_rate"] == pytest.approx(2 / 3, abs=1e-4)
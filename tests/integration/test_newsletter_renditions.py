@@ -0,0 +1,149 @@
+"""Integration tests for stored newsletter renditions.
+
+Requires DATABASE_URL to point at a PostgreSQL server; skipped otherwise.
+"""
+
+import asyncio
+import os
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+
+from crypto_newsletter.core.storage.repository import NewsletterRepository
+from crypto_newsletter.newsletter.rendering import EMAIL, HTML, TEXT
+from crypto_newsletter.newsletter.storage import NewsletterStorage
+from crypto_newsletter.shared.database import connection
+from crypto_newsletter.shared.database.connection import DatabaseManager
+from crypto_newsletter.shared.models import Base, Newsletter, NewsletterRendition
+
+DATABASE = "newsletter_renditions_check"
+
+
+def _base_url() -> str | None:
+    url = os.environ.get("DATABASE_URL", "")
+    if not url.startswith(("postgresql", "postgres")):
+        return None
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1).replace(
+        "postgres://", "postgresql://", 1
+    )
+
+
+@pytest.fixture(scope="module")
+def renditions_db():
+    """Dedicated database bound to the global database manager."""
+    url = _base_url()
+    if url is None:
+        pytest.skip("DATABASE_URL is not a PostgreSQL URL")
+
+    admin_engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE}"))
+            conn.execute(text(f"CREATE DATABASE {DATABASE}"))
+    except Exception as e:
+        admin_engine.dispose()
+        pytest.skip(f"PostgreSQL not reachable: {e}")
+
+    database_url = admin_engine.url.set(database=DATABASE)
+    engine = create_engine(database_url)
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+    engine.dispose()
+
+    manager = DatabaseManager()
+    manager.initialize(database_url.render_as_string(hide_password=False))
+    patch = pytest.MonkeyPatch()
+    patch.setattr(connection, "_db_manager", manager)
+
+    yield
+
+    patch.undo()
+    manager._discard_all()
+    with admin_engine.connect() as conn:
+        conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE} WITH (FORCE)"))
+    admin_engine.dispose()
+
+
+async def _create_newsletter() -> int:
+    async with connection.get_db_session() as db:
+        newsletter = Newsletter(
+            title="Daily",
+            content="# Daily\n\nFirst [link](https://example.com/1)",
+            generation_date=datetime(2026, 10, 1, tzinfo=UTC),
+            status="DRAFT",
+            quality_score=0.8,
+        )
+        db.add(newsletter)
+        await db.flush()
+        return newsletter.id
+
+
+async def _rendition(newsletter_id: int, variant: str) -> str | None:
+    async with connection.get_db_session() as db:
+        newsletter = await db.get(Newsletter, newsletter_id)
+        return await NewsletterStorage(db).get_rendition(newsletter, variant)
+
+
+async def _stored(newsletter_id: int) -> dict[str, str]:
+    async with connection.get_db_session() as db:
+        rows = await db.execute(
+            select(NewsletterRendition.variant, NewsletterRendition.body).where(
+                NewsletterRendition.newsletter_id == newsletter_id
+            )
+        )
+        return dict(rows.all())
+
+
+@pytest.mark.integration
+def test_legacy_newsletter_is_rendered_on_first_view_and_saved(renditions_db):
+    newsletter_id = asyncio.run(_create_newsletter())
+    assert asyncio.run(_stored(newsletter_id)) == {}
+
+    html = asyncio.run(_rendition(newsletter_id, HTML))
+
+    assert '<a href="https://example.com/1">link</a>' in html
+    stored = asyncio.run(_stored(newsletter_id))
+    assert set(stored) == {HTML, EMAIL, TEXT}
+    assert stored[HTML] == html
+    assert asyncio.run(_rendition(newsletter_id, TEXT)) == stored[TEXT]
+
+
+@pytest.mark.integration
+def test_edit_rerenders_and_delete_cascades(renditions_db):
+    newsletter_id = asyncio.run(_create_newsletter())
+
+    async def edit() -> None:
+        async with connection.get_db_session() as db:
+            await NewsletterRepository(db).update_newsletter(
+                newsletter_id, content="# Daily\n\nEdited"
+            )
+
+    asyncio.run(edit())
+    assert "Edited" in asyncio.run(_stored(newsletter_id))[TEXT]
+
+    async def delete() -> int:
+        async with connection.get_db_session() as db:
+            await NewsletterRepository(db).delete_newsletter(newsletter_id)
+        async with connection.get_db_session() as db:
+            return await db.scalar(
+                select(func.count(NewsletterRendition.id)).where(
+                    NewsletterRendition.newsletter_id == newsletter_id
+                )
+            )
+
+    assert asyncio.run(delete()) == 0
+
+
+@pytest.mark.integration
+def test_refresh_renditions_only_renders_stale(renditions_db):
+    async def refresh(force: bool = False) -> dict[str, int]:
+        async with connection.get_db_session() as db:
+            return await NewsletterStorage(db).refresh_renditions(force=force)
+
+    asyncio.run(_create_newsletter())
+    first = asyncio.run(refresh())
+    assert first["rendered"] >= 1
+
+    assert asyncio.run(refresh())["rendered"] == 0
+    assert asyncio.run(refresh(force=True))["rendered"] == first["newsletters"]
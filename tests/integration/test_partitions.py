@@ -0,0 +1,401 @@
+"""Integration tests for monthly partitioning of articles and article_analyses.
+
+Builds an isolated PostgreSQL schema with the ORM models, converts it with the
+partitioning migration, and exercises partition maintenance and retention.
+
+Requires DATABASE_URL to point at a PostgreSQL server; skipped otherwise.
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from crypto_newsletter.analysis.agents.orchestrator import existing_analysis_id
+from crypto_newsletter.core.ingestion.article_processor import ArticleProcessor
+from crypto_newsletter.shared.database.partitions import (
+    add_months,
+    apply_partition_retention,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+    month_floor,
+    partition_name,
+)
+from crypto_newsletter.shared.models import Base
+
+SCHEMA = "partition_check"
+ARCHIVE_SCHEMA = "partition_check_archive"
+MIGRATION = (
+    Path(__file__).resolve().parents[2]
+    / "alembic"
+    / "versions"
+    / "7b2d4f6a8c1e_partition_articles_by_month.py"
+)
+
+CURRENT_MONTH = month_floor(datetime.now(UTC))
+# Months (relative to now) that get seeded articles and analyses
+SEEDED_MONTH_OFFSETS = [-14, -13, -2, 0]
+
+
+def _base_url() -> str | None:
+    url = os.environ.get("DATABASE_URL", "")
+    if not url.startswith(("postgresql", "postgres")):
+        return None
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1).replace(
+        "postgres://", "postgresql://", 1
+    )
+
+
+def _run_migration(engine, direction: str) -> None:
+    spec = importlib.util.spec_from_file_location("partition_migration", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    with engine.connect() as conn:
+        context = MigrationContext.configure(conn)
+        with Operations.context(context):
+            spec.loader.exec_module(migration)
+            getattr(migration, direction)()
+        conn.commit()
+
+
+@pytest.fixture(scope="module")
+def partitioned_schema():
+    """Create a schema from the models, seed it and partition it."""
+    url = _base_url()
+    if url is None:
+        pytest.skip("DATABASE_URL is not a PostgreSQL URL")
+
+    admin_engine = create_engine(url)
+    try:
+        with admin_engine.begin() as conn:
+            for schema in (SCHEMA, ARCHIVE_SCHEMA):
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+            conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    except Exception as e:
+        admin_engine.dispose()
+        pytest.skip(f"PostgreSQL not reachable: {e}")
+
+    engine = create_engine(url, connect_args={"options": f"-csearch_path={SCHEMA}"})
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        for index, offset in enumerate(SEEDED_MONTH_OFFSETS):
+            published = add_months(CURRENT_MONTH, offset).replace(day=2)
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO articles (
+                        external_id, guid, title, url, status,
+                        upvotes, downvotes, score, published_on, created_at
+                    )
+                    VALUES (:n, 'guid-' || :n, 'Article', 'https://x/' || :n,
+                            'ACTIVE', 0, 0, 0, :published, :published)
+                    """
+                ),
+                {"n": index, "published": published},
+            )
+        conn.execute(
+            text(
+                """
+                INSERT INTO article_analyses (
+                    article_id, analysis_version, sentiment, validation_status,
+                    created_at, updated_at
+                )
+                SELECT id, '1.0', 'NEUTRAL', 'COMPLETED', published_on, published_on
+                FROM articles
+                """
+            )
+        )
+        conn.execute(
+            text("INSERT INTO article_categories (article_id) SELECT id FROM articles")
+        )
+
+    _run_migration(engine, "upgrade")
+
+    yield url, engine
+
+    engine.dispose()
+    with admin_engine.begin() as conn:
+        for schema in (SCHEMA, ARCHIVE_SCHEMA):
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+    admin_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db(partitioned_schema):
+    url, _ = partitioned_schema
+    engine = create_async_engine(
+        url.replace("postgresql://", "postgresql+asyncpg://", 1),
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+        yield session
+    await engine.dispose()
+
+
+def _count(engine, sql: str) -> int:
+    with engine.connect() as conn:
+        return conn.execute(text(sql)).scalar()
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_migration_creates_monthly_partitions(partitioned_schema, db):
+    _, engine = partitioned_schema
+
+    assert await is_partitioned(db, "articles")
+    assert await is_partitioned(db, "article_analyses")
+
+    names = {partition.name for partition in await list_partitions(db, "articles")}
+    oldest = add_months(CURRENT_MONTH, min(SEEDED_MONTH_OFFSETS))
+    assert partition_name("articles", oldest) in names
+    assert partition_name("articles", add_months(CURRENT_MONTH, 3)) in names
+
+    assert _count(engine, "SELECT count(*) FROM articles") == len(SEEDED_MONTH_OFFSETS)
+    assert _count(engine, "SELECT count(*) FROM articles_default") == 0
+    # New rows keep drawing ids from the original sequence
+    assert _count(
+        engine, "SELECT nextval(pg_get_serial_sequence('articles', 'id'))"
+    ) > len(SEEDED_MONTH_OFFSETS)
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_recent_window_prunes_to_current_partitions(partitioned_schema):
+    _, engine = partitioned_schema
+    since = CURRENT_MONTH
+
+    with engine.connect() as conn:
+        plan = conn.execute(
+            text(
+                "EXPLAIN (FORMAT JSON) SELECT id FROM articles "
+                "WHERE status = 'ACTIVE' AND published_on >= :since"
+            ),
+            {"since": since},
+        ).scalar()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+
+    def relations(node: dict) -> set[str]:
+        found = {node["Relation Name"]} if "Relation Name" in node else set()
+        for child in node.get("Plans", []):
+            found |= relations(child)
+        return found
+
+    scanned = relations(plan[0]["Plan"])
+    assert partition_name("articles", add_months(CURRENT_MONTH, -2)) not in scanned
+    assert len(scanned - {"articles_default"}) <= 4  # current + pre-created months
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_ensure_partitions_moves_rows_out_of_default(partitioned_schema, db):
+    _, engine = partitioned_schema
+    future = add_months(CURRENT_MONTH, 6).replace(day=10)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                """
+                INSERT INTO articles (
+                    external_id, guid, title, url, status,
+                    upvotes, downvotes, score, published_on
+                )
+                VALUES (999, 'guid-999', 'Future', 'https://x/999', 'ACTIVE',
+                        0, 0, 0, :published)
+                """
+            ),
+            {"published": future},
+        )
+    assert _count(engine, "SELECT count(*) FROM articles_default") == 1
+
+    created = await ensure_partitions(db, months_ahead=6)
+    await db.commit()
+
+    assert partition_name("articles", future) in created
+    assert partition_name("article_analyses", future) in created
+    assert _count(engine, "SELECT count(*) FROM articles_default") == 0
+    assert (
+        _count(engine, f"SELECT count(*) FROM {partition_name('articles', future)}")
+        == 1
+    )
+    # Idempotent once everything exists
+    assert await ensure_partitions(db, months_ahead=6) == []
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_retention_archives_whole_partitions(partitioned_schema, db):
+    _, engine = partitioned_schema
+    cutoff = add_months(CURRENT_MONTH, -12)
+    expected = {
+        partition_name(table, add_months(CURRENT_MONTH, offset))
+        for table in ("articles", "article_analyses")
+        for offset in (-14, -13)
+    }
+
+    planned = await apply_partition_retention(db, cutoff, dry_run=True)
+    assert expected <= {partition.name for partition in planned}
+    assert _count(engine, "SELECT count(*) FROM articles") == 5
+
+    with pytest.raises(ValueError, match="Unknown retention mode"):
+        await apply_partition_retention(db, cutoff, mode="truncate")
+
+    retired = await apply_partition_retention(
+        db, cutoff, mode="archive", archive_schema=ARCHIVE_SCHEMA
+    )
+    await db.commit()
+
+    assert expected <= {partition.name for partition in retired}
+    assert _count(engine, "SELECT count(*) FROM articles") == 3
+    assert _count(engine, "SELECT count(*) FROM article_analyses") == 2
+    archived = partition_name("articles", add_months(CURRENT_MONTH, -14))
+    assert _count(engine, f"SELECT count(*) FROM {ARCHIVE_SCHEMA}.{archived}") == 1
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_retention_drop_removes_partitions_and_children(partitioned_schema, db):
+    _, engine = partitioned_schema
+    cutoff = add_months(CURRENT_MONTH, -1)
+    dropped = partition_name("articles", add_months(CURRENT_MONTH, -2))
+    with engine.begin() as conn:
+        article_id = conn.execute(text(f"SELECT id FROM {dropped}")).scalar()
+        # A re-analysis this month lands in a partition that stays
+        analysis_id = conn.execute(
+            text(
+                """
+                INSERT INTO article_analyses (
+                    article_id, analysis_version, sentiment, validation_status,
+                    created_at, updated_at
+                )
+                VALUES (:article_id, '2.0', 'NEUTRAL', 'COMPLETED', now(), now())
+                RETURNING id
+                """
+            ),
+            {"article_id": article_id},
+        ).scalar()
+        conn.execute(
+            text(
+                """
+                INSERT INTO signals (
+                    article_id, analysis_id, signal_type, description, confidence
+                )
+                VALUES (:article_id, :analysis_id, 'flow', 'Outflows', 0.5)
+                """
+            ),
+            {"article_id": article_id, "analysis_id": analysis_id},
+        )
+        conn.execute(
+            text(
+                """
+                INSERT INTO article_embeddings (
+                    article_id, embedding, embedding_model, embedding_version
+                )
+                VALUES (:article_id, ARRAY[0.1, 0.2], 'test', '1')
+                """
+            ),
+            {"article_id": article_id},
+        )
+
+    await apply_partition_retention(db, cutoff, mode="drop")
+    await db.commit()
+
+    assert _count(engine, f"SELECT count(to_regclass('{dropped}'))") == 0
+    assert _count(engine, "SELECT count(*) FROM articles") == 2
+
+    def orphans(table: str) -> int:
+        return _count(
+            engine,
+            f"SELECT count(*) FROM {table} child "
+            "WHERE NOT EXISTS (SELECT 1 FROM articles a WHERE a.id = child.article_id)",
+        )
+
+    # The two archived months keep their categories; dropped ones go
+    assert orphans("article_categories") == 2
+    for table in ("article_analyses", "signals", "article_embeddings"):
+        assert orphans(table) == 0
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_writers_keep_keys_unique_across_partitions(partitioned_schema, db):
+    url, engine = partitioned_schema
+    current = len(SEEDED_MONTH_OFFSETS) - 1  # external_id of this month's article
+    next_month = add_months(CURRENT_MONTH, 1).replace(day=5)
+    insert_next_month = text(
+        """
+        INSERT INTO articles (
+            external_id, guid, title, url, status,
+            upvotes, downvotes, score, published_on
+        )
+        VALUES (:n, 'guid-' || :n, 'Article', 'https://x/' || :n,
+                'ACTIVE', 0, 0, 0, :published)
+        """
+    )
+
+    # The constraints include the partition key: they only hold per month
+    with engine.connect() as conn:
+        conn.execute(insert_next_month, {"n": current, "published": next_month})
+        conn.rollback()
+
+    # Ingestion checks the whole table for the identifiers instead
+    duplicate = {
+        "ID": current,
+        "GUID": "guid-moved",
+        "URL": "https://x/moved",
+        "TITLE": "Article",
+        "LANG": "EN",
+        "PUBLISHED_ON": int(next_month.timestamp()),
+    }
+    assert await ArticleProcessor(db).process_articles([duplicate]) == 0
+    assert (
+        _count(engine, f"SELECT count(*) FROM articles WHERE external_id = {current}")
+        == 1
+    )
+
+    # Analysis writers hold the key's lock from the check until commit
+    article_id = _count(
+        engine, f"SELECT id FROM articles WHERE external_id = {current}"
+    )
+    other_engine = create_async_engine(
+        url.replace("postgresql://", "postgresql+asyncpg://", 1),
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    try:
+        async with async_sessionmaker(other_engine, class_=AsyncSession)() as other:
+            assert await existing_analysis_id(db, article_id, "9.9") is None
+            racing = asyncio.create_task(existing_analysis_id(other, article_id, "9.9"))
+            await asyncio.sleep(0.2)
+            assert not racing.done()
+
+            stored = await db.scalar(
+                text(
+                    """
+                    INSERT INTO article_analyses (
+                        article_id, analysis_version, sentiment,
+                        validation_status, created_at, updated_at
+                    )
+                    VALUES (:id, '9.9', 'NEUTRAL', 'COMPLETED',
+                            now() - interval '40 days', now())
+                    RETURNING id
+                    """
+                ),
+                {"id": article_id},
+            )
+            await db.commit()
+
+            assert await racing == stored
+    finally:
+        await other_engine.dispose()
@@ -0,0 +1,251 @@
+"""EXPLAIN-based regression tests for hot query paths.
+
+Seeds an isolated PostgreSQL schema with a realistic volume of articles and
+analyses, runs the real repository / identifier / scheduler / monitoring code
+against it while capturing the SQL it emits, and then EXPLAINs every captured
+statement. The test fails if any of them plans a sequential scan over
+``articles`` or ``article_analyses``.
+
+Requires DATABASE_URL to point at a PostgreSQL server; skipped otherwise.
+"""
+
+import json
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from crypto_newsletter.analysis.scheduling import AnalysisScheduler
+from crypto_newsletter.core.storage.repository import ArticleRepository
+from crypto_newsletter.newsletter.batch.identifier import BatchArticleIdentifier
+from crypto_newsletter.newsletter.monitoring import NewsletterTaskMonitor
+from crypto_newsletter.shared.models import Base
+
+SCHEMA = "query_plan_check"
+HOT_TABLES = {"articles", "article_analyses"}
+
+ARTICLE_COUNT = 60_000
+ANALYZED_FRACTION = 0.8
+PUBLISHER_COUNT = 25
+
+
+def _base_url() -> str | None:
+    url = os.environ.get("DATABASE_URL", "")
+    if not url.startswith(("postgresql", "postgres")):
+        return None
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1).replace(
+        "postgres://", "postgresql://", 1
+    )
+
+
+SEED_SQL = [
+    f"""
+    INSERT INTO publishers (source_id, source_key, name, status)
+    SELECT g, 'src_' || g,
+           CASE g WHEN 1 THEN 'CoinDesk' WHEN 2 THEN 'NewsBTC'
+                  ELSE 'Publisher ' || g END,
+           'ACTIVE'
+    FROM generate_series(1, {PUBLISHER_COUNT}) g
+    """,
+    f"""
+    INSERT INTO articles (
+        external_id, guid, title, url, body, status, publisher_id,
+        upvotes, downvotes, score, published_on, created_at, updated_at
+    )
+    SELECT g, 'guid-' || g, 'Article ' || g, 'https://example.com/' || g,
+           repeat('bitcoin market structure ', 40 + (g % 200)),
+           CASE WHEN g % 50 = 0 THEN 'DELETED' ELSE 'ACTIVE' END,
+           (SELECT id FROM publishers ORDER BY id LIMIT 1) + (g % {PUBLISHER_COUNT}),
+           0, 0, 0,
+           now() - (g || ' minutes')::interval * 15,
+           now() - (g || ' minutes')::interval * 15,
+           now() - (g || ' minutes')::interval * 15
+    FROM generate_series(1, {ARTICLE_COUNT}) g
+    """,
+    f"""
+    INSERT INTO article_analyses (
+        article_id, analysis_version, sentiment, validation_status,
+        signal_strength, analysis_confidence, cost_usd, created_at, updated_at
+    )
+    SELECT a.id, '1.0', 'NEUTRAL',
+           CASE WHEN a.id % 7 = 0 THEN 'FAILED' ELSE 'COMPLETED' END,
+           ((a.id % 100) / 100.0)::numeric(3, 2),
+           0.80,
+           0.0013,
+           a.created_at + interval '5 minutes',
+           a.created_at + interval '5 minutes'
+    FROM articles a
+    WHERE a.external_id % 10 < {int(ANALYZED_FRACTION * 10)}
+    """,
+    "ANALYZE",
+]
+
+
+def _seq_scans(plan: dict) -> list[str]:
+    """Collect relation names that are read with a sequential scan."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in HOT_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+class _StatementCapture:
+    """Collects SELECT statements emitted through an engine."""
+
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, str, object]] = []
+        self.label = ""
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.statements.append((self.label, statement, parameters))
+
+
+@pytest.fixture(scope="module")
+def seeded_schema():
+    """Create and seed an isolated schema, dropping it afterwards."""
+    url = _base_url()
+    if url is None:
+        pytest.skip("DATABASE_URL is not a PostgreSQL URL")
+
+    admin_engine = create_engine(url)
+    try:
+        with admin_engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    except Exception as e:
+        admin_engine.dispose()
+        pytest.skip(f"PostgreSQL not reachable: {e}")
+
+    sync_engine = create_engine(
+        url, connect_args={"options": f"-csearch_path={SCHEMA}"}
+    )
+    with sync_engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        for statement in SEED_SQL:
+            conn.execute(text(statement))
+
+    yield url, sync_engine
+
+    sync_engine.dispose()
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    admin_engine.dispose()
+
+
+def _assert_no_seq_scans(explain_rows: list[tuple[str, str, list]]) -> None:
+    offenders = []
+    for label, statement, plan_json in explain_rows:
+        plan = plan_json[0]["Plan"] if isinstance(plan_json, list) else plan_json
+        scans = _seq_scans(plan)
+        if scans:
+            offenders.append(f"{label}: Seq Scan on {sorted(set(scans))}\n{statement}")
+    assert not offenders, "Hot queries fell back to sequential scans:\n\n" + (
+        "\n\n".join(offenders)
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_async_hot_queries_use_indexes(seeded_schema):
+    """Repository and monitoring queries must be index-driven."""
+    url, _ = seeded_schema
+    engine = create_async_engine(
+        url.replace("postgresql://", "postgresql+asyncpg://", 1),
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    capture = _StatementCapture()
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+    since = datetime.now(UTC) - timedelta(hours=24)
+
+    try:
+        async with session_factory() as db:
+            repo = ArticleRepository(db)
+            monitor = NewsletterTaskMonitor(db)
+            identifier = BatchArticleIdentifier()
+
+            calls = {
+                "get_recent_articles": lambda: repo.get_recent_articles(
+                    hours=24, include_categories=False
+                ),
+                "get_articles_by_publisher": lambda: repo.get_articles_by_publisher(
+                    publisher_id=1
+                ),
+                "get_articles_with_analysis_since": lambda: (
+                    repo.get_articles_with_analysis_since(
+                        since, min_signal_strength=0.5
+                    )
+                ),
+                "get_agent_articles_since": lambda: repo.get_agent_articles_since(
+                    since, min_signal_strength=0.5
+                ),
+                "get_articles_with_filters": lambda: repo.get_articles_with_filters(
+                    limit=10
+                ),
+                "get_analyzable_articles": lambda: identifier.get_analyzable_articles(
+                    db, limit=50
+                ),
+                "get_newsletter_pipeline_health": (
+                    monitor.get_newsletter_pipeline_health
+                ),
+            }
+            for label, call in calls.items():
+                capture.label = label
+                await call()
+
+            explained = []
+            for label, statement, parameters in capture.statements:
+                result = await db.connection()
+                rows = await result.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                )
+                plan = rows.scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                explained.append((label, statement, plan))
+    finally:
+        await engine.dispose()
+
+    assert {label for label, _, _ in explained} == set(calls)
+    _assert_no_seq_scans(explained)
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_sync_hot_queries_use_indexes(seeded_schema):
+    """Identifier and scheduler queries used by Celery must be index-driven."""
+    _, sync_engine = seeded_schema
+    capture = _StatementCapture()
+    event.listen(sync_engine, "before_cursor_execute", capture)
+
+    try:
+        with Session(sync_engine) as db:
+            identifier = BatchArticleIdentifier()
+            scheduler = AnalysisScheduler()
+
+            capture.label = "get_recent_analyzable_articles_sync"
+            identifier.get_recent_analyzable_articles_sync(db, hours_back=24, limit=50)
+            capture.label = "_check_daily_budget_usage"
+            scheduler._check_daily_budget_usage(db)
+
+            explained = []
+            for label, statement, parameters in capture.statements:
+                plan = db.connection().exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                ).scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                explained.append((label, statement, plan))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+    assert len(explained) == 2
+    _assert_no_seq_scans(explained)
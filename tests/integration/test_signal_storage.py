@@ -0,0 +1,300 @@
+"""Integration tests for normalized signal storage, backfill and queries.
+
+Requires DATABASE_URL to point at a PostgreSQL server; skipped otherwise.
+"""
+
+import asyncio
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+
+from crypto_newsletter.core.storage import repository
+from crypto_newsletter.core.storage.repository import SignalRepository
+from crypto_newsletter.core.storage.signals import (
+    backfill_analysis_signals,
+    store_analysis_signals,
+)
+from crypto_newsletter.shared.database import connection
+from crypto_newsletter.shared.database.connection import DatabaseManager
+from crypto_newsletter.shared.models import (
+    ArticleAnalysis,
+    Base,
+    Signal,
+    SignalAnomaly,
+    SignalConnection,
+)
+
+DATABASE = "signal_storage_check"
+NOW = datetime.now(UTC)
+
+
+def _base_url() -> str | None:
+    url = os.environ.get("DATABASE_URL", "")
+    if not url.startswith(("postgresql", "postgres")):
+        return None
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1).replace(
+        "postgres://", "postgresql://", 1
+    )
+
+
+def _signal(signal_type: str, confidence: float) -> dict:
+    return {
+        "signal_type": signal_type,
+        "description": f"{signal_type} at {confidence}",
+        "confidence": confidence,
+        "implications": "Watch closely",
+        "evidence": ["quote"],
+        "timeframe": "short-term",
+    }
+
+
+# article id -> (analysis age, weak signals, pattern anomalies, connections)
+ANALYSES = {
+    1: (
+        timedelta(days=1),
+        [
+            _signal("regulatory_shift", 0.8),
+            _signal("technology_adoption", 0.5),
+            {"signal_type": "regulatory_shift"},  # malformed, skipped
+        ],
+        [
+            {
+                "expected_pattern": "Sell-off after hack",
+                "observed_pattern": "Price held",
+                "deviation_significance": 0.7,
+                "historical_context": "Unusual",
+                "potential_causes": ["Insurance fund"],
+            }
+        ],
+        [
+            {
+                "crypto_element": "USDC",
+                "external_domain": "payments",
+                "connection_type": "integration",
+                "relevance": 0.9,
+                "opportunity_description": "Card networks",
+                "development_indicators": ["Volume"],
+            }
+        ],
+    ),
+    2: (timedelta(days=10), [_signal("regulatory_shift", 0.9)], [], []),
+    3: (timedelta(days=2), None, None, None),
+}
+
+
+@pytest.fixture(scope="module")
+def signal_db_url():
+    """Dedicated database with three analyses and no normalized rows yet."""
+    url = _base_url()
+    if url is None:
+        pytest.skip("DATABASE_URL is not a PostgreSQL URL")
+
+    admin_engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE}"))
+            conn.execute(text(f"CREATE DATABASE {DATABASE}"))
+    except Exception as e:
+        admin_engine.dispose()
+        pytest.skip(f"PostgreSQL not reachable: {e}")
+
+    database_url = admin_engine.url.set(database=DATABASE)
+    engine = create_engine(database_url)
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+        conn.execute(
+            text(
+                "INSERT INTO publishers (id, source_id, source_key, name, status) "
+                "VALUES (1, 1, 'coindesk', 'CoinDesk', 'ACTIVE')"
+            )
+        )
+        for article_id, (age, signals, anomalies, connections) in ANALYSES.items():
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO articles (
+                        id, external_id, guid, title, url, status,
+                        publisher_id, upvotes, downvotes, score, published_on
+                    )
+                    VALUES (:n, :n, 'guid-' || :n, 'Article ' || :n,
+                            'https://x/' || :n, 'ACTIVE', 1, 0, 0, 0, :published)
+                    """
+                ),
+                {"n": article_id, "published": NOW - age},
+            )
+            conn.execute(
+                ArticleAnalysis.__table__.insert(),
+                {
+                    "article_id": article_id,
+                    "analysis_version": "1.0",
+                    "sentiment": "NEUTRAL",
+                    "validation_status": "COMPLETED",
+                    "weak_signals": signals,
+                    "pattern_anomalies": anomalies,
+                    "adjacent_connections": connections,
+                    "created_at": NOW - age,
+                    "updated_at": NOW - age,
+                },
+            )
+    engine.dispose()
+
+    yield database_url.render_as_string(hide_password=False)
+
+    with admin_engine.connect() as conn:
+        conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE} WITH (FORCE)"))
+    admin_engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def run(signal_db_url):
+    """Run a coroutine against the signal database through get_db_session."""
+    manager = DatabaseManager()
+    manager.initialize(signal_db_url)
+    patch = pytest.MonkeyPatch()
+    patch.setattr(connection, "_db_manager", manager)
+
+    backfill = asyncio.run(backfill_analysis_signals(chunk_size=2))
+    yield lambda coroutine: asyncio.run(coroutine), backfill
+
+    patch.undo()
+    manager._discard_all()
+
+
+async def _row_counts() -> dict[str, int]:
+    async with connection.get_db_session() as db:
+        return {
+            model.__tablename__: await db.scalar(select(func.count(model.id)))
+            for model in (Signal, SignalAnomaly, SignalConnection)
+        }
+
+
+async def _query(method: str, *args, **kwargs):
+    async with connection.get_db_session() as db:
+        return await getattr(SignalRepository(db), method)(*args, **kwargs)
+
+
+@pytest.mark.integration
+def test_backfill_is_chunked_and_idempotent(run):
+    execute, report = run
+
+    assert report["analyses_processed"] == 3
+    assert report["chunks"] == 2
+    assert report["last_analysis_id"] == 3
+    assert report["signals_rows"] == 3
+    assert report["signal_anomalies_rows"] == 1
+    assert report["signal_connections_rows"] == 1
+
+    counts = execute(_row_counts())
+    again = execute(backfill_analysis_signals(chunk_size=50))
+    assert again["signals_rows"] == 3
+    assert execute(_row_counts()) == counts
+    assert execute(backfill_analysis_signals(start_after_id=3))["chunks"] == 0
+
+
+@pytest.mark.integration
+def test_signal_queries_filter_by_type_confidence_and_window(run):
+    execute, _ = run
+    week_ago = NOW - timedelta(days=7)
+
+    this_week = execute(
+        _query(
+            "get_signals",
+            week_ago,
+            signal_type="regulatory_shift",
+            min_confidence=0.7,
+        )
+    )
+    assert [signal["confidence"] for signal in this_week] == [0.8]
+    assert this_week[0]["article_title"] == "Article 1"
+    assert this_week[0]["metadata"]["timeframe"] == "short-term"
+
+    by_score = execute(
+        _query(
+            "get_signals",
+            NOW - timedelta(days=30),
+            signal_type="regulatory_shift",
+            order_by="score",
+        )
+    )
+    assert [signal["confidence"] for signal in by_score] == [0.9, 0.8]
+    older = execute(
+        _query("get_signals", NOW - timedelta(days=30), until=NOW - timedelta(days=5))
+    )
+    assert [signal["article_id"] for signal in older] == [2]
+
+    summary = execute(_query("get_signal_type_summary", NOW - timedelta(days=30)))
+    assert {row["signal_type"]: row["count"] for row in summary} == {
+        "regulatory_shift": 2,
+        "technology_adoption": 1,
+    }
+
+    anomalies = execute(_query("get_anomalies", week_ago, min_significance=0.5))
+    assert anomalies[0]["potential_causes"] == ["Insurance fund"]
+    connections = execute(
+        _query("get_connections", week_ago, external_domain="payments")
+    )
+    assert connections[0]["relevance"] == 0.9
+
+    with pytest.raises(ValueError, match="Unknown ordering"):
+        execute(_query("get_signals", week_ago, order_by="random"))
+
+
+@pytest.mark.integration
+def test_signal_query_uses_type_confidence_index(run, signal_db_url):
+    query = repository._signal_table_statement("signals", True, False, True)
+    engine = create_engine(signal_db_url)
+    compiled = query.compile(dialect=engine.dialect)
+    params = compiled.construct_params(
+        {
+            "category": "regulatory_shift",
+            "min_score": 0.7,
+            "since": NOW - timedelta(days=7),
+            "limit": 10,
+            "offset": 0,
+        }
+    )
+
+    with engine.connect() as conn:
+        # The seeded tables are tiny; make the planner show index usage
+        conn.exec_driver_sql("SET enable_seqscan = off")
+        plan = "\n".join(
+            row[0]
+            for row in conn.exec_driver_sql(f"EXPLAIN {compiled.string}", params)
+        )
+    engine.dispose()
+
+    assert "idx_signals_type_confidence" in plan
+
+
+@pytest.mark.integration
+def test_store_analysis_signals_in_callers_transaction(run):
+    execute, _ = run
+
+    async def store() -> dict[str, int]:
+        async with connection.get_db_session() as db:
+            analysis = ArticleAnalysis(
+                article_id=3,
+                analysis_version="2.0",
+                weak_signals=[_signal("institutional_behavior", 0.75)],
+                pattern_anomalies=[],
+                adjacent_connections=[],
+            )
+            db.add(analysis)
+            return await store_analysis_signals(db, analysis)
+
+    assert execute(store()) == {
+        "signals": 1,
+        "signal_anomalies": 0,
+        "signal_connections": 0,
+    }
+    stored = execute(
+        _query(
+            "get_signals",
+            NOW - timedelta(hours=1),
+            signal_type="institutional_behavior",
+        )
+    )
+    assert stored[0]["agent_version"] == "2.0"
+    assert stored[0]["analysis_id"] is not None
@@ -0,0 +1,154 @@
+"""Integration tests for the streaming article export on PostgreSQL.
+
+Covers the server-side cursor and the latest-analysis LATERAL join.
+Requires DATABASE_URL to point at a PostgreSQL server; skipped otherwise.
+"""
+
+import asyncio
+import io
+import json
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from crypto_newsletter.core.storage.export import ExportQuery, stream_export
+from crypto_newsletter.shared.database import connection
+from crypto_newsletter.shared.database.connection import DatabaseManager
+from crypto_newsletter.shared.models import Article, ArticleAnalysis, Base
+
+DATABASE = "article_export_check"
+NOW = datetime.now(UTC)
+ARTICLES = 40
+
+
+def _base_url() -> str | None:
+    url = os.environ.get("DATABASE_URL", "")
+    if not url.startswith(("postgresql", "postgres")):
+        return None
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1).replace(
+        "postgres://", "postgresql://", 1
+    )
+
+
+@pytest.fixture(scope="module")
+def export_db():
+    """Dedicated, seeded database bound to the global database manager."""
+    url = _base_url()
+    if url is None:
+        pytest.skip("DATABASE_URL is not a PostgreSQL URL")
+
+    admin_engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE}"))
+            conn.execute(text(f"CREATE DATABASE {DATABASE}"))
+    except Exception as e:
+        admin_engine.dispose()
+        pytest.skip(f"PostgreSQL not reachable: {e}")
+
+    database_url = admin_engine.url.set(database=DATABASE)
+    engine = create_engine(database_url)
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
+    engine.dispose()
+
+    manager = DatabaseManager()
+    manager.initialize(database_url.render_as_string(hide_password=False))
+    patch = pytest.MonkeyPatch()
+    patch.setattr(connection, "_db_manager", manager)
+    asyncio.run(_seed())
+
+    yield
+
+    patch.undo()
+    manager._discard_all()
+    with admin_engine.connect() as conn:
+        conn.execute(text(f"DROP DATABASE IF EXISTS {DATABASE} WITH (FORCE)"))
+    admin_engine.dispose()
+
+
+async def _seed() -> None:
+    async with connection.get_db_session() as db:
+        for n in range(1, ARTICLES + 1):
+            db.add(
+                Article(
+                    id=n,
+                    external_id=1000 + n,
+                    guid=f"guid-{n}",
+                    title=f"Article {n}",
+                    url=f"https://example.com/{n}",
+                    body="Bitcoin " * 20,
+                    published_on=NOW - timedelta(hours=n),
+                    status="ACTIVE",
+                )
+            )
+        await db.flush()
+        # Article 1 was analyzed twice; only the latest analysis is exported
+        db.add_all(
+            [
+                ArticleAnalysis(
+                    article_id=1,
+                    analysis_version="1.0",
+                    sentiment="NEUTRAL",
+                    impact_score=0.2,
+                    weak_signals=[],
+                    created_at=NOW - timedelta(hours=2),
+                ),
+                ArticleAnalysis(
+                    article_id=1,
+                    analysis_version="1.1",
+                    sentiment="POSITIVE",
+                    impact_score=0.75,
+                    summary="ETF inflows",
+                    weak_signals=[{"signal": "a"}, {"signal": "b"}],
+                    created_at=NOW - timedelta(hours=1),
+                ),
+            ]
+        )
+
+
+def _rows(query: ExportQuery) -> list[dict]:
+    async def collect() -> bytes:
+        return b"".join(
+            [chunk async for chunk in stream_export(query, "ndjson", chunk_size=7)]
+        )
+
+    return [json.loads(line) for line in asyncio.run(collect()).splitlines()]
+
+
+@pytest.mark.integration
+def test_latest_analysis_is_joined(export_db):
+    rows = _rows(ExportQuery(include_analysis=True))
+
+    assert len(rows) == ARTICLES
+    assert [row["id"] for row in rows] == list(range(ARTICLES, 0, -1))
+    latest = rows[-1]
+    assert latest["analysis_sentiment"] == "POSITIVE"
+    assert latest["impact_score"] == 0.75
+    assert latest["weak_signal_count"] == 2
+    assert latest["analysis_summary"] == "ETF inflows"
+    assert rows[0]["analysis_sentiment"] is None
+
+
+@pytest.mark.integration
+def test_parquet_with_analysis(export_db):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    async def collect() -> bytes:
+        query = ExportQuery(include_analysis=True, include_body=True)
+        return b"".join(
+            [
+                chunk
+                async for chunk in stream_export(
+                    query, "parquet", "zstd", chunk_size=16
+                )
+            ]
+        )
+
+    table = pq.read_table(io.BytesIO(asyncio.run(collect())))
+
+    assert table.num_rows == ARTICLES
+    assert table.column("impact_score").to_pylist()[-1] == 0.75
+    assert table.column("body").to_pylist()[0].startswith("Bitcoin")
@@ -0,0 +1,197 @@
+"""Unit tests for provider batch jobs for backlog content analysis."""
+
+import asyncio
+import json
+
+import pytest
+from pydantic_ai.usage import Usage
+
+from crypto_newsletter.analysis import batch_jobs
+from crypto_newsletter.analysis.agents.content_analysis import content_analysis_agent
+from crypto_newsletter.analysis.agents.settings import analysis_settings
+from crypto_newsletter.analysis.batch_jobs import (
+    StubBatchBackend,
+    batch_cost,
+    build_batch_request,
+    build_content_analysis_jsonl,
+    create_batch_backend,
+    estimate_batch_cost,
+    parse_batch_results,
+    stub_content_analysis,
+)
+from crypto_newsletter.analysis.condense import estimate_tokens
+from crypto_newsletter.analysis.models.analysis import ContentAnalysis
+from crypto_newsletter.analysis.tasks import submit_backlog_analysis_batch_task
+
+ARTICLE_BODY = (
+    "Bitcoin miners moved 12,000 BTC to exchanges on Monday, the most since "
+    "January.\n\nSubscribe to our daily newsletter for the latest crypto news."
+)
+
+
+def _response_line(key: str, text: str, prompt_tokens=100, output_tokens=50) -> str:
+    return json.dumps(
+        {
+            "key": key,
+            "response": {
+                "candidates": [{"content": {"parts": [{"text": text}]}}],
+                "usageMetadata": {
+                    "promptTokenCount": prompt_tokens,
+                    "candidatesTokenCount": output_tokens,
+                },
+            },
+        }
+    )
+
+
+@pytest.mark.unit
+class TestRequests:
+    def test_request_carries_prompt_instructions_and_schema(self):
+        line = build_batch_request("article-7", "TITLE: T", content_analysis_agent)
+        request = line["request"]
+
+        assert line["key"] == "article-7"
+        system = request["system_instruction"]["parts"][0]["text"]
+        assert system == "\n\n".join(content_analysis_agent._system_prompts)
+        assert request["contents"][0]["parts"][0]["text"] == "TITLE: T"
+        config = request["generation_config"]
+        assert config["response_mime_type"] == "application/json"
+        # Nested models are inlined for the provider's schema support
+        schema = json.dumps(config["response_json_schema"])
+        assert "$ref" not in schema and "weak_signals" in schema
+
+    def test_jsonl_has_one_condensed_request_per_article(self):
+        jsonl = build_content_analysis_jsonl(
+            [(1, "Miners", ARTICLE_BODY, "CoinDesk"), (2, "Other", "Body.", None)]
+        )
+        lines = [json.loads(line) for line in jsonl.splitlines()]
+
+        assert [line["key"] for line in lines] == ["article-1", "article-2"]
+        prompt = lines[0]["request"]["contents"][0]["parts"][0]["text"]
+        assert "PUBLISHER: CoinDesk" in prompt and "12,000 BTC" in prompt
+        assert "Subscribe" not in prompt
+
+    def test_all_boilerplate_article_is_sent_as_is(self):
+        body = "By Jane Doe\n\n© 2026 CoinDesk. All rights reserved."
+
+        jsonl = build_content_analysis_jsonl([(1, "Title", body, None)])
+
+        prompt = json.loads(jsonl)["request"]["contents"][0]["parts"][0]["text"]
+        assert "Jane Doe" in prompt and "All rights reserved" in prompt
+
+
+@pytest.mark.unit
+class TestResults:
+    def test_outputs_are_validated_per_article(self):
+        valid = stub_content_analysis(
+            {"contents": [{"parts": [{"text": "TITLE: Miners"}]}]}
+        )
+        jsonl = "\n".join(
+            [
+                _response_line("article-1", valid),
+                _response_line("article-2", '{"sentiment": "POSITIVE"}'),
+                json.dumps({"key": "article-3", "error": {"message": "blocked"}}),
+                _response_line("unexpected", valid),
+                "",
+            ]
+        )
+
+        results = parse_batch_results(jsonl, ContentAnalysis)
+
+        assert sorted(results) == [1, 2, 3]
+        assert results[1].output.summary == "Stub analysis of Miners."
+        assert results[1].usage.request_tokens == 100
+        assert results[1].usage.total_tokens == 150
+        assert results[2].output is None and "validation errors" in results[2].error
+        assert results[2].usage.response_tokens == 50
+        assert results[3].output is None and results[3].error == "blocked"
+
+    def test_batch_cost_is_discounted(self):
+        usage = Usage(request_tokens=1_000_000, response_tokens=1_000_000)
+
+        assert batch_cost(usage) == pytest.approx((0.075 + 0.30) / 2)
+
+    def test_estimate_covers_prompts_and_expected_output(self):
+        one = build_content_analysis_jsonl([(1, "Miners", ARTICLE_BODY, None)])
+        two = build_content_analysis_jsonl(
+            [(1, "Miners", ARTICLE_BODY, None), (2, "Miners", ARTICLE_BODY, None)]
+        )
+        request = json.loads(one)["request"]
+        prompt_tokens = estimate_tokens(
+            request["system_instruction"]["parts"][0]["text"]
+        ) + estimate_tokens(request["contents"][0]["parts"][0]["text"])
+
+        assert estimate_batch_cost(one) == pytest.approx(
+            batch_cost(
+                Usage(
+                    request_tokens=prompt_tokens,
+                    response_tokens=batch_jobs.ESTIMATED_OUTPUT_TOKENS,
+                )
+            )
+        )
+        assert estimate_batch_cost(two) == pytest.approx(2 * estimate_batch_cost(one))
+
+
+@pytest.mark.unit
+class TestStubBackend:
+    def test_job_lifecycle_across_backend_instances(self, tmp_path):
+        jsonl = build_content_analysis_jsonl([(5, "Miners", ARTICLE_BODY, None)])
+        submitter = StubBatchBackend(tmp_path, completion_seconds=0.2)
+
+        async def scenario():
+            job_id = await submitter.submit(jsonl, "backlog")
+            # Another worker polls the same job
+            poller = StubBatchBackend(tmp_path, completion_seconds=0.2)
+            running = await poller.status(job_id)
+            await asyncio.sleep(0.25)
+            finished = await poller.status(job_id)
+            return running, finished, await poller.results(job_id)
+
+        running, finished, results_jsonl = asyncio.run(scenario())
+
+        assert (running.state, running.done) == ("RUNNING", False)
+        assert (finished.state, finished.done) == ("SUCCEEDED", True)
+        result = parse_batch_results(results_jsonl, ContentAnalysis)[5]
+        assert result.output.summary == "Stub analysis of Miners."
+        assert result.usage.request_tokens > 0 and result.error is None
+
+    def test_cancelled_job(self, tmp_path):
+        jsonl = build_content_analysis_jsonl([(5, "Miners", ARTICLE_BODY, None)])
+        backend = StubBatchBackend(tmp_path, completion_seconds=60)
+
+        async def scenario():
+            job_id = await backend.submit(jsonl, "backlog")
+            await backend.cancel(job_id)
+            return await backend.status(job_id)
+
+        status = asyncio.run(scenario())
+
+        assert (status.state, status.done) == ("CANCELLED", True)
+        with pytest.raises(ValueError, match="Unknown job"):
+            asyncio.run(backend.cancel("stub-missing"))
+
+    def test_unknown_job_fails(self, tmp_path):
+        status = asyncio.run(StubBatchBackend(tmp_path).status("stub-missing"))
+
+        assert status.state == "FAILED" and status.done
+
+
+@pytest.mark.unit
+class TestConfiguration:
+    def test_backend_selection(self, monkeypatch):
+        monkeypatch.setattr(analysis_settings, "gemini_api_key", None)
+
+        assert isinstance(create_batch_backend("stub"), StubBatchBackend)
+        with pytest.raises(ValueError, match="Unknown batch job backend"):
+            create_batch_backend("openai")
+        with pytest.raises(ValueError, match="GEMINI_API_KEY"):
+            create_batch_backend("gemini")
+
+    def test_submission_task_is_opt_in(self, monkeypatch):
+        monkeypatch.setattr(analysis_settings, "backlog_batch_jobs", False)
+        monkeypatch.setattr(batch_jobs, "get_batch_backend", pytest.fail)
+
+        assert submit_backlog_analysis_batch_task.run() == {
+            "success": True,
+            "status": "disabled",
+        }
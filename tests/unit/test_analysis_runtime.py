@@ -0,0 +1,189 @@
+"""Unit tests for the persistent analysis event loop."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from sqlalchemy import text
+
+from crypto_newsletter.analysis.runtime import AnalysisRuntime
+from crypto_newsletter.shared.database import connection
+from crypto_newsletter.shared.database.connection import DatabaseManager
+
+
+@pytest.fixture
+def runtime():
+    runtime = AnalysisRuntime(name="test-runtime")
+    yield runtime
+    runtime.shutdown(timeout=1)
+
+
+async def _loop_identity():
+    return asyncio.get_running_loop(), threading.current_thread().name
+
+
+@pytest.mark.unit
+class TestAnalysisRuntime:
+    def test_reuses_one_loop_across_calls(self, runtime):
+        first = runtime.run(_loop_identity())
+        second = runtime.run(_loop_identity())
+
+        assert first == second
+        assert first[1] == "test-runtime"
+        assert first[0] is not None and runtime.running
+
+    def test_submissions_run_concurrently(self, runtime):
+        async def nap():
+            await asyncio.sleep(0.2)
+            return 1
+
+        started = time.perf_counter()
+        futures = [runtime.submit(nap()) for _ in range(10)]
+
+        assert sum(future.result(timeout=5) for future in futures) == 10
+        assert time.perf_counter() - started < 1.0
+        assert runtime.inflight == 0
+
+    def test_timeout_cancels_coroutine(self, runtime):
+        cancelled = threading.Event()
+
+        async def hang():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            runtime.run(hang(), timeout=0.1)
+        assert cancelled.wait(timeout=2)
+
+    def test_exceptions_propagate(self, runtime):
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            runtime.run(fail())
+
+    def test_run_from_runtime_loop_is_refused(self, runtime):
+        async def nested():
+            return runtime.run(_loop_identity())
+
+        with pytest.raises(RuntimeError, match="own event loop"):
+            runtime.run(nested())
+
+    def test_shutdown_drains_inflight_work(self, runtime):
+        async def slow():
+            await asyncio.sleep(0.3)
+            return "done"
+
+        future = runtime.submit(slow())
+        runtime.shutdown(timeout=5)
+
+        assert future.result(timeout=0) == "done"
+        assert not runtime.running
+
+    def test_shutdown_cancels_after_drain_timeout(self, runtime):
+        async def hang():
+            await asyncio.sleep(60)
+
+        future = runtime.submit(hang())
+        started = time.perf_counter()
+        runtime.shutdown(timeout=0.1)
+
+        assert future.cancelled()
+        assert time.perf_counter() - started < 5
+
+    def test_refuses_work_while_draining_and_restarts_after(self, runtime):
+        release = threading.Event()
+        refused = []
+
+        async def blocker():
+            await asyncio.to_thread(release.wait, 5)
+
+        runtime.submit(blocker())
+        stopper = threading.Thread(target=runtime.shutdown, kwargs={"timeout": 5})
+        stopper.start()
+        time.sleep(0.1)
+        try:
+            runtime.submit(_loop_identity())
+        except RuntimeError as e:
+            refused.append(e)
+        release.set()
+        stopper.join(timeout=10)
+
+        assert refused and "shutting down" in str(refused[0])
+        assert runtime.run(_loop_identity())[1] == "test-runtime"
+
+    def test_db_pool_is_reused_and_disposed(self, runtime, tmp_path, monkeypatch):
+        manager = DatabaseManager()
+        manager.initialize(f"sqlite+aiosqlite:///{tmp_path / 'runtime.db'}")
+        monkeypatch.setattr(connection, "_db_manager", manager)
+
+        async def query():
+            async with connection.get_db_session() as db:
+                await db.execute(text("SELECT 1"))
+            return id(manager.engine)
+
+        assert runtime.warm_up()
+        assert runtime.run(query()) == runtime.run(query())
+        assert manager.engine_count == 1
+
+        runtime.shutdown(timeout=1)
+
+        assert manager.engine_count == 0
+
+    def test_warm_up_touches_each_agent_model(self, runtime, tmp_path, monkeypatch):
+        from crypto_newsletter.analysis.agents import providers
+        from crypto_newsletter.analysis.agents.content_analysis import (
+            content_analysis_agent,
+        )
+        from crypto_newsletter.analysis.agents.signal_validation import (
+            signal_validation_agent,
+        )
+
+        manager = DatabaseManager()
+        manager.initialize(f"sqlite+aiosqlite:///{tmp_path / 'runtime.db'}")
+        monkeypatch.setattr(connection, "_db_manager", manager)
+        warmed = []
+
+        async def fake_warm_up_model(model):
+            warmed.append((model, asyncio.get_running_loop()))
+
+        monkeypatch.setattr(providers, "warm_up_model", fake_warm_up_model)
+
+        assert runtime.warm_up()
+
+        loop = runtime.run(_loop_identity())[0]
+        assert warmed == [
+            (content_analysis_agent.model, loop),
+            (signal_validation_agent.model, loop),
+        ]
+
+    def test_warm_up_failure_is_reported_not_raised(self, runtime, monkeypatch):
+        async def broken():
+            raise ConnectionError("provider unreachable")
+
+        monkeypatch.setattr(runtime, "_warm_up", broken)
+
+        assert runtime.warm_up() is False
+
+
+@pytest.mark.unit
+def test_worker_process_init_warms_analysis_runtime(monkeypatch):
+    from crypto_newsletter.analysis import runtime as runtime_module
+    from crypto_newsletter.shared.celery import worker
+
+    warmed = threading.Event()
+
+    class FakeRuntime:
+        def warm_up(self):
+            warmed.set()
+            return True
+
+    monkeypatch.setattr(runtime_module, "get_analysis_runtime", FakeRuntime)
+
+    worker.worker_process_init_handler()
+
+    assert warmed.wait(timeout=5)
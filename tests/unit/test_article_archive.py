@@ -0,0 +1,174 @@
+"""Unit tests for chunked article archiving, checkpoint/resume and restore."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from crypto_newsletter.core.storage import archive
+from crypto_newsletter.core.storage.archive import (
+    ArchiveCheckpoint,
+    ArticleArchiver,
+    iter_archive_files,
+    read_archive_file,
+    resolve_archive_format,
+    restore_articles,
+    write_archive_file,
+)
+from crypto_newsletter.shared.database import connection
+from crypto_newsletter.shared.database.connection import DatabaseManager
+from crypto_newsletter.shared.models import Article
+
+NOW = datetime(2026, 10, 1, tzinfo=UTC)
+OLD_ARTICLES = 25
+
+
+def _article_row(n: int, published_on: datetime) -> dict:
+    return {
+        "id": n,
+        "external_id": 1000 + n,
+        "guid": f"guid-{n}",
+        "title": f"Article {n}",
+        "url": f"https://example.com/{n}",
+        "body": "Bitcoin " * 20,
+        "published_on": published_on,
+        "upvotes": 0,
+        "downvotes": 0,
+        "score": n,
+        "status": "ACTIVE",
+        "created_at": published_on,
+        "updated_at": published_on,
+    }
+
+
+@pytest.fixture
+def article_db(tmp_path, monkeypatch):
+    """SQLite-backed database manager seeded with old and recent articles."""
+    manager = DatabaseManager()
+    manager.initialize(f"sqlite+aiosqlite:///{tmp_path / 'archive.db'}")
+    monkeypatch.setattr(connection, "_db_manager", manager)
+
+    async def seed():
+        async with manager.engine.begin() as conn:
+            await conn.run_sync(Article.__table__.create)
+        async with manager.get_session() as session:
+            rows = [
+                _article_row(n, NOW - timedelta(days=60, hours=n))
+                for n in range(1, OLD_ARTICLES + 1)
+            ]
+            rows += [
+                _article_row(n, NOW - timedelta(days=1))
+                for n in range(OLD_ARTICLES + 1, OLD_ARTICLES + 6)
+            ]
+            await session.execute(Article.__table__.insert(), rows)
+
+    asyncio.run(seed())
+    yield manager
+    manager._discard_all()
+
+
+async def _status_counts() -> dict[str, int]:
+    async with connection.get_db_session() as session:
+        result = await session.execute(
+            select(Article.status, func.count()).group_by(Article.status)
+        )
+        return dict(result.all())
+
+
+@pytest.mark.unit
+class TestArchiveFiles:
+    """Archive files round-trip article rows in every available format."""
+
+    @pytest.mark.parametrize(
+        ("archive_format", "module"),
+        [
+            ("ndjson-gzip", None),
+            ("ndjson-zstd", "zstandard"),
+            ("parquet", "pyarrow"),
+        ],
+    )
+    def test_round_trip(self, tmp_path, archive_format, module):
+        if module:
+            pytest.importorskip(module)
+        rows = [_article_row(n, NOW - timedelta(days=n)) for n in range(1, 4)]
+        extension = archive.ARCHIVE_FORMATS[archive_format]
+        path = tmp_path / f"articles-test-000000000001.{extension}"
+
+        size = write_archive_file(path, rows, archive_format)
+
+        assert size == path.stat().st_size > 0
+        assert read_archive_file(path) == rows
+        assert list(iter_archive_files(tmp_path)) == [path]
+
+    def test_unknown_format_rejected(self):
+        with pytest.raises(ValueError, match="Unknown archive format"):
+            resolve_archive_format("xml")
+
+    def test_auto_falls_back_to_gzip(self, monkeypatch):
+        monkeypatch.setattr(archive, "_has_module", lambda name: False)
+        assert resolve_archive_format("auto") == "ndjson-gzip"
+
+
+@pytest.mark.unit
+class TestArticleArchiver:
+    """Old articles are archived and soft-deleted in resumable chunks."""
+
+    def test_archives_in_chunks(self, article_db, tmp_path):
+        archiver = ArticleArchiver(
+            tmp_path / "archive",
+            chunk_size=10,
+            sleep_seconds=0,
+            archive_format="ndjson-gzip",
+        )
+
+        report = asyncio.run(archiver.run(NOW - timedelta(days=30)))
+
+        assert report["completed"] is True
+        assert report["chunks"] == 3
+        assert report["articles_archived"] == OLD_ARTICLES
+        assert report["bytes_written"] > 0
+        assert asyncio.run(_status_counts()) == {"DELETED": OLD_ARTICLES, "ACTIVE": 5}
+
+        files = list(iter_archive_files(archiver.archive_dir))
+        assert len(files) == 3
+        archived_ids = [row["id"] for path in files for row in read_archive_file(path)]
+        assert archived_ids == list(range(1, OLD_ARTICLES + 1))
+
+    def test_resume_continues_from_checkpoint(self, article_db, tmp_path):
+        archiver = ArticleArchiver(
+            tmp_path / "archive",
+            chunk_size=10,
+            sleep_seconds=0,
+            archive_format="ndjson-gzip",
+        )
+        cutoff = NOW - timedelta(days=30)
+
+        first = asyncio.run(archiver.run(cutoff, max_chunks=1))
+        assert first["completed"] is False
+        assert first["last_id"] == 10
+        checkpoint = ArchiveCheckpoint.load(archiver.checkpoint_path)
+        assert checkpoint.rows == 10 and not checkpoint.completed
+
+        second = asyncio.run(archiver.run(cutoff))
+        assert second["completed"] is True
+        assert second["chunks"] == 3
+        assert second["articles_archived"] == OLD_ARTICLES
+        assert len(list(iter_archive_files(archiver.archive_dir))) == 3
+
+    def test_restore_reactivates_archived_articles(self, article_db, tmp_path):
+        archiver = ArticleArchiver(
+            tmp_path / "archive",
+            chunk_size=10,
+            sleep_seconds=0,
+            archive_format="ndjson-gzip",
+        )
+        asyncio.run(archiver.run(NOW - timedelta(days=30)))
+
+        preview = asyncio.run(restore_articles(archiver.archive_dir, dry_run=True))
+        assert preview == {"files": 3, "articles_restored": 25, "articles_inserted": 0}
+        assert asyncio.run(_status_counts())["DELETED"] == OLD_ARTICLES
+
+        summary = asyncio.run(restore_articles(archiver.archive_dir))
+        assert summary["articles_restored"] == OLD_ARTICLES
+        assert asyncio.run(_status_counts()) == {"ACTIVE": OLD_ARTICLES + 5}
@@ -0,0 +1,219 @@
+"""Unit tests for article condensation before content analysis."""
+
+import asyncio
+
+import pytest
+
+from crypto_newsletter.analysis.agents import orchestrator as orchestrator_module
+from crypto_newsletter.analysis.agents.content_analysis import content_analysis_agent
+from crypto_newsletter.analysis.agents.orchestrator import AnalysisOrchestrator
+from crypto_newsletter.analysis.agents.settings import analysis_settings
+from crypto_newsletter.analysis.cache import LLMCache
+from crypto_newsletter.analysis.condense import (
+    condense_article,
+    estimate_tokens,
+    split_sentences,
+)
+from crypto_newsletter.analysis.dependencies import AnalysisDependencies, CostTracker
+
+LEDE = (
+    "BlackRock's spot bitcoin ETF took in $1.2 billion on Tuesday, its largest "
+    "daily inflow since March."
+)
+FILLER = (
+    "Many people have been talking about this for a while now and it is "
+    "something that a lot of people think is interesting in many ways."
+)
+SPECIFIC = (
+    "Fidelity's FBTC added $340 million while Grayscale's GBTC lost $95 million "
+    "as bitcoin ETF inflows topped $2 billion for the week."
+)
+
+
+def _article(paragraphs: list[str]) -> str:
+    return "\n\n".join(paragraphs)
+
+
+@pytest.mark.unit
+class TestCleaning:
+    def test_boilerplate_paragraphs_are_removed(self):
+        body = _article(
+            [
+                "By Jane Doe",
+                LEDE,
+                "Read more: Bitcoin hits new high",
+                SPECIFIC,
+                "Disclaimer: This article is provided for informational purposes "
+                "only. It is not financial advice.",
+                "Subscribe to our daily newsletter for the latest crypto news.",
+                "© 2026 CoinDesk. All rights reserved.",
+            ]
+        )
+
+        condensed = condense_article(body, token_budget=10_000)
+
+        assert condensed.text == f"{LEDE}\n\n{SPECIFIC}"
+        assert condensed.boilerplate_removed == 5
+        assert condensed.sentences_dropped == 0
+        assert condensed.tokens_saved == (
+            estimate_tokens(body) - estimate_tokens(condensed.text)
+        )
+
+    def test_news_sentences_that_open_like_boilerplate_are_kept(self):
+        sentences = [
+            "Published data shows bitcoin ETF inflows hit $1 billion on Monday.",
+            "Updated rules from the SEC require custodians to segregate assets.",
+            "By Tuesday outflows had reversed.",
+            "Join the Solana validator community call on Thursday.",
+        ]
+        body = _article([LEDE, *sentences])
+
+        condensed = condense_article(body, 10_000)
+
+        assert condensed.boilerplate_removed == 0
+        assert condensed.text == body
+
+    def test_datelines_and_bylines_are_removed(self):
+        body = _article(
+            [
+                "Published: Oct. 17, 2026 at 3:45 p.m. UTC",
+                "Updated: 2026-10-18",
+                "By Jane Doe and John O'Brien",
+                LEDE,
+            ]
+        )
+
+        condensed = condense_article(body, 10_000)
+
+        assert condensed.boilerplate_removed == 3
+        assert condensed.text == LEDE
+
+    def test_long_paragraphs_are_never_boilerplate(self):
+        long_paragraph = (
+            "Analysts stressed that the note was not financial advice, but the "
+            "report went on to detail " + "inflows and outflows " * 30
+        )
+
+        condensed = condense_article(_article([LEDE, long_paragraph]), 10_000)
+
+        assert condensed.boilerplate_removed == 0
+        assert long_paragraph.strip() in condensed.text
+
+    def test_duplicate_paragraphs_are_removed(self):
+        body = _article([LEDE, SPECIFIC, LEDE.upper(), f"  {SPECIFIC}  "])
+
+        condensed = condense_article(body, 10_000)
+
+        assert condensed.duplicates_removed == 2
+        assert condensed.text == f"{LEDE}\n\n{SPECIFIC}"
+
+    def test_single_line_break_paragraphs(self):
+        body = f"{LEDE}\nRelated: ETF flows explained\n{SPECIFIC}"
+
+        assert condense_article(body, 10_000).text == f"{LEDE}\n\n{SPECIFIC}"
+
+
+@pytest.mark.unit
+class TestBudget:
+    def test_keeps_dense_sentences_within_budget(self):
+        body = _article(
+            [LEDE, " ".join([FILLER] * 3), SPECIFIC, FILLER + " " + SPECIFIC]
+        )
+        budget = estimate_tokens(LEDE) + estimate_tokens(SPECIFIC) + 5
+
+        condensed = condense_article(body, budget)
+
+        assert condensed.condensed_tokens <= budget
+        assert condensed.text == f"{LEDE}\n\n{SPECIFIC}"
+        assert condensed.sentences_dropped > 0
+        assert condensed.original_tokens > condensed.condensed_tokens
+
+    def test_selected_sentences_keep_article_order(self):
+        sentences = [
+            f"Sentence {n} reports that Coinbase listed token {n} at ${n}.{n} million."
+            for n in range(40)
+        ]
+        body = " ".join(sentences)
+
+        condensed = condense_article(body, token_budget=200)
+        kept = split_sentences(condensed.text)
+
+        assert kept[0] == sentences[0]
+        assert kept == sorted(kept, key=sentences.index)
+        assert 0 < len(kept) < 40
+
+    def test_sentence_splitting(self):
+        text = 'The U.S. SEC approved it. "Prices rose 5%." 2026 looks busy! ok.'
+
+        assert split_sentences(text) == [
+            "The U.S. SEC approved it.",
+            '"Prices rose 5%."',
+            "2026 looks busy! ok.",
+        ]
+
+
+@pytest.mark.unit
+class TestOrchestratorCondensation:
+    def test_model_receives_condensed_article(self, monkeypatch):
+        monkeypatch.setattr(
+            orchestrator_module, "get_llm_cache", lambda: LLMCache(None)
+        )
+        monkeypatch.setattr(analysis_settings, "article_token_budget", 60)
+        prompts = []
+        run = content_analysis_agent.run
+
+        async def recording_run(prompt, **kwargs):
+            prompts.append(prompt)
+            return await run(prompt, **kwargs)
+
+        monkeypatch.setattr(content_analysis_agent, "run", recording_run)
+        body = _article(["By Jane Doe", LEDE, " ".join([FILLER] * 20), SPECIFIC])
+        deps = AnalysisDependencies(
+            db_session=None,
+            cost_tracker=CostTracker(daily_budget=10.0),
+            min_signal_confidence=2.0,
+        )
+
+        result = asyncio.run(
+            AnalysisOrchestrator().analyze_article(1, "Title", body, "Pub", deps)
+        )
+
+        assert result["success"]
+        assert result["condensation"]["condensed_tokens"] <= 60
+        assert result["condensation"]["tokens_saved"] > 300
+        assert result["condensation"]["boilerplate_removed"] == 1
+        assert result["processing_metadata"]["processing_time_ms"] >= 0
+        assert LEDE in prompts[0] and "Jane Doe" not in prompts[0]
+        assert FILLER not in prompts[0]
+
+    def test_all_boilerplate_article_is_sent_as_is(self, monkeypatch):
+        monkeypatch.setattr(
+            orchestrator_module, "get_llm_cache", lambda: LLMCache(None)
+        )
+        prompts = []
+        run = content_analysis_agent.run
+
+        async def recording_run(prompt, **kwargs):
+            prompts.append(prompt)
+            return await run(prompt, **kwargs)
+
+        monkeypatch.setattr(content_analysis_agent, "run", recording_run)
+        disclaimer = (
+            "Disclaimer: This article is provided for informational purposes "
+            "only. It is not financial advice."
+        )
+        body = _article(["By Jane Doe", disclaimer])
+        deps = AnalysisDependencies(
+            db_session=None,
+            cost_tracker=CostTracker(daily_budget=10.0),
+            min_signal_confidence=2.0,
+        )
+
+        assert condense_article(body, token_budget=60).text == ""
+
+        result = asyncio.run(
+            AnalysisOrchestrator().analyze_article(1, "Title", body, "Pub", deps)
+        )
+
+        assert result["success"]
+        assert "Jane Doe" in prompts[0] and disclaimer in prompts[0]
@@ -0,0 +1,228 @@
+"""Unit tests for the streaming article export (NDJSON, CSV, Parquet)."""
+
+import asyncio
+import csv
+import gzip
+import io
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from crypto_newsletter.core.storage import export
+from crypto_newsletter.core.storage.export import (
+    ARTICLE_FIELDS,
+    ExportQuery,
+    ExportStats,
+    check_export_options,
+    export_filename,
+    export_media_type,
+    export_to_file,
+    stream_export,
+)
+from crypto_newsletter.shared.database import connection
+from crypto_newsletter.shared.database.connection import DatabaseManager
+from crypto_newsletter.shared.models import Article, Publisher
+from crypto_newsletter.web.routers import api
+
+NOW = datetime.now(UTC)
+ARTICLES = 23
+
+
+@pytest.fixture
+def article_db(tmp_path, monkeypatch):
+    """SQLite-backed database manager seeded with articles and a publisher."""
+    manager = DatabaseManager()
+    manager.initialize(f"sqlite+aiosqlite:///{tmp_path / 'export.db'}")
+    monkeypatch.setattr(connection, "_db_manager", manager)
+
+    async def seed():
+        async with manager.engine.begin() as conn:
+            await conn.run_sync(Publisher.__table__.create)
+            await conn.run_sync(Article.__table__.create)
+        async with manager.get_session() as session:
+            session.add(
+                Publisher(id=1, source_id=5, source_key="coindesk", name="CoinDesk")
+            )
+            for n in range(1, ARTICLES + 1):
+                published_on = NOW - timedelta(hours=n)
+                session.add(
+                    Article(
+                        id=n,
+                        external_id=1000 + n,
+                        guid=f"guid-{n}",
+                        title=f'Article {n}, "quoted"',
+                        url=f"https://example.com/{n}",
+                        body="Bitcoin\nbody",
+                        published_on=published_on,
+                        publisher_id=1 if n % 2 else None,
+                        upvotes=0,
+                        downvotes=0,
+                        score=n,
+                        status="DELETED" if n == ARTICLES else "ACTIVE",
+                        created_at=published_on,
+                        updated_at=published_on,
+                    )
+                )
+
+    asyncio.run(seed())
+    yield manager
+    asyncio.run(manager.close())
+
+
+def _export(query: ExportQuery, export_format: str, compression: str = "none"):
+    async def collect():
+        stats = ExportStats()
+        chunks = [
+            chunk
+            async for chunk in stream_export(
+                query, export_format, compression, chunk_size=5, stats=stats
+            )
+        ]
+        return b"".join(chunks), stats, len(chunks)
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.unit
+class TestExportOptions:
+    def test_rejects_unknown_format_and_compression(self):
+        with pytest.raises(ValueError, match="format"):
+            check_export_options("xml", "none")
+        with pytest.raises(ValueError, match="compression"):
+            check_export_options("csv", "bzip2")
+
+    def test_missing_optional_dependency(self, monkeypatch):
+        monkeypatch.setattr(export, "_has_module", lambda name: False)
+
+        with pytest.raises(ImportError, match="archive"):
+            check_export_options("parquet", "none")
+        with pytest.raises(ImportError, match="zstandard"):
+            check_export_options("ndjson", "zstd")
+        check_export_options("csv", "gzip")
+
+    def test_filenames_and_media_types(self):
+        assert export_filename("ndjson", "zstd") == "articles.ndjson.zst"
+        assert export_filename("csv", "gzip") == "articles.csv.gz"
+        assert export_filename("parquet", "zstd") == "articles.parquet"
+        assert export_media_type("csv", "none") == "text/csv"
+        assert export_media_type("ndjson", "gzip") == "application/gzip"
+        assert export_media_type("parquet", "zstd") == (
+            "application/vnd.apache.parquet"
+        )
+
+    def test_fields(self):
+        assert ExportQuery().fields == list(ARTICLE_FIELDS)
+        query = ExportQuery(include_body=True, include_analysis=True)
+        assert query.fields[len(ARTICLE_FIELDS)] == "body"
+        assert "impact_score" in query.fields
+
+
+@pytest.mark.unit
+class TestStreamExport:
+    def test_ndjson_streams_in_chunks(self, article_db):
+        data, stats, chunks = _export(ExportQuery(), "ndjson")
+
+        rows = [json.loads(line) for line in data.decode().splitlines()]
+        assert len(rows) == stats.rows == ARTICLES - 1
+        # One chunk per cursor partition, plus the (empty) trailer
+        assert chunks == 6
+        assert [row["id"] for row in rows] == list(range(ARTICLES - 1, 0, -1))
+        assert rows[-1]["publisher"] == "CoinDesk"
+        assert rows[-2]["publisher"] is None
+        assert "body" not in rows[0]
+        assert stats.bytes_written == len(data)
+        assert stats.report()["rows_per_second"] > 0
+
+    def test_filters(self, article_db):
+        query = ExportQuery(
+            since=NOW - timedelta(hours=10), status=None, publisher_id=1
+        )
+        data, _, _ = _export(query, "ndjson")
+
+        ids = [json.loads(line)["id"] for line in data.decode().splitlines()]
+        assert ids == [9, 7, 5, 3, 1]
+
+    def test_csv_with_body_and_gzip(self, article_db):
+        data, stats, _ = _export(ExportQuery(include_body=True), "csv", "gzip")
+
+        rows = list(csv.reader(io.StringIO(gzip.decompress(data).decode())))
+        assert rows[0] == [*ARTICLE_FIELDS, "body"]
+        assert len(rows) - 1 == stats.rows
+        assert rows[-1][2] == 'Article 1, "quoted"'
+        assert rows[-1][-1] == "Bitcoin\nbody"
+
+    def test_ndjson_zstd(self, article_db):
+        zstandard = pytest.importorskip("zstandard")
+
+        data, stats, _ = _export(ExportQuery(), "ndjson", "zstd")
+
+        decompressed = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data))
+        lines = decompressed.read().decode().splitlines()
+        assert len(lines) == stats.rows
+
+    def test_parquet(self, article_db):
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        data, stats, _ = _export(ExportQuery(), "parquet", "zstd")
+
+        parquet = pq.ParquetFile(io.BytesIO(data))
+        table = parquet.read()
+        assert table.num_rows == stats.rows
+        assert parquet.metadata.num_row_groups == 5
+        assert parquet.metadata.row_group(0).column(0).compression == "ZSTD"
+        assert table.column("publisher").to_pylist()[-1] == "CoinDesk"
+        assert str(table.schema.field("published_on").type) == "timestamp[us, tz=UTC]"
+
+    def test_export_to_file_is_atomic(self, article_db, tmp_path):
+        path = tmp_path / "articles.ndjson"
+        report = asyncio.run(export_to_file(path, ExportQuery(), "ndjson"))
+
+        assert report["rows"] == ARTICLES - 1
+        assert report["path"] == str(path)
+        assert len(path.read_text().splitlines()) == ARTICLES - 1
+        assert list(tmp_path.glob(".*.tmp")) == []
+
+
+@pytest.mark.unit
+class TestExportEndpoint:
+    @pytest.fixture
+    def anonymous_client(self, article_db):
+        app = FastAPI()
+        app.include_router(api.router, prefix="/api")
+        return TestClient(app)
+
+    @pytest.fixture
+    def client(self, anonymous_client):
+        anonymous_client.app.dependency_overrides[api.get_api_key] = lambda: "key"
+        return anonymous_client
+
+    def test_streams_download(self, client):
+        response = client.get("/api/export?format=csv&compression=gzip&days=0")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert 'filename="articles.csv.gz"' in response.headers["content-disposition"]
+        lines = gzip.decompress(response.content).decode().splitlines()
+        assert len(lines) == ARTICLES
+
+    def test_invalid_options(self, client):
+        assert client.get("/api/export?format=xml").status_code == 400
+        assert client.get("/api/export?start_date=yesterday").status_code == 400
+
+    def test_anonymous_exports_are_recent_and_bodiless(self, anonymous_client):
+        recent = anonymous_client.get("/api/export?format=csv&days=1")
+        assert recent.status_code == 200
+        assert "body" not in recent.text.splitlines()[0]
+
+        old = (NOW - timedelta(days=30)).isoformat()
+        for refused in (
+            "days=0",
+            "days=30",
+            "include_body=true",
+            f"start_date={old.replace('+', '%2B')}",
+        ):
+            response = anonymous_client.get(f"/api/export?{refused}")
+            assert response.status_code == 403, refused
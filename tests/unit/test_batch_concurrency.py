@@ -0,0 +1,244 @@
+"""Unit tests for concurrent batch analysis and LLM request rate limiting."""
+
+import asyncio
+import time
+from datetime import UTC, datetime
+
+import pytest
+
+from crypto_newsletter.analysis import budget
+from crypto_newsletter.analysis import tasks as analysis_tasks
+from crypto_newsletter.analysis.budget import LocalBudgetLedger
+from crypto_newsletter.analysis.dependencies import CostTracker
+from crypto_newsletter.analysis.rate_limit import AsyncRateLimiter
+from crypto_newsletter.analysis.tasks import (
+    analyze_article_isolated,
+    analyze_articles_concurrently,
+)
+from crypto_newsletter.newsletter.batch.config import BatchProcessingConfig
+from crypto_newsletter.newsletter.batch.tasks import batch_analyze_articles_async
+from crypto_newsletter.shared.database import connection
+from crypto_newsletter.shared.database.connection import DatabaseManager
+from crypto_newsletter.shared.models import Article, Publisher
+
+
+class FakeAnalyses:
+    """Stand-in for analyze_article_isolated that records concurrency."""
+
+    def __init__(self, durations: dict[int, float], failing: tuple = ()) -> None:
+        self.durations = durations
+        self.failing = failing
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(
+        self,
+        article_id: int,
+        cost_tracker: CostTracker,
+        packed=None,
+        session_id=None,
+    ) -> dict:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.durations.get(article_id, 0.1))
+            if article_id in self.failing:
+                raise RuntimeError(f"provider error for {article_id}")
+            return {
+                "success": True,
+                "article_id": article_id,
+                "processing_cost": 0.001,
+                "signals_found": 2,
+            }
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.unit
+class TestAsyncRateLimiter:
+    def test_paces_after_burst(self):
+        limiter = AsyncRateLimiter(rate=20, burst=2)
+
+        async def acquire_all():
+            started = time.perf_counter()
+            waits = [await limiter.acquire() for _ in range(6)]
+            return time.perf_counter() - started, waits
+
+        elapsed, waits = asyncio.run(acquire_all())
+
+        # Two free tokens, then one every 50ms
+        assert 0.18 <= elapsed < 0.5
+        assert waits[:2] == [0.0, 0.0]
+        assert all(wait > 0 for wait in waits[2:])
+
+    def test_shared_by_concurrent_waiters(self):
+        limiter = AsyncRateLimiter.per_minute(600, burst=1)
+
+        async def acquire_concurrently():
+            started = time.perf_counter()
+            await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+            return time.perf_counter() - started
+
+        assert 0.28 <= asyncio.run(acquire_concurrently()) < 0.6
+
+    def test_rebinds_to_new_event_loop(self):
+        limiter = AsyncRateLimiter(rate=1000, burst=5)
+
+        asyncio.run(limiter.acquire())
+        asyncio.run(limiter.acquire())
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            AsyncRateLimiter(rate=0)
+
+
+@pytest.mark.unit
+class TestAnalyzeArticlesConcurrently:
+    def test_wall_clock_tracks_slowest_article(self, monkeypatch):
+        fake = FakeAnalyses({n: 0.2 for n in range(10)} | {3: 0.4})
+        monkeypatch.setattr(analysis_tasks, "analyze_article_isolated", fake)
+
+        started = time.perf_counter()
+        results = asyncio.run(
+            analyze_articles_concurrently(
+                list(range(10)), max_concurrency=10, daily_budget=1.0
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.7  # sequentially: 2.2s
+        assert fake.peak == 10
+        assert sorted(r["article_id"] for r in results) == list(range(10))
+        # Gathered as they complete: the slow article comes last
+        assert results[-1]["article_id"] == 3
+        assert results[-1]["duration_seconds"] >= 0.4
+
+    def test_semaphore_bounds_concurrency(self, monkeypatch):
+        fake = FakeAnalyses({n: 0.05 for n in range(12)})
+        monkeypatch.setattr(analysis_tasks, "analyze_article_isolated", fake)
+
+        asyncio.run(
+            analyze_articles_concurrently(
+                list(range(12)), max_concurrency=3, daily_budget=1.0
+            )
+        )
+
+        assert fake.peak == 3
+
+    def test_failures_and_timeouts_are_isolated(self, monkeypatch):
+        fake = FakeAnalyses({1: 0.05, 2: 0.05, 3: 5.0}, failing=(2,))
+        monkeypatch.setattr(analysis_tasks, "analyze_article_isolated", fake)
+
+        results = asyncio.run(
+            analyze_articles_concurrently(
+                [1, 2, 3], max_concurrency=3, daily_budget=1.0, timeout=0.2
+            )
+        )
+        by_id = {r["article_id"]: r for r in results}
+
+        assert by_id[1]["success"]
+        assert by_id[2] == {
+            "success": False,
+            "article_id": 2,
+            "error": "provider error for 2",
+            "duration_seconds": by_id[2]["duration_seconds"],
+        }
+        assert "timed out" in by_id[3]["error"]
+
+
+@pytest.mark.unit
+class TestBatchTask:
+    def test_batch_runs_articles_concurrently(self, monkeypatch):
+        fake = FakeAnalyses({n: 0.3 for n in range(1, 6)}, failing=(5,))
+        monkeypatch.setattr(analysis_tasks, "analyze_article_isolated", fake)
+        monkeypatch.setattr(BatchProcessingConfig, "MAX_CONCURRENT_ARTICLES", 5)
+        ledger = LocalBudgetLedger(daily_budget=50.0)
+        monkeypatch.setattr(budget, "_budget_ledger", ledger)
+
+        started = time.perf_counter()
+        result = asyncio.run(
+            batch_analyze_articles_async.run([1, 2, 3, 4, 5], 1, "session")
+        )
+
+        assert time.perf_counter() - started < 1.0  # sequentially: 1.5s + 10s sleeps
+        assert result["status"] == "completed"
+        assert result["articles_processed"] == 4
+        assert result["articles_failed"] == 1
+        assert result["estimated_batch_cost"] == pytest.approx(0.004)
+        assert result["max_concurrency"] == 5
+        assert asyncio.run(ledger.usage("session"))["limit"] == (
+            BatchProcessingConfig.MAX_TOTAL_BUDGET
+        )
+
+    def test_concurrency_bounded_by_provider_limit(self):
+        assert BatchProcessingConfig.get_article_concurrency(2) == 2
+        assert BatchProcessingConfig.get_article_concurrency(100) == (
+            BatchProcessingConfig.MAX_CONCURRENT_ARTICLES
+        )
+        assert BatchProcessingConfig.get_article_concurrency(0) == 1
+
+
+@pytest.mark.unit
+class TestAnalyzeArticleIsolated:
+    @pytest.fixture
+    def article_db(self, tmp_path, monkeypatch):
+        manager = DatabaseManager()
+        manager.initialize(f"sqlite+aiosqlite:///{tmp_path / 'analysis.db'}")
+        monkeypatch.setattr(connection, "_db_manager", manager)
+
+        async def seed():
+            async with manager.engine.begin() as conn:
+                await conn.run_sync(Publisher.__table__.create)
+                await conn.run_sync(Article.__table__.create)
+            async with manager.get_session() as session:
+                session.add(
+                    Article(
+                        id=1,
+                        external_id=1001,
+                        guid="guid-1",
+                        title="Short",
+                        url="https://example.com/1",
+                        body="Too short",
+                        published_on=datetime(2026, 10, 1, tzinfo=UTC),
+                        status="ACTIVE",
+                    )
+                )
+                session.add(
+                    Article(
+                        id=2,
+                        external_id=1002,
+                        guid="guid-2",
+                        title="Analyzed",
+                        url="https://example.com/2",
+                        body="Bitcoin ETF inflows " * 200,
+                        published_on=datetime(2026, 10, 1, tzinfo=UTC),
+                        status="ACTIVE",
+                    )
+                )
+
+        asyncio.run(seed())
+        yield
+        asyncio.run(manager.close())
+
+    def test_missing_and_short_articles(self, article_db):
+        tracker = CostTracker(daily_budget=1.0)
+
+        missing = asyncio.run(analyze_article_isolated(99, tracker))
+        short = asyncio.run(analyze_article_isolated(1, tracker))
+
+        assert missing["success"] is False and "not found" in missing["error"]
+        assert short["success"] is False and "too short" in short["error"]
+
+    def test_existing_analysis_is_skipped(self, article_db, monkeypatch):
+        checked = []
+
+        async def fake_existing(db, article_id, analysis_version="1.0"):
+            checked.append((article_id, analysis_version))
+            return 42
+
+        monkeypatch.setattr(analysis_tasks, "existing_analysis_id", fake_existing)
+
+        result = asyncio.run(analyze_article_isolated(2, CostTracker(daily_budget=1.0)))
+
+        assert checked == [(2, "1.0")]
+        assert result["skipped"] is True and result["analysis_id"] == 42
@@ -0,0 +1,232 @@
+"""Unit tests for the analysis budget ledger."""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import text
+
+from crypto_newsletter.analysis import budget
+from crypto_newsletter.analysis.budget import (
+    BudgetExceededError,
+    LocalBudgetLedger,
+    RedisBudgetLedger,
+    create_budget_ledger,
+)
+from crypto_newsletter.analysis.dependencies import CostTracker
+from crypto_newsletter.analysis.tasks import analyze_article_isolated
+from crypto_newsletter.shared.database import connection
+from crypto_newsletter.shared.database.connection import DatabaseManager
+from crypto_newsletter.shared.models import Article, Publisher
+
+
+@pytest.mark.unit
+class TestReservations:
+    def test_concurrent_reservations_never_overspend(self):
+        ledger = LocalBudgetLedger(daily_budget=1.0)
+
+        async def analysis():
+            try:
+                reservation = await ledger.reserve(0.25)
+            except BudgetExceededError:
+                return False
+            await asyncio.sleep(0.05)
+            await ledger.commit(reservation, 0.25)
+            return True
+
+        async def scenario():
+            return await asyncio.gather(*(analysis() for _ in range(20)))
+
+        assert sum(asyncio.run(scenario())) == 4
+        usage = ledger.usage_sync()
+        assert usage["spent"] == pytest.approx(1.0)
+        assert usage["reserved"] == 0 and usage["analyses"] == 4
+
+    def test_commit_and_release_return_unused_holds(self):
+        ledger = LocalBudgetLedger(daily_budget=1.0)
+
+        async def scenario():
+            committed = await ledger.reserve(0.25)
+            released = await ledger.reserve(0.25)
+            held = await ledger.usage()
+            await ledger.commit(committed, 0.01)
+            await ledger.release(released)
+            return held, await ledger.usage()
+
+        held, settled = asyncio.run(scenario())
+
+        assert held["reserved"] == pytest.approx(0.5)
+        assert held["remaining"] == pytest.approx(0.5)
+        assert settled == {
+            "limit": 1.0,
+            "spent": pytest.approx(0.01),
+            "reserved": 0.0,
+            "remaining": pytest.approx(0.99),
+            "analyses": 1,
+        }
+
+    def test_session_budget_caps_its_analyses_only(self):
+        ledger = LocalBudgetLedger(daily_budget=10.0)
+
+        async def scenario():
+            await ledger.open_session("batch-1", 0.5)
+            first = await ledger.reserve(0.25, session_id="batch-1")
+            await ledger.reserve(0.25, session_id="batch-1")
+            with pytest.raises(
+                BudgetExceededError, match="Session analysis budget"
+            ) as e:
+                await ledger.reserve(0.25, session_id="batch-1")
+            # Other work still draws on the day's budget
+            await ledger.reserve(0.25)
+            await ledger.commit(first, 0.1)
+            return e.value, await ledger.usage("batch-1")
+
+        exceeded, session = asyncio.run(scenario())
+
+        assert exceeded.scope == "session" and exceeded.available == 0.0
+        assert session["spent"] == pytest.approx(0.1)
+        assert session["reserved"] == pytest.approx(0.25)
+        assert session["remaining"] == pytest.approx(0.15)
+
+    def test_expired_holds_are_reclaimed(self):
+        ledger = LocalBudgetLedger(daily_budget=0.5, hold_seconds=0.1)
+
+        async def scenario():
+            # A worker reserves the whole budget and dies
+            abandoned = await ledger.reserve(0.5)
+            with pytest.raises(BudgetExceededError, match=r"Daily .* \(\$0.0000"):
+                await ledger.reserve(0.25)
+            await asyncio.sleep(0.15)
+            reservation = await ledger.reserve(0.25)
+            # Settling the expired hold only adds its actual cost
+            await ledger.commit(abandoned, 0.05)
+            await ledger.commit(reservation, 0.05)
+
+        asyncio.run(scenario())
+
+        usage = ledger.usage_sync()
+        assert usage["spent"] == pytest.approx(0.1)
+        assert usage["reserved"] == 0
+
+    def test_long_holds_survive_later_reservations(self):
+        ledger = LocalBudgetLedger(daily_budget=1.0)
+
+        async def scenario():
+            await ledger.reserve(0.25, hold_seconds=0.01)
+            await asyncio.sleep(0.02)
+            # Reclaims the expired hold, but not the long one made after it
+            await ledger.reserve(0.25, hold_seconds=86400)
+            await ledger.reserve(0.25)
+            return await ledger.usage()
+
+        assert asyncio.run(scenario())["reserved"] == pytest.approx(0.5)
+
+    def test_budget_rolls_over_at_midnight(self, monkeypatch):
+        ledger = LocalBudgetLedger(daily_budget=0.25)
+        monkeypatch.setattr(budget, "_today", lambda: "2026-10-17")
+
+        async def scenario():
+            await ledger.commit(await ledger.reserve(0.25), 0.25)
+            with pytest.raises(BudgetExceededError):
+                await ledger.reserve(0.25)
+            monkeypatch.setattr(budget, "_today", lambda: "2026-10-18")
+            return await ledger.reserve(0.25)
+
+        assert asyncio.run(scenario()).day == "2026-10-18"
+
+    def test_unreserved_spending_is_recorded(self):
+        ledger = LocalBudgetLedger(daily_budget=1.0)
+
+        asyncio.run(ledger.record(0.4, analyses=3))
+
+        usage = ledger.usage_sync()
+        assert usage["spent"] == pytest.approx(0.4) and usage["analyses"] == 3
+        assert usage["remaining"] == pytest.approx(0.6)
+
+
+@pytest.mark.unit
+class TestConfiguration:
+    def test_backend_selection(self):
+        assert isinstance(create_budget_ledger(), RedisBudgetLedger)
+        assert isinstance(create_budget_ledger("local"), LocalBudgetLedger)
+        assert isinstance(create_budget_ledger("redis"), RedisBudgetLedger)
+        with pytest.raises(ValueError, match="Unknown budget ledger backend"):
+            create_budget_ledger("memcached")
+
+
+@pytest.mark.unit
+class TestRedisFallback:
+    def test_unreachable_redis_falls_back_to_local_budget(self, caplog):
+        # Nothing listens on port 1
+        ledger = RedisBudgetLedger(0.5, redis_url="redis://127.0.0.1:1/0")
+
+        async def scenario():
+            await ledger.open_session("batch-1", 0.3)
+            reservation = await ledger.reserve(0.25, session_id="batch-1")
+            with pytest.raises(BudgetExceededError, match="Session"):
+                await ledger.reserve(0.25, session_id="batch-1")
+            await ledger.commit(reservation, 0.1)
+            await ledger.record(0.2, analyses=2)
+            return reservation, await ledger.usage()
+
+        reservation, usage = asyncio.run(scenario())
+
+        assert reservation.fallback and ledger.degraded
+        assert usage["spent"] == pytest.approx(0.3) and usage["analyses"] == 3
+        assert ledger.usage_sync()["remaining"] == pytest.approx(0.2)
+        assert "cannot reach Redis" in caplog.text
+
+
+@pytest.mark.unit
+class TestAnalysisReservations:
+    @pytest.fixture
+    def article_db(self, tmp_path, monkeypatch):
+        manager = DatabaseManager()
+        manager.initialize(f"sqlite+aiosqlite:///{tmp_path / 'budget.db'}")
+        monkeypatch.setattr(connection, "_db_manager", manager)
+
+        async def seed():
+            async with manager.engine.begin() as conn:
+                await conn.run_sync(Publisher.__table__.create)
+                await conn.run_sync(Article.__table__.create)
+                # Only the columns the already-analyzed check reads (the
+                # model's JSONB columns do not exist in SQLite)
+                await conn.execute(
+                    text(
+                        "CREATE TABLE article_analyses "
+                        "(id INTEGER PRIMARY KEY, article_id INTEGER, "
+                        "analysis_version VARCHAR)"
+                    )
+                )
+            async with manager.get_session() as session:
+                session.add(
+                    Article(
+                        id=1,
+                        external_id=1001,
+                        guid="guid-1",
+                        title="Miners",
+                        url="https://example.com/1",
+                        body="Bitcoin miners moved coins to exchanges. " * 100,
+                        published_on=datetime(2026, 10, 1, tzinfo=UTC),
+                        status="ACTIVE",
+                    )
+                )
+
+        asyncio.run(seed())
+        yield
+        asyncio.run(manager.close())
+
+    def test_analysis_is_refused_without_budget(self, article_db, monkeypatch):
+        ledger = LocalBudgetLedger(daily_budget=0.1)
+        monkeypatch.setattr(budget, "_budget_ledger", ledger)
+
+        result = asyncio.run(
+            analyze_article_isolated(1, CostTracker(daily_budget=50.0))
+        )
+
+        assert result == {
+            "success": False,
+            "article_id": 1,
+            "error": "Daily analysis budget exceeded ($0.1000 available)",
+        }
+        assert ledger.usage_sync()["reserved"] == 0
@@ -0,0 +1,258 @@
+"""Unit tests for ETag / Last-Modified handling on newsletter and article routes."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from crypto_newsletter.shared.cache import NEWSLETTERS, ResponseCache
+from crypto_newsletter.web import cache as web_cache
+from crypto_newsletter.web.cache import Validator, http_date, strong_etag
+from crypto_newsletter.web.routers import api
+
+UPDATED_AT = datetime(2026, 10, 1, 8, 30, 15, 123456, tzinfo=UTC)
+
+
+def _newsletter(status: str = "DRAFT", updated_at: datetime = UPDATED_AT):
+    return SimpleNamespace(
+        id=7,
+        title="Daily",
+        content="# Daily\n\nBody",
+        summary="Summary",
+        generation_date=UPDATED_AT,
+        status=status,
+        quality_score=0.9,
+        agent_version="1.0",
+        generation_metadata={"newsletter_type": "DAILY"},
+        published_at=None,
+        created_at=UPDATED_AT,
+        updated_at=updated_at,
+    )
+
+
+class FakeNewsletterRepository:
+    newsletter = _newsletter()
+    calls = 0
+
+    def __init__(self, db) -> None:
+        pass
+
+    async def get_newsletter_by_id(self, newsletter_id, include_articles=True):
+        type(self).calls += 1
+        return self.newsletter if newsletter_id == 7 else None
+
+    async def get_newsletters_with_filters(self, **filters):
+        type(self).calls += 1
+        older = _newsletter(updated_at=datetime(2026, 9, 1, tzinfo=UTC))
+        older.id = 6
+        return [self.newsletter, older]
+
+    async def count_newsletters_with_filters(self, **filters):
+        return 2
+
+
+class FakeNewsletterStorage(FakeNewsletterRepository):
+    async def get_rendition(self, newsletter, variant="html"):
+        if variant == "text":
+            return newsletter.title
+        return f"<h1>{newsletter.title}</h1>"
+
+
+class FakeArticleRepository:
+    calls = 0
+
+    def __init__(self, db) -> None:
+        pass
+
+    async def get_article_by_id(self, article_id):
+        type(self).calls += 1
+        return {"id": article_id, "title": "A", "updated_at": UPDATED_AT.isoformat()}
+
+
+@asynccontextmanager
+async def _no_session():
+    yield None
+
+
+@pytest.fixture
+def client(monkeypatch):
+    cache = ResponseCache()
+    monkeypatch.setattr(web_cache, "get_response_cache", lambda: cache)
+    monkeypatch.setattr(api, "get_read_session", _no_session)
+    monkeypatch.setattr(api, "NewsletterRepository", FakeNewsletterRepository)
+    monkeypatch.setattr(api, "NewsletterStorage", FakeNewsletterStorage)
+    monkeypatch.setattr(api, "ArticleRepository", FakeArticleRepository)
+    FakeNewsletterRepository.newsletter = _newsletter()
+    FakeNewsletterRepository.calls = 0
+    FakeArticleRepository.calls = 0
+
+    app = FastAPI()
+    app.include_router(api.router, prefix="/api")
+    return TestClient(app), cache
+
+
+@pytest.mark.unit
+class TestValidator:
+    def test_strong_etag_is_quoted_and_stable(self):
+        etag = strong_etag("newsletter", 7, UPDATED_AT.isoformat())
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == strong_etag("newsletter", 7, UPDATED_AT.isoformat())
+        assert etag != strong_etag("newsletter", 7, "2026-10-02")
+
+    def test_http_date(self):
+        assert http_date(UPDATED_AT) == "Thu, 01 Oct 2026 08:30:15 GMT"
+        assert http_date(UPDATED_AT.replace(tzinfo=None)) == http_date(UPDATED_AT)
+
+    def test_matching_rules(self):
+        validator = Validator(etag='"abc"', last_modified=http_date(UPDATED_AT))
+
+        def matches(**headers):
+            app = FastAPI()
+
+            @app.get("/")
+            async def probe(request: web_cache.Request):
+                return {"matches": validator.matches(request)}
+
+            return TestClient(app).get("/", headers=headers).json()["matches"]
+
+        assert matches(**{"If-None-Match": '"x", W/"abc"'})
+        assert matches(**{"If-None-Match": "*"})
+        assert not matches(**{"If-None-Match": '"x"'})
+        assert matches(**{"If-Modified-Since": http_date(UPDATED_AT)})
+        assert not matches(**{"If-Modified-Since": "Wed, 30 Sep 2026 00:00:00 GMT"})
+        assert not matches(**{"If-Modified-Since": "not a date"})
+        # If-None-Match wins over If-Modified-Since
+        assert not matches(
+            **{"If-None-Match": '"x"', "If-Modified-Since": http_date(UPDATED_AT)}
+        )
+        assert not matches()
+
+
+@pytest.mark.unit
+class TestNewsletterConditionalGet:
+    def test_etag_and_cache_control_by_status(self, client):
+        client, _ = client
+
+        draft = client.get("/api/newsletters/7")
+        assert draft.status_code == 200
+        assert draft.json()["title"] == "Daily"
+        assert draft.headers["cache-control"] == "private, no-cache"
+        assert draft.headers["last-modified"] == http_date(UPDATED_AT)
+
+        FakeNewsletterRepository.newsletter = _newsletter("PUBLISHED")
+        published = client.get("/api/newsletters/7")
+        assert published.headers["cache-control"] == (
+            "private, max-age=86400, immutable"
+        )
+
+    def test_repeat_view_is_304_without_database(self, client):
+        client, _ = client
+        etag = client.get("/api/newsletters/7").headers["etag"]
+
+        response = client.get("/api/newsletters/7", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert FakeNewsletterRepository.calls == 1
+
+    def test_change_invalidates_validator(self, client):
+        client, cache = client
+        etag = client.get("/api/newsletters/7").headers["etag"]
+
+        FakeNewsletterRepository.newsletter = _newsletter(
+            updated_at=datetime(2026, 10, 2, tzinfo=UTC)
+        )
+        asyncio.run(cache.invalidate(NEWSLETTERS))
+        response = client.get("/api/newsletters/7", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert FakeNewsletterRepository.calls == 2
+
+    def test_json_and_html_have_different_etags(self, client):
+        client, _ = client
+
+        json_etag = client.get("/api/newsletters/7").headers["etag"]
+        html = client.get("/api/newsletters/7/html")
+
+        assert html.status_code == 200
+        assert html.headers["content-type"].startswith("text/html")
+        assert html.text == "<h1>Daily</h1>"
+        assert html.headers["etag"] != json_etag
+        repeat = client.get(
+            "/api/newsletters/7/html", headers={"If-None-Match": html.headers["etag"]}
+        )
+        assert repeat.status_code == 304
+
+    def test_email_and_text_renditions(self, client):
+        client, _ = client
+
+        html_etag = client.get("/api/newsletters/7/html").headers["etag"]
+        email = client.get("/api/newsletters/7/html?variant=email")
+        text = client.get("/api/newsletters/7/text")
+
+        assert email.status_code == 200
+        assert email.headers["etag"] != html_etag
+        assert text.headers["content-type"].startswith("text/plain")
+        assert text.text == "Daily"
+        assert client.get("/api/newsletters/7/html?variant=pdf").status_code == 422
+
+    def test_missing_newsletter_is_404(self, client):
+        client, _ = client
+
+        assert client.get("/api/newsletters/8").status_code == 404
+
+
+@pytest.mark.unit
+class TestArticleConditionalGet:
+    def test_if_modified_since(self, client):
+        client, _ = client
+        first = client.get("/api/articles/3")
+        assert first.headers["last-modified"] == http_date(UPDATED_AT)
+
+        response = client.get(
+            "/api/articles/3",
+            headers={"If-Modified-Since": first.headers["last-modified"]},
+        )
+
+        assert response.status_code == 304
+        assert FakeArticleRepository.calls == 1
+
+
+@pytest.mark.unit
+class TestNewsletterListConditionalGet:
+    def test_last_modified_is_newest_item(self, client):
+        client, _ = client
+
+        page = client.get("/api/newsletters?limit=5")
+        assert page.status_code == 200
+        assert page.json()["total_count"] == 2
+        assert page.headers["last-modified"] == http_date(UPDATED_AT)
+        assert page.headers["cache-control"] == "private, no-cache"
+
+        by_date = client.get(
+            "/api/newsletters?limit=5",
+            headers={"If-Modified-Since": page.headers["last-modified"]},
+        )
+        by_etag = client.get(
+            "/api/newsletters?limit=5", headers={"If-None-Match": page.headers["etag"]}
+        )
+        assert by_date.status_code == by_etag.status_code == 304
+        # The page itself came from the response cache after the first request
+        assert FakeNewsletterRepository.calls == 1
+
+    def test_list_without_response_cache(self, client, monkeypatch):
+        client, _ = client
+        monkeypatch.setattr(web_cache.get_settings(), "response_cache_enabled", False)
+
+        page = client.get("/api/newsletters?limit=5")
+
+        assert page.status_code == 200
+        assert page.json()["total_count"] == 2
+        assert page.headers["last-modified"] == http_date(UPDATED_AT)
@@ -0,0 +1,213 @@
+"""Unit tests for per-event-loop async engines and read replica routing."""
+
+import asyncio
+import gc
+import threading
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from crypto_newsletter.shared.database.connection import (
+    DatabaseManager,
+    _engine_kwargs_for,
+)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Database manager backed by a throwaway SQLite file."""
+    manager = DatabaseManager()
+    manager.initialize(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+    yield manager
+    manager._discard_all()
+
+
+async def _engine_and_query(manager: DatabaseManager):
+    async with manager.get_session() as session:
+        value = (await session.execute(text("SELECT 1"))).scalar()
+    return manager.engine, value
+
+
+@pytest.mark.unit
+class TestDatabaseManagerEngineRegistry:
+    """Engines are pooled per event loop and cleaned up with the loop."""
+
+    def test_uninitialized_manager_raises(self):
+        with pytest.raises(RuntimeError, match="not initialized"):
+            DatabaseManager().engine
+
+    def test_engine_uses_bounded_queue_pool(self, db_manager):
+        engine, _ = asyncio.run(_engine_and_query(db_manager))
+        assert isinstance(engine.pool, AsyncAdaptedQueuePool)
+
+    def test_engine_reused_within_loop(self, db_manager):
+        async def run():
+            first, _ = await _engine_and_query(db_manager)
+            second, _ = await _engine_and_query(db_manager)
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first is second
+
+    def test_separate_engine_per_loop(self, db_manager):
+        loop_a = asyncio.new_event_loop()
+        loop_b = asyncio.new_event_loop()
+        try:
+            engine_a, value_a = loop_a.run_until_complete(_engine_and_query(db_manager))
+            engine_b, value_b = loop_b.run_until_complete(_engine_and_query(db_manager))
+            assert (value_a, value_b) == (1, 1)
+            assert engine_a is not engine_b
+            assert db_manager.engine_count == 2
+        finally:
+            for loop in (loop_a, loop_b):
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+
+    def test_engine_per_thread_loop(self, db_manager):
+        engines = []
+
+        def worker():
+            engines.append(asyncio.run(_engine_and_query(db_manager))[0])
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(engine) for engine in engines}) == 3
+
+    def test_engine_disposed_when_loop_shuts_down(self, db_manager):
+        asyncio.run(_engine_and_query(db_manager))
+        # asyncio.run() shuts down async generators, which disposes the engine
+        assert db_manager.engine_count == 0
+
+    def test_closed_loop_entries_are_pruned(self, db_manager):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(_engine_and_query(db_manager))
+        # Closed without shutdown_asyncgens(): the entry is stale until pruned
+        loop.close()
+        del loop
+        gc.collect()
+
+        asyncio.run(_engine_and_query(db_manager))
+        assert db_manager.engine_count == 0
+
+    def test_fork_child_discards_engines(self, db_manager):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(_engine_and_query(db_manager))
+            assert db_manager.engine_count == 1
+            db_manager._after_fork_in_child()
+            assert db_manager.engine_count == 0
+        finally:
+            loop.close()
+
+
+@pytest.fixture
+def replicated_manager(tmp_path):
+    """Manager with a primary and two replicas, each a separate SQLite file."""
+
+    async def create_marker(url: str, name: str) -> None:
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE marker (name TEXT)"))
+            await conn.execute(text("INSERT INTO marker VALUES (:n)"), {"n": name})
+        await engine.dispose()
+
+    urls = {name: f"sqlite+aiosqlite:///{tmp_path / name}.db" for name in
+            ("primary", "replica_a", "replica_b")}
+    for name, url in urls.items():
+        asyncio.run(create_marker(url, name))
+
+    manager = DatabaseManager()
+    manager.initialize(
+        urls["primary"], replica_urls=[urls["replica_a"], urls["replica_b"]]
+    )
+    yield manager, urls
+    manager._discard_all()
+
+
+async def _read_marker(manager: DatabaseManager) -> str:
+    async with manager.get_read_session() as session:
+        return (await session.execute(text("SELECT name FROM marker"))).scalar()
+
+
+@pytest.mark.unit
+class TestDatabaseManagerReadReplicas:
+    """Read sessions are routed to healthy replicas with primary fallback."""
+
+    def test_reads_use_primary_without_replicas(self, db_manager):
+        async def run():
+            async with db_manager.get_read_session() as session:
+                return (await session.execute(text("SELECT 1"))).scalar()
+
+        assert asyncio.run(run()) == 1
+        assert db_manager.replica_count == 0
+
+    def test_round_robin_across_replicas(self, replicated_manager):
+        manager, _ = replicated_manager
+
+        async def run():
+            return [await _read_marker(manager) for _ in range(4)]
+
+        assert asyncio.run(run()) == ["replica_a", "replica_b"] * 2
+
+    def test_unreachable_replica_is_skipped(self, replicated_manager, tmp_path):
+        manager, urls = replicated_manager
+        manager.initialize(
+            urls["primary"],
+            replica_urls=[
+                f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}",
+                urls["replica_b"],
+            ],
+        )
+
+        async def run():
+            return [await _read_marker(manager) for _ in range(3)]
+
+        assert asyncio.run(run()) == ["replica_b"] * 3
+        status = manager.replica_status()
+        assert [entry["available"] for entry in status] == [False, True]
+
+    def test_falls_back_to_primary_when_no_replica_available(self, replicated_manager):
+        manager, _ = replicated_manager
+        for replica in manager._replicas:
+            replica.mark_unavailable(60)
+
+        assert asyncio.run(_read_marker(manager)) == "primary"
+
+    def test_read_session_discards_writes(self, replicated_manager):
+        manager, _ = replicated_manager
+        for replica in manager._replicas:
+            replica.mark_unavailable(60)
+
+        async def run():
+            async with manager.get_read_session() as session:
+                await session.execute(text("DELETE FROM marker"))
+            async with manager.get_session() as session:
+                rows = await session.execute(text("SELECT count(*) FROM marker"))
+                return rows.scalar()
+
+        assert asyncio.run(run()) == 1
+
+
+@pytest.mark.unit
+class TestPreparedStatementCache:
+    """asyncpg engines keep a prepared statement cache per pooled connection."""
+
+    def test_asyncpg_gets_configured_cache_size(self):
+        kwargs = _engine_kwargs_for(
+            "postgresql+asyncpg://u:p@db/app", {"echo": False}, 512
+        )
+        assert kwargs["connect_args"] == {"prepared_statement_cache_size": 512}
+        assert kwargs["echo"] is False
+
+    def test_url_setting_wins(self):
+        url = "postgresql+asyncpg://u:p@db/app?prepared_statement_cache_size=0"
+        assert "connect_args" not in _engine_kwargs_for(url, {}, 512)
+
+    def test_other_drivers_untouched(self):
+        assert _engine_kwargs_for("sqlite+aiosqlite:///x.db", {}, 512) == {}
@@ -0,0 +1,142 @@
+"""Tests for the local embedder and the in-memory vector index."""
+
+import time
+from datetime import UTC, datetime
+
+import numpy as np
+import pytest
+
+from crypto_newsletter.core.embeddings import (
+    HashingEmbedder,
+    VectorIndex,
+    article_text,
+    get_embedder,
+)
+from crypto_newsletter.core.embeddings.embedder import Embedder
+
+BITCOIN_ETF = "SEC approves spot Bitcoin ETF applications from BlackRock"
+BITCOIN_ETF_2 = "Spot Bitcoin ETF inflows surge after SEC approval for BlackRock"
+SOLANA = "Solana validators ship network upgrade to cut transaction fees"
+
+
+class TestHashingEmbedder:
+    def test_deterministic_and_normalized(self):
+        embedder = HashingEmbedder(dimension=64)
+        first = embedder.embed([BITCOIN_ETF, SOLANA])
+        second = HashingEmbedder(dimension=64).embed([BITCOIN_ETF, SOLANA])
+
+        assert first.shape == (2, 64)
+        assert first.dtype == np.float32
+        np.testing.assert_array_equal(first, second)
+        np.testing.assert_allclose(np.linalg.norm(first, axis=1), 1.0, rtol=1e-5)
+
+    def test_related_texts_are_more_similar(self):
+        vectors = HashingEmbedder().embed([BITCOIN_ETF, BITCOIN_ETF_2, SOLANA])
+
+        assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+
+    def test_empty_text_is_zero_vector(self):
+        vectors = HashingEmbedder(dimension=16).embed(["", "the and of"])
+
+        assert not vectors.any()
+
+    def test_get_embedder(self):
+        embedder = get_embedder("hashing", 128)
+        assert isinstance(embedder, HashingEmbedder)
+        assert embedder.version == "v1-d128"
+
+        custom = get_embedder(f"{__name__}:_ConstantEmbedder", 8)
+        assert custom.embed(["x"]).shape == (1, 8)
+
+        with pytest.raises(ValueError, match="Unknown embedding backend"):
+            get_embedder("word2vec")
+        with pytest.raises(TypeError):
+            get_embedder("collections:OrderedDict")
+
+    def test_article_text_weights_title(self):
+        text = article_text("Title", None, "b" * 10_000)
+
+        assert text.startswith("Title\nTitle\n")
+        assert len(text) == len("Title\nTitle\n") + 4000
+
+
+class _ConstantEmbedder(Embedder):
+    name = "constant"
+    version = "1"
+
+    def __init__(self, dimension: int) -> None:
+        self.dimension = dimension
+
+    def embed(self, texts):
+        return np.ones((len(texts), self.dimension), dtype=np.float32)
+
+
+def _index(dimension: int = 4) -> VectorIndex:
+    index = VectorIndex(dimension, "test", "v1")
+    index.add(
+        [10, 20, 30],
+        np.array(
+            [[1, 0, 0, 0], [0.8, 0.6, 0, 0], [0, 0, 1, 0]], dtype=np.float32
+        ),
+    )
+    return index
+
+
+class TestVectorIndex:
+    def test_search_orders_by_similarity(self):
+        results = _index().search(np.array([1, 0, 0, 0]), k=2)
+
+        assert [article_id for article_id, _ in results] == [10, 20]
+        assert results[0][1] == pytest.approx(1.0)
+        assert results[1][1] == pytest.approx(0.8)
+
+    def test_search_excludes_and_caps_k(self):
+        index = _index()
+
+        results = index.search(np.array([1, 0, 0, 0]), k=10, exclude=[10])
+        assert [article_id for article_id, _ in results] == [20, 30]
+        assert index.search(np.zeros(4), k=3) == []
+
+    def test_add_replaces_existing_vector(self):
+        index = _index()
+        index.add([30, 40], np.array([[1, 0, 0, 0], [0, 0, 0, 1]]))
+
+        assert len(index) == 4
+        assert 40 in index
+        np.testing.assert_array_equal(index.get(30), [1, 0, 0, 0])
+        with pytest.raises(ValueError):
+            index.add([1, 2], np.zeros((1, 4)))
+
+    def test_save_and_load_memory_mapped(self, tmp_path):
+        index = _index()
+        index.watermark = datetime(2026, 10, 1, 8, 30, tzinfo=UTC)
+        path = tmp_path / "index" / "articles"
+        index.save(path)
+
+        loaded = VectorIndex.load(path)
+        assert isinstance(loaded._vectors, np.memmap)
+        assert loaded.watermark == datetime(2026, 10, 1, 8, 30, tzinfo=UTC)
+        assert loaded.matches("test", "v1", 4)
+        assert loaded.search(np.array([0, 0, 1, 0]), k=1)[0][0] == 30
+
+        # Upserting into a read-only mapping copies it instead of failing
+        loaded.add([10], np.array([[0, 0, 0, 1]]))
+        assert loaded.search(np.array([0, 0, 0, 1]), k=1)[0][0] == 10
+        assert VectorIndex.load(tmp_path / "missing") is None
+
+    @pytest.mark.slow
+    def test_search_latency_over_100k_articles(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((100_000, 256), dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        index = VectorIndex(256, "test", "v1")
+        index.add(np.arange(100_000), vectors)
+
+        index.search(vectors[0], k=10)
+        started = time.perf_counter()
+        for i in range(20):
+            results = index.search(vectors[i], k=10, exclude=[i])
+        elapsed = (time.perf_counter() - started) / 20
+
+        assert results[0][0] != 19
+        assert elapsed < 0.1
@@ -0,0 +1,189 @@
+"""Unit tests for the content-addressed LLM result cache."""
+
+import asyncio
+import os
+import time
+
+import pytest
+from pydantic import BaseModel
+from pydantic_ai import Agent
+from pydantic_ai.models.test import TestModel
+from pydantic_ai.usage import Usage
+
+from crypto_newsletter.analysis.agents import orchestrator as orchestrator_module
+from crypto_newsletter.analysis.agents.content_analysis import content_analysis_agent
+from crypto_newsletter.analysis.agents.orchestrator import AnalysisOrchestrator
+from crypto_newsletter.analysis.cache import (
+    DiskLLMCacheBackend,
+    LLMCache,
+    create_llm_cache,
+)
+from crypto_newsletter.analysis.dependencies import AnalysisDependencies, CostTracker
+
+
+class Summary(BaseModel):
+    text: str
+    score: float
+
+
+def _agent(system_prompt: str = "Summarize.", model: str = "test") -> Agent:
+    test_model = TestModel()
+    test_model._model_name = model
+    return Agent(test_model, output_type=Summary, system_prompt=system_prompt)
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    return LLMCache(DiskLLMCacheBackend(tmp_path), ttl_seconds=60, max_entries=3)
+
+
+@pytest.mark.unit
+class TestCacheKey:
+    def test_key_covers_agent_model_prompt_and_input(self):
+        base = LLMCache.key("summary", _agent(), "article")
+
+        assert base == LLMCache.key("summary", _agent(), "article")
+        assert base != LLMCache.key("other", _agent(), "article")
+        assert base != LLMCache.key("summary", _agent(model="other"), "article")
+        assert base != LLMCache.key("summary", _agent("Summarize briefly."), "article")
+        assert base != LLMCache.key("summary", _agent(), "article!")
+        assert len(base) == 64
+
+
+@pytest.mark.unit
+class TestDiskCache:
+    def test_round_trip_validates_output(self, disk_cache):
+        agent = _agent()
+        key = disk_cache.key("summary", agent, "article")
+        usage = Usage(
+            requests=1, request_tokens=120, response_tokens=30, total_tokens=150
+        )
+
+        async def round_trip():
+            miss = await disk_cache.get(key, Summary)
+            await disk_cache.set(
+                key, "summary", agent, Summary(text="s", score=0.5), usage
+            )
+            return miss, await disk_cache.get(key, Summary)
+
+        miss, hit = asyncio.run(round_trip())
+
+        assert miss is None
+        assert hit.cached and hit.output == Summary(text="s", score=0.5)
+        assert hit.usage.total_tokens == 150
+        assert disk_cache.report() == {
+            "backend": "disk",
+            "hits": 1,
+            "misses": 1,
+            "stores": 1,
+            "evictions": 0,
+            "errors": 0,
+            "hit_rate": 0.5,
+        }
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        cache = LLMCache(DiskLLMCacheBackend(tmp_path), ttl_seconds=0)
+        agent = _agent()
+
+        async def store_and_get():
+            await cache.set(
+                "k" * 64, "summary", agent, Summary(text="s", score=1), Usage()
+            )
+            return await cache.get("k" * 64, Summary)
+
+        assert asyncio.run(store_and_get()) is None
+        assert list(tmp_path.glob("*/*.json")) == []
+
+    def test_entries_that_no_longer_validate_are_misses(self, disk_cache):
+        class Renamed(BaseModel):
+            headline: str
+
+        async def store_and_get():
+            await disk_cache.set(
+                "a" * 64, "summary", _agent(), Summary(text="s", score=1), Usage()
+            )
+            return await disk_cache.get("a" * 64, Renamed)
+
+        assert asyncio.run(store_and_get()) is None
+        assert disk_cache.stats["misses"] == 1
+
+    def test_prune_evicts_least_recently_used(self, disk_cache, tmp_path):
+        agent = _agent()
+        keys = [str(n) * 64 for n in range(5)]
+
+        async def fill():
+            for key in keys:
+                await disk_cache.set(
+                    key, "summary", agent, Summary(text=key[:1], score=0), Usage()
+                )
+            # Make the first entry the most recently used
+            old = time.time() - 100
+            for n, key in enumerate(keys):
+                os.utime(tmp_path / key[:2] / f"{key}.json", (old + n, old + n))
+            await disk_cache.get(keys[0], Summary)
+            return await disk_cache.prune()
+
+        assert asyncio.run(fill()) == 2
+        remaining = sorted(path.stem[:1] for path in tmp_path.glob("*/*.json"))
+        assert remaining == ["0", "3", "4"]
+        assert disk_cache.stats["evictions"] == 2
+
+    def test_backend_errors_are_misses(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        cache = LLMCache(DiskLLMCacheBackend(blocker))
+
+        async def store_and_get():
+            await cache.set(
+                "b" * 64, "summary", _agent(), Summary(text="s", score=1), Usage()
+            )
+            return await cache.get("b" * 64, Summary)
+
+        assert asyncio.run(store_and_get()) is None
+        assert cache.stats["errors"] == 2
+        assert cache.stats["misses"] == 1
+
+    def test_disabled_and_unknown_backends(self):
+        assert not create_llm_cache("none").enabled
+        with pytest.raises(ValueError, match="Unknown LLM cache backend"):
+            create_llm_cache("memcached")
+
+
+@pytest.mark.unit
+class TestOrchestratorCache:
+    def test_repeat_analysis_skips_the_model(self, disk_cache, monkeypatch):
+        monkeypatch.setattr(orchestrator_module, "get_llm_cache", lambda: disk_cache)
+        calls = []
+        run = content_analysis_agent.run
+
+        async def counting_run(*args, **kwargs):
+            calls.append(args[0])
+            return await run(*args, **kwargs)
+
+        monkeypatch.setattr(content_analysis_agent, "run", counting_run)
+
+        async def analyze_twice():
+            results = []
+            for _ in range(2):
+                deps = AnalysisDependencies(
+                    db_session=None,
+                    cost_tracker=CostTracker(daily_budget=10.0),
+                    min_signal_confidence=2.0,  # skip validation
+                )
+                results.append(
+                    await AnalysisOrchestrator().analyze_article(
+                        1, "Title", "Body " * 100, "Publisher", deps
+                    )
+                )
+            return results
+
+        first, second = asyncio.run(analyze_twice())
+
+        assert first["success"] and second["success"]
+        assert len(calls) == 1
+        assert first["cache"]["content_analysis"] is False
+        assert second["cache"]["content_analysis"] is True
+        assert second["costs"]["content_analysis"] == 0.0
+        assert second["content_analysis"] == first["content_analysis"]
+        assert second["usage_stats"] == first["usage_stats"]
+        assert disk_cache.stats["hits"] == 1
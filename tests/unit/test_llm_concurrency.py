@@ -0,0 +1,299 @@
+"""Unit tests for adaptive LLM concurrency and the circuit breaker."""
+
+import asyncio
+
+import httpx
+import pytest
+from pydantic_ai.exceptions import ModelHTTPError
+
+from crypto_newsletter.analysis import concurrency
+from crypto_newsletter.analysis.agents.content_analysis import content_analysis_agent
+from crypto_newsletter.analysis.agents.orchestrator import orchestrator
+from crypto_newsletter.analysis.agents.settings import analysis_settings
+from crypto_newsletter.analysis.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    is_overload_error,
+    llm_concurrency_metrics,
+    run_agent,
+)
+from crypto_newsletter.analysis.dependencies import AnalysisDependencies, CostTracker
+from crypto_newsletter.newsletter.agents.newsletter_writer import (
+    newsletter_writer_agent,
+)
+from crypto_newsletter.newsletter.agents.orchestrator import NewsletterOrchestrator
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _overload() -> ModelHTTPError:
+    return ModelHTTPError(status_code=429, model_name="gemini")
+
+
+async def _call(limiter, error=None, seconds=0.0, clock=None):
+    async with limiter.slot():
+        if clock is not None:
+            clock.now += seconds
+        await asyncio.sleep(0)
+        if error is not None:
+            raise error
+
+
+@pytest.fixture
+def controllers(monkeypatch):
+    """Fresh process-wide controllers."""
+    monkeypatch.setattr(concurrency, "_controllers", {})
+
+
+@pytest.mark.unit
+class TestErrorClassification:
+    def test_rate_limits_server_errors_and_request_timeouts_are_overloads(self):
+        assert is_overload_error(_overload())
+        assert is_overload_error(ModelHTTPError(503, "gemini"))
+        assert is_overload_error(httpx.ReadTimeout("provider timed out"))
+        # A run's own deadline says nothing about the provider
+        assert not is_overload_error(TimeoutError())
+        assert not is_overload_error(ModelHTTPError(400, "gemini"))
+        assert not is_overload_error(ValueError("bad output"))
+
+    def test_wrapped_errors_are_classified_by_cause(self):
+        try:
+            try:
+                raise _overload()
+            except ModelHTTPError as e:
+                raise RuntimeError("analysis failed") from e
+        except RuntimeError as wrapped:
+            assert is_overload_error(wrapped)
+
+
+@pytest.mark.unit
+class TestAIMD:
+    def test_limit_grows_additively_while_healthy(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            "gemini", max_limit=4, initial_limit=1, clock=FakeClock()
+        )
+
+        async def scenario():
+            limits = []
+            for _ in range(8):
+                await _call(limiter)
+                limits.append(limiter.limit)
+            return limits
+
+        # One more slot per window of (limit) healthy calls, up to the max
+        assert asyncio.run(scenario()) == [2, 2, 3, 3, 3, 4, 4, 4]
+
+    def test_slow_calls_hold_the_limit(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(
+            "gemini", max_limit=4, initial_limit=2, latency_target=5.0, clock=clock
+        )
+
+        async def scenario():
+            for _ in range(5):
+                await _call(limiter, seconds=6.0, clock=clock)
+
+        asyncio.run(scenario())
+
+        assert limiter.limit == 2
+        assert limiter.stats["successes"] == 5
+
+    def test_overload_burst_cuts_the_limit_once(self):
+        limiter = AdaptiveConcurrencyLimiter("gemini", max_limit=8, clock=FakeClock())
+
+        async def scenario():
+            # Eight calls in flight when the provider starts returning 429s
+            return await asyncio.gather(
+                *(_call(limiter, error=_overload()) for _ in range(8)),
+                return_exceptions=True,
+            )
+
+        errors = asyncio.run(scenario())
+
+        assert all(isinstance(e, ModelHTTPError) for e in errors)
+        assert limiter.limit == 4
+        assert limiter.stats["decreases"] == 1
+        assert limiter.stats["overloads"] == 8
+
+    def test_repeated_overloads_back_off_to_the_minimum(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(
+            "gemini",
+            max_limit=8,
+            min_limit=1,
+            breaker=CircuitBreaker(failure_threshold=10, clock=clock),
+            clock=clock,
+        )
+
+        async def scenario():
+            limits = []
+            for _ in range(4):
+                clock.now += 1
+                with pytest.raises(ModelHTTPError):
+                    await _call(limiter, error=_overload())
+                limits.append(limiter.limit)
+            return limits
+
+        assert asyncio.run(scenario()) == [4, 2, 1, 1]
+
+    def test_in_flight_calls_never_exceed_the_limit(self):
+        limiter = AdaptiveConcurrencyLimiter("gemini", max_limit=3)
+        active = peak = 0
+
+        async def call():
+            nonlocal active, peak
+            async with limiter.slot():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        async def scenario():
+            await asyncio.gather(*(call() for _ in range(12)))
+
+        asyncio.run(scenario())
+
+        assert peak == 3
+        assert limiter.in_flight == 0 and limiter.snapshot()["waiting"] == 0
+
+    def test_cancelled_waiters_do_not_leak_slots(self):
+        limiter = AdaptiveConcurrencyLimiter("gemini", max_limit=1)
+
+        async def hold(seconds):
+            async with limiter.slot():
+                await asyncio.sleep(seconds)
+
+        async def scenario():
+            holder = asyncio.create_task(hold(0.05))
+            await asyncio.sleep(0)
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(hold(0), 0.01)
+            await holder
+            await asyncio.wait_for(hold(0), 0.1)
+
+        asyncio.run(scenario())
+
+        assert limiter.in_flight == 0
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    def test_open_circuit_fails_fast_then_probes_half_open(self):
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(
+            "gemini",
+            max_limit=4,
+            breaker=CircuitBreaker(failure_threshold=3, reset_seconds=30, clock=clock),
+            clock=clock,
+        )
+
+        async def scenario():
+            for _ in range(3):
+                with pytest.raises(ModelHTTPError):
+                    await _call(limiter, error=_overload())
+            with pytest.raises(CircuitOpenError, match="retry in 30s") as rejected:
+                await _call(limiter)
+            clock.now += 30
+            # The probe fails: the circuit reopens
+            with pytest.raises(ModelHTTPError):
+                await _call(limiter, error=_overload())
+            with pytest.raises(CircuitOpenError):
+                await _call(limiter)
+            clock.now += 30
+            await _call(limiter)
+            return rejected.value
+
+        rejected = asyncio.run(scenario())
+
+        assert rejected.model == "gemini" and rejected.retry_after == 30
+        snapshot = limiter.snapshot()
+        assert snapshot["circuit"] == "closed"
+        assert snapshot["times_opened"] == 2
+        assert snapshot["rejected"] == 2
+
+    def test_half_open_circuit_lets_one_probe_through(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, clock=clock)
+        breaker.record_failure()
+        clock.now += 10
+
+        assert breaker.allow() is True
+        assert breaker.state == "half_open"
+        assert breaker.allow() is False
+        breaker.record_success()
+        assert breaker.state == "closed" and breaker.allow() is True
+
+    def test_other_errors_do_not_trip_the_breaker(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            "gemini", max_limit=2, breaker=CircuitBreaker(failure_threshold=1)
+        )
+
+        async def scenario():
+            for _ in range(3):
+                with pytest.raises(ValueError):
+                    await _call(limiter, error=ValueError("invalid output"))
+
+        asyncio.run(scenario())
+
+        assert limiter.breaker.state == "closed"
+        assert limiter.stats["errors"] == 3 and limiter.limit == 2
+
+
+@pytest.mark.unit
+class TestAgents:
+    def test_agent_timeouts_are_not_overloads(self, controllers, monkeypatch):
+        monkeypatch.setattr(analysis_settings, "llm_call_timeout_seconds", 0.05)
+        monkeypatch.setattr(analysis_settings, "llm_breaker_failure_threshold", 1)
+
+        async def slow_run(prompt, **kwargs):
+            await asyncio.sleep(1)
+
+        monkeypatch.setattr(content_analysis_agent, "run", slow_run)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(run_agent(content_analysis_agent, "TITLE: Miners"))
+
+        metrics = llm_concurrency_metrics()["test"]
+        assert metrics["timeouts"] == 1
+        assert metrics["overloads"] == 0 and metrics["decreases"] == 0
+        assert metrics["circuit"] == "closed" and metrics["in_flight"] == 0
+
+    def test_newsletter_agents_have_a_longer_limit(self, controllers, monkeypatch):
+        monkeypatch.setattr(analysis_settings, "llm_call_timeout_seconds", 0.05)
+        monkeypatch.setattr(analysis_settings, "llm_newsletter_timeout_seconds", 1.0)
+
+        async def slow_run(prompt, **kwargs):
+            await asyncio.sleep(0.1)
+            return "newsletter"
+
+        monkeypatch.setattr(newsletter_writer_agent, "run", slow_run)
+
+        result = asyncio.run(
+            NewsletterOrchestrator()._run_agent(newsletter_writer_agent, "Write")
+        )
+
+        assert result == "newsletter"
+        with pytest.raises(TimeoutError):
+            asyncio.run(run_agent(newsletter_writer_agent, "Write"))
+
+    def test_orchestrator_calls_are_exposed_as_metrics(self, controllers):
+        deps = AnalysisDependencies(db_session=None, cost_tracker=CostTracker())
+
+        asyncio.run(
+            orchestrator._run_agent(
+                "content_analysis", content_analysis_agent, "TITLE: Miners", deps
+            )
+        )
+
+        metrics = llm_concurrency_metrics()
+        assert metrics["test"]["successes"] == 1
+        assert metrics["test"]["limit"] == analysis_settings.llm_max_concurrency
+        assert metrics["test"]["in_flight"] == 0
+        assert metrics["test"]["circuit"] == "closed"
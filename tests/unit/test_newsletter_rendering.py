@@ -0,0 +1,125 @@
+"""Unit tests for newsletter rendition rendering."""
+
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from crypto_newsletter.newsletter.models.newsletter import NewsletterContent
+from crypto_newsletter.newsletter.rendering import (
+    EMAIL,
+    HTML,
+    TEXT,
+    RenditionSource,
+    format_newsletter_markdown,
+    markdown_to_text,
+    render_newsletter,
+)
+
+GENERATED = datetime(2026, 10, 1, 8, 30, tzinfo=UTC)
+CONTENT = """# Daily Brief
+
+## Executive Summary
+
+- **ETF** inflows hit a [record](https://example.com/etf)
+- Stablecoin supply <grows>
+
+> Quote of the day
+"""
+
+
+def _newsletter(**overrides):
+    fields = {
+        "id": 7,
+        "title": "Daily <Brief>",
+        "content": CONTENT,
+        "quality_score": 0.875,
+        "generation_date": GENERATED,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.mark.unit
+class TestRenderNewsletter:
+    def test_renders_all_variants_deterministically(self):
+        first = render_newsletter(_newsletter())
+
+        assert set(first) == {HTML, EMAIL, TEXT}
+        assert first == render_newsletter(_newsletter())
+
+    def test_web_html(self):
+        html = render_newsletter(_newsletter())[HTML]
+
+        assert html.startswith("<!DOCTYPE html>")
+        assert "<style>" in html
+        assert '<a href="https://example.com/etf">record</a>' in html
+        # The title is escaped, the markdown body is inserted as HTML
+        assert "<title>Daily &lt;Brief&gt;</title>" in html
+        assert "<blockquote>" in html
+        assert "0.88/1.0" in html
+        assert "2026-10-01 08:30 UTC" in html
+
+    def test_email_html_has_inline_styles_only(self):
+        email = render_newsletter(_newsletter())[EMAIL]
+
+        assert "<style>" not in email
+        assert '<h1 style="' in email
+        assert '<a href="https://example.com/etf" style="' in email
+        assert '<table role="presentation"' in email
+
+    def test_text(self):
+        text = render_newsletter(_newsletter())[TEXT]
+
+        assert "Daily Brief\n===========" in text
+        assert "Executive Summary\n-----------------" in text
+        assert "ETF inflows hit a record (https://example.com/etf)" in text
+        assert "**" not in text
+        assert "Stablecoin supply <grows>" in text
+
+    def test_missing_score_and_date(self):
+        html = render_newsletter(
+            _newsletter(quality_score=None, generation_date=None)
+        )[HTML]
+
+        assert "N/A/1.0" in html
+        assert "Unknown" in html
+
+    def test_legacy_json_content(self):
+        content = NewsletterContent(
+            title="Weekly",
+            executive_summary=["One", "Two"],
+            main_analysis="Main",
+            pattern_spotlight="Pattern",
+            adjacent_watch="Adjacent",
+            signal_radar="Radar",
+            action_items=["Act"],
+            source_citations=["https://example.com/a"],
+            estimated_read_time=6,
+            editorial_quality_score=0.9,
+        )
+        renditions = render_newsletter(
+            _newsletter(content=json.dumps(content.model_dump()))
+        )
+
+        assert "<h2>Pattern Spotlight</h2>" in renditions[HTML]
+        assert "Read Time:</strong> 6 minutes" in renditions[HTML]
+        assert renditions[TEXT].startswith("Weekly\n======")
+        assert format_newsletter_markdown(content).startswith("# Weekly\n")
+
+
+@pytest.mark.unit
+class TestRenditionSource:
+    def test_hash_changes_with_rendered_fields_only(self):
+        base = RenditionSource.of(_newsletter())
+
+        assert base.hash == RenditionSource.of(_newsletter()).hash
+        assert len(base.hash) == 64
+        assert base.hash != RenditionSource.of(_newsletter(content="# Other")).hash
+        assert base.hash != RenditionSource.of(_newsletter(title="Other")).hash
+        # The id is not rendered
+        assert base.hash == RenditionSource.of(_newsletter(id=8)).hash
+
+    def test_markdown_to_text_keeps_plain_lines(self):
+        assert markdown_to_text("Just text\n\n\n\nMore") == "Just text\n\nMore\n"
@@ -0,0 +1,234 @@
+"""Unit tests for packed multi-article content analysis."""
+
+import asyncio
+
+import pytest
+from pydantic_ai.models.test import TestModel
+
+from crypto_newsletter.analysis import tasks as analysis_tasks
+from crypto_newsletter.analysis.agents import orchestrator as orchestrator_module
+from crypto_newsletter.analysis.agents.content_analysis import (
+    content_analysis_agent,
+    packed_content_analysis_agent,
+)
+from crypto_newsletter.analysis.agents.orchestrator import (
+    AnalysisOrchestrator,
+    PackableArticle,
+    plan_packs,
+)
+from crypto_newsletter.analysis.cache import LLMCache
+from crypto_newsletter.analysis.condense import CondensedArticle
+from crypto_newsletter.analysis.dependencies import AnalysisDependencies, CostTracker
+
+
+def _analysis(summary: str = "Summary", **extra) -> dict:
+    return {
+        "sentiment": "POSITIVE",
+        "impact_score": 0.4,
+        "summary": summary,
+        "context": "Context",
+        "weak_signals": [],
+        "pattern_anomalies": [],
+        "adjacent_connections": [],
+        "narrative_gaps": [],
+        "edge_indicators": [],
+        "analysis_confidence": 0.7,
+        "signal_strength": 0.3,
+        "uniqueness_score": 0.5,
+        **extra,
+    }
+
+
+def _article(article_id: int, tokens: int) -> PackableArticle:
+    body = " ".join(f"word{article_id}x{n}" for n in range(tokens // 2))
+    return PackableArticle(
+        article_id=article_id,
+        title=f"Article {article_id}",
+        body=body,
+        publisher="Publisher",
+        condensed=CondensedArticle(body, tokens, tokens),
+    )
+
+
+def _deps() -> AnalysisDependencies:
+    return AnalysisDependencies(
+        db_session=None,
+        cost_tracker=CostTracker(daily_budget=10.0),
+        min_signal_confidence=2.0,  # skip validation
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_llm_cache(monkeypatch):
+    monkeypatch.setattr(orchestrator_module, "get_llm_cache", lambda: LLMCache(None))
+
+
+@pytest.mark.unit
+class TestPlanPacks:
+    def test_first_fit_decreasing_under_budget(self):
+        articles = [
+            _article(n, tokens) for n, tokens in enumerate([300, 500, 200, 400, 100])
+        ]
+
+        packs = plan_packs(
+            articles, token_budget=800, max_articles=8, article_max_tokens=600
+        )
+
+        assert [[a.article_id for a in pack] for pack in packs] == [[1, 0], [3, 2, 4]]
+        assert all(sum(a.tokens for a in pack) <= 800 for pack in packs)
+
+    def test_long_articles_and_max_articles(self):
+        articles = [_article(0, 2000)] + [_article(n, 50) for n in range(1, 6)]
+
+        packs = plan_packs(
+            articles, token_budget=10_000, max_articles=2, article_max_tokens=600
+        )
+
+        assert [[a.article_id for a in pack] for pack in packs] == [
+            [0],
+            [1, 2],
+            [3, 4],
+            [5],
+        ]
+
+
+@pytest.mark.unit
+class TestAnalyzeContentPacked:
+    def test_results_are_split_by_article_and_token_share(self):
+        articles = [_article(1, 300), _article(2, 100), _article(3, 200)]
+        output = {
+            "analyses": [
+                _analysis("Three", article_id=3),
+                _analysis("One", article_id=1),
+                _analysis("Two", article_id=2),
+            ]
+        }
+
+        with packed_content_analysis_agent.override(
+            model=TestModel(custom_output_args=output)
+        ):
+            results = asyncio.run(
+                AnalysisOrchestrator().analyze_content_packed(articles, _deps())
+            )
+
+        assert sorted(results) == [1, 2, 3]
+        assert results[1].run.output.summary == "One"
+        assert [results[n].share for n in (1, 2, 3)] == pytest.approx(
+            [0.5, 1 / 6, 1 / 3]
+        )
+        assert results[1].pack_size == 3
+        request_tokens = [results[n].run.usage.request_tokens for n in (1, 2, 3)]
+        assert request_tokens[0] == pytest.approx(3 * request_tokens[1], abs=1)
+
+    def test_malformed_entries_fall_back(self):
+        articles = [_article(1, 100), _article(2, 100), _article(3, 100)]
+        output = {
+            "analyses": [
+                _analysis(article_id=1),
+                _analysis(article_id=2),
+                _analysis(article_id=2),  # duplicate: ambiguous
+                _analysis(article_id=99),  # not in the pack
+            ]
+        }
+
+        with packed_content_analysis_agent.override(
+            model=TestModel(custom_output_args=output)
+        ):
+            results = asyncio.run(
+                AnalysisOrchestrator().analyze_content_packed(articles, _deps())
+            )
+
+        assert sorted(results) == [1]
+
+    def test_failed_request_falls_back(self):
+        articles = [_article(1, 100), _article(2, 100)]
+
+        with packed_content_analysis_agent.override(
+            model=TestModel(custom_output_args={"analyses": "not a list"})
+        ):
+            results = asyncio.run(
+                AnalysisOrchestrator().analyze_content_packed(articles, _deps())
+            )
+
+        assert results == {}
+
+
+@pytest.mark.unit
+class TestPackedThroughput:
+    def test_packed_requests_use_fewer_calls_and_tokens(self, monkeypatch):
+        articles = [_article(n, 150) for n in range(1, 7)]
+        calls = {"single": 0, "packed": 0}
+        single_run, packed_run = (
+            content_analysis_agent.run,
+            packed_content_analysis_agent.run,
+        )
+
+        async def count_single(*args, **kwargs):
+            calls["single"] += 1
+            return await single_run(*args, **kwargs)
+
+        async def count_packed(*args, **kwargs):
+            calls["packed"] += 1
+            return await packed_run(*args, **kwargs)
+
+        monkeypatch.setattr(content_analysis_agent, "run", count_single)
+        monkeypatch.setattr(packed_content_analysis_agent, "run", count_packed)
+        orchestrator = AnalysisOrchestrator()
+        output = {"analyses": [_analysis(article_id=a.article_id) for a in articles]}
+
+        async def analyze_all(packed: bool) -> list[dict]:
+            shares = {}
+            if packed:
+                shares = await orchestrator.analyze_content_packed(articles, _deps())
+            return [
+                await orchestrator.analyze_article(
+                    a.article_id,
+                    a.title,
+                    a.body,
+                    a.publisher,
+                    _deps(),
+                    packed=shares.get(a.article_id),
+                )
+                for a in articles
+            ]
+
+        single = asyncio.run(analyze_all(packed=False))
+        with packed_content_analysis_agent.override(
+            model=TestModel(custom_output_args=output)
+        ):
+            packed = asyncio.run(analyze_all(packed=True))
+
+        assert calls == {"single": 6, "packed": 1}
+        assert all(result["success"] for result in single + packed)
+        assert all(result["packed"] == 6 for result in packed)
+        single_tokens = sum(r["usage_stats"]["content_tokens"] for r in single)
+        packed_tokens = sum(r["usage_stats"]["content_tokens"] for r in packed)
+        assert packed_tokens < single_tokens
+        # Per-article cost is the article's share of the packed request
+        assert packed[0]["costs"]["total"] == pytest.approx(
+            sum(r["costs"]["total"] for r in packed) / 6, rel=0.05
+        )
+
+
+@pytest.mark.unit
+class TestBatchPacking:
+    def test_packed_shares_reach_isolated_analyses(self, monkeypatch):
+        received = {}
+
+        async def fake_packed(article_ids, daily_budget):
+            return {2: "share-2"}
+
+        async def fake_isolated(article_id, cost_tracker, packed=None, session_id=None):
+            received[article_id] = packed
+            return {"success": True, "article_id": article_id}
+
+        monkeypatch.setattr(analysis_tasks, "analyze_content_packed", fake_packed)
+        monkeypatch.setattr(analysis_tasks, "analyze_article_isolated", fake_isolated)
+
+        asyncio.run(
+            analysis_tasks.analyze_articles_concurrently(
+                [1, 2], max_concurrency=2, daily_budget=1.0, packing=True
+            )
+        )
+
+        assert received == {1: None, 2: "share-2"}
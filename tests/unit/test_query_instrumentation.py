@@ -0,0 +1,168 @@
+"""Unit tests for SQL statement fingerprinting and latency tracking."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from crypto_newsletter.core.storage.repository import ArticleRepository
+from crypto_newsletter.shared.database import instrumentation
+from crypto_newsletter.shared.database.connection import DatabaseManager
+from crypto_newsletter.shared.database.instrumentation import (
+    OVERFLOW_FINGERPRINT,
+    QueryStats,
+    fingerprint_statement,
+    instrument_engine,
+)
+from crypto_newsletter.shared.models import Article
+
+
+@pytest.fixture
+def query_stats(monkeypatch):
+    """Fresh process-wide registry that treats every statement as slow."""
+    stats = QueryStats(slow_threshold_ms=0, top_n=3)
+    monkeypatch.setattr(instrumentation, "_query_stats", stats)
+    return stats
+
+
+@pytest.mark.unit
+class TestFingerprint:
+    """Statements differing only in values share a fingerprint."""
+
+    @pytest.mark.parametrize(
+        ("statement", "expected"),
+        [
+            (
+                "SELECT * FROM articles WHERE id = 42 AND title = 'it''s'",
+                "SELECT * FROM articles WHERE id = ? AND title = ?",
+            ),
+            (
+                "SELECT id FROM articles WHERE id IN ($1, $2, $3)",
+                "SELECT id FROM articles WHERE id IN (...)",
+            ),
+            (
+                "SELECT a::text FROM t WHERE b = :b_1 AND c = %(c)s LIMIT 10",
+                "SELECT a::text FROM t WHERE b = ? AND c = ? LIMIT ?",
+            ),
+            (
+                "INSERT INTO t (a, b) VALUES (?, ?), (?, ?), (?, ?)",
+                "INSERT INTO t (a, b) VALUES (?, ?), ...",
+            ),
+            (
+                "SELECT count(*)\n  FROM articles_p2026_01",
+                "SELECT count(*) FROM articles_p2026_01",
+            ),
+        ],
+    )
+    def test_normalizes_values(self, statement, expected):
+        assert fingerprint_statement(statement) == expected
+
+
+@pytest.mark.unit
+class TestQueryStats:
+    """Latency is aggregated per fingerprint with bounded memory."""
+
+    def test_aggregates_by_fingerprint(self):
+        stats = QueryStats(slow_threshold_ms=100)
+        stats.record("SELECT * FROM articles WHERE id = 1", 2.0)
+        stats.record("SELECT * FROM articles WHERE id = 2", 40.0)
+        stats.record("SELECT 1", 150.0, caller="tests.caller")
+
+        heaviest = stats.heaviest()
+        assert [entry["calls"] for entry in heaviest] == [1, 2]
+        articles = heaviest[1]
+        assert articles["total_ms"] == 42.0
+        assert articles["max_ms"] == 40.0
+        assert articles["histogram_ms"]["le_5"] == 1
+        assert articles["histogram_ms"]["le_50"] == 1
+
+        assert stats.total_queries == 3
+        assert stats.slow_queries == 1
+        assert stats.avg_query_time_ms == pytest.approx(64.0)
+        assert stats.slowest()[0]["caller"] == "tests.caller"
+
+    def test_orderings(self):
+        stats = QueryStats(slow_threshold_ms=1000)
+        for _ in range(5):
+            stats.record("SELECT frequent", 1.0)
+        stats.record("SELECT rare", 20.0)
+
+        assert stats.heaviest(1, "calls")[0]["statement"] == "SELECT frequent"
+        assert stats.heaviest(1, "max")[0]["statement"] == "SELECT rare"
+        with pytest.raises(ValueError, match="Unknown ordering"):
+            stats.heaviest(order_by="median")
+
+    def test_percentile_uses_bucket_bounds(self):
+        stats = QueryStats(slow_threshold_ms=10_000)
+        for duration in [1.0] * 95 + [300.0] * 5:
+            stats.record("SELECT 1", duration)
+
+        entry = stats.heaviest()[0]
+        assert entry["p95_ms"] == 1.0
+        stats.record("SELECT 1", 9000.0)
+        assert stats.heaviest()[0]["p95_ms"] == 500.0
+
+    def test_slow_samples_keep_top_n(self):
+        stats = QueryStats(slow_threshold_ms=10, top_n=2)
+        for duration in (15.0, 50.0, 30.0, 11.0):
+            stats.record(f"SELECT {duration}", duration, caller="tests")
+
+        assert [sample["duration_ms"] for sample in stats.slowest()] == [50.0, 30.0]
+        assert stats.slow_queries == 4
+
+    def test_fingerprints_are_bounded(self):
+        stats = QueryStats(max_fingerprints=3)
+        for table in "abcdef":
+            stats.record(f"SELECT * FROM {table}", 1.0)
+
+        entries = {entry["statement"]: entry for entry in stats.heaviest(10)}
+        assert len(entries) == 4
+        assert entries[OVERFLOW_FINGERPRINT]["calls"] == 3
+
+    def test_reset(self):
+        stats = QueryStats()
+        stats.record("SELECT 1", 1.0)
+        stats.reset()
+        assert stats.snapshot()["total_queries"] == 0
+        assert stats.heaviest() == []
+
+
+@pytest.mark.unit
+class TestEngineInstrumentation:
+    """Engine hooks feed the registry for sync and async engines."""
+
+    def test_sync_engine(self, query_stats):
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+        instrument_engine(engine)  # idempotent
+
+        with engine.connect() as conn:
+            for value in (1, 2, 3):
+                conn.execute(text("SELECT :value"), {"value": value})
+        engine.dispose()
+
+        entry = query_stats.heaviest()[0]
+        assert entry["statement"] == "SELECT ?"
+        assert entry["calls"] == 3
+
+    def test_async_engine_records_repository_caller(self, query_stats, tmp_path):
+        manager = DatabaseManager()
+        manager.initialize(f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}")
+
+        async def run():
+            async with manager.engine.begin() as conn:
+                await conn.run_sync(Article.__table__.create)
+            query_stats.reset()
+            async with manager.get_session() as session:
+                await ArticleRepository(session).get_article_by_guid("missing")
+
+        try:
+            asyncio.run(run())
+        finally:
+            manager._discard_all()
+
+        callers = {sample["caller"] for sample in query_stats.slowest()}
+        assert (
+            "crypto_newsletter.core.storage.repository."
+            "ArticleRepository.get_article_by_guid"
+        ) in callers
@@ -2,6 +2,7 @@
 
 import pytest
 from datetime import datetime, timezone, timedelta
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
 from crypto_newsletter.core.storage.repository import ArticleRepository
@@ -137,6 +138,45 @@ class TestArticleRepository:
         assert len(articles) == 1
         assert articles[0] == sample_article
 
+    @pytest.mark.asyncio
+    async def test_get_agent_articles_since_single_query(self, repository, mock_db_session):
+        """Test agent-ready articles are loaded with one query and converted."""
+        published_on = datetime.now(timezone.utc)
+        row = MagicMock(
+            id=1,
+            title="Test Article",
+            body="Test article body",
+            url="https://test.com/article",
+            published_on=published_on,
+            publisher_name=None,
+            signal_strength=Decimal("0.75"),
+            uniqueness_score=None,
+            analysis_confidence=Decimal("0.90"),
+            weak_signals=[{"signal_type": "regulatory"}],
+            pattern_anomalies=None,
+            adjacent_connections=[],
+            narrative_gaps=None,
+            edge_indicators=None,
+        )
+        mock_result = MagicMock()
+        mock_result.all.return_value = [row, row]
+        mock_db_session.execute.return_value = mock_result
+
+        articles = await repository.get_agent_articles_since(
+            published_on - timedelta(hours=24), min_signal_strength=0.5
+        )
+
+        assert len(articles) == 2
+        mock_db_session.execute.assert_called_once()
+
+        article_dict = articles[0].to_agent_dict()
+        assert article_dict["publisher"] == "Unknown"
+        assert article_dict["published_on"] == published_on.isoformat()
+        assert article_dict["signal_strength"] == 0.75
+        assert article_dict["uniqueness_score"] == 0.0
+        assert article_dict["weak_signals"] == [{"signal_type": "regulatory"}]
+        assert article_dict["pattern_anomalies"] == []
+
     @pytest.mark.asyncio
     async def test_get_articles_by_category(self, repository, mock_db_session, sample_article):
         """Test getting articles by category."""
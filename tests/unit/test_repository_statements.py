@@ -0,0 +1,137 @@
+"""Unit tests for the cached statements behind the hot repository methods."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from crypto_newsletter.core.storage import repository
+from crypto_newsletter.core.storage.repository import ArticleRepository
+from crypto_newsletter.shared.database.connection import DatabaseManager
+from crypto_newsletter.shared.models import (
+    Article,
+    ArticleCategory,
+    Category,
+    Publisher,
+)
+
+NOW = datetime.now(UTC)
+
+
+@pytest.fixture
+def run_with_repository(tmp_path):
+    """Run a coroutine against an ArticleRepository over a seeded SQLite file."""
+    manager = DatabaseManager()
+    manager.initialize(f"sqlite+aiosqlite:///{tmp_path / 'repository.db'}")
+
+    async def seed():
+        async with manager.engine.begin() as conn:
+            for model in (Publisher, Category, Article, ArticleCategory):
+                await conn.run_sync(model.__table__.create)
+            await conn.execute(
+                Publisher.__table__.insert(),
+                [
+                    {"id": 1, "source_id": 1, "source_key": "cd", "name": "CoinDesk"},
+                    {"id": 2, "source_id": 2, "source_key": "ot", "name": "Other"},
+                ],
+            )
+            await conn.execute(
+                Article.__table__.insert(),
+                [
+                    {
+                        "id": n,
+                        "external_id": 100 + n,
+                        "guid": f"guid-{n}",
+                        "title": f"{'Bitcoin' if n % 2 else 'Ether'} {n}",
+                        "url": f"https://example.com/{n}",
+                        "body": "x" * (2500 if n % 3 else 10),
+                        "published_on": NOW - timedelta(hours=n),
+                        "status": "ACTIVE",
+                        "upvotes": 0,
+                        "downvotes": 0,
+                        "score": n,
+                        "publisher_id": 1 if n % 2 else 2,
+                    }
+                    for n in range(1, 21)
+                ],
+            )
+
+    asyncio.run(seed())
+
+    def run(method, *args, **kwargs):
+        async def call():
+            async with manager.get_session() as session:
+                return await method(ArticleRepository(session), *args, **kwargs)
+
+        return asyncio.run(call())
+
+    yield run
+    manager._discard_all()
+
+
+def _ids(rows):
+    return [row["id"] for row in rows]
+
+
+@pytest.mark.unit
+class TestCachedRepositoryStatements:
+    """Statements are built once per shape and bind values per call."""
+
+    def test_filter_statement_built_once_per_shape(self, run_with_repository):
+        repository._filtered_articles_statement.cache_clear()
+        filters = ArticleRepository.get_articles_with_filters
+
+        run_with_repository(filters, limit=3, search_query="bitcoin")
+        run_with_repository(filters, limit=5, search_query="ether")
+        run_with_repository(filters, limit=5, publisher_id=2)
+
+        info = repository._filtered_articles_statement.cache_info()
+        assert (info.misses, info.hits) == (2, 1)
+
+    def test_filters_bind_values(self, run_with_repository):
+        filters = ArticleRepository.get_articles_with_filters
+
+        assert _ids(run_with_repository(filters, limit=3)) == [1, 2, 3]
+        assert _ids(run_with_repository(filters, limit=3, offset=2, order="asc")) == [
+            18,
+            17,
+            16,
+        ]
+        assert _ids(
+            run_with_repository(filters, limit=3, order_by="id", search_query="ether")
+        ) == [20, 18, 16]
+        assert _ids(
+            run_with_repository(filters, limit=5, publisher_name="coin", hours_back=6)
+        ) == [1, 3, 5]
+
+    def test_analysis_ready_binds_values(self, run_with_repository):
+        ready = ArticleRepository.get_analysis_ready_articles
+
+        # Quality publishers first, then newest; short bodies excluded
+        assert _ids(run_with_repository(ready, limit=4)) == [1, 5, 7, 11]
+        assert _ids(run_with_repository(ready, limit=4, min_content_length=5)) == [
+            1,
+            3,
+            5,
+            7,
+        ]
+
+    def test_lookups_and_recent_articles(self, run_with_repository):
+        repo = ArticleRepository
+
+        assert run_with_repository(repo.get_article_by_external_id, 105).id == 5
+        assert run_with_repository(repo.get_article_by_guid, "guid-7").id == 7
+        assert run_with_repository(repo.get_article_by_url, "https://example.com/9")
+        assert run_with_repository(repo.get_article_by_id, 4)["id"] == 4
+        assert len(run_with_repository(repo.get_recent_articles, hours=5)) == 4
+        assert (
+            len(
+                run_with_repository(
+                    repo.get_recent_articles,
+                    hours=48,
+                    limit=7,
+                    include_categories=False,
+                )
+            )
+            == 7
+        )
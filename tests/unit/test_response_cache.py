@@ -0,0 +1,280 @@
+"""Unit tests for the two-level response cache and the endpoint decorator."""
+
+import asyncio
+import functools
+
+import pytest
+from fastapi import FastAPI, Query
+from fastapi.testclient import TestClient
+
+from crypto_newsletter.shared.cache import (
+    ARTICLES,
+    NEWSLETTERS,
+    ResponseCache,
+    cache_key,
+)
+from crypto_newsletter.shared.monitoring.metrics import get_metrics_collector
+from crypto_newsletter.web import cache as web_cache
+
+
+class InMemoryRedis:
+    """The subset of redis.asyncio.Redis the cache uses, shared like a server."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+        self.fail = False
+
+    def _check(self) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    async def get(self, key):
+        self._check()
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        self._check()
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        self._check()
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def incr(self, key):
+        self._check()
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    async def delete(self, key):
+        self._check()
+        self.data.pop(key, None)
+
+
+def run_async(test):
+    """Run an async test method in a fresh event loop."""
+
+    @functools.wraps(test)
+    def wrapper(*args, **kwargs):
+        return asyncio.run(test(*args, **kwargs))
+
+    return wrapper
+
+
+class Counter:
+    def __init__(self, value=None) -> None:
+        self.calls = 0
+        self.value = value
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.value if self.value is not None else {"calls": self.calls}
+
+
+@pytest.mark.unit
+class TestCacheKey:
+    def test_order_and_none_values_do_not_matter(self):
+        assert cache_key("stats", {"a": 1, "b": None, "c": "x"}) == cache_key(
+            "stats", {"c": "x", "a": 1}
+        )
+        assert cache_key("stats", {"a": 1}) != cache_key("stats", {"a": 2})
+        assert cache_key("stats", {}) != cache_key("publishers", {})
+
+
+@pytest.mark.unit
+class TestLocalCache:
+    """Without Redis the per-process LRU still caches and invalidates."""
+
+    @run_async
+    async def test_hit_after_miss(self):
+        cache = ResponseCache()
+        compute = Counter()
+
+        first = await cache.get_or_set("k", compute, tags=[ARTICLES])
+        second = await cache.get_or_set("k", compute, tags=[ARTICLES])
+
+        assert first == second == {"calls": 1}
+        assert cache.stats["l1_hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    @run_async
+    async def test_invalidate_only_affects_tagged_entries(self):
+        cache = ResponseCache()
+        articles, newsletters = Counter(), Counter()
+        await cache.get_or_set("a", articles, tags=[ARTICLES])
+        await cache.get_or_set("n", newsletters, tags=[NEWSLETTERS])
+
+        await cache.invalidate(ARTICLES)
+        await cache.get_or_set("a", articles, tags=[ARTICLES])
+        await cache.get_or_set("n", newsletters, tags=[NEWSLETTERS])
+
+        assert articles.calls == 2
+        # The L1 was cleared, but the newsletter entry's key is unchanged
+        assert newsletters.calls == 2
+        await cache.get_or_set("n", newsletters, tags=[NEWSLETTERS])
+        assert newsletters.calls == 2
+
+    @run_async
+    async def test_ttl_and_lru_eviction(self):
+        cache = ResponseCache(l1_size=2)
+        compute = Counter()
+        for key in ("a", "b", "c"):
+            await cache.get_or_set(key, compute, ttl=60)
+        assert len(cache._l1) == 2
+
+        await cache.get_or_set("a", compute, ttl=60)
+        assert compute.calls == 4
+
+        for key, (_, value) in list(cache._l1.items()):
+            cache._l1[key] = (0.0, value)
+        await cache.get_or_set("a", compute, ttl=60)
+        assert compute.calls == 5
+
+    @run_async
+    async def test_concurrent_misses_compute_once(self):
+        cache = ResponseCache()
+        compute = Counter()
+
+        results = await asyncio.gather(
+            *(cache.get_or_set("k", compute) for _ in range(10))
+        )
+
+        assert compute.calls == 1
+        assert all(result == {"calls": 1} for result in results)
+        assert cache.stats["coalesced"] == 9
+
+    @run_async
+    async def test_errors_are_not_cached(self):
+        cache = ResponseCache()
+
+        async def failing():
+            raise RuntimeError("database down")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_set("k", failing)
+        assert await cache.get_or_set("k", Counter()) == {"calls": 1}
+
+    @run_async
+    async def test_values_are_stored_in_json_form(self):
+        cache = ResponseCache()
+
+        value = await cache.get_or_set("k", Counter(value={"ids": (1, 2)}))
+
+        assert value == {"ids": [1, 2]}
+
+
+@pytest.mark.unit
+class TestSharedCache:
+    """Two caches sharing one Redis behave like two processes."""
+
+    @run_async
+    async def test_l2_is_shared_and_invalidation_reaches_all_processes(self):
+        redis = InMemoryRedis()
+        web, worker = ResponseCache(redis_client=redis), ResponseCache(
+            redis_client=redis
+        )
+        compute = Counter()
+
+        await web.get_or_set("stats", compute, tags=[ARTICLES])
+        other = ResponseCache(redis_client=redis)
+        assert await other.get_or_set("stats", compute, tags=[ARTICLES]) == {
+            "calls": 1
+        }
+        assert other.stats["l2_hits"] == 1
+
+        # e.g. ingestion committing in a worker process
+        await worker.invalidate(ARTICLES)
+        assert await web.get_or_set("stats", compute, tags=[ARTICLES]) == {
+            "calls": 2
+        }
+
+    @run_async
+    async def test_waits_for_another_process_holding_the_lock(self):
+        redis = InMemoryRedis()
+        cache = ResponseCache(redis_client=redis)
+        full_key = "stats:0"
+        redis.data[f"response-cache:lock:{full_key}"] = "1"
+        compute = Counter()
+
+        async def other_process_finishes():
+            await asyncio.sleep(0.1)
+            redis.data[f"response-cache:{full_key}"] = '{"calls": 0}'
+
+        result, _ = await asyncio.gather(
+            cache.get_or_set("stats", compute), other_process_finishes()
+        )
+
+        assert result == {"calls": 0}
+        assert compute.calls == 0
+
+    @run_async
+    async def test_redis_errors_fall_back_to_local_cache(self):
+        redis = InMemoryRedis()
+        redis.fail = True
+        cache = ResponseCache(redis_client=redis)
+        compute = Counter()
+
+        await cache.get_or_set("k", compute, tags=[ARTICLES])
+        await cache.get_or_set("k", compute, tags=[ARTICLES])
+
+        assert compute.calls == 1
+        await cache.invalidate(ARTICLES)
+        await cache.get_or_set("k", compute, tags=[ARTICLES])
+        assert compute.calls == 2
+
+
+@pytest.mark.unit
+class TestCachedEndpoint:
+    @pytest.fixture
+    def client(self, monkeypatch):
+        cache = ResponseCache()
+        monkeypatch.setattr(web_cache, "get_response_cache", lambda: cache)
+        calls = []
+        app = FastAPI()
+
+        @app.get("/items")
+        @web_cache.cached_endpoint(tags=[ARTICLES])
+        async def items(
+            limit: int = Query(10, le=100),
+            status: str | None = None,
+            api_key: str | None = None,
+        ) -> dict:
+            calls.append((limit, status))
+            return {"limit": limit, "status": status, "n": len(calls)}
+
+        return TestClient(app), calls, cache
+
+    def test_keyed_by_normalized_query_params(self, client):
+        client, calls, _ = client
+        hits = get_metrics_collector()._cache_hits
+
+        first = client.get("/items?limit=5&api_key=a").json()
+        assert client.get("/items?api_key=b&limit=5").json() == first
+        client.get("/items?limit=5&status=ACTIVE")
+
+        assert calls == [(5, None), (5, "ACTIVE")]
+        assert get_metrics_collector()._cache_hits == hits + 1
+
+    def test_validation_still_applies(self, client):
+        client, calls, _ = client
+
+        assert client.get("/items?limit=500").status_code == 422
+        assert calls == []
+
+    def test_disabled_by_setting(self, client, monkeypatch):
+        client, calls, _ = client
+        monkeypatch.setenv("RESPONSE_CACHE_ENABLED", "false")
+        from crypto_newsletter.shared.config.settings import reset_settings
+
+        reset_settings()
+        try:
+            client.get("/items")
+            client.get("/items")
+        finally:
+            monkeypatch.delenv("RESPONSE_CACHE_ENABLED")
+            reset_settings()
+
+        assert len(calls) == 2
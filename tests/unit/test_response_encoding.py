@@ -0,0 +1,233 @@
+"""Unit tests for fast JSON responses and response compression."""
+
+import gzip
+import json
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from crypto_newsletter.shared.cache import ResponseCache
+from crypto_newsletter.shared.config.settings import reset_settings
+from crypto_newsletter.web import cache as web_cache
+from crypto_newsletter.web import middleware
+from crypto_newsletter.web.middleware import CompressionMiddleware, _accepts
+from crypto_newsletter.web.responses import FastJSONResponse, json_response
+from crypto_newsletter.web.routers import api
+
+CREATED = datetime(2026, 10, 1, 8, 30, tzinfo=UTC)
+
+
+class Item(BaseModel):
+    id: int
+    title: str
+    created_at: datetime
+    score: float | None = None
+
+
+@pytest.fixture
+def fast_json(monkeypatch):
+    """Toggle FAST_JSON_RESPONSES; call with True or False."""
+
+    def toggle(enabled: bool) -> None:
+        monkeypatch.setenv("FAST_JSON_RESPONSES", str(enabled).lower())
+        reset_settings()
+
+    yield toggle
+    monkeypatch.delenv("FAST_JSON_RESPONSES")
+    reset_settings()
+
+
+def _body(response) -> object:
+    return json.loads(response.body)
+
+
+@pytest.mark.unit
+class TestJsonResponse:
+    def test_fast_response_renders_compact_utf8(self):
+        response = FastJSONResponse({"title": "Café", "at": CREATED, 1: None})
+
+        assert response.body == (
+            b'{"title":"Caf\xc3\xa9","at":"2026-10-01T08:30:00+00:00","1":null}'
+        )
+        assert response.media_type == "application/json"
+
+    def test_fast_and_default_paths_produce_the_same_json(self, fast_json):
+        items = [
+            Item(id=1, title="A", created_at=CREATED),
+            Item(id=2, title="B", created_at=CREATED, score=0.5),
+        ]
+        fast_json(True)
+        fast = json_response(items)
+        fast_json(False)
+        default = json_response(items)
+
+        assert isinstance(fast, FastJSONResponse)
+        assert not isinstance(default, FastJSONResponse)
+        assert _body(fast) == _body(default)
+        assert _body(fast)[1] == {
+            "id": 2,
+            "title": "B",
+            "created_at": "2026-10-01T08:30:00Z",
+            "score": 0.5,
+        }
+
+    def test_status_and_headers(self, fast_json):
+        fast_json(True)
+        response = json_response({"ok": True}, status_code=201, headers={"X-A": "1"})
+
+        assert response.status_code == 201
+        assert response.headers["x-a"] == "1"
+
+
+def _app(body_size: int, status_code: int = 200, media_type: str = "text/plain"):
+    app = FastAPI()
+
+    @app.get("/")
+    async def body():
+        return Response(
+            b"x" * body_size if status_code != 304 else b"",
+            status_code=status_code,
+            media_type=media_type,
+        )
+
+    app.add_middleware(CompressionMiddleware, minimum_size=1000)
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestCompressionMiddleware:
+    def test_large_bodies_are_gzipped(self, monkeypatch):
+        monkeypatch.setattr(middleware, "brotli", None)
+        response = _app(5000).get("/", headers={"Accept-Encoding": "br, gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.num_bytes_downloaded < 200
+        assert response.content == b"x" * 5000
+
+    def test_small_bodies_and_not_modified_are_sent_as_is(self):
+        headers = {"Accept-Encoding": "gzip"}
+
+        assert "content-encoding" not in _app(500).get("/", headers=headers).headers
+        not_modified = _app(5000, status_code=304).get("/", headers=headers)
+        assert not_modified.status_code == 304
+        assert "content-encoding" not in not_modified.headers
+
+    def test_binary_media_types_are_not_compressed(self):
+        response = _app(5000, media_type="image/png").get(
+            "/", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert "content-encoding" not in response.headers
+
+    def test_streamed_bodies_are_gzipped_chunk_by_chunk(self, monkeypatch):
+        monkeypatch.setattr(middleware, "brotli", None)
+        app = FastAPI()
+
+        @app.get("/")
+        async def stream():
+            async def rows():
+                for n in range(50):
+                    yield f'{{"id": {n}, "title": "Bitcoin ETF inflows"}}\n'.encode()
+
+            return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+        app.add_middleware(CompressionMiddleware, minimum_size=1000)
+        response = TestClient(app).get("/", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text.count("\n") == 50
+
+    def test_brotli_when_installed_and_accepted(self, monkeypatch):
+        class FakeCompressor:
+            def __init__(self, quality):
+                self.chunks = []
+
+            def process(self, body):
+                self.chunks.append(body)
+                return b""
+
+            def finish(self):
+                # gzip stands in for brotli: the test only checks negotiation
+                return gzip.compress(b"".join(self.chunks))
+
+        monkeypatch.setattr(
+            middleware, "brotli", type("brotli", (), {"Compressor": FakeCompressor})
+        )
+        client = _app(5000)
+
+        br = client.get("/", headers={"Accept-Encoding": "gzip, br"})
+        refused = client.get("/", headers={"Accept-Encoding": "gzip, br;q=0"})
+
+        assert br.headers["content-encoding"] == "br"
+        assert refused.headers["content-encoding"] == "gzip"
+
+    def test_accept_encoding_parsing(self):
+        assert _accepts("gzip, br", "br")
+        assert _accepts("BR;q=0.5", "br")
+        assert not _accepts("br;q=0", "br")
+        assert not _accepts("gzip, brotli", "br")
+        assert not _accepts("", "br")
+
+
+class FakeNewsletterRepository:
+    newsletter = SimpleNamespace(
+        id=7,
+        title="Daily",
+        content="# Daily\n\nBody",
+        summary="Summary",
+        generation_date=CREATED,
+        status="PUBLISHED",
+        quality_score=0.9,
+        agent_version="1.0",
+        generation_metadata={"newsletter_type": "DAILY"},
+        published_at=CREATED,
+        created_at=CREATED,
+        updated_at=CREATED,
+    )
+
+    def __init__(self, db) -> None:
+        pass
+
+    async def get_newsletter_by_id(self, newsletter_id):
+        return self.newsletter
+
+    async def get_newsletters_with_filters(self, **filters):
+        return [self.newsletter]
+
+    async def count_newsletters_with_filters(self, **filters):
+        return 1
+
+
+@asynccontextmanager
+async def _no_session():
+    yield None
+
+
+@pytest.mark.unit
+def test_newsletter_routes_are_unchanged_by_fast_json(fast_json, monkeypatch):
+    monkeypatch.setattr(api, "get_read_session", _no_session)
+    monkeypatch.setattr(api, "NewsletterRepository", FakeNewsletterRepository)
+    app = FastAPI()
+    app.include_router(api.router, prefix="/api")
+    client = TestClient(app)
+
+    bodies = {}
+    for enabled in (False, True):
+        fast_json(enabled)
+        # A fresh response cache, so both runs render the page themselves
+        monkeypatch.setattr(web_cache, "get_response_cache", ResponseCache)
+        bodies[enabled] = [
+            client.get(path).json()
+            for path in ("/api/newsletters/7", "/api/newsletters?limit=5")
+        ]
+
+    assert bodies[True] == bodies[False]
+    assert bodies[True][0]["published_at"] == CREATED.isoformat()
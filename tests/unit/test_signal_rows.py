@@ -0,0 +1,83 @@
+"""Unit tests for turning analysis JSONB arrays into normalized signal rows."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from crypto_newsletter.analysis.models.signals import WeakSignal
+from crypto_newsletter.core.storage.signals import build_signal_rows
+from crypto_newsletter.shared.models import Signal, SignalAnomaly, SignalConnection
+
+DETECTED_AT = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+@pytest.mark.unit
+class TestBuildSignalRows:
+    """One row per well-formed entry, tagged with the analysis."""
+
+    def test_rows_per_table(self):
+        rows = build_signal_rows(
+            7,
+            42,
+            DETECTED_AT,
+            agent_version="1.0",
+            weak_signals=[
+                WeakSignal(
+                    signal_type="regulatory_shift",
+                    description="SEC staff comment",
+                    confidence=0.8,
+                    implications="Faster ETF approvals",
+                    evidence=["quote"],
+                    timeframe="short-term",
+                ),
+                {"signal_type": "technology_adoption", "description": "L2 fees"},
+                {"signal_type": "x", "description": "y", "confidence": "1.4"},
+            ],
+            pattern_anomalies=[
+                {
+                    "expected_pattern": "Sell-off",
+                    "observed_pattern": "Rally",
+                    "deviation_significance": 0.6,
+                }
+            ],
+            adjacent_connections=[
+                {
+                    "crypto_element": "USDC",
+                    "external_domain": "payments",
+                    "relevance": 0.7,
+                    "connection_type": "",
+                },
+                "not a dict",
+            ],
+        )
+
+        signals = rows[Signal]
+        assert [signal["signal_type"] for signal in signals] == [
+            "regulatory_shift",
+            "x",
+        ]
+        assert signals[0]["signal_metadata"] == {
+            "evidence": ["quote"],
+            "timeframe": "short-term",
+        }
+        assert signals[0]["agent_version"] == "1.0"
+        # Out-of-range scores are clamped to satisfy the check constraint
+        assert signals[1]["confidence"] == 1.0
+
+        anomaly = rows[SignalAnomaly][0]
+        assert anomaly["potential_causes"] == []
+        assert (anomaly["article_id"], anomaly["analysis_id"]) == (7, 42)
+
+        connection = rows[SignalConnection]
+        assert len(connection) == 1
+        assert connection[0]["connection_type"] is None
+        assert connection[0]["detected_at"] == DETECTED_AT
+        assert "agent_version" not in connection[0]
+
+    def test_missing_arrays(self):
+        rows = build_signal_rows(1, 1, DETECTED_AT, weak_signals=None)
+        assert all(model_rows == [] for model_rows in rows.values())
+
+    def test_unknown_array(self):
+        with pytest.raises(ValueError, match="narrative_gaps"):
+            build_signal_rows(1, 1, DETECTED_AT, narrative_gaps=[])
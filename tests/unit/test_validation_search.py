@@ -0,0 +1,247 @@
+"""Unit tests for the signal validation search client and tool."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from pydantic_ai.models.test import TestModel
+
+from crypto_newsletter.analysis.agents import signal_validation
+from crypto_newsletter.analysis.agents.signal_validation import signal_validation_agent
+from crypto_newsletter.analysis.dependencies import AnalysisDependencies, CostTracker
+from crypto_newsletter.analysis.search import (
+    ExternalSearch,
+    StubSearchBackend,
+    TavilySearchBackend,
+    create_external_search,
+    format_results,
+    normalize_query,
+)
+
+
+class FailingBackend(StubSearchBackend):
+    async def search(self, query, max_results):
+        if "fail" in query:
+            self.queries.append(query)
+            raise ConnectionError("search API unreachable")
+        return await super().search(query, max_results)
+
+
+@pytest.mark.unit
+class TestExternalSearch:
+    def test_normalized_queries_share_cache_entry(self):
+        backend = StubSearchBackend()
+        search = ExternalSearch(backend)
+
+        async def run():
+            first = await search.search("Bitcoin  ETF inflows")
+            second = await search.search("  bitcoin etf INFLOWS ")
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first == second
+        assert backend.queries == ["Bitcoin  ETF inflows"]
+        assert search.stats["hits"] == 1
+        assert normalize_query("  A\tB  ") == "a b"
+
+    def test_ttl_and_lru_bounds(self, monkeypatch):
+        backend = StubSearchBackend()
+        search = ExternalSearch(backend, cache_ttl=10, cache_size=2)
+        now = [1000.0]
+        monkeypatch.setattr(
+            "crypto_newsletter.analysis.search.time.monotonic", lambda: now[0]
+        )
+
+        async def run():
+            for query in ("a", "b", "a", "c", "a", "b"):
+                await search.search(query)
+            now[0] += 11
+            await search.search("a")
+
+        asyncio.run(run())
+
+        # "b" was evicted by "c" (least recently used); "a" expired at the end
+        assert backend.queries == ["a", "b", "c", "b", "a"]
+
+    def test_concurrent_identical_searches_are_coalesced(self):
+        backend = StubSearchBackend(latency=0.1)
+        search = ExternalSearch(backend)
+
+        async def run():
+            return await asyncio.gather(
+                *(search.search("stablecoin supply") for _ in range(5))
+            )
+
+        results = asyncio.run(run())
+
+        assert backend.queries == ["stablecoin supply"]
+        assert all(result == results[0] for result in results)
+        assert search.stats["coalesced"] == 4
+
+    def test_waiters_retry_when_the_shared_search_is_cancelled(self):
+        backend = StubSearchBackend(latency=0.05)
+        search = ExternalSearch(backend)
+
+        async def run():
+            leader = asyncio.create_task(search.search("miner outflows"))
+            await asyncio.sleep(0)
+            waiters = [
+                asyncio.create_task(search.search("miner outflows")) for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await asyncio.gather(*waiters)
+
+        results = asyncio.run(run())
+
+        # One waiter repeats the search; the others join it
+        assert backend.queries == ["miner outflows"] * 2
+        assert all(result == results[0] for result in results)
+
+    def test_search_many_runs_in_parallel_and_isolates_errors(self):
+        backend = FailingBackend(latency=0.2)
+        search = ExternalSearch(backend, max_parallel=4)
+
+        started = time.perf_counter()
+        results = asyncio.run(
+            search.search_many(["one", "fail", "two", "three"], max_results=2)
+        )
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.4  # sequentially: 0.6s
+        assert [query for query, _ in results] == ["one", "fail", "two", "three"]
+        assert isinstance(results[1][1], ConnectionError)
+        assert len(results[0][1]) == 2
+        assert search.stats["errors"] == 1
+
+        # Failures are not cached
+        asyncio.run(search.search_many(["fail"]))
+        assert backend.queries.count("fail") == 2
+
+    def test_max_parallel_bounds_fan_out(self):
+        active = peak = 0
+
+        class CountingBackend(StubSearchBackend):
+            async def search(self, query, max_results):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                try:
+                    await asyncio.sleep(0.05)
+                    return []
+                finally:
+                    active -= 1
+
+        search = ExternalSearch(CountingBackend(), max_parallel=2)
+        asyncio.run(search.search_many([f"q{n}" for n in range(6)]))
+
+        assert peak == 2
+
+    def test_format_results(self):
+        text = format_results(
+            [{"title": "T", "url": "https://x", "content": "c" * 600}]
+        )
+
+        assert text.startswith("Source: T\nURL: https://x\nContent: ")
+        assert "c" * 500 + "..." in text and "c" * 501 not in text
+        assert format_results([]) == "No relevant sources found"
+
+
+@pytest.mark.unit
+class TestTavilyBackend:
+    def test_one_async_client_per_event_loop(self, monkeypatch):
+        created = []
+
+        class FakeAsyncTavilyClient:
+            def __init__(self, api_key):
+                created.append(self)
+
+            async def search(self, **kwargs):
+                await asyncio.sleep(0)
+                return {"results": [{"title": kwargs["query"]}]}
+
+        monkeypatch.setattr("tavily.AsyncTavilyClient", FakeAsyncTavilyClient)
+        backend = TavilySearchBackend("key")
+
+        async def two_searches():
+            return [await backend.search(q, 3) for q in ("a", "b")]
+
+        assert asyncio.run(two_searches()) == [[{"title": "a"}], [{"title": "b"}]]
+        assert len(created) == 1
+        asyncio.run(two_searches())
+        assert len(created) == 2
+        assert len(backend._clients) == 1  # the closed loop's client is dropped
+
+    def test_backend_selection(self):
+        assert isinstance(create_external_search("stub").backend, StubSearchBackend)
+        with pytest.raises(ValueError, match="Unknown search backend"):
+            create_external_search("bing")
+
+
+@pytest.mark.unit
+class TestSearchTool:
+    def test_agent_tool_uses_search_client(self, monkeypatch):
+        backend = StubSearchBackend()
+        monkeypatch.setattr(
+            signal_validation, "get_external_search", lambda: ExternalSearch(backend)
+        )
+        deps = AnalysisDependencies(db_session=None, cost_tracker=CostTracker())
+
+        with signal_validation_agent.override(
+            model=TestModel(call_tools=["search_external_sources"])
+        ):
+            result = asyncio.run(signal_validation_agent.run("Validate", deps=deps))
+
+        assert backend.queries
+        tool_returns = [
+            part.content
+            for message in result.all_messages()
+            for part in message.parts
+            if part.part_kind == "tool-return"
+        ]
+        assert tool_returns and tool_returns[0].startswith("QUERY: ")
+        assert "Source: Result 1 for" in tool_returns[0]
+
+    def test_tool_caps_queries_per_call(self, monkeypatch):
+        backend = StubSearchBackend()
+        monkeypatch.setattr(
+            signal_validation, "get_external_search", lambda: ExternalSearch(backend)
+        )
+        deps = AnalysisDependencies(
+            db_session=None, cost_tracker=CostTracker(), max_searches_per_validation=2
+        )
+
+        text = asyncio.run(
+            signal_validation.search_external_sources(
+                SimpleNamespace(deps=deps), ["a", "b", "c"], 1
+            )
+        )
+
+        assert backend.queries == ["a", "b"]
+        assert text.endswith("Skipped 1 queries: limit is 2 searches per validation")
+
+    def test_tool_limit_spans_repeated_calls(self, monkeypatch):
+        backend = StubSearchBackend()
+        monkeypatch.setattr(
+            signal_validation, "get_external_search", lambda: ExternalSearch(backend)
+        )
+        deps = AnalysisDependencies(
+            db_session=None, cost_tracker=CostTracker(), max_searches_per_validation=3
+        )
+        ctx = SimpleNamespace(deps=deps)
+
+        async def calls():
+            return [
+                await signal_validation.search_external_sources(ctx, queries, 1)
+                for queries in (["a", "b"], ["c", "d"], ["e"])
+            ]
+
+        first, second, third = asyncio.run(calls())
+
+        assert backend.queries == ["a", "b", "c"]
+        assert deps.searches_used == 3
+        assert "Skipped" not in first
+        assert second.endswith("Skipped 1 queries: limit is 3 searches per validation")
+        assert third == "Search limit reached: 3 searches per validation"